@@ -0,0 +1,15 @@
+"""
+Benchmarks for the story bot hot paths, run against generated story graphs and workspaces.
+
+    python -m benchmarks --size medium --out benchmarks/results.json
+    python -m benchmarks --size medium --baseline benchmarks/results.json --tolerance 0.25
+"""
+import sys
+from pathlib import Path
+
+workspace_root = Path(__file__).resolve().parent.parent
+src_root = workspace_root / "src"
+if str(src_root) not in sys.path:
+    sys.path.insert(0, str(src_root))
+if str(workspace_root) not in sys.path:
+    sys.path.insert(0, str(workspace_root))
@@ -0,0 +1,83 @@
+"""
+Run the benchmark scenarios, write JSON results and compare them against a baseline.
+
+Exits 1 when any scenario regressed by more than the tolerance against the baseline.
+"""
+import argparse
+import dataclasses
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.generators import SIZES, GraphSize
+from benchmarks.harness import build_results, compare, load_results, print_comparison, run_scenarios, write_results
+from benchmarks.scenarios import BenchmarkContext, scenarios_named
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__)
+    parser.add_argument('--size', choices=sorted(SIZES), default='small', help='preset graph size (default: small)')
+    for field in dataclasses.fields(GraphSize):
+        parser.add_argument(f'--{field.name.replace("_", "-")}', type=int, dest=field.name,
+                            help=f'override the number of {field.name.replace("_", " ")} per parent')
+    parser.add_argument('--seed', type=int, default=0, help='seed for generated names (default: 0)')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs per scenario (default: 5)')
+    parser.add_argument('--warmup', type=int, default=1, help='unmeasured runs per scenario (default: 1)')
+    parser.add_argument('--only', nargs='+', metavar='SCENARIO', help='run only these scenarios')
+    parser.add_argument('--out', type=Path, help='write results JSON here')
+    parser.add_argument('--baseline', type=Path, help='compare against this results JSON')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed slowdown / growth over the baseline, as a fraction (default: 0.25)')
+    parser.add_argument('--verbose', action='store_true', help='show what the measured code prints')
+    parser.add_argument('--keep-workspace', action='store_true', help='keep the generated workspace and print its path')
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    overrides = {field.name: getattr(args, field.name) for field in dataclasses.fields(GraphSize)
+                 if getattr(args, field.name) is not None}
+    size = dataclasses.replace(SIZES[args.size], **overrides)
+    try:
+        scenarios = scenarios_named(args.only)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    baseline = load_results(args.baseline) if args.baseline else None
+
+    root = Path(tempfile.mkdtemp(prefix='bot-bench-'))
+    try:
+        print(f'Generating workspace: {size.to_dict()} ({size.story_count} stories)')
+        context = BenchmarkContext(size, seed=args.seed, root=root)
+        scenario_results = run_scenarios(scenarios, context, repeat=args.repeat, warmup=args.warmup,
+                                        progress=print, quiet=not args.verbose)
+    finally:
+        if args.keep_workspace:
+            print(f'Workspace kept at {root}')
+        else:
+            shutil.rmtree(root, ignore_errors=True)
+
+    results = build_results(scenario_results, {
+        'size': size.to_dict(), 'seed': args.seed, 'repeat': args.repeat, 'warmup': args.warmup,
+    })
+    if args.out:
+        write_results(results, args.out)
+        print(f'Results written to {args.out}')
+    if baseline is None:
+        return 0
+    if baseline.get('parameters', {}).get('size') != results['parameters']['size']:
+        print('Warning: baseline was recorded with a different graph size', file=sys.stderr)
+    print_comparison(results, baseline)
+    regressions = compare(results, baseline, tolerance=args.tolerance)
+    if regressions:
+        print(f'{len(regressions)} regression(s) over {args.tolerance:.0%} tolerance:')
+        for regression in regressions:
+            print(f'  {regression}')
+        return 1
+    print(f'No regressions over {args.tolerance:.0%} tolerance')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
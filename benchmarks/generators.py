@@ -0,0 +1,216 @@
+"""
+Synthetic story graphs and workspaces of tunable size.
+
+A graph has epics x sub-epics x stories x scenarios x steps nodes, shaped like
+docs/story/story-graph.json (story groups, test classes and methods, increments). The
+matching workspace writes the graph to docs/story/story-graph.json, one src module per
+sub-epic with a method per story, and one test file per sub-epic with a test class per
+story and a test method per scenario that calls into src - so scope enrichment, rule
+scanners and trace generation all have real files to work on.
+"""
+import json
+import random
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+VERBS = ['Load', 'Save', 'Render', 'Validate', 'Filter', 'Submit', 'Navigate', 'Export',
+         'Import', 'Merge', 'Sync', 'Track', 'Review', 'Publish', 'Archive', 'Assign']
+NOUNS = ['Story Map', 'Scope', 'Behavior', 'Action', 'Increment', 'Scenario', 'Diagram',
+         'Report', 'Rule', 'Workspace', 'Panel', 'Trace', 'Domain Concept', 'Status', 'Layout']
+QUALIFIERS = ['Draft', 'Shared', 'Nested', 'Pending', 'Cached', 'Remote', 'Local', 'Bulk']
+
+
+@dataclass(frozen=True)
+class GraphSize:
+    epics: int = 2
+    sub_epics: int = 3
+    stories: int = 4
+    scenarios: int = 3
+    steps: int = 3
+
+    @property
+    def story_count(self) -> int:
+        return self.epics * self.sub_epics * self.stories
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+SIZES = {
+    'small': GraphSize(2, 3, 4, 3, 3),
+    'medium': GraphSize(4, 6, 8, 4, 4),
+    'large': GraphSize(8, 10, 12, 5, 5),
+}
+
+
+def snake_case(name: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '_', name.lower()).strip('_')
+
+
+def pascal_case(name: str) -> str:
+    return ''.join(part.capitalize() for part in re.split(r'[^A-Za-z0-9]+', name) if part)
+
+
+class _Names:
+    """Readable, unique node names drawn from a seeded vocabulary."""
+
+    def __init__(self, seed: int):
+        self._random = random.Random(seed)
+        self._used = set()
+
+    def next(self, kind: str) -> str:
+        while True:
+            name = f'{self._random.choice(VERBS)} {self._random.choice(QUALIFIERS)} {self._random.choice(NOUNS)}'
+            if kind != 'story':
+                name = f'{name} {kind.replace("_", " ").title()}'
+            if name not in self._used:
+                self._used.add(name)
+                return name
+            # Vocabulary exhausted for this shape: disambiguate with a counter
+            name = f'{name} {len(self._used)}'
+            if name not in self._used:
+                self._used.add(name)
+                return name
+
+
+def generate_story_graph(size: GraphSize, seed: int = 0, increments: int = 3) -> Dict[str, Any]:
+    """Story graph with size.epics epics, each holding size.sub_epics sub-epics of size.stories stories."""
+    names = _Names(seed)
+    epics = []
+    story_names: List[str] = []
+    for e in range(size.epics):
+        sub_epics = []
+        for s in range(size.sub_epics):
+            sub_epic_name = names.next('sub_epic')
+            stories = []
+            for t in range(size.stories):
+                story_name = names.next('story')
+                story_names.append(story_name)
+                stories.append(_story(story_name, t, size, names))
+            sub_epics.append({
+                'name': sub_epic_name,
+                'sequential_order': float(s),
+                'behavior': None,
+                'domain_concepts': [],
+                'test_file': f'test_{snake_case(sub_epic_name)}.py',
+                'sub_epics': [],
+                'story_groups': [{
+                    'name': '',
+                    'sequential_order': 0.0,
+                    'type': 'and',
+                    'connector': None,
+                    'behavior': None,
+                    'stories': stories,
+                }],
+            })
+        epics.append({
+            'name': names.next('epic'),
+            'sequential_order': float(e),
+            'behavior': None,
+            'domain_concepts': [],
+            'sub_epics': sub_epics,
+            'story_groups': [],
+        })
+    return {'epics': epics, 'increments': _increments(story_names, increments)}
+
+
+def _story(name: str, order: int, size: GraphSize, names: _Names) -> Dict[str, Any]:
+    scenarios = []
+    for c in range(size.scenarios):
+        scenario_name = f'{name} {["succeeds", "fails", "retries", "is skipped", "times out"][c % 5]} {c + 1}'
+        steps = [f'Given {name.lower()} has {c + i} pending item(s)' if i == 0 else
+                 f'And step {i} of {scenario_name.lower()} runs' for i in range(max(size.steps - 2, 1))]
+        steps += [f'When the user runs {name.lower()}', f'Then {scenario_name.lower()} is reported']
+        scenarios.append({
+            'name': scenario_name,
+            'sequential_order': float(c + 1),
+            'type': '',
+            'background': [],
+            'test_method': f'test_{snake_case(scenario_name)}',
+            'steps': '\n'.join(steps[:max(size.steps, 1)]),
+        })
+    return {
+        'name': name,
+        'sequential_order': float(order),
+        'connector': None,
+        'story_type': 'user',
+        'users': ['Bot User'],
+        'test_class': f'Test{pascal_case(name)}',
+        'scenarios': scenarios,
+    }
+
+
+def _increments(story_names: List[str], count: int) -> List[Dict[str, Any]]:
+    if count <= 0 or not story_names:
+        return []
+    per_increment = max(len(story_names) // (count + 1), 1)
+    return [{
+        'name': f'Increment {i + 1}',
+        'priority': i + 1,
+        'stories': story_names[i * per_increment:(i + 1) * per_increment],
+    } for i in range(count)]
+
+
+def iter_sub_epics(story_graph: Dict[str, Any]) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """(epic, sub_epic) pairs of a generated graph."""
+    for epic in story_graph.get('epics', []):
+        for sub_epic in epic.get('sub_epics', []):
+            yield epic, sub_epic
+
+
+def iter_stories(sub_epic: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    for group in sub_epic.get('story_groups', []):
+        yield from group.get('stories', [])
+
+
+def generate_workspace(root: Path, story_graph: Dict[str, Any]) -> Path:
+    """Write story_graph plus matching src/ and test/ trees under root; returns root."""
+    root = Path(root)
+    graph_path = root / 'docs' / 'story' / 'story-graph.json'
+    graph_path.parent.mkdir(parents=True, exist_ok=True)
+    graph_path.write_text(json.dumps(story_graph, indent=2), encoding='utf-8')
+    (root / 'src' / 'app').mkdir(parents=True, exist_ok=True)
+    (root / 'src' / 'app' / '__init__.py').write_text('', encoding='utf-8')
+    (root / 'test').mkdir(parents=True, exist_ok=True)
+    for _, sub_epic in iter_sub_epics(story_graph):
+        module = snake_case(sub_epic['name'])
+        stories = list(iter_stories(sub_epic))
+        (root / 'src' / 'app' / f'{module}.py').write_text(_src_module(sub_epic['name'], stories), encoding='utf-8')
+        (root / 'test' / sub_epic['test_file']).write_text(_test_module(module, sub_epic['name'], stories), encoding='utf-8')
+    return root
+
+
+def _src_module(sub_epic_name: str, stories: List[Dict[str, Any]]) -> str:
+    class_name = f'{pascal_case(sub_epic_name)}Service'
+    lines = [f'"""{sub_epic_name} service."""', '', '',
+             'def normalize_items(items):', '    return [item.strip().lower() for item in items if item]', '', '',
+             f'class {class_name}:', '',
+             '    def __init__(self, items=None):', '        self.items = normalize_items(items or [])', '']
+    for story in stories:
+        method = snake_case(story['name'])
+        lines += [f'    def {method}(self, count):',
+                  f'        """{story["name"]}."""',
+                  '        selected = self.items[:count]',
+                  '        return self._summarize(selected)', '']
+    lines += ['    def _summarize(self, selected):', "        return {'count': len(selected), 'items': selected}", '']
+    return '\n'.join(lines)
+
+
+def _test_module(module: str, sub_epic_name: str, stories: List[Dict[str, Any]]) -> str:
+    class_name = f'{pascal_case(sub_epic_name)}Service'
+    lines = [f'"""Tests for {sub_epic_name}."""', f'from app.{module} import {class_name}', '', '']
+    for story in stories:
+        method = snake_case(story['name'])
+        lines += [f'class {story["test_class"]}:', '']
+        for index, scenario in enumerate(story['scenarios']):
+            lines += [f'    def {scenario["test_method"]}(self):',
+                      '        """',
+                      *[f'        {step}' for step in scenario['steps'].split('\n')],
+                      '        """',
+                      f"        service = {class_name}(['Alpha', 'Beta', 'Gamma'])",
+                      f'        result = service.{method}({index + 1})',
+                      f"        assert result['count'] == {min(index + 1, 3)}", '']
+        lines.append('')
+    return '\n'.join(lines)
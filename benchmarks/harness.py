@@ -0,0 +1,159 @@
+"""
+Benchmark harness - timed scenarios, tracemalloc peaks, JSON results and baseline comparison.
+
+Each scenario's setup builds whatever it needs once and returns the callable to measure.
+The callable runs warmup times unmeasured, then repeat times under perf_counter, then
+once more under tracemalloc (kept apart so tracing overhead does not skew the timings).
+Results are compared by median time and peak memory against a stored baseline; a value
+more than tolerance above its baseline is a regression.
+"""
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+RESULTS_VERSION = 1
+COMPARED_METRICS = ('median_seconds', 'peak_memory_bytes')
+# Timings this small are dominated by noise; they never count as regressions
+MIN_COMPARED_SECONDS = 0.005
+
+
+@dataclass
+class Scenario:
+    name: str
+    description: str
+    setup: Callable[[Any], Callable[[], Any]]
+
+
+@dataclass
+class Regression:
+    scenario: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float('inf')
+
+    def __str__(self) -> str:
+        return f'{self.scenario}.{self.metric}: {self.baseline:.6g} -> {self.current:.6g} ({self.ratio:.2f}x)'
+
+
+def measure(run: Callable[[], Any], repeat: int = 5, warmup: int = 1) -> Dict[str, Any]:
+    """Timing statistics and tracemalloc peak of run()."""
+    for _ in range(warmup):
+        run()
+    timings = []
+    for _ in range(max(repeat, 1)):
+        gc.collect()
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        'repeat': len(timings),
+        'min_seconds': min(timings),
+        'median_seconds': statistics.median(timings),
+        'mean_seconds': statistics.fmean(timings),
+        'max_seconds': max(timings),
+        'peak_memory_bytes': peak,
+    }
+
+
+@contextlib.contextmanager
+def _silenced():
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        yield
+
+
+def run_scenarios(scenarios: List[Scenario], context: Any, repeat: int = 5, warmup: int = 1,
+                  progress: Optional[Callable[[str], None]] = None, quiet: bool = True) -> Dict[str, Dict[str, Any]]:
+    """Measure each scenario; with quiet, whatever the measured code prints is discarded."""
+    results = {}
+    for scenario in scenarios:
+        if progress:
+            progress(f'{scenario.name}: {scenario.description}')
+        with _silenced() if quiet else contextlib.nullcontext():
+            run = scenario.setup(context)
+            results[scenario.name] = measure(run, repeat=repeat, warmup=warmup)
+        if progress:
+            stats = results[scenario.name]
+            progress(f"  median {stats['median_seconds'] * 1000:.1f} ms, peak {stats['peak_memory_bytes'] / 1024:.0f} KiB")
+    return results
+
+
+def build_results(scenario_results: Dict[str, Dict[str, Any]], parameters: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'version': RESULTS_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'parameters': parameters,
+        'scenarios': scenario_results,
+    }
+
+
+def write_results(results: Dict[str, Any], path: Path) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    tmp_path.write_text(json.dumps(results, indent=2, sort_keys=True), encoding='utf-8')
+    os.replace(tmp_path, path)
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    results = json.loads(Path(path).read_text(encoding='utf-8'))
+    if results.get('version') != RESULTS_VERSION:
+        raise ValueError(f"{path} has results version {results.get('version')}, expected {RESULTS_VERSION}")
+    return results
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.25) -> List[Regression]:
+    """Scenarios of current that are more than tolerance slower or larger than in baseline.
+
+    Scenarios missing from either side are not compared. A baseline recorded with other
+    parameters (graph size, repeat) is still compared; the caller decides whether that is meaningful.
+    """
+    regressions = []
+    for name, stats in current.get('scenarios', {}).items():
+        base = baseline.get('scenarios', {}).get(name)
+        if not base:
+            continue
+        for metric in COMPARED_METRICS:
+            if metric not in stats or metric not in base:
+                continue
+            if metric.endswith('_seconds') and max(stats[metric], base[metric]) < MIN_COMPARED_SECONDS:
+                continue
+            if stats[metric] > base[metric] * (1 + tolerance):
+                regressions.append(Regression(name, metric, base[metric], stats[metric]))
+    return regressions
+
+
+def print_comparison(current: Dict[str, Any], baseline: Dict[str, Any], stream=sys.stdout) -> None:
+    for name, stats in sorted(current.get('scenarios', {}).items()):
+        base = baseline.get('scenarios', {}).get(name)
+        if not base:
+            print(f'{name}: no baseline', file=stream)
+            continue
+        parts = []
+        for metric in COMPARED_METRICS:
+            if metric in stats and metric in base and base[metric]:
+                parts.append(f'{metric} {stats[metric] / base[metric]:.2f}x')
+        print(f"{name}: {', '.join(parts)}", file=stream)
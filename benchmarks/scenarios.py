@@ -0,0 +1,140 @@
+"""
+Benchmark scenarios - one per hot path, run against a generated workspace.
+
+    story_map_load          parse story-graph.json and build the full StoryMap
+    json_scope_all          JSONScope.to_dict for an unfiltered scope (enriched graph cache applies)
+    json_scope_filtered     JSONScope.to_dict for a story filter (always enriched from scratch)
+    rules_validate          Rules.validate of the code behavior over src/ and test/, forced full
+    drawio_render_save      render the outline diagram and save it
+    drawio_load             load the saved outline diagram
+    trace_generate          trace one story's scenarios through test and src code
+"""
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.generators import GraphSize, generate_story_graph, generate_workspace, iter_stories, iter_sub_epics
+from benchmarks.harness import Scenario
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BOT_DIRECTORY = REPO_ROOT / 'bots' / 'story_bot'
+
+
+class BenchmarkContext:
+    """Generated workspace shared by every scenario of a run; the bot is created on first use."""
+
+    def __init__(self, size: GraphSize, seed: int = 0, root: Optional[Path] = None):
+        self.size = size
+        self.root = Path(root) if root else Path(tempfile.mkdtemp(prefix='bot-bench-'))
+        self.workspace = self.root / 'workspace'
+        self.story_graph = generate_story_graph(size, seed)
+        generate_workspace(self.workspace, self.story_graph)
+        self.story_graph_path = self.workspace / 'docs' / 'story' / 'story-graph.json'
+        self._bot = None
+
+    @property
+    def bot(self):
+        if self._bot is None:
+            from bot.bot import Bot
+            os.environ['BOT_DIRECTORY'] = str(BOT_DIRECTORY)
+            os.environ['WORKING_AREA'] = str(self.workspace)
+            self._bot = Bot(bot_name='story_bot', bot_directory=BOT_DIRECTORY,
+                            config_path=BOT_DIRECTORY / 'bot_config.json', workspace_path=self.workspace)
+        return self._bot
+
+    def first_story(self):
+        _, sub_epic = next(iter_sub_epics(self.story_graph))
+        return sub_epic, next(iter_stories(sub_epic))
+
+
+def _story_map_load(context: BenchmarkContext) -> Callable[[], Any]:
+    from story_graph.nodes import StoryMap
+    from story_graph.story_graph_store import StoryGraphStore
+
+    def run():
+        # A fresh store per run so the file is parsed every time
+        story_map = StoryMap(StoryGraphStore().load_copy(context.story_graph_path))
+        return len(story_map.all_scenarios)
+    return run
+
+
+def _json_scope(context: BenchmarkContext, filtered: bool) -> Callable[[], Any]:
+    from scope.json_scope import JSONScope
+    from scope.scope import Scope, ScopeType
+    _, story = context.first_story()
+
+    def run():
+        scope = Scope(context.workspace, context.bot.bot_paths)
+        if filtered:
+            scope.filter(ScopeType.STORY, [story['name']])
+        else:
+            scope.filter(ScopeType.SHOW_ALL, [])
+        return JSONScope(scope).to_dict()
+    return run
+
+
+def _rules_validate(context: BenchmarkContext) -> Callable[[], Any]:
+    from actions.action_context import ValidateActionContext
+    from rules.rules import Rules, ValidationContext
+    behavior = context.bot.behaviors.find_by_name('code')
+
+    def run():
+        rules = Rules(behavior=behavior, bot_paths=behavior.bot_paths)
+        validation_context = ValidationContext.from_action_context(behavior, ValidateActionContext(scope=None, force_full=True))
+        rules.validate(validation_context)
+        return rules.violation_summary
+    return run
+
+
+def _drawio_render_save(context: BenchmarkContext) -> Callable[[], Any]:
+    from story_graph.nodes import StoryMap
+    from synchronizers.story_io.drawio_story_map import DrawIOOutlineMap
+    output = context.root / 'drawio' / 'story-map-outline.drawio'
+
+    def run():
+        diagram = DrawIOOutlineMap()
+        diagram.render(StoryMap(context.story_graph))
+        diagram.save(output)
+        return output
+    return run
+
+
+def _drawio_load(context: BenchmarkContext) -> Callable[[], Any]:
+    from synchronizers.story_io.drawio_story_map import DrawIOStoryMap
+    path = _drawio_render_save(context)()
+
+    def run():
+        return len(DrawIOStoryMap.load(path).get_stories())
+    return run
+
+
+def _trace_generate(context: BenchmarkContext) -> Callable[[], Any]:
+    from traceability.trace_generator import TraceGenerator
+    sub_epic, story = context.first_story()
+    test_file = f"test/{sub_epic['test_file']}"
+
+    def run():
+        return TraceGenerator(context.workspace).generate_for_story(story['test_class'], test_file)
+    return run
+
+
+SCENARIOS: List[Scenario] = [
+    Scenario('story_map_load', 'parse the story graph and build the StoryMap', _story_map_load),
+    Scenario('json_scope_all', 'JSONScope.to_dict, unfiltered', lambda context: _json_scope(context, filtered=False)),
+    Scenario('json_scope_filtered', 'JSONScope.to_dict, one story filter', lambda context: _json_scope(context, filtered=True)),
+    Scenario('rules_validate', 'Rules.validate of the code behavior, forced full', _rules_validate),
+    Scenario('drawio_render_save', 'render and save the outline diagram', _drawio_render_save),
+    Scenario('drawio_load', 'load the outline diagram', _drawio_load),
+    Scenario('trace_generate', 'trace one story through test and src code', _trace_generate),
+]
+
+
+def scenarios_named(names: Optional[List[str]]) -> List[Scenario]:
+    if not names:
+        return list(SCENARIOS)
+    by_name: Dict[str, Scenario] = {scenario.name: scenario for scenario in SCENARIOS}
+    unknown = [name for name in names if name not in by_name]
+    if unknown:
+        raise ValueError(f"Unknown scenario(s): {', '.join(unknown)}; choose from {', '.join(by_name)}")
+    return [by_name[name] for name in names]
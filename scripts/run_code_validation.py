@@ -14,6 +14,7 @@ Usage:
 
 When story_filter is provided, story graph is filtered to that story.
 Pass --skiprule RULE_NAME to skip slow rules (e.g. eliminate_duplication).
+Pass --jobs N to run rule scanners on N workers (--parallel-mode process|thread, default process).
 By default, code files are discovered from the story's test file imports.
 Pass --files to override with explicit paths (comma-separated, globs supported).
 """
@@ -102,6 +103,15 @@ def main():
         idx = args.index("--skiprule")
         if idx + 1 < len(args):
             skiprule = [r.strip() for r in args[idx + 1].split(",")]
+    parallel = {}
+    if "--jobs" in args:
+        idx = args.index("--jobs")
+        if idx + 1 < len(args):
+            parallel["jobs"] = int(args[idx + 1])
+    if "--parallel-mode" in args:
+        idx = args.index("--parallel-mode")
+        if idx + 1 < len(args):
+            parallel["parallel_mode"] = args[idx + 1]
 
     if story_filter:
         scope = Scope(workspace_directory, bot.bot_paths)
@@ -113,14 +123,14 @@ def main():
             scope.filter(ScopeType.FILES, file_paths, [], skiprule)
         else:
             scope.filter(ScopeType.STORY, [story_filter], [], skiprule)
-        context = ValidateActionContext(scope=scope)
+        context = ValidateActionContext(scope=scope, **parallel)
     else:
         scope = Scope(workspace_directory, bot.bot_paths) if skiprule else None
         if scope:
             scope.filter(ScopeType.ALL, [], [], skiprule)
-            context = ValidateActionContext(scope=scope)
+            context = ValidateActionContext(scope=scope, **parallel)
         else:
-            context = ValidateActionContext(scope=None)
+            context = ValidateActionContext(scope=None, **parallel)
 
     validation_context = ValidationContext.from_action_context(behavior, context)
     file_count = sum(len(v) for v in validation_context.files.values())
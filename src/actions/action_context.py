@@ -59,6 +59,8 @@ class ValidateActionContext(ScopeActionContext):
     all_files: bool = False
     force_full: bool = False
     max_cross_file_comparisons: int = 20
+    jobs: int = 1
+    parallel_mode: str = 'process'
     
     def __post_init__(self):
         if self.force_full:
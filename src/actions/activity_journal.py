@@ -0,0 +1,341 @@
+"""
+Activity journal - append-only, line-delimited JSON log of action starts and completions.
+
+Each event is one os.write of one line to a file opened with O_APPEND, so writers never
+rewrite earlier entries and concurrent processes cannot interleave partial lines. fsync is
+batched by count and time; an idle timer syncs and closes the descriptor once appends stop,
+and journals still open at exit are closed then. When the journal grows by more than
+max_bytes past its snapshot or its segment is older than max_age, it is rotated into
+numbered archives and restarted from a compacted snapshot holding the last entry per action
+state and status. The snapshot starts with a marker line recording when the segment started
+and how large the snapshot was, since its entries may be much older than the segment and
+may by themselves exceed max_bytes.
+Readers tail the file from the last
+offset they read and keep the last entry per action state / behavior indexed.
+"""
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils import atomic_write
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_NAME = 'activity_log.jsonl'
+LEGACY_TINYDB_NAME = 'activity_log.json'
+
+FSYNC_EVERY = 32
+FSYNC_INTERVAL_SECONDS = 2.0
+MAX_BYTES = 5 * 1024 * 1024
+MAX_AGE_SECONDS = 30 * 24 * 3600
+KEEP_ARCHIVES = 3
+SEGMENT_MARKER = '_segment_started'
+SNAPSHOT_BYTES = '_snapshot_bytes'
+
+_journals: Dict[str, 'ActivityJournal'] = {}
+_journals_lock = threading.Lock()
+
+
+class ActivityIndex:
+    """Last entry per action state ('bot.behavior.action') and per (bot, behavior)."""
+
+    def __init__(self):
+        self.entries: List[Dict[str, Any]] = []
+        self._by_state: Dict[str, Dict[str, Any]] = {}
+        self._by_state_status: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._by_behavior: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        self.entries.append(entry)
+        state = entry.get('action_state')
+        if not state:
+            return
+        self._by_state[state] = entry
+        self._by_state_status[(state, entry.get('status'))] = entry
+        parts = state.split('.')
+        if len(parts) == 3:
+            self._by_behavior[(parts[0], parts[1])] = entry
+
+    def last(self, action_state: str, status: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        if status is None:
+            return self._by_state.get(action_state)
+        return self._by_state_status.get((action_state, status))
+
+    def last_in_behavior(self, bot_name: str, behavior: str) -> Optional[Dict[str, Any]]:
+        return self._by_behavior.get((bot_name, behavior))
+
+    def compacted(self) -> List[Dict[str, Any]]:
+        """Last entry per (action state, status), in original order."""
+        kept = {id(entry) for entry in self._by_state_status.values()}
+        return [entry for entry in self.entries if id(entry) in kept]
+
+
+class ActivityJournal:
+
+    def __init__(self, path: Path, max_bytes: int = MAX_BYTES, max_age_seconds: float = MAX_AGE_SECONDS,
+                 keep_archives: int = KEEP_ARCHIVES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.keep_archives = keep_archives
+        self._lock = threading.RLock()
+        self._fd: Optional[int] = None
+        self._fd_inode: Optional[Tuple[int, int]] = None
+        self._segment_started: Optional[float] = None
+        self._snapshot_bytes = 0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._last_append = time.monotonic()
+        self._idle_timer: Optional[threading.Timer] = None
+        # reader state
+        self._index = ActivityIndex()
+        self._read_offset = 0
+        self._read_inode: Optional[Tuple[int, int]] = None
+        self._partial = b''
+
+    @classmethod
+    def for_workspace(cls, workspace_directory: Path) -> 'ActivityJournal':
+        """One journal per workspace for the process; migrates a legacy TinyDB log on first use."""
+        path = Path(workspace_directory) / JOURNAL_NAME
+        key = str(path.resolve())
+        with _journals_lock:
+            journal = _journals.get(key)
+            if journal is None:
+                journal = cls(path)
+                _journals[key] = journal
+                migrate_tinydb_log(Path(workspace_directory) / LEGACY_TINYDB_NAME, journal)
+        return journal
+
+    # --- writing -----------------------------------------------------------
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        line = (json.dumps(entry, ensure_ascii=False, separators=(',', ':'), default=str) + '\n').encode('utf-8')
+        with self._lock:
+            fd = self._open_for_append()
+            os.write(fd, line)
+            self._unsynced += 1
+            self._last_append = time.monotonic()
+            if self._unsynced >= FSYNC_EVERY or time.monotonic() - self._last_sync >= FSYNC_INTERVAL_SECONDS:
+                self._sync_locked()
+            if self._needs_rotation(os.fstat(fd).st_size):
+                self.rotate()
+            self._schedule_idle_flush()
+
+    def sync(self) -> None:
+        with self._lock:
+            self._sync_locked()
+
+    def close(self) -> None:
+        """Sync and close the descriptor and drop the journal from the per-workspace cache."""
+        with self._lock:
+            self._cancel_idle_flush()
+            self._sync_locked()
+            self._close_fd()
+        with _journals_lock:
+            key = str(self.path.resolve())
+            if _journals.get(key) is self:
+                del _journals[key]
+
+    def _schedule_idle_flush(self, delay: Optional[float] = None) -> None:
+        """Arm a timer that syncs and closes the descriptor once no append happened for a sync interval."""
+        if self._idle_timer is not None:
+            return
+        self._idle_timer = threading.Timer(FSYNC_INTERVAL_SECONDS if delay is None else delay, self._flush_idle)
+        self._idle_timer.daemon = True
+        self._idle_timer.start()
+
+    def _cancel_idle_flush(self) -> None:
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+
+    def _flush_idle(self) -> None:
+        with self._lock:
+            self._idle_timer = None
+            idle = time.monotonic() - self._last_append
+            if idle < FSYNC_INTERVAL_SECONDS:
+                self._schedule_idle_flush(FSYNC_INTERVAL_SECONDS - idle)
+                return
+            self._sync_locked()
+            self._close_fd()  # reopened by the next append
+
+    def _sync_locked(self) -> None:
+        if self._fd is not None and self._unsynced:
+            try:
+                os.fsync(self._fd)
+            except OSError as e:
+                logger.debug(f'fsync of {self.path} failed: {e}')
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _open_for_append(self) -> int:
+        """Keep one descriptor; reopen when another process rotated the file under us."""
+        try:
+            stat = self.path.stat()
+            current = (stat.st_dev, stat.st_ino)
+        except OSError:
+            current = None
+        if self._fd is not None and current == self._fd_inode:
+            return self._fd
+        self._close_fd()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(str(self.path), os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644)
+        stat = os.fstat(self._fd)
+        self._fd_inode = (stat.st_dev, stat.st_ino)
+        self._segment_started, self._snapshot_bytes = self._read_segment_marker()
+        return self._fd
+
+    def _close_fd(self) -> None:
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+        self._fd = None
+        self._fd_inode = None
+
+    def _read_segment_marker(self) -> Tuple[float, int]:
+        """Start and snapshot size recorded by the segment marker of a rotated journal, else the first entry's timestamp."""
+        try:
+            with open(self.path, 'rb') as f:
+                first = json.loads(f.readline() or b'{}')
+            if SEGMENT_MARKER in first:
+                return float(first[SEGMENT_MARKER]), int(first.get(SNAPSHOT_BYTES, 0))
+            return datetime.fromisoformat(first['timestamp']).timestamp(), 0
+        except (OSError, ValueError, KeyError, TypeError):
+            return time.time(), 0
+
+    # --- rotation / compaction --------------------------------------------
+
+    def _needs_rotation(self, size: int) -> bool:
+        if size - self._snapshot_bytes > self.max_bytes:
+            return True
+        return self._segment_started is not None and time.time() - self._segment_started > self.max_age_seconds
+
+    def archive_path(self, number: int) -> Path:
+        return self.path.with_name(f'{self.path.name}.{number}')
+
+    def rotate(self) -> None:
+        """Move the journal to archive .1 (shifting older archives) and restart it from a compacted snapshot."""
+        with self._lock:
+            index = self._read_all()
+            self._sync_locked()
+            self._close_fd()
+            for number in range(self.keep_archives, 0, -1):
+                source = self.path if number == 1 else self.archive_path(number - 1)
+                if source.exists():
+                    os.replace(source, self.archive_path(number))
+            if self.keep_archives <= 0 and self.path.exists():
+                self.path.unlink()
+            started = time.time()
+            entries = ''.join(json.dumps(entry, ensure_ascii=False, separators=(',', ':'), default=str) + '\n'
+                              for entry in index.compacted()).encode('utf-8')
+            marker = (json.dumps({SEGMENT_MARKER: started, SNAPSHOT_BYTES: len(entries)}) + '\n').encode('utf-8')
+            with atomic_write(self.path, 'wb') as f:
+                f.write(marker + entries)
+            self._segment_started = started
+            self._snapshot_bytes = len(entries)
+            self._reset_reader()
+
+    # --- reading -----------------------------------------------------------
+
+    @property
+    def index(self) -> ActivityIndex:
+        """Index over the whole journal, advanced by reading only what was appended since the last call."""
+        with self._lock:
+            self._catch_up()
+            return self._index
+
+    def entries(self) -> List[Dict[str, Any]]:
+        return list(self.index.entries)
+
+    def last_state(self, bot_name: str, behavior: str, action: Optional[str] = None,
+                   status: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        if action is None:
+            return self.index.last_in_behavior(bot_name, behavior)
+        return self.index.last(f'{bot_name}.{behavior}.{action}', status)
+
+    def _reset_reader(self) -> None:
+        self._index = ActivityIndex()
+        self._read_offset = 0
+        self._read_inode = None
+        self._partial = b''
+
+    def _read_all(self) -> ActivityIndex:
+        self._catch_up()
+        return self._index
+
+    def _catch_up(self) -> None:
+        try:
+            stat = self.path.stat()
+        except OSError:
+            self._reset_reader()
+            return
+        inode = (stat.st_dev, stat.st_ino)
+        if inode != self._read_inode or stat.st_size < self._read_offset:
+            self._reset_reader()
+            self._read_inode = inode
+        if stat.st_size == self._read_offset:
+            return
+        with open(self.path, 'rb') as f:
+            f.seek(self._read_offset)
+            chunk = f.read()
+        self._read_offset += len(chunk)
+        data = self._partial + chunk
+        lines = data.split(b'\n')
+        self._partial = lines.pop()  # incomplete trailing line, finished by a later append
+        for raw in lines:
+            entry = self._decode(raw)
+            if entry is not None:
+                self._index.add(entry)
+
+    @staticmethod
+    def _decode(raw: bytes) -> Optional[Dict[str, Any]]:
+        """Skip blank and damaged lines (e.g. null bytes after a crash) and segment markers."""
+        raw = raw.strip().strip(b'\x00')
+        if not raw:
+            return None
+        try:
+            entry = json.loads(raw.decode('utf-8'))
+        except (UnicodeDecodeError, ValueError):
+            logger.debug('Skipping unreadable activity journal line')
+            return None
+        if not isinstance(entry, dict) or SEGMENT_MARKER in entry:
+            return None
+        return entry
+
+
+@atexit.register
+def close_journals() -> None:
+    """Sync and close every journal opened by this process."""
+    with _journals_lock:
+        journals = list(_journals.values())
+    for journal in journals:
+        journal.close()
+
+
+def migrate_tinydb_log(legacy_path: Path, journal: ActivityJournal) -> int:
+    """Append a TinyDB activity_log.json into the journal once, then rename it to *.migrated."""
+    if not legacy_path.is_file():
+        return 0
+    try:
+        data = json.loads(legacy_path.read_text(encoding='utf-8'))
+        table = data.get('_default', {}) if isinstance(data, dict) else {}
+        documents = [table[doc_id] for doc_id in sorted(table, key=lambda doc_id: int(doc_id))]
+    except (OSError, ValueError, AttributeError) as e:
+        logger.warning(f'Could not migrate activity log {legacy_path}: {e}')
+        return 0
+    for document in documents:
+        journal.append(document)
+    journal.sync()
+    try:
+        os.replace(legacy_path, legacy_path.with_name(legacy_path.name + '.migrated'))
+    except OSError as e:
+        logger.warning(f'Migrated {legacy_path} but could not rename it: {e}')
+    return len(documents)
@@ -3,19 +3,7 @@ from datetime import datetime
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 from bot_path import BotPath
-
-# DISABLED: TinyDB activity tracking was causing file corruption issues
-# The activity_log.json file got corrupted with null bytes, breaking the panel
-# To re-enable, set TINYDB_AVAILABLE = True and uncomment the import
-TINYDB_AVAILABLE = False
-TinyDB = None
-
-# try:
-#     from tinydb import TinyDB
-#     TINYDB_AVAILABLE = True
-# except ImportError:
-#     TINYDB_AVAILABLE = False
-#     TinyDB = None
+from actions.activity_journal import ActivityJournal, JOURNAL_NAME
 
 def make_json_serializable(obj: Any) -> Any:
     from instructions.instructions import Instructions
@@ -53,23 +41,22 @@ class ActivityTracker:
 
     @property
     def file(self) -> Path:
-        return self._bot_paths.workspace_directory / 'activity_log.json'
+        return self._bot_paths.workspace_directory / JOURNAL_NAME
+
+    @property
+    def journal(self) -> ActivityJournal:
+        return ActivityJournal.for_workspace(self.workspace_dir)
 
     def track_start(self, state: ActionState):
-        if not TINYDB_AVAILABLE:
-            return
-        self.file.parent.mkdir(parents=True, exist_ok=True)
-        with TinyDB(self.file) as db:
-            db.insert({'action_state': state.state_key, 'status': 'started', 'timestamp': datetime.now().isoformat()})
+        self.journal.append({'action_state': state.state_key, 'status': 'started', 'timestamp': datetime.now().isoformat()})
 
     def track_completion(self, state: ActionState):
-        if not TINYDB_AVAILABLE:
-            return
-        self.file.parent.mkdir(parents=True, exist_ok=True)
-        with TinyDB(self.file) as db:
-            entry = {'action_state': state.state_key, 'status': 'completed', 'timestamp': datetime.now().isoformat()}
-            if state.outputs:
-                entry['outputs'] = make_json_serializable(state.outputs)
-            if state.duration:
-                entry['duration'] = state.duration
-            db.insert(entry)
\ No newline at end of file
+        entry = {'action_state': state.state_key, 'status': 'completed', 'timestamp': datetime.now().isoformat()}
+        if state.outputs:
+            entry['outputs'] = make_json_serializable(state.outputs)
+        if state.duration:
+            entry['duration'] = state.duration
+        self.journal.append(entry)
+
+    def last_state(self, behavior: str, action: Optional[str] = None, status: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        return self.journal.last_state(self.bot_name, behavior, action, status)
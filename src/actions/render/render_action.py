@@ -9,6 +9,7 @@ from actions.action_context import ActionContext, ScopeActionContext
 from actions.render.render_spec import RenderSpec
 from actions.render.render_config_loader import RenderConfigLoader
 from actions.render.render_instruction_builder import RenderInstructionBuilder
+from story_graph.story_graph_store import StoryGraphStore
 logger = logging.getLogger(__name__)
 
 class RenderOutputAction(Action):
@@ -337,8 +338,7 @@ class RenderOutputAction(Action):
 
             try:
                 drawio_map = DrawIOStoryMap.load(diagram_path)
-                graph_data = json.loads(story_graph_path.read_text(encoding='utf-8'))
-                original_map = StoryMap(graph_data)
+                original_map = StoryMap(StoryGraphStore.shared().load(story_graph_path))
 
                 # When scope is provided, filter the original story map to
                 # only include the scoped node and its descendants.  This
@@ -399,7 +399,7 @@ class RenderOutputAction(Action):
                     results.append({'diagram': spec.output, 'status': 'no_changes'})
                     continue
 
-                graph_data = json.loads(story_graph_path.read_text(encoding='utf-8'))
+                graph_data = StoryGraphStore.shared().load_copy(story_graph_path)
                 changed = False
 
                 for rename in report.renames:
@@ -470,6 +470,7 @@ class RenderOutputAction(Action):
                 if changed:
                     story_graph_path.write_text(
                         json.dumps(graph_data, indent=2, ensure_ascii=False), encoding='utf-8')
+                    StoryGraphStore.shared().invalidate(story_graph_path)
 
                 update_report_path.unlink()
 
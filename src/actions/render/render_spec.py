@@ -153,6 +153,9 @@ class RenderSpec:
             kwargs['renderer_command'] = self._config_data['renderer_command']
         if 'force_outline' in self._config_data:
             kwargs['force_outline'] = self._config_data['force_outline']
+        for option in ('parallel', 'max_workers'):
+            if option in self._config_data:
+                kwargs[option] = self._config_data[option]
         if scope:
             kwargs['scope'] = scope
         return kwargs
@@ -1,10 +1,14 @@
 import logging
+import sys
 import threading
 import traceback
 from pathlib import Path
 from typing import Dict, Any, TYPE_CHECKING
 from datetime import datetime
 from actions.validate.validation_scope import ValidationScope
+from actions.validate.validation_report_writer import validation_topic
+from bot import completion_channel
+from bot.completion_channel import CompletionChannel
 
 if TYPE_CHECKING:
     from action_context import ValidateActionContext
@@ -54,6 +58,7 @@ class BackgroundValidationHandler:
 
     def _handle_validation_error(self, e: Exception, track_completion_fn, status_path: Path, logger) -> None:
         track_completion_fn(outputs={'error': str(e)})
+        self._publish_error(status_path, str(e))
         logger.error(f'Background validation failed: {e}')
         traceback.print_exc()
         try:
@@ -63,11 +68,23 @@ class BackgroundValidationHandler:
         except Exception as status_err:
             logger.error(f'Could not write error to status file: {status_err}')
 
+    def _publish_error(self, status_path: Path, error: str) -> None:
+        # The executor reports its own failures; this covers failures before its status writer started
+        timestamp = status_path.stem.rsplit('-validation-status-', 1)[-1]
+        topic = validation_topic(self.behavior.name, timestamp)
+        channel = CompletionChannel.for_workspace(self.behavior.bot_paths.workspace_directory)
+        if channel.result(topic) is None:
+            channel.publish(topic, {'event': 'error', 'error': error, 'status_file': str(status_path)}, final=True)
+
     def _build_background_response(self, status_path_relative: Path, total_files: int, timestamp: str) -> Dict[str, Any]:
-        return {'instructions': {'base_instructions': self._get_background_instructions(status_path_relative, total_files, timestamp)}, '_background_execution': True, 'background': True, 'status_file': str(status_path_relative), 'total_files': total_files}
+        return {'instructions': {'base_instructions': self._get_background_instructions(status_path_relative, total_files, timestamp)}, '_background_execution': True, 'background': True, 'status_file': str(status_path_relative), 'total_files': total_files, 'completion_topic': validation_topic(self.behavior.name, timestamp), 'wait_command': self._wait_command(timestamp)}
+
+    def _wait_command(self, timestamp: str) -> str:
+        workspace = self.behavior.bot_paths.workspace_directory
+        return f'"{sys.executable}" "{completion_channel.__file__}" wait "{workspace}" {validation_topic(self.behavior.name, timestamp)}'
 
     def _get_background_instructions(self, status_path_relative: Path, total_files: int, timestamp: str) -> list:
         report_path = self.behavior.bot_paths.story_graph_paths.behavior_path(self.behavior.name) / 'violations' / f'{self.behavior.name}-validation-report-{timestamp}.md'
         report_path_relative = report_path.relative_to(self.behavior.bot_paths.workspace_directory)
         report_line = f'  {report_path_relative}' if report_path_relative else '  (Report path will be generated on completion)'
-        return ['', '=' * 70, '**VALIDATION RUNNING IN BACKGROUND**', '=' * 70, '', '**CRITICAL: YOU MUST POLL THE STATUS FILE EVERY 10 SECONDS UNTIL VALIDATION COMPLETES**', '', f'Validation has been started in the background. It will scan {total_files} file(s).', '', '**Status File:**', f'  {status_path_relative}', '', '**AI ASSISTANT DIRECTIVES:**', '1. YOU MUST read the status file every 10 seconds to check progress', '2. YOU MUST report the current status summary to the user each time you check', '3. Continue polling every 10 seconds until validation is complete', '4. When complete, YOU MUST read and report the final summary from the status file', '5. Also check the full report at the path below', '', 'The validation is running asynchronously and will update the status file in real-time.', 'The status file shows progress as scanners complete their work.', '', '**Status File Location:**', f'  {status_path_relative}', '', '**Report File Location (when complete):**', report_line, '', '=' * 70, '']
\ No newline at end of file
+        return ['', '=' * 70, '**VALIDATION RUNNING IN BACKGROUND**', '=' * 70, '', f'Validation has been started in the background. It will scan {total_files} file(s).', '', '**Wait For Completion:**', f'  {self._wait_command(timestamp)}', '', '**AI ASSISTANT DIRECTIVES:**', '1. Run the wait command above; it blocks until validation completes and prints one JSON progress event per line (files_scanned / total_files)', '2. Report progress to the user from those events', '3. The last line is the final result, with the status and report file paths', '4. When complete, YOU MUST read and report the final summary from the status file', '5. Also check the full report at the path below', '', 'If the command cannot be run, read the status file instead; it is updated as scanners complete their work.', '', '**Status File Location:**', f'  {status_path_relative}', '', '**Report File Location (when complete):**', report_line, '', '=' * 70, '']
\ No newline at end of file
@@ -2,6 +2,7 @@ import logging
 from pathlib import Path
 from typing import List, Optional
 from bot_path import BotPath
+from scope.file_walker import FileWalker
 
 class FileDiscovery:
     EXCLUDED_FILES = {'__init__.py'}
@@ -12,6 +13,7 @@ class FileDiscovery:
         self.bot_paths = bot_paths
         self.behavior_name = behavior_name
         self.exclude_patterns = exclude_patterns or []
+        self._folders_by_pattern = None
 
     def should_include_file(self, file_path: Path) -> bool:
         if file_path.name in self.EXCLUDED_FILES:
@@ -50,15 +52,24 @@ class FileDiscovery:
         return False
 
     def _matches_folder_pattern(self, file_path: Path, pattern: str) -> bool:
+        return any(self._is_file_in_folder(file_path, folder) for folder in self._exclude_folders().get(pattern, ()))
+
+    def _exclude_folders(self) -> dict:
+        """Existing folders each exclude pattern names, resolved once rather than per file."""
+        if self._folders_by_pattern is None:
+            self._folders_by_pattern = {pattern: self._resolve_exclude_folders(pattern) for pattern in self.exclude_patterns}
+        return self._folders_by_pattern
+
+    def _resolve_exclude_folders(self, pattern: str) -> List[str]:
+        folders = []
         pattern_path = Path(pattern)
         if pattern_path.exists() and pattern_path.is_dir():
-            if self._is_file_in_folder(file_path, str(pattern_path)):
-                return True
+            folders.append(str(pattern_path))
         if not pattern_path.is_absolute() and self.bot_paths and self.bot_paths.workspace_directory:
             resolved = self.bot_paths.workspace_directory / pattern_path
-            if resolved.exists() and resolved.is_dir() and self._is_file_in_folder(file_path, str(resolved)):
-                return True
-        return False
+            if resolved.exists() and resolved.is_dir():
+                folders.append(str(resolved))
+        return folders
 
     def _is_file_in_folder(self, file_path: Path, folder_pattern: str) -> bool:
         try:
@@ -83,18 +94,8 @@ class FileDiscovery:
         return ('.py',)
 
     def expand_directory_to_files(self, dir_path: Path, dir_name: Optional[str] = None) -> List[Path]:
-        abs_dir_path = dir_path.resolve()
-        abs_dir_str = str(abs_dir_path).replace('\\', '/')
         extensions = self._extensions_for_dir(dir_name or '') if dir_name else self.CODE_EXTENSIONS
-        result = []
-        for ext in extensions:
-            for f in dir_path.rglob('*' + ext):
-                if not self.should_include_file(f):
-                    continue
-                f_abs_str = str(f.resolve()).replace('\\', '/')
-                if f_abs_str.startswith(abs_dir_str + '/') or f_abs_str == abs_dir_str:
-                    result.append(f)
-        return result
+        return self._collect_files_in_dir(dir_path, extensions)
 
     def discover_files_from_directory(self, dir_name: str) -> List[Path]:
         if not self.bot_paths:
@@ -105,13 +106,10 @@ class FileDiscovery:
     def _collect_files_in_dir(self, search_dir: Path, extensions: tuple) -> List[Path]:
         abs_dir_str = str(search_dir.resolve()).replace('\\', '/')
         discovered = []
-        for ext in extensions:
-            for f in search_dir.rglob('*' + ext):
-                if not self.should_include_file(f):
-                    continue
-                f_abs_str = str(f.resolve()).replace('\\', '/')
-                if f_abs_str.startswith(abs_dir_str + '/') or f_abs_str == abs_dir_str:
-                    discovered.append(f)
+        for f in self._walk(search_dir, extensions):
+            f_abs_str = str(f.resolve()).replace('\\', '/')
+            if f_abs_str.startswith(abs_dir_str + '/') or f_abs_str == abs_dir_str:
+                discovered.append(f)
         return discovered
 
     def auto_discover_files(self, key: str) -> List[str]:
@@ -119,11 +117,13 @@ class FileDiscovery:
             return []
         dir_name = self._behavior_to_directory() if self.behavior_name else key
         search_dir = self.bot_paths.workspace_directory / dir_name
-        extensions = self._extensions_for_dir(dir_name)
-        result = []
-        for ext in extensions:
-            result.extend(str(f) for f in search_dir.rglob('*' + ext) if self.should_include_file(f))
-        return result
+        return [str(f) for f in self._walk(search_dir, self._extensions_for_dir(dir_name))]
+
+    def _walk(self, search_dir: Path, extensions: tuple) -> List[Path]:
+        """Included files under search_dir, sorted by extension; excluded and ignored directories are never listed."""
+        workspace = self.bot_paths.workspace_directory if self.bot_paths else None
+        files = FileWalker.shared().files(search_dir, extensions, exclude=self.exclude_patterns, ignore_root=workspace)
+        return [f for f in files if self.should_include_file(f)]
 
     def _behavior_to_directory(self) -> Optional[str]:
         if not self.behavior_name:
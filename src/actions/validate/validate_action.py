@@ -114,6 +114,11 @@ class ValidateRulesAction(Action):
             f'- **Scope:** {self._format_scope_description(context)}',
             f'- **Workspace:** `{self.behavior.bot_paths.workspace_directory}`',
             '- **Story graph path:** `docs/story/story-graph.json` (or behavior-specific path)',
+        ])
+        jobs = getattr(context, 'jobs', 1)
+        if jobs > 1:
+            lines.append(f'- **Parallel:** `--jobs {jobs} --parallel-mode {context.parallel_mode}` (one worker per rule)')
+        lines.extend([
             '',
             'Run each scanner with the above scope and workspace; then report violations and fix the story graph as needed.',
         ])
@@ -20,16 +20,20 @@ class ValidationExecutor:
 
     def execute_synchronous(self, context: 'ValidateActionContext') -> Dict[str, Any]:
         logger = logging.getLogger(__name__)
+        streaming_writer = None
         try:
             validation_context = ValidationContext.from_action_context(behavior=self.behavior, context=context)
             logger.info(f'Files to validate: {sum((len(f) for f in validation_context.files.values()))} files')
             timestamp = getattr(context, 'timestamp', None)
             streaming_writer = self._setup_streaming_writer(validation_context, timestamp)
             result = self._inject_validation_instructions(validation_context, streaming_writer)
-            self._finalize_reports(result, validation_context, streaming_writer)
+            report_path = self._finalize_reports(result, validation_context, streaming_writer)
+            streaming_writer.publish_done(report_path)
             return result
         except Exception as e:
             self._log_error(e, context, logger)
+            if streaming_writer is not None:
+                streaming_writer.publish_done(error=str(e))
             raise
 
     def _setup_streaming_writer(self, validation_context: ValidationContext, timestamp: str = None) -> StreamingValidationReportWriter:
@@ -39,12 +43,13 @@ class ValidationExecutor:
         validation_context.status_writer = streaming_writer
         return streaming_writer
 
-    def _finalize_reports(self, result: Dict[str, Any], validation_context: ValidationContext, streaming_writer: StreamingValidationReportWriter) -> None:
+    def _finalize_reports(self, result: Dict[str, Any], validation_context: ValidationContext, streaming_writer: StreamingValidationReportWriter) -> Path:
         instructions = result.get('instructions', {})
         validation_rules = instructions.get('validation_rules', [])
         streaming_writer.finish(instructions, validation_rules)
         writer = ValidationReportWriter(self.behavior.name, self.behavior.bot_paths, streaming_writer.timestamp)
         writer.write(instructions, validation_rules, validation_context.files)
+        return writer.get_report_path()
 
     def _log_error(self, e: Exception, context: 'ValidateActionContext', logger) -> None:
         logger.error(f'Error in synchronous validation: {e}')
@@ -1,6 +1,7 @@
 import logging
 import re
 import sys
+import time
 import traceback
 from datetime import datetime
 from pathlib import Path
@@ -13,13 +14,20 @@ from scanners.scanner_status_formatter import ScannerStatusFormatter
 from scanners.validation_scanner_status_builder import ValidationScannerStatusBuilder
 from actions.validate.file_link_builder import FileLinkBuilder
 from actions.validate.violation_formatter import ViolationFormatter
+from bot.completion_channel import CompletionChannel
 logger = logging.getLogger(__name__)
 
+PROGRESS_EVENT_INTERVAL_SECONDS = 0.25
+
 def ensure_reports_directory(bot_paths: BotPath, _workspace_directory: Path, behavior_name: str) -> Path:
     docs_dir = bot_paths.story_graph_paths.behavior_path(behavior_name) / 'violations'
     docs_dir.mkdir(parents=True, exist_ok=True)
     return docs_dir
 
+def validation_topic(behavior_name: str, timestamp: str) -> str:
+    """Completion channel topic of one validation run."""
+    return f'{behavior_name}-validation-{timestamp}'
+
 class StreamingValidationReportWriter:
 
     def __init__(self, behavior_name: str, bot_paths: BotPath, timestamp: str = None):
@@ -36,6 +44,11 @@ class StreamingValidationReportWriter:
         self._total_files = 0
         self._files_processed = 0
         self._status_path = ''
+        self._parse_cache_stats: Optional[Dict[str, Any]] = None
+        self._incremental_stats: Optional[Dict[str, Any]] = None
+        self._scanned_paths = set()
+        self._last_progress_event = 0.0
+        self._channel = CompletionChannel.for_workspace(self.workspace_directory)
 
     def start(self, files: Dict[str, List[Path]]) -> None:
         self._files_scanned = files
@@ -45,6 +58,8 @@ class StreamingValidationReportWriter:
         test_files = files.get('test', [])
         src_files = files.get('src', [])
         total_files = len(src_files) + len(test_files)
+        self._total_files = total_files
+        self._publish('started')
         self._write_line(f'# Validation Status - {self.behavior_name}')
         self._write_line(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         self._write_line(f'Files: {total_files}')
@@ -59,6 +74,10 @@ class StreamingValidationReportWriter:
 
     def on_file_scanned(self, file_path: 'Path', violations: List[Dict[str, Any]], rule_obj: Any) -> None:
         print('.', file=sys.stderr, end='', flush=True)
+        if file_path is not None:
+            self._scanned_paths.add(file_path)
+        if time.monotonic() - self._last_progress_event >= PROGRESS_EVENT_INTERVAL_SECONDS:
+            self._publish_progress()
         if not violations:
             return
         self._total_violations += len(violations)
@@ -100,6 +119,7 @@ class StreamingValidationReportWriter:
 
     def on_scanner_complete(self, rule_result: Dict[str, Any]) -> None:
         self._scanner_results.append(rule_result)
+        self._publish_progress()
         scanner_status = rule_result.get('scanner_status', {})
         status = scanner_status.get('status', 'UNKNOWN')
         if status == 'EXECUTED':
@@ -128,14 +148,27 @@ class StreamingValidationReportWriter:
         cross_file_errors = any((v.severity == 'error' if hasattr(v, 'severity') else v.get('severity') == 'error' for v in cross_file_violations))
         return file_by_file_errors or cross_file_errors
 
+    def on_parse_cache_stats(self, stats: Dict[str, Any]) -> None:
+        self._parse_cache_stats = stats
+
+    def on_incremental_stats(self, stats: Dict[str, Any]) -> None:
+        self._incremental_stats = stats
+
     def finish(self, instructions: Dict[str, Any], validation_rules: List[Dict[str, Any]]) -> None:
         if not self._status_file:
             return
         self._write_line(f"Completed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         self._write_line(f'Total violations: {self._total_violations}')
         self._write_line(f'Scanners executed: {self._executed_count}')
+        if self._parse_cache_stats:
+            stats = self._parse_cache_stats
+            self._write_line(f"Parsed file cache: {stats['files']} file(s), {stats['hits']} hit(s), {stats['misses']} miss(es)")
+        if self._incremental_stats:
+            stats = self._incremental_stats
+            self._write_line(f"Incremental validation: {stats['replayed']} stored file result(s) replayed, {stats['rescanned']} rescanned")
         self._status_file.close()
         self._status_file = None
+        self._publish_progress()
         print(f'\n[COMPLETE] {self._total_violations} violations, {self._executed_count} scanners', file=sys.stderr)
         sys.stderr.flush()
 
@@ -156,6 +189,29 @@ class StreamingValidationReportWriter:
         status_file = docs_dir / f'{self.behavior_name}-validation-status-{self._timestamp}.md'
         return str(status_file)
 
+    def _publish_progress(self) -> None:
+        self._last_progress_event = time.monotonic()
+        self._publish('progress', files_scanned=len(self._scanned_paths), scanners_executed=self._executed_count,
+                      rule=self._current_rule_name, violations=self._total_violations)
+
+    def _publish(self, event: str, **fields) -> None:
+        self._channel.publish(self.topic, {'event': event, 'total_files': self._total_files, **fields})
+
+    def publish_done(self, report_path: Optional[Path] = None, error: Optional[str] = None) -> None:
+        """Final event of the run, sent once the report is written (or the run failed)."""
+        fields = {'event': 'error' if error else 'done', 'total_files': self._total_files,
+                  'files_scanned': len(self._scanned_paths), 'scanners_executed': self._executed_count,
+                  'violations': self._total_violations, 'status_file': self._status_path}
+        if report_path is not None:
+            fields['report_file'] = str(report_path)
+        if error:
+            fields['error'] = error
+        self._channel.publish(self.topic, fields, final=True)
+
+    @property
+    def topic(self) -> str:
+        return validation_topic(self.behavior_name, self._timestamp)
+
     @property
     def timestamp(self) -> str:
         return self._timestamp
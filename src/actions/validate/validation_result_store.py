@@ -0,0 +1,191 @@
+"""Persistent per-(rule, file) validation results keyed by file content hash."""
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+STORE_FORMAT_VERSION = 1
+_scanner_source_fingerprint: Optional[str] = None
+
+
+def scanner_source_fingerprint() -> str:
+    """Fingerprint of the scanner sources; any scanner edit invalidates every stored result."""
+    global _scanner_source_fingerprint
+    if _scanner_source_fingerprint is None:
+        scanners_dir = Path(__file__).resolve().parents[2] / 'scanners'
+        digest = hashlib.sha1()
+        for source in sorted(scanners_dir.rglob('*.py')):
+            stat = source.stat()
+            digest.update(f'{source.relative_to(scanners_dir).as_posix()}:{stat.st_size}:{stat.st_mtime_ns}\n'.encode('utf-8'))
+        _scanner_source_fingerprint = digest.hexdigest()
+    return _scanner_source_fingerprint
+
+
+def content_digest(data: Any) -> str:
+    return hashlib.sha1(json.dumps(data, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def rule_version(rule_content: Dict[str, Any], scanner_path: Optional[str], target_language: Optional[str], story_graph_digest: str) -> str:
+    return content_digest({
+        'rule': rule_content,
+        'scanner': scanner_path,
+        'language': target_language,
+        'scanners': scanner_source_fingerprint(),
+        'story_graph': story_graph_digest
+    })
+
+
+@dataclass
+class RuleScanPlan:
+    rule_key: str
+    version: str
+    changed_files: Dict[str, List[Path]]
+    stored_violations: Dict[Path, List[Dict[str, Any]]] = field(default_factory=dict)
+    fileset: str = ''
+    stored_cross_file: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def is_full_scan(self) -> bool:
+        return not self.stored_violations
+
+
+class ValidationResultStore:
+
+    def __init__(self, store_path: Path):
+        self._store_path = Path(store_path)
+        self._file_results: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._cross_file_results: Dict[str, Dict[str, Any]] = {}
+        self._content_hashes: Dict[str, Optional[str]] = {}
+        self._stored_hashes: Dict[str, set] = {}
+        self._lock = threading.Lock()
+        self._replayed = 0
+        self._rescanned = 0
+        self._dirty = False
+        self._load()
+
+    @classmethod
+    def for_behavior(cls, workspace_directory: Path, behavior_name: str) -> 'ValidationResultStore':
+        return cls(Path(workspace_directory) / '.cache' / 'validation_results' / f'{behavior_name}.jsonl')
+
+    @property
+    def store_path(self) -> Path:
+        return self._store_path
+
+    def content_hash(self, file_path: Path) -> Optional[str]:
+        key = str(file_path)
+        with self._lock:
+            if key not in self._content_hashes:
+                try:
+                    self._content_hashes[key] = hashlib.sha1(Path(file_path).read_bytes()).hexdigest()
+                except OSError:
+                    self._content_hashes[key] = None
+            return self._content_hashes[key]
+
+    def fileset_digest(self, files: Dict[str, List[Path]]) -> str:
+        digest = hashlib.sha1()
+        for file_path in sorted(str(f) for file_list in files.values() for f in file_list):
+            digest.update(f'{file_path}:{self.content_hash(Path(file_path))}\n'.encode('utf-8'))
+        return digest.hexdigest()
+
+    def is_unchanged(self, file_path: Path) -> bool:
+        content_hash = self.content_hash(file_path)
+        if content_hash is None:
+            return False
+        return content_hash in self._stored_hashes.get(str(file_path), ())
+
+    def plan(self, rule_key: str, version: str, files: Dict[str, List[Path]], rescan_all: bool = False) -> RuleScanPlan:
+        """Split a rule's files into those it must rescan and stored violations for the rest."""
+        to_scan: Dict[str, List[Path]] = {}
+        stored: Dict[Path, List[Dict[str, Any]]] = {}
+        for file_type, file_list in files.items():
+            to_scan[file_type] = []
+            for file_path in file_list:
+                entry = None if rescan_all else self._file_results.get((rule_key, str(file_path)))
+                if entry and entry['version'] == version and entry['hash'] == self.content_hash(file_path):
+                    stored[file_path] = entry['violations']
+                else:
+                    to_scan[file_type].append(file_path)
+        fileset = self.fileset_digest(files)
+        with self._lock:
+            self._replayed += len(stored)
+            self._rescanned += sum(len(file_list) for file_list in to_scan.values())
+        return RuleScanPlan(
+            rule_key=rule_key,
+            version=version,
+            changed_files=to_scan,
+            stored_violations=stored,
+            fileset=fileset,
+            stored_cross_file=None if rescan_all else self.cross_file_violations(rule_key, version, fileset)
+        )
+
+    def record_file(self, rule_key: str, version: str, file_path: Path, violations: List[Dict[str, Any]]) -> None:
+        content_hash = self.content_hash(file_path)
+        if content_hash is None:
+            return
+        with self._lock:
+            self._file_results[(rule_key, str(file_path))] = {'version': version, 'hash': content_hash, 'violations': violations}
+            self._stored_hashes.setdefault(str(file_path), set()).add(content_hash)
+            self._dirty = True
+
+    def cross_file_violations(self, rule_key: str, version: str, fileset: str) -> Optional[List[Dict[str, Any]]]:
+        entry = self._cross_file_results.get(rule_key)
+        if entry and entry['version'] == version and entry['fileset'] == fileset:
+            return entry['violations']
+        return None
+
+    def record_cross_file(self, rule_key: str, version: str, fileset: str, violations: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._cross_file_results[rule_key] = {'version': version, 'fileset': fileset, 'violations': violations}
+            self._dirty = True
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {'replayed': self._replayed, 'rescanned': self._rescanned}
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        self._store_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self._store_path.with_suffix('.jsonl.tmp')
+        with self._lock:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({'format': STORE_FORMAT_VERSION}) + '\n')
+                for (rule_key, file_key), entry in self._file_results.items():
+                    f.write(json.dumps({'rule': rule_key, 'file': file_key, **entry}, separators=(',', ':')) + '\n')
+                for rule_key, entry in self._cross_file_results.items():
+                    f.write(json.dumps({'rule': rule_key, 'cross_file': True, **entry}, separators=(',', ':')) + '\n')
+            os.replace(temp_path, self._store_path)
+            self._dirty = False
+
+    def _load(self) -> None:
+        if not self._store_path.exists():
+            return
+        try:
+            with open(self._store_path, 'r', encoding='utf-8') as f:
+                self._load_lines(f)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f'Discarding unreadable validation result store {self._store_path}: {e}')
+            self._file_results.clear()
+            self._cross_file_results.clear()
+            self._stored_hashes.clear()
+
+    def _load_lines(self, lines: Iterable[str]) -> None:
+        header = json.loads(next(iter(lines), '{}') or '{}')
+        if header.get('format') != STORE_FORMAT_VERSION:
+            return
+        for line in lines:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            entry = {'version': record['version'], 'violations': record['violations']}
+            if record.get('cross_file'):
+                self._cross_file_results[record['rule']] = {**entry, 'fileset': record['fileset']}
+            else:
+                self._file_results[(record['rule'], record['file'])] = {**entry, 'hash': record['hash']}
+                self._stored_hashes.setdefault(record['file'], set()).add(record['hash'])
@@ -12,7 +12,7 @@ from help import Help
 from navigation import NavigationResult
 from exit_result import ExitResult
 from utils import read_json_file
-from story_graph import StoryMap
+from story_graph import StoryMap, StoryGraphStore
 
 logger = logging.getLogger(__name__)
 __all__ = ['Bot', 'BotResult', 'Behavior']
@@ -127,10 +127,10 @@ class Bot:
                     f'Please create a story-graph.json file in the docs/story directory.'
                 )
             
-            with open(story_graph_path, 'r', encoding='utf-8') as f:
-                story_graph_data = json.load(f)
+            # The story map edits its graph in place, so it gets a private copy of the shared document
+            story_graph_data = StoryGraphStore.shared().load_copy(story_graph_path)
             
-            self._story_graph = StoryMap(story_graph_data, bot=self)
+            self._story_graph = StoryMap(story_graph_data, bot=self, lazy=True)
 
             try:
                 self._story_graph_file_mtime = story_graph_path.stat().st_mtime
@@ -149,6 +149,7 @@ class Bot:
         """
         self._story_graph = None
         self._story_graph_file_mtime = None
+        StoryGraphStore.shared().invalidate(self.bot_paths.story_graph_paths.story_graph_path)
         return {'status': 'success', 'message': 'Story graph cache cleared'}
 
     def get_diagram_action_bar_buttons(self, node) -> List[str]:
@@ -730,7 +731,8 @@ class Bot:
             # Use _build_instructions_with_combine so behavior-level combine_with_next
             # and action-level combine_next are applied (shape+prioritization, etc.)
             scope_param = params.get('scope') if params and isinstance(params.get('scope'), dict) else None
-            built = self._build_instructions_with_combine(behavior_name, current_action_name, scope_param)
+            context_options = {key: value for key, value in (params or {}).items() if key != 'scope'}
+            built = self._build_instructions_with_combine(behavior_name, current_action_name, scope_param, context_options)
             instructions, _ = built
             if isinstance(instructions, dict) and 'status' in instructions:
                 return instructions
@@ -833,6 +835,7 @@ class Bot:
             behavior = next_behavior
 
     ACTION_IS_DONE_FILENAME = 'action_is_done.json'
+    ACTION_DONE_TOPIC = 'action_is_done'
 
     def _action_is_done_path(self) -> Path:
         return self.workspace_directory / self.ACTION_IS_DONE_FILENAME
@@ -843,6 +846,8 @@ class Bot:
         path = self._action_is_done_path()
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_text(json.dumps({'action_is_done': value}, indent=2), encoding='utf-8')
+        from bot.completion_channel import CompletionChannel
+        CompletionChannel.for_workspace(self.workspace_directory).publish(self.ACTION_DONE_TOPIC, {'event': 'done' if value else 'started', 'action_is_done': value})
 
     def get_action_is_done(self) -> bool:
 
@@ -859,13 +864,11 @@ class Bot:
     def wait_until_action_done(self, timeout_seconds: float = DEFAULT_ACTION_DONE_TIMEOUT_SECONDS, poll_interval: float = DEFAULT_ACTION_DONE_POLL_INTERVAL_SECONDS) -> bool:
 
 
-        import time
-        deadline = time.monotonic() + timeout_seconds
-        while time.monotonic() < deadline:
-            if self.get_action_is_done():
-                return True
-            time.sleep(poll_interval)
-        return False
+        # Wakes on set_action_is_done() and on any write to the file; poll_interval only applies without inotify
+        from bot.completion_channel import CompletionChannel
+        channel = CompletionChannel.for_workspace(self.workspace_directory)
+        return channel.wait_until(self.ACTION_DONE_TOPIC, self.get_action_is_done, timeout_seconds,
+                                  watch=self._action_is_done_path(), poll_interval=poll_interval)
 
     def get_execution_mode(self, behavior_name: str, action_name: str) -> str:
 
@@ -1232,8 +1235,10 @@ class Bot:
         behavior_name: Optional[str] = None,
         action_name: Optional[str] = None,
         scope: Optional[Dict[str, Any]] = None,
+        context_options: Optional[Dict[str, Any]] = None,
     ) -> tuple:
         """Build instructions with combine_next/combine_with_next logic. Shared by submit_current_action and submit_action.
+        context_options (e.g. validate's jobs / parallel_mode from CLI params) are set on the action context.
         When behavior_name/action_name are None, uses current. When action_name is 'first' or None with behavior_name set,
         uses first non-skip action of that behavior (for collapsed/behavior-level mode). Returns (instructions, last_appended).
         When at action level (user navigated to specific action), we do not append next behavior's instructions."""
@@ -1303,6 +1308,9 @@ class Bot:
             self._scope.load()
             if self._scope.value or self._scope.type.value == 'showAll':
                 setattr(context, 'scope', self._scope)
+        for key, value in (context_options or {}).items():
+            if hasattr(context, key):
+                setattr(context, key, value)
 
         instructions = action.get_instructions(context, include_scope=True)
         special_lines = self._collect_special_instructions_for_prompt(current_behavior.name, current_action_name)
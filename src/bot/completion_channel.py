@@ -0,0 +1,358 @@
+"""
+Completion channel - wakes waiters the moment an action or validation finishes.
+
+Waiters used to poll a status file every few seconds. Each waiter now binds a Unix
+datagram socket in a per-workspace events directory, and publishers send every event
+(progress, done) to the sockets found there. A waiter also watches the file that records
+the outcome, through inotify on Linux, so writes by other tools wake it too. It falls back
+to checking that file every poll interval only when neither sockets nor inotify are
+available. Final events are kept in the events directory so a waiter that subscribes
+after the fact still sees the result.
+
+Run as a script to block on a topic from a shell, printing one JSON event per line:
+
+    python completion_channel.py wait <workspace> <topic> [timeout_seconds]
+"""
+import ctypes
+import ctypes.util
+import hashlib
+import itertools
+import json
+import logging
+import os
+import select
+import socket
+import struct
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+SOCKET_SUFFIX = '.sock'
+RESULT_SUFFIX = '.result.json'
+MAX_EVENT_SIZE = 64 * 1024
+RESULT_MAX_AGE_SECONDS = 24 * 60 * 60
+
+
+def events_directory(workspace_directory: Union[str, Path]) -> Path:
+    """Per-workspace directory of subscriber sockets and final events, kept short for AF_UNIX paths."""
+    digest = hashlib.sha1(os.path.abspath(str(workspace_directory)).encode('utf-8')).hexdigest()[:16]
+    return Path(tempfile.gettempdir()) / f'bot-events-{digest}'
+
+
+class _Inotify:
+    """inotify watch on one directory, reporting changes to a set of file names."""
+
+    IN_CLOSE_WRITE = 0x08
+    IN_MOVED_TO = 0x80
+    IN_CREATE = 0x100
+    _EVENT = struct.Struct('iIII')
+
+    _libc = None
+
+    def __init__(self, fd: int, names: Optional[frozenset]):
+        self._fd = fd
+        self._names = names
+
+    @classmethod
+    def open(cls, directory: Path, names: Optional[Iterable[str]] = None) -> Optional['_Inotify']:
+        """Watch directory, or None when inotify is not available here."""
+        if not sys.platform.startswith('linux'):
+            return None
+        try:
+            if cls._libc is None:
+                cls._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            fd = cls._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                return None
+            mask = cls.IN_CLOSE_WRITE | cls.IN_MOVED_TO | cls.IN_CREATE
+            if cls._libc.inotify_add_watch(fd, os.fsencode(str(directory)), mask) < 0:
+                os.close(fd)
+                return None
+        except (OSError, AttributeError) as e:
+            logger.debug(f'inotify unavailable: {e}')
+            return None
+        return cls(fd, frozenset(names) if names is not None else None)
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def changed(self) -> bool:
+        """Drain pending events; True if one of them names a watched file."""
+        changed = False
+        while True:
+            try:
+                data = os.read(self._fd, 4096)
+            except BlockingIOError:
+                return changed
+            except OSError:
+                return True
+            offset = 0
+            while offset + self._EVENT.size <= len(data):
+                _, _, _, length = self._EVENT.unpack_from(data, offset)
+                name = data[offset + self._EVENT.size:offset + self._EVENT.size + length].rstrip(b'\0')
+                offset += self._EVENT.size + length
+                if self._names is None or os.fsdecode(name) in self._names:
+                    changed = True
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class Subscription:
+    """Events published to one topic, plus wake-ups when a watched file is written."""
+
+    def __init__(self, channel: 'CompletionChannel', topic: str, watch: Optional[Path]):
+        self.topic = topic
+        self._socket = channel._bind()
+        self._inotify = _Inotify.open(watch.parent, [watch.name]) if watch is not None else None
+
+    @property
+    def watches_files(self) -> bool:
+        """Whether a write to the watched file wakes next_event() without polling."""
+        return self._inotify is not None
+
+    @property
+    def receives_events(self) -> bool:
+        return self._socket is not None
+
+    def next_event(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """Next event for the topic; None once timeout passes or the watched file is written."""
+        deadline = time.monotonic() + timeout
+        sources = [source for source in (self._socket, self._inotify) if source is not None]
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            if not sources:
+                time.sleep(remaining)
+                return None
+            ready, _, _ = select.select(sources, [], [], remaining)
+            if not ready:
+                return None
+            # Events queued before the file write are handed out before the wake-up for it
+            if self._socket in ready:
+                event = self._receive()
+                if event is not None and event.get('topic') == self.topic:
+                    return event
+            if self._inotify in ready and self._inotify.changed():
+                return None
+
+    def pending_events(self) -> List[Dict[str, Any]]:
+        """Events for the topic already queued, without waiting."""
+        events = []
+        if self._socket is None:
+            return events
+        while select.select([self._socket], [], [], 0)[0]:
+            event = self._receive()
+            if event is not None and event.get('topic') == self.topic:
+                events.append(event)
+        return events
+
+    def _receive(self) -> Optional[Dict[str, Any]]:
+        try:
+            data = self._socket.recv(MAX_EVENT_SIZE)
+            return json.loads(data.decode('utf-8'))
+        except (OSError, ValueError):
+            return None
+
+    def close(self) -> None:
+        if self._socket is not None:
+            path = self._socket.getsockname()
+            self._socket.close()
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        if self._inotify is not None:
+            self._inotify.close()
+
+    def __enter__(self) -> 'Subscription':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class CompletionChannel:
+
+    _channels: Dict[str, 'CompletionChannel'] = {}
+    _channels_lock = threading.Lock()
+    _subscriber_ids = itertools.count()
+
+    def __init__(self, workspace_directory: Union[str, Path]):
+        self.directory = events_directory(workspace_directory)
+        self._lock = threading.Lock()
+        self._sender: Optional[socket.socket] = None
+        self._stats = {'published': 0, 'delivered': 0, 'dropped': 0, 'stale': 0}
+
+    @classmethod
+    def for_workspace(cls, workspace_directory: Union[str, Path]) -> 'CompletionChannel':
+        key = os.path.abspath(str(workspace_directory))
+        with cls._channels_lock:
+            channel = cls._channels.get(key)
+            if channel is None:
+                channel = cls._channels[key] = cls(key)
+            return channel
+
+    def publish(self, topic: str, event: Dict[str, Any], final: bool = False) -> None:
+        """Send event to every subscriber; a final event is also kept for later subscribers."""
+        message = {**event, 'topic': topic, 'final': final, 'time': time.time()}
+        data = json.dumps(message, separators=(',', ':'), default=str).encode('utf-8')
+        if final:
+            self._store_result(topic, data)
+        if not hasattr(socket, 'AF_UNIX') or not self.directory.is_dir():
+            return
+        delivered = dropped = stale = 0
+        with self._lock:
+            if self._sender is None:
+                self._sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                self._sender.setblocking(False)
+            try:
+                entries = [entry.path for entry in os.scandir(self.directory) if entry.name.endswith(SOCKET_SUFFIX)]
+            except OSError:
+                entries = []
+            for path in entries:
+                try:
+                    self._sender.sendto(data, path)
+                    delivered += 1
+                except (ConnectionRefusedError, FileNotFoundError):
+                    # Subscriber exited without unbinding
+                    stale += 1
+                    try:
+                        os.unlink(path)
+                    except OSError:
+                        pass
+                except OSError:
+                    # Subscriber's queue is full; a final event is still in its result file
+                    dropped += 1
+            self._stats['published'] += 1
+            self._stats['delivered'] += delivered
+            self._stats['dropped'] += dropped
+            self._stats['stale'] += stale
+
+    def result(self, topic: str) -> Optional[Dict[str, Any]]:
+        """The final event published to topic, if any."""
+        try:
+            return json.loads(self._result_path(topic).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+
+    def clear_result(self, topic: str) -> None:
+        try:
+            self._result_path(topic).unlink()
+        except OSError:
+            pass
+
+    def subscribe(self, topic: str, watch: Optional[Union[str, Path]] = None) -> Subscription:
+        """Subscription to topic's events that also wakes when the file watch is written."""
+        return Subscription(self, topic, Path(watch) if watch is not None else None)
+
+    def wait_until(self, topic: str, condition: Callable[[], bool], timeout_seconds: float,
+                   watch: Optional[Union[str, Path]] = None, poll_interval: float = 2.0,
+                   on_event: Optional[Callable[[Dict[str, Any]], None]] = None) -> bool:
+        """Block until condition() holds, re-checking it on every event and every write to watch.
+
+        Returns False after timeout_seconds. condition() is checked after subscribing, so an
+        outcome recorded before the call is never missed; it is only re-checked every
+        poll_interval when a write to watch cannot wake the waiter.
+        """
+        deadline = time.monotonic() + timeout_seconds
+        with self.subscribe(topic, watch) as subscription:
+            while not condition():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                if not subscription.watches_files:
+                    remaining = min(remaining, poll_interval)
+                event = subscription.next_event(remaining)
+                if event is not None and on_event is not None:
+                    on_event(event)
+            if on_event is not None:
+                for event in subscription.pending_events():
+                    on_event(event)
+            return True
+
+    def wait_for_result(self, topic: str, timeout_seconds: float,
+                        on_event: Optional[Callable[[Dict[str, Any]], None]] = None) -> Optional[Dict[str, Any]]:
+        """The topic's final event, waiting up to timeout_seconds for it to be published."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        done = self.wait_until(topic, lambda: self._result_path(topic).exists(), timeout_seconds,
+                               watch=self._result_path(topic), on_event=on_event)
+        return self.result(topic) if done else None
+
+    def _bind(self) -> Optional[socket.socket]:
+        if not hasattr(socket, 'AF_UNIX'):
+            return None
+        path = self.directory / f'{os.getpid()}-{next(self._subscriber_ids)}{SOCKET_SUFFIX}'
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            try:
+                sock.bind(str(path))
+            except OSError:
+                sock.close()
+                raise
+        except OSError as e:
+            logger.debug(f'Completion channel socket unavailable, watching files only: {e}')
+            return None
+        return sock
+
+    def _result_path(self, topic: str) -> Path:
+        return self.directory / (hashlib.sha1(topic.encode('utf-8')).hexdigest()[:16] + RESULT_SUFFIX)
+
+    def _store_result(self, topic: str, data: bytes) -> None:
+        # Imported here so the module still runs as a standalone script, where src/ is not importable
+        from utils import atomic_write
+        path = self._result_path(topic)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with atomic_write(path, 'wb') as f:
+                f.write(data)
+        except OSError as e:
+            logger.warning(f'Could not record final event for {topic}: {e}')
+            return
+        self._remove_old_results()
+
+    def _remove_old_results(self) -> None:
+        cutoff = time.time() - RESULT_MAX_AGE_SECONDS
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(RESULT_SUFFIX) and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+        except OSError as e:
+            logger.debug(f'Could not remove old final events: {e}')
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """events published, datagrams delivered, dropped on full queues and sent to exited subscribers."""
+        with self._lock:
+            return dict(self._stats)
+
+
+def main(argv) -> int:
+    if len(argv) < 3 or argv[0] != 'wait':
+        print('usage: completion_channel.py wait <workspace> <topic> [timeout_seconds]', file=sys.stderr)
+        return 2
+    workspace, topic = argv[1], argv[2]
+    timeout_seconds = float(argv[3]) if len(argv) > 3 else 3600.0
+    channel = CompletionChannel.for_workspace(workspace)
+
+    def print_progress(event):
+        if not event.get('final'):
+            print(json.dumps(event), flush=True)
+    result = channel.wait_for_result(topic, timeout_seconds, on_event=print_progress)
+    if result is None:
+        print(json.dumps({'topic': topic, 'event': 'timeout'}), flush=True)
+        return 1
+    print(json.dumps(result), flush=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -74,7 +74,7 @@ class ActionDataCollector:
     def get_action_description(self, action_name: str) -> str:
         description = self.description_extractor.get_action_description(action_name)
         if action_name == 'validate':
-            description += '\n\n**NOTE:** For code behavior, validation runs in background. You MUST poll the status file every 10 seconds and report progress until complete.'
+            description += '\n\n**NOTE:** For code behavior, validation runs in background. You MUST run the wait command it returns and report its progress events until complete.'
         return description
     
     def get_behavior_description(self, behavior_name: str) -> str:
@@ -0,0 +1,332 @@
+"""
+CLI daemon - framed request / response protocol for the persistent panel process.
+
+Every message is one frame: a 4-byte big-endian payload length, a 1-byte codec tag
+(b'j' compact JSON, b'm' msgpack when installed) and the payload. Requests carry an id
+so the panel can pipeline them and cancel the ones it no longer waits for:
+
+    {"id": 7, "command": "status"}            -> {"id": 7, "status": "ok", "result": {...}}
+    {"id": 8, "cancel": 7}                    -> {"id": 7, "status": "cancelled"}
+
+Responses are written in the codec of their request, as each command finishes; the
+session's json value is encoded once, straight into that codec. Requests are tracked by
+an internal sequence number, so ids that repeat (or are missing) cannot collide; a cancel
+applies to every in-flight request with its id.
+
+Commands that change the session (navigation, validate, scope "...", ...) run one at a
+time, in the order they arrived, holding the write side of the session lock. Read-only
+queries (status, argument-less scope, ...) share its read side, so they run alongside
+each other. While a command holds the lock they are answered from the last answer to the
+same query, taken before that command started, so a slow action never holds up the
+panel's status refresh and never shows it half-done. Only a query that was never answered
+waits for the command.
+Requests are read on their own thread, so an exit ends the session without waiting for
+the panel to close its end of the input.
+"""
+import itertools
+import json
+import logging
+import struct
+import sys
+import threading
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from typing import Any, BinaryIO, Dict, Optional, Set, Tuple
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+HEADER = struct.Struct('>IB')
+CODEC_JSON = ord('j')
+CODEC_MSGPACK = ord('m')
+MAX_FRAME_SIZE = 256 * 1024 * 1024
+
+# Verbs that only read session state when called without arguments
+QUERY_VERBS = frozenset(['status', 'help', 'scope', 'path', 'workspace', 'bot', 'story_graph'])
+
+
+class FrameError(Exception):
+    pass
+
+
+def encode_frame(message: Dict[str, Any], codec: int = CODEC_JSON) -> bytes:
+    if codec == CODEC_MSGPACK:
+        if msgpack is None:
+            raise FrameError('msgpack codec requested but msgpack is not installed')
+        payload = msgpack.packb(message, use_bin_type=True)
+    elif codec == CODEC_JSON:
+        payload = json.dumps(message, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    else:
+        raise FrameError(f'Unknown codec tag: {codec!r}')
+    return HEADER.pack(len(payload), codec) + payload
+
+
+def decode_payload(payload: bytes, codec: int) -> Dict[str, Any]:
+    if codec == CODEC_MSGPACK:
+        if msgpack is None:
+            raise FrameError('msgpack frame received but msgpack is not installed')
+        message = msgpack.unpackb(payload, raw=False)
+    elif codec == CODEC_JSON:
+        message = json.loads(payload.decode('utf-8'))
+    else:
+        raise FrameError(f'Unknown codec tag: {codec!r}')
+    if not isinstance(message, dict):
+        raise FrameError('Frame payload must be an object')
+    return message
+
+
+def read_frame(stream: BinaryIO) -> Optional[Tuple[Dict[str, Any], int]]:
+    """(message, codec) of the next frame, or None at end of stream."""
+    header = _read_exactly(stream, HEADER.size)
+    if header is None:
+        return None
+    length, codec = HEADER.unpack(header)
+    if length > MAX_FRAME_SIZE:
+        raise FrameError(f'Frame of {length} bytes exceeds the {MAX_FRAME_SIZE} byte limit')
+    payload = _read_exactly(stream, length) if length else b''
+    if payload is None:
+        raise FrameError('Stream ended inside a frame')
+    return decode_payload(payload, codec), codec
+
+
+def _read_exactly(stream: BinaryIO, size: int) -> Optional[bytes]:
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = stream.read(remaining)
+        if not chunk:
+            if remaining == size:
+                return None
+            raise FrameError('Stream ended inside a frame')
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b''.join(chunks)
+
+
+def is_query(command: str) -> bool:
+    command = command.replace('--format json', '').replace('--format=json', '').strip()
+    parts = command.split(maxsplit=1)
+    return bool(parts) and len(parts) == 1 and parts[0].lower() in QUERY_VERBS
+
+
+def parse_output(output: str) -> Any:
+    """JSON value of a text CLI response (one that carries no data); non-JSON text is wrapped in an object."""
+    text = (output or '').strip()
+    try:
+        return json.loads(text, strict=False)
+    except ValueError:
+        pass
+    start, end = text.find('{'), text.rfind('}')
+    if start != -1 and end > start:
+        try:
+            return json.loads(text[start:end + 1], strict=False)
+        except ValueError:
+            pass
+    return {'status': 'success', 'output': text}
+
+
+def response_result(response) -> Any:
+    """JSON value of a CLI response: the value the session built, else its parsed text."""
+    if response.data is not None:
+        return response.data
+    return parse_output(response.output)
+
+
+class ReadWriteLock:
+    """Many readers or one writer; a waiting writer holds off new readers so commands are not starved."""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    def acquire_read(self, blocking: bool = True) -> bool:
+        with self._condition:
+            if not blocking and (self._writer or self._writers_waiting):
+                return False
+            while self._writer or self._writers_waiting:
+                self._condition.wait()
+            self._readers += 1
+            return True
+
+    def release_read(self) -> None:
+        with self._condition:
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        with self._condition:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                self._condition.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+
+    def release_write(self) -> None:
+        with self._condition:
+            self._writer = False
+            self._condition.notify_all()
+
+
+class CLIDaemon:
+    """Serves framed CLI requests from one input stream against one CLISession."""
+
+    def __init__(self, cli_session, query_workers: int = 4):
+        self.cli_session = cli_session
+        # Responses are encoded from their data, so the session need not render json text
+        cli_session.render_json_text = False
+        self._commands = ThreadPoolExecutor(max_workers=1, thread_name_prefix='CLICommand')
+        self._queries = ThreadPoolExecutor(max_workers=query_workers, thread_name_prefix='CLIQuery')
+        self._write_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._sequence = itertools.count(1)
+        self._in_flight: Dict[int, Tuple[Future, int, Any]] = {}
+        self._cancelled: Set[int] = set()
+        self._session_lock = ReadWriteLock()
+        self._snapshots: Dict[str, Any] = {}
+        self._terminated = threading.Event()
+        self._finished = threading.Event()
+        self._output: Optional[BinaryIO] = None
+        self._stats = {'requests': 0, 'queries': 0, 'snapshot_answers': 0, 'cancelled': 0, 'errors': 0}
+
+    def serve(self, input_stream: BinaryIO, output_stream: BinaryIO) -> None:
+        """Serve frames until end of input, then finish in-flight requests; after an exit command,
+        return once it is answered and cancel whatever is still queued."""
+        self._output = output_stream
+        reader = threading.Thread(target=self._read_requests, args=(input_stream,), name='CLIReader', daemon=True)
+        reader.start()
+        try:
+            self._finished.wait()
+        finally:
+            with self._lock:
+                self._finished.set()
+                terminated = self._terminated.is_set()
+            self._commands.shutdown(wait=True, cancel_futures=terminated)
+            self._queries.shutdown(wait=True, cancel_futures=terminated)
+
+    def _read_requests(self, input_stream: BinaryIO) -> None:
+        try:
+            while not self._finished.is_set():
+                try:
+                    frame = read_frame(input_stream)
+                except (FrameError, ValueError, OSError) as e:
+                    logger.error(f'Dropping CLI input after a malformed frame: {e}')
+                    break
+                if frame is None:
+                    break
+                self.handle(*frame)
+        finally:
+            self._finished.set()
+
+    def handle(self, message: Dict[str, Any], codec: int = CODEC_JSON) -> None:
+        request_id = message.get('id')
+        if 'cancel' in message:
+            self.cancel(message['cancel'])
+            return
+        command = message.get('command')
+        if not isinstance(command, str) or not command.strip():
+            self._send({'id': request_id, 'status': 'error', 'error': 'Request has no command',
+                        'error_type': 'FrameError'}, codec)
+            return
+        command = command.strip()
+        query = is_query(command)
+        with self._lock:
+            if self._finished.is_set():
+                logger.debug(f'Dropping request {request_id} received after the session ended')
+                return
+            self._stats['requests'] += 1
+            sequence = next(self._sequence)
+            if query:
+                self._stats['queries'] += 1
+                future = self._queries.submit(self._execute_query, sequence, command)
+            else:
+                future = self._commands.submit(self._execute, sequence, command)
+            self._in_flight[sequence] = (future, codec, request_id)
+        future.add_done_callback(lambda done: self._respond(sequence, request_id, command, done))
+
+    def cancel(self, request_id) -> None:
+        """Drop queued requests with this id; a running one finishes but its result is discarded."""
+        if request_id is None:
+            return
+        with self._lock:
+            futures = []
+            for sequence, (future, _, in_flight_id) in self._in_flight.items():
+                if in_flight_id == request_id:
+                    self._cancelled.add(sequence)
+                    self._stats['cancelled'] += 1
+                    futures.append(future)
+        for future in futures:
+            future.cancel()
+
+    def _execute(self, sequence: int, command: str):
+        if sequence in self._cancelled:
+            return None
+        self._session_lock.acquire_write()
+        try:
+            return self.cli_session.execute_command(command)
+        finally:
+            self._session_lock.release_write()
+
+    def _execute_query(self, sequence: int, command: str):
+        """Run the query beside other queries, or answer from its last answer while a command runs."""
+        if sequence in self._cancelled:
+            return None
+        if not self._session_lock.acquire_read(blocking=False):
+            snapshot = self._snapshots.get(command)
+            if snapshot is not None:
+                with self._lock:
+                    self._stats['snapshot_answers'] += 1
+                return snapshot
+            self._session_lock.acquire_read()
+        try:
+            response = self.cli_session.execute_command(command)
+            self._snapshots[command] = response
+            return response
+        finally:
+            self._session_lock.release_read()
+
+    def _respond(self, sequence: int, request_id, command: str, future: Future) -> None:
+        with self._lock:
+            codec = self._in_flight.pop(sequence, (None, CODEC_JSON, None))[1]
+            cancelled = sequence in self._cancelled
+            self._cancelled.discard(sequence)
+        if cancelled:
+            self._send({'id': request_id, 'status': 'cancelled'}, codec)
+            return
+        try:
+            response = future.result()
+        except CancelledError:
+            self._send({'id': request_id, 'status': 'cancelled'}, codec)
+            return
+        except Exception as e:
+            with self._lock:
+                self._stats['errors'] += 1
+            print(f'ERROR: {e}', file=sys.stderr)
+            self._send({'id': request_id, 'status': 'error', 'error': str(e),
+                        'error_type': type(e).__name__, 'command': command}, codec)
+            return
+        self._send({'id': request_id, 'status': 'ok', 'result': response_result(response)}, codec)
+        if response.cli_terminated:
+            with self._lock:
+                self._terminated.set()
+                self._finished.set()
+
+    def _send(self, message: Dict[str, Any], codec: int) -> None:
+        try:
+            frame = encode_frame(message, codec)
+        except (FrameError, TypeError, ValueError) as e:
+            frame = encode_frame({'id': message.get('id'), 'status': 'error', 'error': str(e),
+                                  'error_type': type(e).__name__}, CODEC_JSON)
+        with self._write_lock:
+            self._output.write(frame)
+            self._output.flush()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
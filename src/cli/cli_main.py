@@ -76,9 +76,15 @@ def main():
         print(f"ERROR: Failed to initialize bot: {e}", file=sys.stderr)
         sys.exit(1)
     
-    json_mode = os.environ.get('CLI_MODE', '').lower() == 'json'
+    cli_mode = os.environ.get('CLI_MODE', '').lower()
+    framed_mode = cli_mode == 'framed'
+    json_mode = cli_mode == 'json' or framed_mode
     mode = 'json' if json_mode else None
     
+    if framed_mode:
+        serve_framed(CLISession(bot=bot, workspace_directory=workspace_directory, mode=mode))
+        return
+    
     is_piped = not sys.stdin.isatty()
     
     if is_piped and not json_mode:
@@ -178,5 +184,17 @@ def main():
         
         cli_session.run()
 
+def serve_framed(cli_session):
+    # Frames own the real stdout; stray prints from commands go to stderr instead
+    from cli.cli_daemon import CLIDaemon
+    output_stream = sys.stdout.buffer
+    sys.stdout = sys.stderr
+    try:
+        # Unbuffered stdin: after exit the reader thread may still be blocked in a read at shutdown
+        CLIDaemon(cli_session).serve(sys.stdin.buffer.raw, output_stream)
+    except KeyboardInterrupt:
+        pass
+    sys.exit(0)
+
 if __name__ == '__main__':
     main()
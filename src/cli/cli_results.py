@@ -1,6 +1,6 @@
 ﻿
 from dataclasses import dataclass
-from typing import Optional, Dict
+from typing import Any, Optional, Dict
 
 @dataclass
 class CLICommandResponse:
@@ -12,6 +12,7 @@ class CLICommandResponse:
     scope: Optional[Dict] = None
     context_passed_to_action: Optional[Dict] = None
     cli_terminated: bool = False
+    data: Any = None  # JSON value of a json-mode response, when the session built one
 
 @dataclass
 class TTYDetectionResult:
@@ -1,5 +1,6 @@
 
 import sys
+import json
 import logging
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -13,8 +14,23 @@ class CLISession:
         self.bot = bot
         self.workspace_directory = Path(workspace_directory)
         self.mode = mode
+        # json-mode responses always carry their value in CLICommandResponse.data; callers that
+        # only read data (the framed daemon) turn this off to skip rendering the indented text
+        self.render_json_text = True
     
     def execute_command(self, command: str) -> CLICommandResponse:
+        from story_graph.story_graph_store import StoryGraphStore
+        store = StoryGraphStore.shared()
+        before = store.stats
+        try:
+            return self._execute_command(command)
+        finally:
+            after = store.stats
+            avoided = after['hits'] + after['hash_hits'] - before['hits'] - before['hash_hits']
+            logging.getLogger(__name__).debug(
+                f"[CLISession] story graph parses for '{command}': {after['parses'] - before['parses']}, avoided: {avoided}")
+    
+    def _execute_command(self, command: str) -> CLICommandResponse:
         # Extract format mode from the entire command first
         command = self._extract_format_mode(command)
         
@@ -54,12 +70,7 @@ class CLISession:
         params = self._parse_save_params(args)
         result = self.bot.save(**params)
         if self.mode == 'json':
-            import json
-            return CLICommandResponse(
-                output=json.dumps(result, indent=2),
-                status=result.get('status', 'success'),
-                cli_terminated=False
-            )
+            return self._json_response(result, status=result.get('status', 'success'))
         return None
     
     def _handle_submit(self, verb: str, args: str) -> CLICommandResponse:
@@ -80,12 +91,7 @@ class CLISession:
     def _handle_generate_context_package(self, verb: str, args: str) -> CLICommandResponse:
         result = self.bot.generate_context_package()
         if self.mode == 'json':
-            import json
-            return CLICommandResponse(
-                output=json.dumps(result, indent=2),
-                status='success',
-                cli_terminated=False
-            )
+            return self._json_response(result, status='success')
         created = result.get('created_files', [])
         summary = result.get('summary', '')
         lines = [f"[OK] {summary}"]
@@ -101,12 +107,7 @@ class CLISession:
     
     def _format_submit_response(self, result: dict, success_message: str) -> CLICommandResponse:
         if self.mode == 'json':
-            import json
-            return CLICommandResponse(
-                output=json.dumps(result, indent=2),
-                status=result.get('status', 'success'),
-                cli_terminated=False
-            )
+            return self._json_response(result, status=result.get('status', 'success'))
         
         if result.get('status') != 'success':
             return CLICommandResponse(
@@ -327,11 +328,8 @@ class CLISession:
     def _build_error_response(self, verb: str) -> CLICommandResponse:
         error_message = f"Unknown command '{verb}'"
         if self.mode == 'json':
-            import json
-            output = json.dumps({'status': 'error', 'message': error_message, 'command': verb}, indent=2)
-        else:
-            output = f"ERROR: {error_message}"
-        return CLICommandResponse(output=output, status='error', cli_terminated=False)
+            return self._json_response({'status': 'error', 'message': error_message, 'command': verb}, status='error')
+        return CLICommandResponse(output=f"ERROR: {error_message}", status='error', cli_terminated=False)
     
     def _build_response(self, result, is_navigation_command: bool, cli_terminated: bool) -> CLICommandResponse:
         if isinstance(result, CLICommandResponse):
@@ -341,120 +339,61 @@ class CLISession:
         if isinstance(result, dict) and set(result.keys()) >= {'behavior', 'action', 'execution_mode'} and result.get('execution_mode') in ('combine_next', 'auto', 'skip', 'manual'):
             b, a, m = result.get('behavior', ''), result.get('action', ''), result.get('execution_mode', 'manual')
             if self.mode == 'json':
-                import json
-                output = json.dumps(result, indent=2)
-            else:
-                output = f"{b}.{a}: {m}"
-            return CLICommandResponse(output=output, status=result.get('status'), cli_terminated=cli_terminated)
+                return self._json_response(result, status=result.get('status'), cli_terminated=cli_terminated)
+            return CLICommandResponse(output=f"{b}.{a}: {m}", status=result.get('status'), cli_terminated=cli_terminated)
 
-        # Special handling for status command in JSON mode - wrap bot data consistently
-        from bot.bot import Bot
-        if isinstance(result, Bot) and self.mode == 'json':
-            import json
-            from utils import sanitize_json_string, sanitize_for_json
-            adapter = self._get_adapter_for_domain(result)
-            try:
-                bot_data = json.loads(adapter.serialize())
-            except ValueError as e:
-                if 'control character' in str(e).lower() or 'Invalid' in str(e):
-                    import logging
-                    logger = logging.getLogger(__name__)
-                    logger.warning(f"[CLISession] JSON parse error in bot data, sanitizing: {str(e)}")
-                    bot_data = json.loads(sanitize_json_string(adapter.serialize()))
-                else:
-                    raise
-            wrapped = {'bot': bot_data}
-            sanitized_wrapped = sanitize_for_json(wrapped)
-            return CLICommandResponse(output=json.dumps(sanitized_wrapped, indent=2, ensure_ascii=True), cli_terminated=cli_terminated)
+        # Extract status from result if it's a dict
+        status = None
+        if isinstance(result, dict):
+            status = result.get('status')
+
+        if self.mode == 'json':
+            return self._build_json_response(result, is_navigation_command, cli_terminated, status)
         
         adapter = self._get_adapter_for_domain(result)
         output = adapter.serialize()
         
-        from instructions.instructions import Instructions
-        if isinstance(result, Instructions) and self.mode == 'json':
-            return self._build_json_instructions_response(output)
-        
         if is_navigation_command and not cli_terminated:
-            output = self._append_navigation_context(result, output)
-        
-        # Extract status from result if it's a dict
-        status = None
-        if isinstance(result, dict):
-            status = result.get('status')
+            output = self._append_tty_navigation_context(result, output)
         
         return CLICommandResponse(output=output, status=status, cli_terminated=cli_terminated)
-    
-    def _build_json_instructions_response(self, output: str) -> CLICommandResponse:
-        import json
-        from utils import sanitize_json_string, sanitize_for_json
+
+    def _build_json_response(self, result, is_navigation_command: bool, cli_terminated: bool, status: Optional[str]) -> CLICommandResponse:
+        from bot.bot import Bot
+        from instructions.instructions import Instructions
+        # Status in JSON mode - wrap bot data consistently
+        if isinstance(result, Bot):
+            return self._json_response({'bot': self._json_data(result)}, cli_terminated=cli_terminated)
         
-        try:
-            instructions_data = json.loads(output) if isinstance(output, str) else output
-        except ValueError as e:
-            if 'control character' in str(e).lower() or 'Invalid' in str(e):
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.warning(f"[CLISession] JSON parse error in instructions, sanitizing: {str(e)}")
-                instructions_data = json.loads(sanitize_json_string(output)) if isinstance(output, str) else output
-            else:
-                raise
+        data = self._json_data(result)
+        if isinstance(result, Instructions):
+            return self._json_response({'instructions': data, 'bot': self._json_data(self.bot)})
         
-        status_adapter = self._get_adapter_for_domain(self.bot)
-        try:
-            status_data = json.loads(status_adapter.serialize())
-        except ValueError as e:
-            if 'control character' in str(e).lower() or 'Invalid' in str(e):
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.warning(f"[CLISession] JSON parse error in status, sanitizing: {str(e)}")
-                status_data = json.loads(sanitize_json_string(status_adapter.serialize()))
-            else:
-                raise
-        
-        unified = {'instructions': instructions_data, 'bot': status_data}
-        sanitized_unified = sanitize_for_json(unified)
-        return CLICommandResponse(output=json.dumps(sanitized_unified, indent=2, ensure_ascii=True), cli_terminated=False)
-    
-    def _append_navigation_context(self, result, output: str) -> str:
-        if self.mode == 'json':
-            return self._append_json_navigation_context(result, output)
-        return self._append_tty_navigation_context(result, output)
-    
-    def _append_json_navigation_context(self, result, output: str) -> str:
-        import json
+        if is_navigation_command and not cli_terminated:
+            data = self._append_json_navigation_context(result, data)
+        return self._json_response(data, status=status, cli_terminated=cli_terminated)
+
+    def _json_data(self, domain_object) -> Any:
+        """Value the json adapter of domain_object serializes, without rendering it to text."""
+        return self._get_adapter_for_domain(domain_object).to_dict()
+
+    def _json_response(self, data, status: Optional[str] = None, cli_terminated: bool = False) -> CLICommandResponse:
+        """json-mode response carrying a sanitized copy of data, so later session changes do not show through it."""
+        from utils import sanitize_for_json
+        data = sanitize_for_json(data)
+        output = json.dumps(data, indent=2, ensure_ascii=True) if self.render_json_text else ''
+        return CLICommandResponse(output=output, data=data, status=status, cli_terminated=cli_terminated)
+    
+    def _append_json_navigation_context(self, result, result_data) -> dict:
         from instructions.instructions import Instructions
-        from utils import sanitize_json_string, sanitize_for_json
-        
-        try:
-            result_data = json.loads(output) if isinstance(output, str) else output
-        except ValueError as e:
-            if 'control character' in str(e).lower() or 'Invalid' in str(e):
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.warning(f"[CLISession] JSON parse error in navigation context, sanitizing: {str(e)}")
-                result_data = json.loads(sanitize_json_string(output)) if isinstance(output, str) else output
-            else:
-                raise
         
         unified = dict(result_data) if isinstance(result_data, dict) else {}
         
         if self._navigation_succeeded(result) and not isinstance(result, Instructions):
             self._add_instructions_to_unified(unified)
         
-        status_adapter = self._get_adapter_for_domain(self.bot)
-        try:
-            unified['bot'] = json.loads(status_adapter.serialize())
-        except ValueError as e:
-            if 'control character' in str(e).lower() or 'Invalid' in str(e):
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.warning(f"[CLISession] JSON parse error in status, sanitizing: {str(e)}")
-                unified['bot'] = json.loads(sanitize_json_string(status_adapter.serialize()))
-            else:
-                raise
-        
-        sanitized_unified = sanitize_for_json(unified)
-        return json.dumps(sanitized_unified, indent=2, ensure_ascii=True)
+        unified['bot'] = self._json_data(self.bot)
+        return unified
     
     def _append_tty_navigation_context(self, result, output: str) -> str:
         from instructions.instructions import Instructions
@@ -474,39 +413,13 @@ class CLISession:
         return result['status'] not in ['error', 'at_start', 'at_end']
     
     def _add_instructions_to_unified(self, unified: dict) -> None:
-        import json
         instructions_result = self.bot.current()
         
         if isinstance(instructions_result, dict) and instructions_result.get('status') == 'error':
             unified['instructions_error'] = instructions_result.get('message', 'Unknown error')
             return
         
-        adapter = self._get_adapter_for_domain(instructions_result)
-        try:
-            serialized = adapter.serialize()
-            unified['instructions'] = json.loads(serialized)
-        except ValueError as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            error_msg = str(e)
-            logger.error(f"[CLISession] JSON parse error in instructions: {error_msg}")
-            # Try to identify the problematic position
-            import re
-            pos_match = re.search(r'column (\d+)', error_msg)
-            if pos_match and serialized:
-                pos = int(pos_match.group(1))
-                start = max(0, pos - 50)
-                end = min(len(serialized), pos + 50)
-                context = serialized[start:end]
-                logger.error(f"[CLISession] JSON context around error position {pos}: ...{repr(context)}...")
-            # Try sanitizing
-            from utils import sanitize_json_string
-            try:
-                unified['instructions'] = json.loads(sanitize_json_string(serialized))
-                logger.warning("[CLISession] Sanitization fixed the JSON parse error")
-            except ValueError:
-                logger.error("[CLISession] Sanitization did not fix the error, returning error object")
-                unified['instructions_error'] = f"Failed to parse instructions JSON: {error_msg}"
+        unified['instructions'] = self._json_data(instructions_result)
     
     def _add_instructions_to_parts(self, parts: list) -> None:
         instructions_result = self.bot.current()
@@ -596,6 +509,19 @@ class CLISession:
                     'value': scope_value_match.group(1)
                 }
         
+        jobs_match = re.search(r'--jobs(?:=|\s+)(\S+)', args_string)
+        if jobs_match:
+            if not jobs_match.group(1).isdigit() or int(jobs_match.group(1)) < 1:
+                raise ValueError(f"Invalid --jobs value: {jobs_match.group(1)}. Use a positive number of workers.")
+            params['jobs'] = int(jobs_match.group(1))
+        
+        parallel_mode_match = re.search(r'--parallel-mode(?:=|\s+)(\S+)', args_string)
+        if parallel_mode_match:
+            parallel_mode = parallel_mode_match.group(1).lower()
+            if parallel_mode not in ('process', 'thread'):
+                raise ValueError(f"Invalid --parallel-mode: {parallel_mode}. Use process or thread.")
+            params['parallel_mode'] = parallel_mode
+        
         return params
     
     def _route_to_behavior_action(self, command: str) -> Any:
@@ -608,7 +534,11 @@ class CLISession:
         if is_story_graph_command:
             return self._execute_domain_object_command(command)
         
-        params = self._parse_action_params(args_string) if args_string else None
+        try:
+            params = self._parse_action_params(args_string) if args_string else None
+        except ValueError as e:
+            # Not an unknown command: report the bad option itself
+            return {'status': 'error', 'message': str(e)}
         
         if '.' in command_core:
             command_parts = command_core.split('.')
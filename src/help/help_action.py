@@ -256,7 +256,7 @@ class HelpAction(Action):
             instructions.add_display(description)
             instructions.add_display('')
             if action_name == 'validate':
-                instructions.add_display('**NOTE:** For code behavior, validation runs in background. You MUST poll the status file every 10 seconds and report progress until complete.')
+                instructions.add_display('**NOTE:** For code behavior, validation runs in background. You MUST run the wait command it returns and report its progress events until complete.')
                 instructions.add_display('')
             instructions.add_display('```')
             instructions.add_display(f'/{self.behavior.bot_name}-<behavior> {action_name} [parameters]')
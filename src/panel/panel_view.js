@@ -48,25 +48,24 @@ function isProductionRepoPath(filePath) {
            fs.existsSync(path.join(normalized, 'bots'));
 }
 
-// End-of-response marker that Python CLI sends after each JSON response
-const END_MARKER = '<<<END_OF_RESPONSE>>>';
+// Framed CLI protocol (src/cli/cli_daemon.py): 4-byte big-endian payload length,
+// 1-byte codec tag ('j' = compact JSON) and the payload. Each request carries an id
+// so commands can be pipelined and cancelled.
+const FRAME_HEADER_SIZE = 5;
+const CODEC_JSON = 'j'.charCodeAt(0);
+const COMMAND_TIMEOUT_MS = 60000;
 
 /**
- * Sanitize JSON string by removing invalid control characters.
- * JSON only allows \n (0x0A), \r (0x0D), and \t (0x09) as control characters.
- * All other control characters (0x00-0x1F) are invalid and will cause parse errors.
- * 
- * @param {string} jsonString - JSON string that may contain invalid control characters
- * @returns {string} Sanitized JSON string
+ * Encode one message as a JSON frame.
+ * @param {object} message - Request or cancel message
+ * @returns {Buffer} Frame bytes
  */
-function sanitizeJsonString(jsonString) {
-    if (typeof jsonString !== 'string') {
-        return jsonString;
-    }
-    
-    // Remove invalid control characters (0x00-0x1F) except \n (0x0A), \r (0x0D), \t (0x09)
-    // This regex matches control chars but preserves newlines, carriage returns, and tabs
-    return jsonString.replace(/[\x00-\x08\x0B\x0C\x0E-\x1F]/g, '');
+function encodeFrame(message) {
+    const payload = Buffer.from(JSON.stringify(message), 'utf8');
+    const header = Buffer.alloc(FRAME_HEADER_SIZE);
+    header.writeUInt32BE(payload.length, 0);
+    header.writeUInt8(CODEC_JSON, 4);
+    return Buffer.concat([header, payload]);
 }
 
 class PanelView {
@@ -100,11 +99,10 @@ class PanelView {
             // Use workspace root for panel-debug.log (same as bot_panel)
             _panelLogPath = path.join(this._workspaceDir, 'panel-debug.log');
         }
-        this._pendingResolve = null;
-        this._pendingReject = null;
-        this._responseBuffer = '';
-        // Serialize CLI commands to prevent interleaved responses
-        this._commandQueue = Promise.resolve();
+        // In-flight requests by id; responses may arrive in any order
+        this._pending = new Map();
+        this._nextRequestId = 1;
+        this._responseBuffer = Buffer.alloc(0);
     }
     
     /**
@@ -140,7 +138,7 @@ class PanelView {
             ...process.env,
             PYTHONPATH: pythonPath,
             BOT_DIRECTORY: this._botPath,
-            CLI_MODE: 'json',
+            CLI_MODE: 'framed',
             SUPPRESS_CLI_HEADER: '1',            
             IDE: vscode.env.uriScheme.toLowerCase().includes('cursor') ? 'cursor' : 'vscode'
         };
@@ -165,70 +163,10 @@ class PanelView {
         _perfLog(`_spawnProcess DONE: ${(performance.now() - tSpawnStart).toFixed(0)}ms`);
         
         this._pythonProcess.stdout.on('data', (data) => {
-            const dataStr = data.toString();
-            this._responseBuffer += dataStr;
-            
-            // Log first chunk received with timing
-            if (this._responseBuffer.length === dataStr.length) {
-                const elapsed = this._perfExecuteStart ? (performance.now() - this._perfExecuteStart).toFixed(0) : '?';
-                _perfLog(`First chunk received: ${dataStr.length} bytes, ${elapsed}ms since execute start`);
-            }
-            
-            const markerIndex = this._responseBuffer.indexOf(END_MARKER);
-            if (markerIndex !== -1) {
-                const elapsed = this._perfExecuteStart ? (performance.now() - this._perfExecuteStart).toFixed(0) : '?';
-                _perfLog(`END_MARKER received, response size ${markerIndex}, ${elapsed}ms since execute start`);
-                const jsonOutput = this._responseBuffer.substring(0, markerIndex).trim();
-                this._responseBuffer = this._responseBuffer.substring(markerIndex + END_MARKER.length);
-                
-                if (this._pendingResolve) {
-                    try {
-                        const tParseStart = performance.now();
-                        const jsonMatch = jsonOutput.match(/\{[\s\S]*\}/);
-                        if (!jsonMatch) {
-                            console.error('[PanelView] No JSON found in CLI output');
-                            this._pendingReject(new Error('No JSON found in CLI output'));
-                        } else {
-                            // Sanitize JSON string to remove invalid control characters
-                            const rawJson = jsonMatch[0];
-                            const sanitizedJson = sanitizeJsonString(rawJson);
-                            
-                            // Log if sanitization removed characters (for debugging)
-                            if (rawJson.length !== sanitizedJson.length) {
-                                const removed = rawJson.length - sanitizedJson.length;
-                                console.warn(`[PanelView] Removed ${removed} invalid control character(s) from JSON response`);
-                            }
-                            
-                            const jsonData = JSON.parse(sanitizedJson);
-                            _perfLog(`JSON parse done: ${(performance.now() - tParseStart).toFixed(0)}ms, size ${jsonOutput.length}`);
-                            if (jsonData.status && (jsonData.behavior || jsonData.instructions_length !== undefined)) {
-                                console.log('[SUBMIT_DEBUG] PanelView: received submit response, status=', jsonData.status, 'clipboard_status=', jsonData.clipboard_status, 'instructions_length=', jsonData.instructions_length);
-                            }
-                            // Check if response indicates an error from CLI
-                            if (jsonData.status === 'error' && jsonData.error) {
-                                console.error('[PanelView] CLI returned error:', jsonData.error);
-                                // Resolve with the error object so it can be handled gracefully
-                                this._pendingResolve(jsonData);
-                            } else {
-                                console.log('[PanelView] Command executed successfully, response keys:', Object.keys(jsonData));
-                                this._pendingResolve(jsonData);
-                            }
-                        }
-                    } catch (parseError) {
-                        console.error('[PanelView] JSON parse error:', parseError.message);
-                        console.error('[PanelView] JSON parse error stack:', parseError.stack);
-                        // Log a sample of the JSON that failed to parse (first 500 chars)
-                        const jsonMatch = jsonOutput.match(/\{[\s\S]*\}/);
-                        if (jsonMatch) {
-                            const sample = jsonMatch[0].substring(0, 500);
-                            console.error('[PanelView] Failed JSON sample:', sample);
-                        }
-                        this._pendingReject(new Error(`Failed to parse CLI JSON: ${parseError.message}`));
-                    }
-                    this._pendingResolve = null;
-                    this._pendingReject = null;
-                }
-            }
+            this._responseBuffer = this._responseBuffer.length
+                ? Buffer.concat([this._responseBuffer, data])
+                : data;
+            this._drainFrames();
         });
         
         this._pythonProcess.stderr.on('data', (data) => {
@@ -243,24 +181,112 @@ class PanelView {
         this._pythonProcess.on('error', (err) => {
             console.error('[PanelView] Python process error:', err);
             this._pythonProcess = null;
-            if (this._pendingReject) {
-                this._pendingReject(new Error(`Python process error: ${err.message}`));
-                this._pendingResolve = null;
-                this._pendingReject = null;
-            }
+            this._rejectAllPending(new Error(`Python process error: ${err.message}`));
         });
         
         this._pythonProcess.on('close', (code) => {
             console.log('[PanelView] Python process closed with code:', code);
             this._pythonProcess = null;
-            if (this._pendingReject) {
-                this._pendingReject(new Error(`Python process exited unexpectedly (code ${code})`));
-                this._pendingResolve = null;
-                this._pendingReject = null;
-            }
+            this._responseBuffer = Buffer.alloc(0);
+            this._rejectAllPending(new Error(`Python process exited unexpectedly (code ${code})`));
         });
     }
     
+    /**
+     * Parse every complete frame in the response buffer and settle its request
+     */
+    _drainFrames() {
+        while (this._responseBuffer.length >= FRAME_HEADER_SIZE) {
+            const length = this._responseBuffer.readUInt32BE(0);
+            const codec = this._responseBuffer.readUInt8(4);
+            if (this._responseBuffer.length < FRAME_HEADER_SIZE + length) {
+                return;
+            }
+            const payload = this._responseBuffer.subarray(FRAME_HEADER_SIZE, FRAME_HEADER_SIZE + length);
+            this._responseBuffer = this._responseBuffer.subarray(FRAME_HEADER_SIZE + length);
+            if (codec !== CODEC_JSON) {
+                console.error(`[PanelView] Ignoring CLI frame with unsupported codec ${codec}`);
+                continue;
+            }
+            let message;
+            try {
+                message = JSON.parse(payload.toString('utf8'));
+            } catch (parseError) {
+                console.error('[PanelView] JSON parse error:', parseError.message);
+                console.error('[PanelView] Failed JSON sample:', payload.toString('utf8').substring(0, 500));
+                continue;
+            }
+            this._settle(message, length);
+        }
+    }
+    
+    /**
+     * Resolve or reject the pending request a response frame belongs to
+     */
+    _settle(message, size) {
+        const pending = this._pending.get(message.id);
+        if (!pending) {
+            // Timed out or cancelled on this side already
+            return;
+        }
+        this._pending.delete(message.id);
+        clearTimeout(pending.timeoutId);
+        const elapsed = (performance.now() - pending.start).toFixed(0);
+        if (message.status === 'ok') {
+            _perfLog(`execute DONE: "${pending.command}" in ${elapsed}ms, size ${size}`);
+            const jsonData = message.result;
+            if (jsonData && jsonData.status && (jsonData.behavior || jsonData.instructions_length !== undefined)) {
+                console.log('[SUBMIT_DEBUG] PanelView: received submit response, status=', jsonData.status, 'clipboard_status=', jsonData.clipboard_status, 'instructions_length=', jsonData.instructions_length);
+            }
+            pending.resolve(jsonData);
+        } else if (message.status === 'error') {
+            // Resolve with the error object so it can be handled gracefully
+            console.error('[PanelView] CLI returned error:', message.error);
+            _perfLog(`execute FAILED: "${pending.command}" after ${elapsed}ms`);
+            pending.resolve({
+                status: 'error',
+                error: message.error,
+                error_type: message.error_type,
+                command: message.command || pending.command
+            });
+        } else {
+            _perfLog(`execute CANCELLED: "${pending.command}" after ${elapsed}ms`);
+            pending.reject(new Error(`Command cancelled: ${pending.command}`));
+        }
+    }
+    
+    _rejectAllPending(err) {
+        const pending = Array.from(this._pending.values());
+        this._pending.clear();
+        for (const entry of pending) {
+            clearTimeout(entry.timeoutId);
+            entry.reject(err);
+        }
+    }
+    
+    _sendFrame(message) {
+        this._pythonProcess.stdin.write(encodeFrame(message));
+    }
+    
+    /**
+     * Ask the CLI to drop a request; a queued command never runs, a running one is discarded
+     */
+    cancel(requestId) {
+        const pending = this._pending.get(requestId);
+        if (pending) {
+            this._pending.delete(requestId);
+            clearTimeout(pending.timeoutId);
+            pending.reject(new Error(`Command cancelled: ${pending.command}`));
+        }
+        if (this._pythonProcess) {
+            try {
+                this._sendFrame({ id: this._nextRequestId++, cancel: requestId });
+            } catch (err) {
+                console.error('[PanelView] Failed to send cancel:', err.message);
+            }
+        }
+    }
+    
     /**
      * Cleanup - kill the Python process and remove all event listeners
      */
@@ -297,102 +323,65 @@ class PanelView {
             }, 100);
             
             this._pythonProcess = null;
-            this._pendingResolve = null;
-            this._pendingReject = null;
-            this._responseBuffer = '';
+            this._responseBuffer = Buffer.alloc(0);
+            this._rejectAllPending(new Error('CLI process was stopped'));
         }
     }
     
     /**
      * Execute command using the persistent Python process.
+     * Commands are pipelined: the CLI runs state-changing commands in order and answers
+     * read-only queries (status, scope, ...) alongside them.
      */
     async execute(command) {
-        const runCommand = async () => {
-            // Delegate to injected CLI if present
-            if (this._cli) {
-                if (command === 'submit' || command.includes('submit')) {
-                    console.log('[SUBMIT_DEBUG] PanelView.execute: delegating to _cli (injected)');
-                }
-                return this._cli.execute(command);
-            }
-            
-            if (!this._pythonProcess) {
-                if (command === 'submit' || command.includes('submit')) {
-                    console.log('[SUBMIT_DEBUG] PanelView.execute: spawning Python process');
-                }
-                this._spawnProcess();
+        // Delegate to injected CLI if present
+        if (this._cli) {
+            if (command === 'submit' || command.includes('submit')) {
+                console.log('[SUBMIT_DEBUG] PanelView.execute: delegating to _cli (injected)');
             }
-            
-            const perfCmdStart = performance.now();
-            this._perfExecuteStart = perfCmdStart;
+            return this._cli.execute(command);
+        }
+        
+        if (!this._pythonProcess) {
             if (command === 'submit' || command.includes('submit')) {
-                console.log('[SUBMIT_DEBUG] PanelView.execute: sending to Python stdin:', command);
+                console.log('[SUBMIT_DEBUG] PanelView.execute: spawning Python process');
             }
-            _perfLog(`execute START: "${command}"`);
-            
-            const timeoutMs = 60000;
-            console.log(`[PanelView] Using timeout: ${timeoutMs}ms for command: "${command}"`);
+            this._spawnProcess();
+        }
+        
+        const requestId = this._nextRequestId++;
+        _perfLog(`execute START: #${requestId} "${command}"`);
+        
+        const result = new Promise((resolve, reject) => {
+            const timeoutId = setTimeout(() => {
+                if (this._pending.has(requestId)) {
+                    console.error(`[PanelView] Command timed out after ${COMMAND_TIMEOUT_MS}ms: "${command}"`);
+                    this._pending.delete(requestId);
+                    reject(new Error(`Command timed out after ${COMMAND_TIMEOUT_MS / 1000} seconds: ${command}`));
+                    this.cancel(requestId);
+                }
+            }, COMMAND_TIMEOUT_MS);
+            this._pending.set(requestId, { resolve, reject, timeoutId, command, start: performance.now() });
             
-            return new Promise((resolve, reject) => {
-                this._pendingResolve = resolve;
-                this._pendingReject = reject;
-                
-                const timeoutId = setTimeout(() => {
-                    if (this._pendingReject) {
-                        console.error(`[PanelView] Command timed out after ${timeoutMs}ms: "${command}"`);
-                        this._pendingReject(new Error(`Command timed out after ${timeoutMs / 1000} seconds: ${command}`));
-                        this._pendingResolve = null;
-                        this._pendingReject = null;
-                    }
-                }, timeoutMs);
-                
-                const originalResolve = resolve;
-                const originalReject = reject;
-                this._pendingResolve = (value) => {
-                    clearTimeout(timeoutId);
-                    const perfCmdEnd = performance.now();
-                    _perfLog(`execute DONE: "${command}" in ${(perfCmdEnd - perfCmdStart).toFixed(0)}ms`);
-                    this._perfExecuteStart = null;
-                    originalResolve(value);
-                };
-                this._pendingReject = (err) => {
-                    clearTimeout(timeoutId);
-                    const perfCmdEnd = performance.now();
-                    _perfLog(`execute FAILED: "${command}" after ${(perfCmdEnd - perfCmdStart).toFixed(0)}ms`);
-                    this._perfExecuteStart = null;
-                    originalReject(err);
-                };
-                
-                try {
-                    const cmd = command.includes('--format json') ? command : `${command} --format json`;
-                    const tBeforeWrite = performance.now();
-                    if (command === 'submit' || command.includes('submit')) {
-                        console.log('[SUBMIT_DEBUG] PanelView: writing to stdin:', cmd);
-                    }
-                    this._pythonProcess.stdin.write(cmd + '\n');
-                    if (command === 'submit' || command.includes('submit')) {
-                        console.log('[SUBMIT_DEBUG] PanelView: stdin.write done, waiting for response');
-                    }
-                    _perfLog(`stdin.write sent: ${(performance.now() - tBeforeWrite).toFixed(0)}ms, ${(performance.now() - perfCmdStart).toFixed(0)}ms since start`);
-                } catch (err) {
-                    clearTimeout(timeoutId);
-                    this._pendingResolve = null;
-                    this._pendingReject = null;
-                    reject(new Error(`Failed to send command: ${err.message}`));
+            try {
+                if (command === 'submit' || command.includes('submit')) {
+                    console.log('[SUBMIT_DEBUG] PanelView: sending request', requestId, command);
                 }
-            });
-        };
-
-        const previous = this._commandQueue;
-        const queued = previous.then(() => runCommand());
-        // Keep queue alive for next command even if this one fails - report to both log and display, never swallow
-        this._commandQueue = queued.catch((err) => {
+                this._sendFrame({ id: requestId, command });
+            } catch (err) {
+                clearTimeout(timeoutId);
+                this._pending.delete(requestId);
+                reject(new Error(`Failed to send command: ${err.message}`));
+            }
+        });
+        // Report failures to both log and display, never swallow; the caller still gets the rejection
+        result.catch((err) => {
             const msg = err?.message || String(err);
             const stack = err?.stack || '';
-            console.error('[PanelView] Command failed (queue continues):', msg, stack);
+            console.error('[PanelView] Command failed:', msg, stack);
             try { vscode.window.showErrorMessage(`Command failed: ${msg}`); } catch (e) { console.error('[PanelView] Could not show error:', e); }
         });
-        return queued;
+        return result;
     }
 }
 
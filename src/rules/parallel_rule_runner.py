@@ -0,0 +1,124 @@
+"""Runs rule scanners across a worker pool and hands results back in rule order."""
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from rules.rule import Rule
+from rules.scan_config import ScanConfig
+from scanners.resources.language_service import LanguageService
+from scanners.resources.parsed_file_store import ParsedFileStore
+
+PROCESS_MODE = 'process'
+THREAD_MODE = 'thread'
+
+_worker_parsed_files: Optional[ParsedFileStore] = None
+
+
+def convert_violations_to_dicts(data: Any) -> Any:
+    if hasattr(data, 'to_dict'):
+        return data.to_dict()
+    elif isinstance(data, dict):
+        return {k: convert_violations_to_dicts(v) for k, v in data.items()}
+    elif isinstance(data, list):
+        return [convert_violations_to_dicts(item) for item in data]
+    else:
+        return data
+
+
+@dataclass
+class RuleScanOutcome:
+    scanner_results: Dict[str, Any]
+    file_by_file_violations: List[Dict[str, Any]]
+    cross_file_violations: List[Dict[str, Any]]
+    execution_status: Optional[str]
+    scanned_files: List[Tuple[Path, List[Dict[str, Any]]]] = field(default_factory=list)
+    progress_messages: List[str] = field(default_factory=list)
+
+
+class ScanEventRecorder:
+    """Stands in for the streaming writer inside a worker; events are replayed on the caller's thread."""
+
+    def __init__(self, forward_to: Optional[Callable] = None):
+        self.scanned_files: List[Tuple[Path, List[Dict[str, Any]]]] = []
+        self.progress_messages: List[str] = []
+        self._forward_to = forward_to
+
+    def on_file_scanned(self, file_path: Path, violations: List[Any], rule_obj: Any) -> None:
+        self.scanned_files.append((file_path, convert_violations_to_dicts(list(violations))))
+        if self._forward_to:
+            self._forward_to(file_path, violations, rule_obj)
+
+    def write_cross_file_progress(self, message: str) -> None:
+        self.progress_messages.append(message)
+
+
+def scan_rule(rule: Rule, config: ScanConfig) -> RuleScanOutcome:
+    recorder = ScanEventRecorder()
+    parsed_files = config.parsed_files if config.parsed_files is not None else _process_parsed_files()
+    config = replace(config, on_file_scanned=recorder.on_file_scanned, status_writer=recorder, parsed_files=parsed_files)
+    scanner_results = rule.scan(config)
+    return RuleScanOutcome(
+        scanner_results=convert_violations_to_dicts(scanner_results),
+        file_by_file_violations=convert_violations_to_dicts(rule.file_by_file_violations),
+        cross_file_violations=convert_violations_to_dicts(rule.cross_file_violations),
+        execution_status=rule.scanner_execution_status,
+        scanned_files=recorder.scanned_files,
+        progress_messages=recorder.progress_messages
+    )
+
+
+def _init_worker(language_cache_path: Optional[Path]) -> None:
+    """Seed a worker process's language memo from the answers saved by earlier runs."""
+    if language_cache_path is not None:
+        LanguageService.shared().load(language_cache_path)
+
+
+def _process_parsed_files() -> ParsedFileStore:
+    global _worker_parsed_files
+    if _worker_parsed_files is None:
+        _worker_parsed_files = ParsedFileStore()
+    return _worker_parsed_files
+
+
+class ParallelRuleRunner:
+
+    def __init__(self, jobs: int, mode: str = PROCESS_MODE, language_cache_path: Optional[Path] = None):
+        if mode not in (PROCESS_MODE, THREAD_MODE):
+            raise ValueError(f"Unknown parallel mode '{mode}' - expected '{PROCESS_MODE}' or '{THREAD_MODE}'")
+        self._jobs = max(1, jobs)
+        self._mode = mode
+        self._language_cache_path = language_cache_path
+
+    @property
+    def jobs(self) -> int:
+        return self._jobs
+
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    def run(self, work: List[Tuple[Rule, ScanConfig]]) -> Iterator[RuleScanOutcome]:
+        if not work:
+            return
+        with self._create_executor(len(work)) as executor:
+            futures = [executor.submit(scan_rule, rule, self._prepare_config(config)) for rule, config in work]
+            try:
+                for future in futures:
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def _create_executor(self, work_count: int) -> Executor:
+        workers = min(self._jobs, work_count)
+        if self._mode == THREAD_MODE:
+            return ThreadPoolExecutor(max_workers=workers, thread_name_prefix='RuleScanner')
+        return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self._language_cache_path,))
+
+    def _prepare_config(self, config: ScanConfig) -> ScanConfig:
+        if self._mode == THREAD_MODE:
+            return config
+        # Callbacks, the status writer and the in-process parse store and story model stay behind;
+        # each worker process keeps its own parse store and builds the story model per scanner.
+        return replace(config, on_file_scanned=None, status_writer=None, parsed_files=None, story_model=None)
@@ -31,6 +31,7 @@ class Rule:
 
     def _init_scanner(self) -> None:
         self._scanner_load_error: Optional[str] = None
+        self._target_language: Optional[str] = None
         scanner_path = self._rule_content.get('scanner')
         if scanner_path:
             self._scanner, self._scanner_load_error = self._load_scanner(scanner_path)
@@ -52,8 +53,14 @@ class Rule:
         """Reload scanner for a specific language."""
         scanner_path = self._rule_content.get('scanner')
         if scanner_path:
+            self._target_language = target_language
             self._scanner, self._scanner_load_error = self._load_scanner(scanner_path, target_language)
 
+    def __reduce__(self):
+        # Scanner classes may be built on the fly by ScannerRegistry, so a pickled
+        # rule is rebuilt from its source file and reloads its scanner on arrival.
+        return (_restore_rule, (self._rule_file_path, self._behavior_name, self._bot_name, self._rule_content_param, self._target_language))
+
     @property
     def name(self) -> str:
         return self._name
@@ -126,6 +133,10 @@ class Rule:
             return False
         return issubclass(self._scanner, TestScanner) or issubclass(self._scanner, CodeScanner)
 
+    @property
+    def reads_story_graph(self) -> bool:
+        return self._scanner is None or getattr(self._scanner, 'reads_story_graph', True)
+
     def scan(self, config: ScanConfig) -> Dict[str, Any]:
         if not self.has_scanner:
             return {}
@@ -162,7 +173,9 @@ class Rule:
                 test_files=config.test_files or [],
                 code_files=config.code_files or []
             ),
-            on_file_scanned=config.on_file_scanned
+            on_file_scanned=config.on_file_scanned,
+            parsed_files=config.parsed_files,
+            story_model=config.story_model
         )
         violations_file_by_file = scanner_instance.scan_with_context(context)
         if violations_file_by_file is not None:
@@ -188,12 +201,25 @@ class Rule:
                     code_files=config.all_code_files or config.code_files or []
                 ),
                 status_writer=config.status_writer,
-                max_comparisons=config.max_cross_file_comparisons or 20
+                max_comparisons=config.max_cross_file_comparisons or 20,
+                parsed_files=config.parsed_files,
+                story_model=config.story_model
             )
             violations_cross_file = scanner_instance.scan_cross_file_with_context(context)
             if violations_cross_file:
                 self._cross_file_violations = violations_cross_file
 
+    def restore_scan_results(self, file_by_file_violations: List[Dict[str, Any]], cross_file_violations: List[Dict[str, Any]], execution_status: Optional[str]) -> None:
+        self._file_by_file_violations = file_by_file_violations
+        self._cross_file_violations = cross_file_violations
+        self._scan_error = None
+        self._scanner_execution_status = execution_status
+
+    def add_stored_results(self, file_by_file_violations: List[Dict[str, Any]], cross_file_violations: Optional[List[Dict[str, Any]]] = None) -> None:
+        self._file_by_file_violations = list(self.file_by_file_violations) + file_by_file_violations
+        if cross_file_violations is not None:
+            self._cross_file_violations = cross_file_violations
+
     def _build_scan_result(self):
         if self.requires_two_pass_scan:
             return {'file_by_file': {'violations': self._file_by_file_violations}, 'cross_file': {'violations': self._cross_file_violations}}
@@ -285,3 +311,9 @@ class Rule:
         formatted.append('')
         return formatted
 
+
+def _restore_rule(rule_file_path: Path, behavior_name: str, bot_name: str, rule_content: Optional[Dict[str, Any]], target_language: Optional[str]) -> Rule:
+    rule = Rule(rule_file_path, behavior_name, bot_name, rule_content)
+    if target_language:
+        rule.reload_scanner_for_language(target_language)
+    return rule
@@ -1,6 +1,5 @@
 from __future__ import annotations
 import logging
-import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional, Iterator, Dict, Any, TYPE_CHECKING, Callable
@@ -11,6 +10,12 @@ from rules.rule_filter import RuleFilter
 from actions.build.story_graph_data import StoryGraphData
 from story_graph.story_graph import StoryGraph
 from actions.validate.validation_scope import ValidationScope
+from scanners.resources.parsed_file_store import ParsedFileStore
+from scanners.resources.language_service import LanguageService
+from scanners.resources.story_model import StoryModel
+from rules.scan_config import ScanConfig
+from rules.parallel_rule_runner import ParallelRuleRunner, RuleScanOutcome, ScanEventRecorder, convert_violations_to_dicts, PROCESS_MODE
+from actions.validate.validation_result_store import ValidationResultStore, RuleScanPlan, content_digest, rule_version
 if TYPE_CHECKING:
     from actions.action_context import ValidateActionContext
 
@@ -35,6 +40,11 @@ class ValidationContext:
     status_writer: Optional[Any] = None
     max_cross_file_comparisons: int = 20
     full_story_graph: Optional[Dict[str, Any]] = None
+    parsed_files: Optional[ParsedFileStore] = None
+    story_model: Optional[StoryModel] = None
+    jobs: int = 1
+    parallel_mode: str = PROCESS_MODE
+    result_store: Optional[ValidationResultStore] = None
 
     @classmethod
     def from_action_context(cls, behavior, context: 'ValidateActionContext', callbacks: Optional[ValidationCallbacks] = None) -> 'ValidationContext':
@@ -65,7 +75,10 @@ class ValidationContext:
             bot_paths=behavior.bot_paths,
             working_dir=behavior.bot_paths.workspace_directory,
             max_cross_file_comparisons=getattr(context, 'max_cross_file_comparisons', 20),
-            full_story_graph=full_story_graph
+            full_story_graph=full_story_graph,
+            jobs=getattr(context, 'jobs', 1) or 1,
+            parallel_mode=getattr(context, 'parallel_mode', PROCESS_MODE) or PROCESS_MODE,
+            result_store=ValidationResultStore.for_behavior(behavior.bot_paths.workspace_directory, behavior.name)
         )
     
     @classmethod
@@ -181,7 +194,9 @@ class ValidationContext:
             scope=scope,
             background=parameters.get('background'),
             skip_cross_file=parameters.get('skip_cross_file', False),
-            all_files=all_files
+            all_files=all_files,
+            jobs=parameters.get('jobs', 1),
+            parallel_mode=parameters.get('parallel_mode', PROCESS_MODE)
         )
         
         return cls.from_action_context(behavior, context, callbacks)
@@ -194,46 +209,13 @@ class ValidationContext:
             return self.files
         return rules_instance._rule_filter.filter_files(self.files, self.exclude)
 
-    def get_last_report_timestamp(self) -> float:
-        logger = logging.getLogger(__name__)
-        behavior_name = self.behavior.name if self.behavior else 'common'
-        reports_dir = self.bot_paths.story_graph_paths.behavior_path(behavior_name) / 'violations'
-        logger.info(f'Looking for previous reports in: {reports_dir}')
-        if not reports_dir.exists():
-            logger.info('Reports directory does not exist - returning 0.0')
-            return 0.0
-        
-        report_files = list(reports_dir.glob(f'{behavior_name}-validation-status-*.md'))
-        logger.info(f'Found {len(report_files)} report files')
-        if not report_files:
-            logger.info('No report files found - returning 0.0')
-            return 0.0
-        
-        current_time = time.time()
-        previous_run_files = [f for f in report_files if (current_time - f.stat().st_mtime) > 10]
-        logger.info(f'Found {len(previous_run_files)} previous run files (excluding files < 10 seconds old)')
-        
-        if not previous_run_files:
-            logger.info('No previous run files found - returning 0.0')
-            return 0.0
-        
-        most_recent = max(previous_run_files, key=lambda p: p.stat().st_mtime)
-        logger.info(f'Most recent previous report: {most_recent.name} (timestamp: {most_recent.stat().st_mtime})')
-        return most_recent.stat().st_mtime
-
     def filter_changed_files(self, files: Dict[str, List[Path]]) -> tuple:
-        if self.all_files:
-            return files, files
-        
-        last_report_time = self.get_last_report_timestamp()
-        
-        if last_report_time == 0.0:
+        if self.all_files or self.result_store is None:
             return files, files
         
         changed_files = {}
         for file_type, file_list in files.items():
-            changed = [f for f in file_list if f.stat().st_mtime > last_report_time]
-            changed_files[file_type] = changed
+            changed_files[file_type] = [f for f in file_list if not self.result_store.is_unchanged(f)]
         
         return changed_files, files
 
@@ -371,14 +353,7 @@ class Rules:
             handler.flush()
     
     def _convert_violations_to_dicts(self, data: Any) -> Any:
-        if hasattr(data, 'to_dict'):
-            return data.to_dict()
-        elif isinstance(data, dict):
-            return {k: self._convert_violations_to_dicts(v) for k, v in data.items()}
-        elif isinstance(data, list):
-            return [self._convert_violations_to_dicts(item) for item in data]
-        else:
-            return data
+        return convert_violations_to_dicts(data)
 
     def _process_scanner_result(self, rule, rule_result: dict, scanner_results: Any, scanner_path: str, scanner_name: str, logger) -> str:
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -396,7 +371,7 @@ class Rules:
         self.add_violations(rule.violations)
         return f'  [OK] {rule.rule_file}: Scanner executed successfully ({violations_count} violations)'
 
-    def _execute_scanner(self, rule, rule_result: dict, context: ValidationContext, scanner_path: str, logger, files: Dict, changed_files: Dict, all_files: Dict) -> str:
+    def _execute_scanner(self, rule, rule_result: dict, context: ValidationContext, scanner_path: str, logger, files: Dict, changed_files: Dict, all_files: Dict, plan: Optional[RuleScanPlan] = None) -> str:
         scanner_name = scanner_path.split('.')[-1] if '.' in scanner_path else scanner_path
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         logger.info(f'[{timestamp}] Starting scanner: {scanner_name} (rule: {rule.rule_file})')
@@ -404,31 +379,86 @@ class Rules:
         if context.callbacks.on_scanner_start:
             context.callbacks.on_scanner_start(rule.rule_file, scanner_path)
         try:
-            max_cross_file = getattr(context, 'max_cross_file_comparisons', 20)
-            from rules.scan_config import ScanConfig
-            scan_config = ScanConfig(
-                story_graph=context.story_graph,
-                full_story_graph=getattr(context, 'full_story_graph', None),
-                files=all_files or files,
-                changed_files=changed_files,
-                skip_cross_file=context.skip_cross_file,
-                max_cross_file_comparisons=max_cross_file,
-                on_file_scanned=context.callbacks.on_file_scanned,
-                status_writer=context.status_writer
-            )
+            scan_config = self._build_scan_config(context, files, changed_files, all_files, plan)
+            recorder = None
+            if plan is not None:
+                recorder = ScanEventRecorder(forward_to=scan_config.on_file_scanned)
+                scan_config.on_file_scanned = recorder.on_file_scanned
             scanner_results = rule.scan(scan_config)
+            if plan is not None:
+                scanner_results = self._apply_stored_results(rule, context, plan, scanner_results, recorder.scanned_files)
             rule_result['scanner_results'] = self._convert_violations_to_dicts(scanner_results)
             return self._process_scanner_result(rule, rule_result, scanner_results, scanner_path, scanner_name, logger)
         except Exception as e:
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            error_msg = f'Scanner execution failed: {str(e)}'
-            logger.error(f'[{timestamp}] Completed scanner: {scanner_name} (rule: {rule.rule_file}) - EXCEPTION: {error_msg}')
-            self._flush_logger_handlers(logger)
-            logger.error(f'Scanner execution failed for rule {rule.rule_file}: {e}', exc_info=True)
-            rule_result['scanner_status'] = {'status': 'EXECUTION_FAILED', 'scanner_path': scanner_path, 'error': error_msg}
+            self._log_scanner_exception(rule, rule_result, scanner_path, scanner_name, e, logger)
             raise
 
-    def _process_rule(self, rule, rule_result: dict, context: ValidationContext, logger, files: Dict, changed_files: Dict, all_files: Dict) -> str:
+    def _build_scan_config(self, context: ValidationContext, files: Dict, changed_files: Dict, all_files: Dict, plan: Optional[RuleScanPlan] = None) -> ScanConfig:
+        if plan is not None:
+            changed_files = plan.changed_files
+        return ScanConfig(
+            story_graph=context.story_graph,
+            full_story_graph=getattr(context, 'full_story_graph', None),
+            files=all_files or files,
+            changed_files=changed_files,
+            skip_cross_file=context.skip_cross_file or (plan is not None and plan.stored_cross_file is not None),
+            max_cross_file_comparisons=getattr(context, 'max_cross_file_comparisons', 20),
+            on_file_scanned=context.callbacks.on_file_scanned,
+            status_writer=context.status_writer,
+            parsed_files=context.parsed_files,
+            story_model=context.story_model
+        )
+
+    def _log_scanner_exception(self, rule, rule_result: dict, scanner_path: str, scanner_name: str, e: Exception, logger) -> None:
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        error_msg = f'Scanner execution failed: {str(e)}'
+        logger.error(f'[{timestamp}] Completed scanner: {scanner_name} (rule: {rule.rule_file}) - EXCEPTION: {error_msg}')
+        self._flush_logger_handlers(logger)
+        logger.error(f'Scanner execution failed for rule {rule.rule_file}: {e}', exc_info=True)
+        rule_result['scanner_status'] = {'status': 'EXECUTION_FAILED', 'scanner_path': scanner_path, 'error': error_msg}
+
+    def _apply_stored_results(self, rule, context: ValidationContext, plan: RuleScanPlan, scanner_results: Any, scanned_files: List) -> Any:
+        store = context.result_store
+        execution_status = rule.scanner_execution_status or 'SUCCESS'
+        if self._has_scanner_error(execution_status, scanner_results):
+            return scanner_results
+        # Only scanners that report every violation through on_file_scanned can be replayed per file;
+        # anything else (story graph scanners, whole-workspace checks) is rescanned on every run.
+        scanned_paths = {str(file_path) for file_path, _ in scanned_files}
+        expected_paths = {str(f) for file_list in plan.changed_files.values() for f in file_list if f.exists() and f.is_file()}
+        reported_count = sum(len(violations) for _, violations in scanned_files)
+        if scanned_paths == expected_paths and reported_count == len(rule.file_by_file_violations):
+            for file_path, violations in scanned_files:
+                store.record_file(plan.rule_key, plan.version, file_path, convert_violations_to_dicts(violations))
+        if plan.is_full_scan and plan.stored_cross_file is None and not context.skip_cross_file and rule.requires_two_pass_scan:
+            store.record_cross_file(plan.rule_key, plan.version, plan.fileset, convert_violations_to_dicts(rule.cross_file_violations))
+        if context.callbacks.on_file_scanned:
+            for file_path, violations in plan.stored_violations.items():
+                context.callbacks.on_file_scanned(file_path, violations, rule)
+        stored_violations = [violation for violations in plan.stored_violations.values() for violation in violations]
+        rule.add_stored_results(stored_violations, plan.stored_cross_file)
+        return rule.scanner_results
+
+    def _apply_scan_outcome(self, rule, rule_result: dict, context: ValidationContext, scanner_path: str, outcome: RuleScanOutcome, logger, plan: Optional[RuleScanPlan] = None) -> str:
+        scanner_name = scanner_path.split('.')[-1] if '.' in scanner_path else scanner_path
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        logger.info(f'[{timestamp}] Starting scanner: {scanner_name} (rule: {rule.rule_file})')
+        if context.callbacks.on_scanner_start:
+            context.callbacks.on_scanner_start(rule.rule_file, scanner_path)
+        if context.callbacks.on_file_scanned:
+            for file_path, violations in outcome.scanned_files:
+                context.callbacks.on_file_scanned(file_path, violations, rule)
+        if context.status_writer:
+            for message in outcome.progress_messages:
+                context.status_writer.write_cross_file_progress(message)
+        rule.restore_scan_results(outcome.file_by_file_violations, outcome.cross_file_violations, outcome.execution_status)
+        scanner_results = outcome.scanner_results
+        if plan is not None:
+            scanner_results = self._convert_violations_to_dicts(self._apply_stored_results(rule, context, plan, scanner_results, outcome.scanned_files))
+        rule_result['scanner_results'] = scanner_results
+        return self._process_scanner_result(rule, rule_result, scanner_results, scanner_path, scanner_name, logger)
+
+    def _process_rule(self, rule, rule_result: dict, context: ValidationContext, logger, files: Dict, changed_files: Dict, all_files: Dict, plan: Optional[RuleScanPlan] = None) -> str:
         scanner_path = rule.scanner_path
         if not scanner_path:
             rule_result['scanner_status'] = {'status': 'NO_SCANNER', 'scanner_path': None}
@@ -438,7 +468,7 @@ class Rules:
             rule_result['scanner_status'] = {'status': 'LOAD_FAILED', 'scanner_path': scanner_path, 'error': load_error}
             logger.error(f'Scanner failed to load for rule {rule.rule_file}: {load_error}')
             return f'  [FAILED] {rule.rule_file}: Scanner failed to load - {load_error}'
-        return self._execute_scanner(rule, rule_result, context, scanner_path, logger, files, changed_files, all_files)
+        return self._execute_scanner(rule, rule_result, context, scanner_path, logger, files, changed_files, all_files, plan)
 
     def validate(self, context: ValidationContext, files: Optional[Dict[str, List[Path]]]=None, callbacks: Optional[ValidationCallbacks]=None, skiprule: Optional[List[str]]=None, exclude: Optional[List[str]]=None) -> List[Dict[str, Any]]:
         if isinstance(context, ValidationContext):
@@ -475,6 +505,11 @@ class Rules:
         rules_list = list(self)
         files = context.get_filtered_files(self)
         changed_files, all_files = context.filter_changed_files(files)
+        context.parsed_files = ParsedFileStore()
+        context.story_model = StoryModel(context.story_graph) if isinstance(context.story_graph, dict) else None
+        language_cache_path = self._language_cache_path(context)
+        if language_cache_path is not None:
+            LanguageService.shared().load(language_cache_path)
         
         # Detect target language from files being scanned
         target_language = self._detect_target_language(files)
@@ -484,6 +519,8 @@ class Rules:
             for rule in rules_list:
                 if rule.scanner_class:
                     rule.reload_scanner_for_language(target_language)
+        plans = self._plan_incremental_scans(rules_list, context, all_files, target_language)
+        outcomes = self._run_rules_in_parallel(rules_list, context, logger, files, changed_files, all_files, plans) if context.jobs > 1 else None
         for idx, rule in enumerate(rules_list, 1):
             rule_name = Path(rule.rule_file).stem
             if context.should_skip_rule(rule_name):
@@ -493,17 +530,89 @@ class Rules:
             logger.info(f'Processing rule {idx}/{len(rules_list)}: {rule.rule_file}')
             rule_result = {'rule_file': rule.rule_file, 'rule_file_path': str(rule.rule_file_path), 'rule_content': rule.rule_content, 'scanner_status': {}}
             try:
-                status_line = self._process_rule(rule, rule_result, context, logger, files, changed_files, all_files)
+                if outcomes is not None and self._is_scannable(rule):
+                    status_line = self._process_parallel_rule(rule, rule_result, context, outcomes, logger, plans.get(rule.rule_file))
+                else:
+                    status_line = self._process_rule(rule, rule_result, context, logger, files, changed_files, all_files, plans.get(rule.rule_file))
                 scanner_status_summary.append(status_line)
             except Exception:
                 scanner_status_summary.append(f'  [ERROR] {rule.rule_file}: Scanner execution failed')
+                if outcomes is not None:
+                    outcomes.close()
                 raise
             processed_rules.append(rule_result)
             if context.callbacks.on_scanner_complete:
                 context.callbacks.on_scanner_complete(rule_result)
+        if outcomes is not None:
+            outcomes.close()
         self._log_scanner_status_summary(scanner_status_summary, logger)
+        self._report_parsed_file_stats(context, logger)
+        self._save_result_store(context, logger)
+        if language_cache_path is not None:
+            LanguageService.shared().save(language_cache_path)
         return processed_rules
     
+    def _language_cache_path(self, context: ValidationContext) -> Optional[Path]:
+        bot_paths = context.bot_paths
+        if bot_paths is None or getattr(bot_paths, 'workspace_directory', None) is None:
+            return None
+        return LanguageService.cache_path_for(bot_paths.workspace_directory)
+    
+    def _plan_incremental_scans(self, rules_list: List[Rule], context: ValidationContext, all_files: Dict, target_language: Optional[str]) -> Dict[str, RuleScanPlan]:
+        if context.result_store is None:
+            return {}
+        story_graph_digest = None
+        plans = {}
+        for rule in rules_list:
+            if context.should_skip_rule(Path(rule.rule_file).stem) or not self._is_scannable(rule):
+                continue
+            if rule.reads_story_graph and story_graph_digest is None:
+                story_graph_digest = content_digest([context.story_graph, context.full_story_graph])
+            version = rule_version(rule.rule_content, rule.scanner_path, target_language, story_graph_digest if rule.reads_story_graph else '')
+            plans[rule.rule_file] = context.result_store.plan(f'{self.bot_name}:{rule.rule_file}', version, all_files, rescan_all=context.all_files)
+        return plans
+
+    def _save_result_store(self, context: ValidationContext, logger) -> None:
+        if context.result_store is None:
+            return
+        stats = context.result_store.stats
+        logger.info(f"Incremental validation: {stats['replayed']} stored file result(s) replayed, {stats['rescanned']} file result(s) rescanned")
+        if context.status_writer and hasattr(context.status_writer, 'on_incremental_stats'):
+            context.status_writer.on_incremental_stats(stats)
+        try:
+            context.result_store.save()
+        except OSError as e:
+            logger.warning(f'Could not save validation result store {context.result_store.store_path}: {e}')
+    
+    def _is_scannable(self, rule) -> bool:
+        return bool(rule.scanner_path) and rule.has_scanner
+
+    def _run_rules_in_parallel(self, rules_list: List[Rule], context: ValidationContext, logger, files: Dict, changed_files: Dict, all_files: Dict, plans: Dict[str, RuleScanPlan]) -> Iterator[RuleScanOutcome]:
+        runner = ParallelRuleRunner(context.jobs, context.parallel_mode, self._language_cache_path(context))
+        work = [
+            (rule, self._build_scan_config(context, files, changed_files, all_files, plans.get(rule.rule_file))) for rule in rules_list
+            if not context.should_skip_rule(Path(rule.rule_file).stem) and self._is_scannable(rule)
+        ]
+        logger.info(f'Running {len(work)} scanner(s) on {runner.jobs} {runner.mode} worker(s)')
+        return runner.run(work)
+
+    def _process_parallel_rule(self, rule, rule_result: dict, context: ValidationContext, outcomes: Iterator[RuleScanOutcome], logger, plan: Optional[RuleScanPlan] = None) -> str:
+        scanner_path = rule.scanner_path
+        try:
+            outcome = next(outcomes)
+        except Exception as e:
+            scanner_name = scanner_path.split('.')[-1] if '.' in scanner_path else scanner_path
+            rule.scanner_execution_status = f'EXECUTION_FAILED: {str(e)}'
+            self._log_scanner_exception(rule, rule_result, scanner_path, scanner_name, e, logger)
+            raise
+        return self._apply_scan_outcome(rule, rule_result, context, scanner_path, outcome, logger, plan)
+
+    def _report_parsed_file_stats(self, context: ValidationContext, logger) -> None:
+        stats = context.parsed_files.stats
+        logger.info(f"Parsed file cache: {stats['files']} file(s), {stats['hits']} hit(s), {stats['misses']} miss(es)")
+        if context.status_writer and hasattr(context.status_writer, 'on_parse_cache_stats'):
+            context.status_writer.on_parse_cache_stats(stats)
+    
     def _log_scanner_status_summary(self, scanner_status_summary: List[str], logger) -> None:
         if scanner_status_summary:
             logger.info('=== SCANNER EXECUTION STATUS ===')
@@ -5,6 +5,8 @@ from dataclasses import dataclass, field
 
 if TYPE_CHECKING:
     from scanners.scan_context import ScanFilesContext, CrossFileScanContext, FileCollection
+    from scanners.resources.parsed_file_store import ParsedFileStore
+    from scanners.resources.story_model import StoryModel
 
 
 @dataclass
@@ -23,6 +25,10 @@ class ScanConfig:
     on_file_scanned: Optional[Callable] = None
     status_writer: Optional[Any] = None
     
+    # Shared per-run caches
+    parsed_files: Optional['ParsedFileStore'] = None
+    story_model: Optional['StoryModel'] = None
+    
     # Derived properties (computed on demand)
     _test_files: Optional[List[Path]] = field(default=None, init=False, repr=False)
     _code_files: Optional[List[Path]] = field(default=None, init=False, repr=False)
@@ -70,7 +76,9 @@ class ScanConfig:
                 test_files=self.test_files,
                 code_files=self.code_files
             ),
-            on_file_scanned=self.on_file_scanned
+            on_file_scanned=self.on_file_scanned,
+            parsed_files=self.parsed_files,
+            story_model=self.story_model
         )
     
     def to_cross_file_context(self, rule_obj: Any) -> 'CrossFileScanContext':
@@ -87,5 +95,7 @@ class ScanConfig:
                 code_files=self.all_code_files
             ),
             status_writer=self.status_writer,
-            max_comparisons=self.max_cross_file_comparisons
+            max_comparisons=self.max_cross_file_comparisons,
+            parsed_files=self.parsed_files,
+            story_model=self.story_model
         )
@@ -10,6 +10,8 @@ logger = logging.getLogger(__name__)
 
 class ActiveLanguageScanner(StoryScanner):
     
+    tags_node_names = True
+    
     def scan_story_node(self, node: StoryNode) -> List[Dict[str, Any]]:
         violations = []
         
@@ -17,6 +17,7 @@ class DomainLanguageCodeScanner(JSCodeScanner):
     Same rules as Python: use domain terms from specification; avoid generate_/calculate_;
     builder-class exception for class names ending in Generator, Calculator, etc.
     """
+    reads_story_graph = True
 
     GENERATE_PATTERNS = [r'^generate_', r'^calculate_']
     BUILDER_VERB_SUFFIXES = (
@@ -30,6 +30,9 @@ class DuplicationScanner(JSCodeScanner):
             # Need at least 2 files to find duplications
             return violations
         
+        self._bind_parsed_files(context)
+        self._prefetch_js_asts(js_files)
+        
         # Extract functions from all files
         all_functions = {}
         for file_path in js_files:
@@ -120,7 +123,7 @@ class DuplicationScanner(JSCodeScanner):
             
             # Variable declarations might contain functions
             elif node_type == 'VariableDeclarator':
-                var_name = node.get('id', {}).get('name')
+                var_name = (node.get('id') or {}).get('name')
                 if var_name:
                     visit_node(node.get('init'), var_name)
                     return
@@ -140,14 +143,14 @@ class DuplicationScanner(JSCodeScanner):
     def _extract_function_info(self, node: Dict, node_type: str, parent_name: str, lines: List[str]) -> Dict:
         """Extract function name, location, and body."""
         if node_type == 'FunctionDeclaration':
-            name = node.get('id', {}).get('name', '<anonymous>')
+            name = (node.get('id') or {}).get('name', '<anonymous>')
         elif node_type == 'MethodDefinition':
             name = node.get('key', {}).get('name', '<method>')
             node = node.get('value', {})  # Get the actual function node
         elif node_type == 'ArrowFunctionExpression':
             name = parent_name or '<arrow>'
         else:  # FunctionExpression
-            name = node.get('id', {}).get('name') or parent_name or '<anonymous>'
+            name = (node.get('id') or {}).get('name') or parent_name or '<anonymous>'
         
         loc = node.get('loc', {})
         start = loc.get('start', {}).get('line', 0)
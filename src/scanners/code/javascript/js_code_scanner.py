@@ -4,14 +4,16 @@ from abc import abstractmethod
 from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 from pathlib import Path
 import json
-import subprocess
 from scanners.scanner import Scanner
 from scanners.violation import Violation
+from scanners.resources.js_ast_cache import JSAstCache
 
 if TYPE_CHECKING:
     from scanners.resources.scan_context import ScanFilesContext, FileScanContext, CrossFileScanContext
     from actions.rules.rule import Rule
 
+_default_js_asts: Optional[JSAstCache] = None
+
 
 class JSCodeScanner(Scanner):
     """Base class for JavaScript code scanners.
@@ -19,6 +21,7 @@ class JSCodeScanner(Scanner):
     Uses esprima (via Node.js) to parse JavaScript and provide AST analysis.
     Subclasses implement specific validation rules.
     """
+    reads_story_graph = False
     
     def __init__(self, rule: 'Rule'):
         super().__init__(rule)
@@ -26,6 +29,8 @@ class JSCodeScanner(Scanner):
     
     def scan_with_context(self, context: 'ScanFilesContext') -> List[Dict[str, Any]]:
         self.story_graph = context.story_graph
+        self._bind_parsed_files(context)
+        self._prefetch_js_asts(context.files.all_files)
         return super().scan_with_context(context)
     
     def scan_file_with_context(self, context: 'FileScanContext') -> List[Dict[str, Any]]:
@@ -58,76 +63,33 @@ class JSCodeScanner(Scanner):
             return None
     
     def _parse_js_with_esprima(self, content: str, filename: str) -> Optional[Dict]:
-        """Use esprima (via Node.js) to parse JavaScript code.
+        """Use esprima (via the shared Node.js parse server) to parse JavaScript code.
         
         Returns:
             AST dictionary or None if parsing fails
         """
-        import tempfile
-        import os
-        
-        try:
-            # Write content to temp file (avoids stdin encoding issues)
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.js', encoding='utf-8', delete=False) as f:
-                temp_path = f.name
-                f.write(content)
-            
-            try:
-                # Create a Node.js script that reads from file
-                js_script = f"""
-                const esprima = require('esprima');
-                const fs = require('fs');
-                
-                const content = fs.readFileSync('{temp_path.replace(chr(92), chr(92)+chr(92))}', 'utf-8');
-                
-                try {{
-                    // Try as module first (supports more modern syntax)
-                    const ast = esprima.parseModule(content, {{
-                        loc: true,
-                        range: true,
-                        comment: true,
-                        tolerant: true
-                    }});
-                    console.log(JSON.stringify(ast));
-                }} catch (e) {{
-                    // Fall back to script mode
-                    try {{
-                        const ast = esprima.parseScript(content, {{
-                            loc: true,
-                            range: true,
-                            comment: true,
-                            tolerant: true
-                        }});
-                        console.log(JSON.stringify(ast));
-                    }} catch (e2) {{
-                        console.error('Parse error:', e2.message);
-                        process.exit(1);
-                    }}
-                }}
-                """
-                
-                # Run Node.js with the script
-                result = subprocess.run(
-                    ['node', '-e', js_script],
-                    capture_output=True,
-                    text=True,
-                    encoding='utf-8',
-                    timeout=30
-                )
-                
-                if result.returncode != 0:
-                    return None
-                
-                ast = json.loads(result.stdout)
-                return ast
-            
-            finally:
-                # Clean up temp file
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
-        
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError, json.JSONDecodeError):
-            return None
+        return self._js_asts().parse(content)
+    
+    def _js_asts(self) -> JSAstCache:
+        """Run-wide AST cache when a validation run bound one, else the process-wide cache."""
+        if self._parsed_files is not None:
+            return self._parsed_files.js_asts
+        global _default_js_asts
+        if _default_js_asts is None:
+            _default_js_asts = JSAstCache()
+        return _default_js_asts
+    
+    def _prefetch_js_asts(self, file_paths: List[Path]) -> None:
+        """Parse every JavaScript file of the run in batched round trips before scanning file by file."""
+        sources = []
+        for file_path in file_paths:
+            if file_path and file_path.suffix == '.js' and file_path.is_file():
+                try:
+                    sources.append(file_path.read_text(encoding='utf-8'))
+                except (OSError, UnicodeDecodeError):
+                    continue
+        if sources:
+            self._js_asts().parse_many(sources)
     
     def _extract_domain_terms(self, story_graph: Dict[str, Any]) -> set:
         """Extract domain terminology from story graph."""
@@ -8,7 +8,6 @@ from scanners.violation import Violation
 
 if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
-from scanners.resources.ast_elements import Functions
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +25,7 @@ class ArrangeActAssertScanner(TestScanner):
         
         content, lines, tree = parsed
         
-        functions = Functions(tree)
+        functions = self._functions_in(tree)
         for function in functions.get_many_functions:
             if function.node.name.startswith('test_'):
                 violation = self._check_aaa_structure(function.node, content, file_path)
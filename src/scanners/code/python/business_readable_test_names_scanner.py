@@ -9,11 +9,11 @@ from scanners.violation import Violation
 
 if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
-from scanners.resources.ast_elements import Functions
 
 logger = logging.getLogger(__name__)
 
 class BusinessReadableTestNamesScanner(TestScanner):
+    reads_story_graph = True
     
     def scan_file_with_context(self, context: 'FileScanContext') -> List[Dict[str, Any]]:
         file_path = context.file_path
@@ -28,7 +28,7 @@ class BusinessReadableTestNamesScanner(TestScanner):
         content, lines, tree = parsed
         domain_language = self._extract_domain_language(story_graph)
         
-        functions = Functions(tree)
+        functions = self._functions_in(tree)
         for function in functions.get_many_functions:
             self._check_test_function_node(function.node, file_path, self.rule, domain_language, violations)
         
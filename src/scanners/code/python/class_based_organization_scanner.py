@@ -11,6 +11,7 @@ if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
 
 class ClassBasedOrganizationScanner(TestScanner):
+    reads_story_graph = True
     
     def scan_story_node(self, node: StoryNode) -> List[Dict[str, Any]]:
         return []
@@ -52,21 +53,20 @@ class ClassBasedOrganizationScanner(TestScanner):
         
         story_names = self._extract_story_names(story_graph)
         
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                if node.name.startswith('Test'):
-                    violation = self._check_class_name_matches_story(node.name, story_names, file_path)
-                    if violation:
-                        violations.append(violation)
-                    
-                    for item in node.body:
-                        if isinstance(item, ast.FunctionDef):
-                            if item.name.startswith('test_'):
-                                violation = self._check_method_name_matches_scenario(
-                                    item.name, node.name, story_names, story_graph, file_path
-                                )
-                                if violation:
-                                    violations.append(violation)
+        for node in self._nodes_of_type(tree, ast.ClassDef):
+            if node.name.startswith('Test'):
+                violation = self._check_class_name_matches_story(node.name, story_names, file_path)
+                if violation:
+                    violations.append(violation)
+                
+                for item in node.body:
+                    if isinstance(item, ast.FunctionDef):
+                        if item.name.startswith('test_'):
+                            violation = self._check_method_name_matches_scenario(
+                                item.name, node.name, story_names, story_graph, file_path
+                            )
+                            if violation:
+                                violations.append(violation)
         
         return violations
     
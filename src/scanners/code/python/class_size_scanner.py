@@ -9,7 +9,6 @@ if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
 from scanners.violation import Violation
 from scanners.complexity_metrics import ComplexityMetrics
-from scanners.resources.ast_elements import Classes
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +32,7 @@ class ClassSizeScanner(CodeScanner):
         
         content, lines, tree = parsed
         
-        classes = Classes(tree)
+        classes = self._classes_in(tree)
         for cls in classes.get_many_classes:
             violation = self._check_class_size(cls.node, file_path, content)
             if violation:
@@ -5,7 +5,6 @@ import ast
 import logging
 from scanners.code.python.code_scanner import CodeScanner
 from scanners.violation import Violation
-from scanners.resources.ast_elements import Functions
 
 if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
@@ -14,6 +13,7 @@ logger = logging.getLogger(__name__)
 
 
 class ClearParametersScanner(CodeScanner):
+    reads_story_graph = True
     
     ACCEPTABLE_PARAMETER_NAMES = {
         'data',
@@ -48,7 +48,7 @@ class ClearParametersScanner(CodeScanner):
         
         content, lines, tree = parsed
         
-        functions = Functions(tree)
+        functions = self._functions_in(tree)
         for function in functions.get_many_functions:
             violation = self._check_parameters(function.node, file_path, domain_terms, content)
             if violation:
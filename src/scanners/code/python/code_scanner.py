@@ -11,6 +11,7 @@ if TYPE_CHECKING:
     from actions.rules.rule import Rule
 
 class CodeScanner(Scanner):
+    reads_story_graph = False
     
     def __init__(self, rule: 'Rule'):
         super().__init__(rule)
@@ -142,6 +143,10 @@ class CodeScanner(Scanner):
         import logging
         logger = logging.getLogger(__name__)
         
+        if self._parsed_files is not None:
+            parsed_file = self._parsed_files.parse(file_path)
+            return parsed_file.as_tuple() if parsed_file else None
+        
         if not file_path.exists():
             return None
         
@@ -9,7 +9,6 @@ if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
 from scanners.violation import Violation
 from collections import defaultdict
-from scanners.resources.ast_elements import Functions, Classes
 
 logger = logging.getLogger(__name__)
 
@@ -30,12 +29,12 @@ class ConsistentNamingScanner(CodeScanner):
         function_names = []
         class_names = []
         
-        functions = Functions(tree)
+        functions = self._functions_in(tree)
         for function in functions.get_many_functions:
             if not (function.node.name.startswith('_') and function.node.name != '__init__'):
                 function_names.append(function.node.name)
         
-        classes = Classes(tree)
+        classes = self._classes_in(tree)
         for cls in classes.get_many_classes:
             class_names.append(cls.node.name)
         
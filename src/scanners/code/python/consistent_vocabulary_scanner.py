@@ -9,6 +9,7 @@ if TYPE_CHECKING:
 from collections import defaultdict
 
 class ConsistentVocabularyScanner(TestScanner):
+    reads_story_graph = True
     
     def scan_file_with_context(self, context: 'FileScanContext') -> List[Dict[str, Any]]:
         file_path = context.file_path
@@ -7,7 +7,6 @@ from scanners.violation import Violation
 
 if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
-from scanners.resources.ast_elements import Functions
 
 class CoverAllPathsScanner(TestScanner):
     
@@ -23,7 +22,7 @@ class CoverAllPathsScanner(TestScanner):
         
         content, lines, tree = parsed
         
-        functions = Functions(tree)
+        functions = self._functions_in(tree)
         test_methods = [function.node for function in functions.get_many_functions if function.node.name.startswith('test_')]
         
         for test_method in test_methods:
@@ -8,7 +8,6 @@ from scanners.violation import Violation
 
 if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
-from scanners.resources.ast_elements import Functions
 
 class DescriptiveFunctionNamesScanner(TestScanner):
     
@@ -24,7 +23,7 @@ class DescriptiveFunctionNamesScanner(TestScanner):
         
         content, lines, tree = parsed
         
-        functions = Functions(tree)
+        functions = self._functions_in(tree)
         for function in functions.get_many_functions:
             if not function.node.name.startswith('test_'):
                 violation = self._check_descriptive_name(function.node, file_path)
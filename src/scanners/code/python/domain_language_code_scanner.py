@@ -9,12 +9,12 @@ from scanners.code.python.code_scanner import CodeScanner
 if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
 from scanners.violation import Violation
-from scanners.resources.ast_elements import Classes
 
 logger = logging.getLogger(__name__)
 
 
 class DomainLanguageCodeScanner(CodeScanner):
+    reads_story_graph = True
     
     GENERATE_PATTERNS = [r'^generate_', r'^calculate_']
     
@@ -55,7 +55,7 @@ class DomainLanguageCodeScanner(CodeScanner):
         
         content, lines, tree = parsed
         
-        classes = Classes(tree)
+        classes = self._classes_in(tree)
         for cls in classes.get_many_classes:
             class_violations = self._check_domain_language(cls.node, file_path, domain_terms, generic_names)
             violations.extend(class_violations)
@@ -7,8 +7,9 @@ import logging
 from scanners.code.python.code_scanner import CodeScanner
 
 if TYPE_CHECKING:
-    from scanners.resources.scan_context import FileScanContext
+    from scanners.resources.scan_context import FileScanContext, CrossFileScanContext
 from scanners.violation import Violation
+from scanners.resources.similarity_index import SimilarityIndex
 import hashlib
 from difflib import SequenceMatcher
 import json
@@ -1900,77 +1901,35 @@ class DuplicationScanner(CodeScanner):
         
         _safe_print("")
     
-    def _filter_files_by_package_proximity(
-        self,
-        changed_files: List[Path],
-        all_files: List[Path],
-        max_parent_levels: int = 3,
-        max_files: int = 20
-    ) -> List[Path]:
-        """Filter all_files to only include files in nearby packages.
-        
-        Priority:
-        1. Same package (immediate siblings)
-        2. Parent package
-        3. Parent's parent package (up to max_parent_levels)
-        
-        Stops adding files once max_files limit is reached.
-        
-        Args:
-            changed_files: Files that were changed (to determine package context)
-            all_files: All files available for comparison
-            max_parent_levels: Maximum number of parent levels to traverse (default: 3)
-            max_files: Maximum number of files to include in comparison (default: 20)
-        
-        Returns:
-            Filtered list of files in nearby packages (up to max_files)
-        """
-        if not changed_files:
-            return all_files[:max_files] if len(all_files) > max_files else all_files
-        
-        nearby_files = []
-        seen_files = set()
-        
-        for changed_file in changed_files:
-            if len(nearby_files) >= max_files:
-                break
-            
-            changed_dir = changed_file.parent
-            
-            for file in all_files:
-                if len(nearby_files) >= max_files:
-                    break
-                if file not in seen_files and file.parent == changed_dir:
-                    nearby_files.append(file)
-                    seen_files.add(file)
-            
-            current_dir = changed_dir
-            for level in range(1, max_parent_levels + 1):
-                if len(nearby_files) >= max_files:
-                    break
-                
-                current_dir = current_dir.parent
-                if not current_dir or current_dir == current_dir.parent:
-                    break
-                
-                for file in all_files:
-                    if len(nearby_files) >= max_files:
-                        break
-                    
-                    if file in seen_files:
-                        continue
-                    
-                    if file.parent == current_dir:
-                        nearby_files.append(file)
-                        seen_files.add(file)
-                    elif file.parent.parent == current_dir:
-                        nearby_files.append(file)
-                        seen_files.add(file)
-        
-        if len(nearby_files) < len(all_files):
-            _safe_print(f"[CROSS-FILE] Filtered to {len(nearby_files)} nearby files (from {len(all_files)} total, max: {max_files}) based on package proximity")
-        
-        return nearby_files
+    def _find_candidate_block_pairs(self, changed_blocks: List[Dict], all_blocks: List[Dict], max_comparisons: int) -> List[Tuple[Dict, Dict]]:
+        index = SimilarityIndex()
+        for idx, block in enumerate(all_blocks):
+            index.add(idx, block['preview'])
+        logger.info(f"[CROSS-FILE] Indexed {len(index)} reference blocks for near-duplicate lookup")
+        
+        candidate_pairs = []
+        seen_pairs = set()
+        for block1 in changed_blocks:
+            key1 = (str(block1['file_path']), block1['start_line'], block1['end_line'])
+            partners = [all_blocks[idx] for idx in index.ranked_candidates(block1['preview'])]
+            partners = [block2 for block2 in partners if block1['file_path'] != block2['file_path']]
+            for block2 in partners[:max_comparisons]:
+                # A block from a changed file is also a reference block, so each pair can turn up from both ends
+                pair = frozenset((key1, (str(block2['file_path']), block2['start_line'], block2['end_line'])))
+                if pair not in seen_pairs:
+                    seen_pairs.add(pair)
+                    candidate_pairs.append((block1, block2))
+        return candidate_pairs
+    
+    def scan_cross_file_with_context(self, context: 'CrossFileScanContext') -> List[Dict[str, Any]]:
+        return self.scan_cross_file(
+            test_files=context.test_files,
+            code_files=context.code_files,
+            all_test_files=context.all_test_files,
+            all_code_files=context.all_code_files,
+            status_writer=context.status_writer,
+            max_cross_file_comparisons=context.max_comparisons
+        )
     
     def scan_cross_file(
         self = None,
@@ -2003,13 +1962,10 @@ class DuplicationScanner(CodeScanner):
         if not changed_files or not all_files:
             return violations
         
-        all_files = self._filter_files_by_package_proximity(changed_files, all_files, max_files=max_cross_file_comparisons)
-        
         if len(changed_files) < len(all_files):
-            _safe_print(f"\n[CROSS-FILE] Incremental scan: Checking {len(changed_files)} changed file(s) against {len(all_files)} total files...")
+            logger.info(f"[CROSS-FILE] Incremental scan: Checking {len(changed_files)} changed file(s) against {len(all_files)} total files...")
         else:
-            _safe_print(f"\n[CROSS-FILE] Full scan: Scanning {len(all_files)} files for cross-file duplication...")
-        import sys
+            logger.info(f"[CROSS-FILE] Full scan: Scanning {len(all_files)} files for cross-file duplication...")
         
         def write_status(msg: str):
             if status_writer and hasattr(status_writer, 'write_cross_file_progress'):
@@ -2024,18 +1980,17 @@ class DuplicationScanner(CodeScanner):
         changed_blocks = []
         all_blocks = []
         
-        _safe_print(f"[CROSS-FILE] Extracting blocks from {len(changed_files)} changed file(s)...")
+        logger.info(f"[CROSS-FILE] Extracting blocks from {len(changed_files)} changed file(s)...")
         for file_idx, file_path in enumerate(changed_files):
             if file_idx % 10 == 0:
-                _safe_print(f"[CROSS-FILE] Changed files: {file_idx}/{len(changed_files)} - {file_path.name}")
-                sys.stdout.flush()
+                logger.info(f"[CROSS-FILE] Changed files: {file_idx}/{len(changed_files)} - {file_path.name}")
             if not file_path.exists():
                 continue
             
             try:
                 file_size = file_path.stat().st_size
                 if file_size > MAX_FILE_SIZE:
-                    _safe_print(f"Skipping large file ({file_size/1024:.1f}KB): {file_path}")
+                    logger.info(f"Skipping large file ({file_size/1024:.1f}KB): {file_path}")
                     continue
             except Exception as e:
                 logger.debug(f'Error checking file size for {file_path}: {type(e).__name__}: {e}')
@@ -2067,17 +2022,16 @@ class DuplicationScanner(CodeScanner):
                 logger.debug(f'Skipping file {file_path} due to {type(e).__name__}: {e}')
                 continue
             except Exception as e:
-                _safe_print(f"Error processing {file_path} for cross-file scan: {e}")
+                logger.warning(f"Error processing {file_path} for cross-file scan: {e}")
                 continue
         
-        _safe_print(f"\n[CROSS-FILE] Extracting blocks from {len(all_files)} reference file(s)...")
+        logger.info(f"[CROSS-FILE] Extracting blocks from {len(all_files)} reference file(s)...")
         cache_hits = 0
         cache_misses = 0
         
         for file_idx, file_path in enumerate(all_files):
             if file_idx % 10 == 0:
-                _safe_print(f"[CROSS-FILE] Reference files: {file_idx}/{len(all_files)} - {file_path.name} (cache: {cache_hits} hits, {cache_misses} misses)")
-                sys.stdout.flush()
+                logger.info(f"[CROSS-FILE] Reference files: {file_idx}/{len(all_files)} - {file_path.name} (cache: {cache_hits} hits, {cache_misses} misses)")
             
             if not file_path.exists():
                 continue
@@ -2101,7 +2055,7 @@ class DuplicationScanner(CodeScanner):
             try:
                 file_size = file_path.stat().st_size
                 if file_size > MAX_FILE_SIZE:
-                    _safe_print(f"Skipping large file ({file_size/1024:.1f}KB): {file_path}")
+                    logger.info(f"Skipping large file ({file_size/1024:.1f}KB): {file_path}")
                     continue
             except Exception as e:
                 logger.debug(f'Error checking file size for {file_path}: {type(e).__name__}: {e}')
@@ -2137,22 +2091,22 @@ class DuplicationScanner(CodeScanner):
                 logger.debug(f'Skipping file {file_path} due to {type(e).__name__}: {e}')
                 continue
             except Exception as e:
-                _safe_print(f"Error processing {file_path} for cross-file scan: {e}")
+                logger.warning(f"Error processing {file_path} for cross-file scan: {e}")
                 continue
         
-        _safe_print(f"[CROSS-FILE] Cache statistics: {cache_hits} hits, {cache_misses} misses ({cache_hits/(cache_hits+cache_misses)*100:.1f}% hit rate)" if (cache_hits + cache_misses) > 0 else "[CROSS-FILE] No files processed")
+        logger.info(f"[CROSS-FILE] Cache statistics: {cache_hits} hits, {cache_misses} misses ({cache_hits/(cache_hits+cache_misses)*100:.1f}% hit rate)" if (cache_hits + cache_misses) > 0 else "[CROSS-FILE] No files processed")
         
-        _safe_print(f"\n[CROSS-FILE] Extracted {len(changed_blocks)} blocks from changed files, {len(all_blocks)} blocks from all files")
+        logger.info(f"[CROSS-FILE] Extracted {len(changed_blocks)} blocks from changed files, {len(all_blocks)} blocks from all files")
         write_status(f"Extracted {len(changed_blocks)} changed blocks, {len(all_blocks)} reference blocks")
         
         SIMILARITY_THRESHOLD = 0.90
-        compared_pairs = set()
-        total_comparisons = len(changed_blocks) * len(all_blocks)
+        candidate_pairs = self._find_candidate_block_pairs(changed_blocks, all_blocks, max_cross_file_comparisons)
+        total_comparisons = len(candidate_pairs)
         comparison_count = 0
         last_progress = 0
         
-        _safe_print(f"[CROSS-FILE] Starting {total_comparisons:,} pairwise comparisons (changed vs all)...")
-        write_status(f"Starting {total_comparisons:,} pairwise comparisons...")
+        logger.info(f"[CROSS-FILE] Starting {total_comparisons:,} candidate comparisons (of {len(changed_blocks) * len(all_blocks):,} possible pairs)...")
+        write_status(f"Starting {total_comparisons:,} candidate comparisons...")
         
         start_time = datetime.now()
         last_report_time = start_time
@@ -2160,93 +2114,83 @@ class DuplicationScanner(CodeScanner):
         REPORT_INTERVAL_COMPARISONS = 50000
         last_comparison_report = 0
         
-        for i, block1 in enumerate(changed_blocks):
-            for j, block2 in enumerate(all_blocks):
-                if block1['file_path'] == block2['file_path']:
-                    continue
+        for block1, block2 in candidate_pairs:
+            comparison_count += 1
+            
+            now = datetime.now()
+            elapsed_since_report = (now - last_report_time).total_seconds()
+            progress_pct = (comparison_count * 100) // total_comparisons if total_comparisons > 0 else 0
+            
+            should_report = (
+                progress_pct >= last_progress + 5 or
+                comparison_count >= last_comparison_report + REPORT_INTERVAL_COMPARISONS or
+                elapsed_since_report >= REPORT_INTERVAL_SECONDS
+            )
+            
+            if should_report:
+                elapsed_total = (now - start_time).total_seconds()
+                rate = comparison_count / max(1, elapsed_total)
+                remaining = total_comparisons - comparison_count
+                eta_seconds = int(remaining / max(1, rate))
+                progress_msg = f"Comparing: {progress_pct}% ({comparison_count:,}/{total_comparisons:,}) - {len(violations)} violations - ETA: {eta_seconds}s"
+                logger.info(f"[CROSS-FILE] {progress_msg}")
+                write_status(progress_msg + "  ")
+                last_progress = progress_pct
+                last_report_time = now
+                last_comparison_report = comparison_count
+            
+            if 'ast_nodes' in block1 and 'ast_nodes' in block2:
+                ast_similarity = self._compare_ast_blocks(block1['ast_nodes'], block2['ast_nodes'])
+            else:
+                ast_similarity = 0.0
+            
+            normalized_similarity = SequenceMatcher(None, block1['normalized'], block2['normalized']).ratio()
+            
+            preview1_normalized = ' '.join(block1['preview'].split())
+            preview2_normalized = ' '.join(block2['preview'].split())
+            content_similarity = SequenceMatcher(None, preview1_normalized, preview2_normalized).ratio()
+            
+            if ast_similarity >= SIMILARITY_THRESHOLD or (normalized_similarity >= SIMILARITY_THRESHOLD and content_similarity >= 0.85):
+                file1 = block1['file_path']
+                file2 = block2['file_path']
+                func1 = block1['func_name']
+                func2 = block2['func_name']
+                start1 = block1['start_line']
+                end1 = block1['end_line']
+                start2 = block2['start_line']
+                end2 = block2['end_line']
                 
-                if (block1['file_path'] == block2['file_path'] and 
-                    block1['start_line'] == block2['start_line'] and
-                    block1['func_name'] == block2['func_name']):
-                    continue
+                preview1 = block1['preview']
+                preview2 = block2['preview']
                 
-                comparison_count += 1
+                if len(preview1) > 300:
+                    preview1 = preview1[:300] + '...'
+                if len(preview2) > 300:
+                    preview2 = preview2[:300] + '...'
                 
-                now = datetime.now()
-                elapsed_since_report = (now - last_report_time).total_seconds()
-                progress_pct = (comparison_count * 100) // total_comparisons if total_comparisons > 0 else 0
+                location1 = f"{file1.name}:{func1} (lines {start1}-{end1})"
+                location2 = f"{file2.name}:{func2} (lines {start2}-{end2})"
                 
-                should_report = (
-                    progress_pct >= last_progress + 5 or
-                    comparison_count >= last_comparison_report + REPORT_INTERVAL_COMPARISONS or
-                    elapsed_since_report >= REPORT_INTERVAL_SECONDS
+                violation_message = (
+                    f'Duplicate code detected across files - extract to shared function.\n\n'
+                    f'Location 1 ({location1}):\n```python\n{preview1}\n```\n\n'
+                    f'Location 2 ({location2}):\n```python\n{preview2}\n```'
                 )
                 
-                if should_report:
-                    elapsed_total = (now - start_time).total_seconds()
-                    rate = comparison_count / max(1, elapsed_total)
-                    remaining = total_comparisons - comparison_count
-                    eta_seconds = int(remaining / max(1, rate))
-                    progress_msg = f"Comparing: {progress_pct}% ({comparison_count:,}/{total_comparisons:,}) - {len(violations)} violations - ETA: {eta_seconds}s"
-                    _safe_print(f"[CROSS-FILE] {progress_msg}")
-                    write_status(progress_msg + "  ")
-                    last_progress = progress_pct
-                    last_report_time = now
-                    last_comparison_report = comparison_count
-                
-                if 'ast_nodes' in block1 and 'ast_nodes' in block2:
-                    ast_similarity = self._compare_ast_blocks(block1['ast_nodes'], block2['ast_nodes'])
-                else:
-                    ast_similarity = 0.0
-                
-                normalized_similarity = SequenceMatcher(None, block1['normalized'], block2['normalized']).ratio()
-                
-                preview1_normalized = ' '.join(block1['preview'].split())
-                preview2_normalized = ' '.join(block2['preview'].split())
-                content_similarity = SequenceMatcher(None, preview1_normalized, preview2_normalized).ratio()
+                violation = Violation(
+                    rule=self.rule,
+                    violation_message=violation_message,
+                    location=str(file1),
+                    line_number=start1,
+                    severity='error'
+                ).to_dict()
+                violations.append(violation)
                 
-                if ast_similarity >= SIMILARITY_THRESHOLD or (normalized_similarity >= SIMILARITY_THRESHOLD and content_similarity >= 0.85):
-                    file1 = block1['file_path']
-                    file2 = block2['file_path']
-                    func1 = block1['func_name']
-                    func2 = block2['func_name']
-                    start1 = block1['start_line']
-                    end1 = block1['end_line']
-                    start2 = block2['start_line']
-                    end2 = block2['end_line']
-                    
-                    preview1 = block1['preview']
-                    preview2 = block2['preview']
-                    
-                    if len(preview1) > 300:
-                        preview1 = preview1[:300] + '...'
-                    if len(preview2) > 300:
-                        preview2 = preview2[:300] + '...'
-                    
-                    location1 = f"{file1.name}:{func1} (lines {start1}-{end1})"
-                    location2 = f"{file2.name}:{func2} (lines {start2}-{end2})"
-                    
-                    violation_message = (
-                        f'Duplicate code detected across files - extract to shared function.\n\n'
-                        f'Location 1 ({location1}):\n```python\n{preview1}\n```\n\n'
-                        f'Location 2 ({location2}):\n```python\n{preview2}\n```'
-                    )
-                    
-                    violation = Violation(
-                        rule=self.rule,
-                        violation_message=violation_message,
-                        location=str(file1),
-                        line_number=start1,
-                        severity='error'
-                    ).to_dict()
-                    violations.append(violation)
-                    
-                    if len(violations) % 10 == 0:
-                        write_status(f"Found {len(violations)} violations so far...")
-                        sys.stdout.flush()
+                if len(violations) % 10 == 0:
+                    write_status(f"Found {len(violations)} violations so far...")
         
         complete_msg = f"Complete: {comparison_count} comparisons, {len(violations)} violations"
-        _safe_print(f"\n[CROSS-FILE] {complete_msg}")
+        logger.info(f"[CROSS-FILE] {complete_msg}")
         write_status(complete_msg)
         write_status("")
         return violations
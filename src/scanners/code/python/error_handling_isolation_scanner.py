@@ -7,7 +7,7 @@ from scanners.code.python.code_scanner import CodeScanner
 if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
 from scanners.violation import Violation
-from scanners.resources.ast_elements import Functions, TryBlocks
+from scanners.resources.ast_elements import TryBlocks
 
 class ErrorHandlingIsolationScanner(CodeScanner):
     
@@ -30,7 +30,7 @@ class ErrorHandlingIsolationScanner(CodeScanner):
     def _check_mixed_error_handling(self, tree: ast.AST, content: str, file_path: Path) -> List[Dict[str, Any]]:
         violations = []
         
-        functions = Functions(tree)
+        functions = self._functions_in(tree)
         for function in functions.get_many_functions:
             try_blocks_collection = TryBlocks(function.node)
             try_blocks_count = len(try_blocks_collection.get_many_try_blocks)
@@ -8,9 +8,9 @@ from scanners.violation import Violation
 
 if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
-from scanners.resources.ast_elements import Functions
 
 class ExactVariableNamesScanner(TestScanner):
+    reads_story_graph = True
     
     def scan_file_with_context(self, context: 'FileScanContext') -> List[Dict[str, Any]]:
         file_path = context.file_path
@@ -26,7 +26,7 @@ class ExactVariableNamesScanner(TestScanner):
         
         domain_concepts = self._extract_domain_concepts(story_graph)
         
-        functions = Functions(tree)
+        functions = self._functions_in(tree)
         for function in functions.get_many_functions:
             if function.node.name.startswith('test_'):
                 violations.extend(self._check_variable_names(function.node, domain_concepts, file_path))
@@ -7,7 +7,6 @@ from scanners.code.python.code_scanner import CodeScanner
 if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
 from scanners.violation import Violation
-from scanners.resources.ast_elements import TryBlocks
 
 class ExceptionHandlingScanner(CodeScanner):
     
@@ -31,7 +30,7 @@ class ExceptionHandlingScanner(CodeScanner):
         violations = []
         lines = content.split('\n')
         
-        try_blocks = TryBlocks(tree)
+        try_blocks = self._try_blocks_in(tree)
         for try_block in try_blocks.get_many_try_blocks:
             for handler in try_block.node.handlers:
                 handler_body = handler.body
@@ -7,7 +7,7 @@ from scanners.code.python.code_scanner import CodeScanner
 
 if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
-from scanners.resources.ast_elements import Functions, IfStatements
+from scanners.resources.ast_elements import IfStatements
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +31,7 @@ class ExcessiveGuardsScanner(CodeScanner):
         
         content, lines, tree = parsed
         
-        functions = Functions(tree)
+        functions = self._functions_in(tree)
         for function in functions.get_many_functions:
             if function.is_test_function:
                 continue
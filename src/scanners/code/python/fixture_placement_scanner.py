@@ -7,7 +7,6 @@ from scanners.violation import Violation
 
 if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
-from scanners.resources.ast_elements import Imports
 
 class FixturePlacementScanner(TestScanner):
     
@@ -30,7 +29,7 @@ class FixturePlacementScanner(TestScanner):
     def _check_fixture_imports(self, tree: ast.AST, file_path: Path) -> List[Dict[str, Any]]:
         violations = []
         
-        imports = Imports(tree)
+        imports = self._imports_in(tree)
         for import_stmt in imports.get_many_imports:
             if isinstance(import_stmt.node, ast.ImportFrom):
                 if import_stmt.node.module and 'fixture' in import_stmt.node.module.lower():
@@ -8,7 +8,6 @@ from scanners.violation import Violation
 
 if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
-from scanners.resources.ast_elements import Functions
 
 class GivenWhenThenHelpersScanner(TestScanner):
     
@@ -36,7 +35,7 @@ class GivenWhenThenHelpersScanner(TestScanner):
         
         helper_functions = self._get_helper_functions(tree, content)
         
-        functions = Functions(tree)
+        functions = self._functions_in(tree)
         for function in functions.get_many_functions:
             if function.node.name.startswith('test_'):
                 test_violations = self._check_test_method(
@@ -9,12 +9,12 @@ from scanners.code.python.code_scanner import CodeScanner
 if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
 from scanners.violation import Violation
-from scanners.resources.ast_elements import Functions, Classes
 
 logger = logging.getLogger(__name__)
 
 
 class IntentionRevealingNamesScanner(CodeScanner):
+    reads_story_graph = True
     
     ACCEPTABLE_DOMAIN_TERMS = {
         'scan', 'scan_test_file', 'scan_code_file', 'scan_cross_file',
@@ -71,39 +71,38 @@ class IntentionRevealingNamesScanner(CodeScanner):
         
         acceptable_single_letter_names = self._collect_loop_and_comprehension_var_names(tree)
         
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Name):
-                var_name = node.id
-                
-                if self._is_in_docstring_or_comment(node, content, docstring_ranges):
+        for node in self._nodes_of_type(tree, ast.Name):
+            var_name = node.id
+            
+            if self._is_in_docstring_or_comment(node, content, docstring_ranges):
+                continue
+            
+            if isinstance(node.ctx, ast.Store):
+                if self._is_acceptable_in_context(node, tree, content):
+                    continue
+            
+            always_allowed = {'i', 'j', 'k', '_'}
+            if len(var_name) == 1:
+                if var_name in always_allowed:
+                    continue
+                if var_name in acceptable_single_letter_names:
+                    continue
+                violations.append(self._create_generic_name_violation(
+                    self.rule, file_path, node, var_name, 'variable', 'single-letter'
+                ))
+                continue
+            
+            var_name_lower = var_name.lower()
+            if var_name_lower in generic_names:
+                if var_name_lower in domain_terms:
                     continue
-                
-                if isinstance(node.ctx, ast.Store):
-                    if self._is_acceptable_in_context(node, tree, content):
-                        continue
-                
-                always_allowed = {'i', 'j', 'k', '_'}
-                if len(var_name) == 1:
-                    if var_name in always_allowed:
-                        continue
-                    if var_name in acceptable_single_letter_names:
-                        continue
+                if not self._is_acceptable_in_context(node, tree, content):
                     violations.append(self._create_generic_name_violation(
-                        self.rule, file_path, node, var_name, 'variable', 'single-letter'
+                        self.rule, file_path, node, var_name, 'variable', 'generic'
                     ))
+            elif domain_terms:
+                if self._matches_domain_term(var_name, domain_terms):
                     continue
-                
-                var_name_lower = var_name.lower()
-                if var_name_lower in generic_names:
-                    if var_name_lower in domain_terms:
-                        continue
-                    if not self._is_acceptable_in_context(node, tree, content):
-                        violations.append(self._create_generic_name_violation(
-                            self.rule, file_path, node, var_name, 'variable', 'generic'
-                        ))
-                elif domain_terms:
-                    if self._matches_domain_term(var_name, domain_terms):
-                        continue
         
         return violations
     
@@ -150,7 +149,9 @@ class IntentionRevealingNamesScanner(CodeScanner):
     def _collect_loop_and_comprehension_var_names(self, tree: ast.AST) -> set:
         acceptable_names = set()
         
-        for node in ast.walk(tree):
+        for node in self._nodes_of_type(
+            tree, ast.For, ast.ExceptHandler, ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp, ast.Lambda, ast.With
+        ):
             self._collect_var_names_from_node(node, acceptable_names)
         
         return acceptable_names
@@ -191,7 +192,7 @@ class IntentionRevealingNamesScanner(CodeScanner):
         if domain_terms is None:
             domain_terms = set()
         
-        functions = Functions(tree)
+        functions = self._functions_in(tree)
         for function in functions.get_many_functions:
             func_name = function.node.name
             func_name_lower = func_name.lower()
@@ -222,7 +223,7 @@ class IntentionRevealingNamesScanner(CodeScanner):
         
         acceptable_class_patterns = ['Scanner', 'CodeScanner', 'TestScanner', 'StoryScanner']
         
-        classes = Classes(tree)
+        classes = self._classes_in(tree)
         for cls in classes.get_many_classes:
             class_name = cls.node.name
             class_name_lower = class_name.lower()
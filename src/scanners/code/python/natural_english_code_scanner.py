@@ -8,7 +8,6 @@ from scanners.code.python.code_scanner import CodeScanner
 if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
 from scanners.violation import Violation
-from scanners.resources.ast_elements import Functions
 
 class NaturalEnglishCodeScanner(CodeScanner):
     
@@ -31,7 +30,7 @@ class NaturalEnglishCodeScanner(CodeScanner):
         
         content, lines, tree = parsed
         
-        functions = Functions(tree)
+        functions = self._functions_in(tree)
         for function in functions.get_many_functions:
             violation = self._check_natural_english(function.node, file_path, content)
             if violation:
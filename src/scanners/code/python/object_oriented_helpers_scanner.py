@@ -27,8 +27,8 @@ class ObjectOrientedHelpersScanner(TestScanner):
 
         content, lines, tree = parsed
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef) and node.name.startswith("test"):
+        for node in self._nodes_of_type(tree, ast.FunctionDef):
+            if node.name.startswith("test"):
                 helper_used = self._uses_helper(node)
                 param_count = self._count_params(node)
                 parametrize_cols = self._parametrize_column_count(node)
@@ -10,7 +10,6 @@ from scanners.code.python.code_scanner import CodeScanner
 if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
 from scanners.violation import Violation
-from scanners.resources.ast_elements import Functions
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +44,7 @@ class PrimitiveVsObjectScanner(CodeScanner):
         
         content, lines, tree = parsed
         
-        functions = Functions(tree)
+        functions = self._functions_in(tree)
         for function in functions.get_many_functions:
             func_violations = self._check_function_parameters(function.node, content, file_path)
             violations.extend(func_violations)
@@ -8,7 +8,6 @@ from scanners.code.python.code_scanner import CodeScanner
 if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
 from scanners.violation import Violation
-from scanners.resources.ast_elements import Classes
 
 class PropertyEncapsulationCodeScanner(CodeScanner):
     
@@ -24,7 +23,7 @@ class PropertyEncapsulationCodeScanner(CodeScanner):
         
         content, lines, tree = parsed
         
-        classes = Classes(tree)
+        classes = self._classes_in(tree)
         for cls in classes.get_many_classes:
             class_violations = self._check_encapsulation(cls.node, content, file_path)
             violations.extend(class_violations)
@@ -13,6 +13,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 class RealImplementationsScanner(TestScanner):
+    reads_story_graph = True
     
     def scan_file_with_context(self, context: 'FileScanContext') -> List[Dict[str, Any]]:
         file_path = context.file_path
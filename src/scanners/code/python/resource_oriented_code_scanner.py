@@ -9,7 +9,6 @@ from scanners.code.python.code_scanner import CodeScanner
 if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
 from scanners.violation import Violation
-from scanners.resources.ast_elements import Classes
 from scanners.vocabulary_helper import VocabularyHelper
 
 logger = logging.getLogger(__name__)
@@ -85,7 +84,7 @@ class ResourceOrientedCodeScanner(CodeScanner):
                 content = file_path.read_text(encoding='utf-8')
                 tree = ast.parse(content, filename=str(file_path))
                 
-                classes = Classes(tree)
+                classes = self._classes_in(tree)
                 for cls in classes.get_many_classes:
                     all_classes[(file_path, cls.node.name)] = cls.node
                     
@@ -8,7 +8,6 @@ from scanners.code.python.code_scanner import CodeScanner
 
 if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
-from scanners.resources.ast_elements import Functions
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +25,7 @@ class SeparateConcernsScanner(CodeScanner):
         
         content, lines, tree = parsed
         
-        functions = Functions(tree)
+        functions = self._functions_in(tree)
         for function in functions.get_many_functions:
             violation = self._check_mixed_concerns(function.node, content, file_path)
             if violation:
@@ -7,7 +7,6 @@ from scanners.code.python.code_scanner import CodeScanner
 if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
 from scanners.violation import Violation
-from scanners.resources.ast_elements import Functions
 
 class SimplifyControlFlowScanner(CodeScanner):
     
@@ -23,7 +22,7 @@ class SimplifyControlFlowScanner(CodeScanner):
         
         content, lines, tree = parsed
         
-        functions = Functions(tree)
+        functions = self._functions_in(tree)
         for function in functions.get_many_functions:
             violation = self._check_nesting_depth(function.node, file_path, content)
             if violation:
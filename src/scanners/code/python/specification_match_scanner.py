@@ -9,11 +9,11 @@ from scanners.violation import Violation
 
 if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
-from scanners.resources.ast_elements import Functions
 
 logger = logging.getLogger(__name__)
 
 class SpecificationMatchScanner(TestScanner):
+    reads_story_graph = True
     
     def scan_file_with_context(self, context: 'FileScanContext') -> List[Dict[str, Any]]:
         file_path = context.file_path
@@ -45,7 +45,7 @@ class SpecificationMatchScanner(TestScanner):
             r'^test_\w+_(init|setup|create|new|get|set|run|execute|do|handle|process|check|verify)$',
         ]
         
-        functions = Functions(tree)
+        functions = self._functions_in(tree)
         for function in functions.get_many_functions:
             if not function.node.name.startswith('test_'):
                 continue
@@ -9,11 +9,11 @@ from scanners.violation import Violation
 
 if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
-from scanners.resources.ast_elements import Classes
 
 logger = logging.getLogger(__name__)
 
 class StoryGraphMatchScanner(TestScanner):
+    reads_story_graph = True
     
     def scan_file_with_context(self, context: 'FileScanContext') -> List[Dict[str, Any]]:
         file_path = context.file_path
@@ -51,7 +51,7 @@ class StoryGraphMatchScanner(TestScanner):
     def _check_test_classes_match_stories(self, tree: ast.AST, story_names: List[str], file_path: Path) -> List[Dict[str, Any]]:
         violations = []
         
-        classes = Classes(tree)
+        classes = self._classes_in(tree)
         for cls in classes.get_many_classes:
             if cls.node.name.startswith('Test'):
                 story_name_from_class = cls.node.name[4:]
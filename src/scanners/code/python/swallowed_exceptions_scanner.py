@@ -7,7 +7,6 @@ from scanners.code.python.code_scanner import CodeScanner
 if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
 from scanners.violation import Violation
-from scanners.resources.ast_elements import TryBlocks
 
 class SwallowedExceptionsScanner(CodeScanner):
     
@@ -30,7 +29,7 @@ class SwallowedExceptionsScanner(CodeScanner):
     def _check_swallowed_exceptions(self, tree: ast.AST, file_path: Path, content: str) -> List[Dict[str, Any]]:
         violations = []
         
-        try_blocks = TryBlocks(tree)
+        try_blocks = self._try_blocks_in(tree)
         for try_block in try_blocks.get_many_try_blocks:
             for handler in try_block.exception_handlers:
                 handler_body = handler.body
@@ -9,7 +9,6 @@ from scanners.code.python.code_scanner import CodeScanner
 if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
 from scanners.violation import Violation
-from scanners.resources.ast_elements import Classes
 from scanners.vocabulary_helper import VocabularyHelper
 
 class TechnicalAbstractionCodeScanner(CodeScanner):
@@ -26,7 +25,7 @@ class TechnicalAbstractionCodeScanner(CodeScanner):
         
         content, lines, tree = parsed
         
-        classes = Classes(tree)
+        classes = self._classes_in(tree)
         for cls in classes.get_many_classes:
             violation = self._check_technical_abstraction(cls.node, file_path)
             if violation:
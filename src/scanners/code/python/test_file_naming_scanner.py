@@ -16,6 +16,7 @@ logger = logging.getLogger(__name__)
 
 
 class TestFileNamingScanner(TestScanner):
+    reads_story_graph = True
     
     def scan_file_with_context(self, context: 'FileScanContext') -> List[Dict[str, Any]]:
         file_path = context.file_path
@@ -10,7 +10,6 @@ from scanners.violation import Violation
 
 if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
-from scanners.resources.ast_elements import Functions
 
 logger = logging.getLogger(__name__)
 
@@ -78,7 +77,7 @@ class TestQualityScanner(TestScanner):
         violations = []
         generic_names = ['test_1', 'test_2', 'test_basic', 'test_simple', 'test_default']
         
-        functions = Functions(tree)
+        functions = self._functions_in(tree)
         for function in functions.get_many_functions:
             if not function.node.name.startswith('test_'):
                 continue
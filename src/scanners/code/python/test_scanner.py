@@ -12,6 +12,7 @@ if TYPE_CHECKING:
 
 
 class TestScanner(Scanner):
+    reads_story_graph = False
     
     def __init__(self, rule: 'Rule'):
         super().__init__(rule)
@@ -25,6 +26,10 @@ class TestScanner(Scanner):
         return self._empty_violation_list()
     
     def _parse_test_file(self, test_file_path: Path) -> Optional[Tuple[str, ast.AST]]:
+        if self._parsed_files is not None:
+            parsed_file = self._parsed_files.parse(test_file_path)
+            return (parsed_file.content, parsed_file.tree) if parsed_file else None
+        
         if not test_file_path.exists():
             return None
         
@@ -39,6 +44,10 @@ class TestScanner(Scanner):
         import logging
         logger = logging.getLogger(__name__)
         
+        if self._parsed_files is not None:
+            parsed_file = self._parsed_files.parse(file_path)
+            return parsed_file.as_tuple() if parsed_file else None
+        
         if not file_path.exists():
             return None
         
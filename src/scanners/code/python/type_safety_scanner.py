@@ -9,7 +9,6 @@ from scanners.code.python.code_scanner import CodeScanner
 if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
 from scanners.violation import Violation
-from scanners.resources.ast_elements import Functions
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +42,7 @@ class TypeSafetyScanner(CodeScanner):
         if file_path.name.startswith('test_'):
             return violations
         
-        functions = Functions(tree)
+        functions = self._functions_in(tree)
         for function in functions.get_many_functions:
             func_violations = self._check_function_type_safety(function.node, file_path, self.rule, content)
             violations.extend(func_violations)
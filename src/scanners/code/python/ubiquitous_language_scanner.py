@@ -14,6 +14,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 class UbiquitousLanguageScanner(TestScanner):
+    reads_story_graph = True
     
     def scan_file_with_context(self, context: 'FileScanContext') -> List[Dict[str, Any]]:
         file_path = context.file_path
@@ -86,25 +87,25 @@ class UbiquitousLanguageScanner(TestScanner):
     def _extract_classes_under_test(self, tree: ast.AST, content: str, lines: List[str]) -> List[Tuple[str, int, str]]:
         classes_used = []
         
-        class ClassVisitor(ast.NodeVisitor):
+        class ClassVisitor:
             def __init__(self):
                 self.classes = []
             
-            def visit_Call(self, node: ast.Call):
+            def enter_Call(self, event):
+                node = event.node
                 if isinstance(node.func, ast.Name):
                     class_name = node.func.id
                     line_num = node.lineno
                     snippet = self._get_code_snippet(lines, line_num)
                     self.classes.append((class_name, line_num, snippet))
-                self.generic_visit(node)
             
-            def visit_ImportFrom(self, node: ast.ImportFrom):
+            def enter_ImportFrom(self, event):
+                node = event.node
                 for alias in node.names:
                     class_name = alias.name
                     line_num = node.lineno
                     snippet = self._get_code_snippet(lines, line_num)
                     self.classes.append((class_name, line_num, snippet))
-                self.generic_visit(node)
             
             def _get_code_snippet(self, lines: List[str], line_num: int, context: int = 2) -> str:
                 start = max(0, line_num - context - 1)
@@ -113,7 +114,7 @@ class UbiquitousLanguageScanner(TestScanner):
         
         try:
             visitor = ClassVisitor()
-            visitor.visit(tree)
+            self._dispatch_ast(tree, visitor)
             classes_used = visitor.classes
         except Exception as e:
             logger.warning(f"Error extracting classes from AST: {e}")
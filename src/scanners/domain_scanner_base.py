@@ -13,7 +13,8 @@ Subclasses:
 
 from typing import List, Dict, Any, Optional, Set, TYPE_CHECKING
 from scanners.story_scanner import StoryScanner
-from scanners.story_map import StoryNode, Story, StoryMap
+from scanners.story_map import StoryNode, Story
+from scanners.resources.story_model import StoryModel, concept_names, concept_attributes
 import re
 
 if TYPE_CHECKING:
@@ -79,22 +80,16 @@ class DomainScannerBase(StoryScanner):
     
     def __init__(self, rule: 'Rule'):
         super().__init__(rule)
-        self._story_map: Optional[StoryMap] = None
-        self._global_concepts: List[Dict[str, Any]] = []
-        self._concept_cache: Dict[str, Set[str]] = {}
+        self._model: Optional[StoryModel] = None
 
     def scan_with_context(self, context: 'ScanFilesContext') -> List[Dict[str, Any]]:
         """Initialize context and delegate to subclass implementation."""
-        story_graph_data = context.story_graph.get('story_graph', context.story_graph)
-        self._story_map = StoryMap(story_graph_data)
-        self._global_concepts = story_graph_data.get('domain_concepts', [])
+        self._model = self._story_model(context)
         
         violations = []
-        for epic in self._story_map.epics():
-            for node in self._story_map.walk(epic):
-                if isinstance(node, Story):
-                    node_violations = self.scan_story_node(node)
-                    violations.extend(node_violations)
+        for node in self._model.stories:
+            node_violations = self.scan_story_node(node)
+            violations.extend(node_violations)
         
         return violations
 
@@ -118,98 +113,30 @@ class DomainScannerBase(StoryScanner):
         
         This allows scenarios to reference domain concepts defined in other epics
         (e.g., User/Entitlement from "Onboards Enterprise" used in "Create Wire Payment").
+        Collected once per epic/sub-epic scope by the run's story model.
         """
-        concepts = []
-        seen_names = set()  # Track to avoid duplicates
-        
-        def add_concepts(concept_list: List[Dict[str, Any]]):
-            for concept in concept_list:
-                name = concept.get('name', '')
-                if name and name not in seen_names:
-                    seen_names.add(name)
-                    concepts.append(concept)
-        
-        # Add global concepts first
-        add_concepts(self._global_concepts)
-        
-        if self._story_map:
-            epics = self._story_map.epics()
-            
-            # Phase 1: Collect from story's own epic and sub-epic chain (local context)
-            if story.epic_idx < len(epics):
-                epic = epics[story.epic_idx]
-                add_concepts(epic.data.get('domain_concepts', []))
-                
-                # Navigate sub-epic chain
-                current_data = epic.data
-                for sub_idx in story.sub_epic_path:
-                    sub_epics = current_data.get('sub_epics', [])
-                    if sub_idx < len(sub_epics):
-                        current_data = sub_epics[sub_idx]
-                        add_concepts(current_data.get('domain_concepts', []))
-            
-            # Phase 2: Collect from ALL other epics (cross-epic fallback)
-            for idx, epic in enumerate(epics):
-                if idx == story.epic_idx:
-                    continue  # Skip story's own epic (already processed)
-                
-                # Add epic-level concepts
-                add_concepts(epic.data.get('domain_concepts', []))
-                
-                # Add concepts from all sub-epics recursively
-                self._collect_all_sub_epic_concepts(epic.data, add_concepts)
-        
-        return concepts
+        if self._model is None:
+            return []
+        return list(self._model.concepts_for_story(story))
+    
+    def _concept_names_for_story(self, story: Story) -> Set[str]:
+        """Lowercased concept names (and plurals) for the story's scope, shared across scanners."""
+        return self._model.concept_names_for_story(story) if self._model else set()
     
-    def _collect_all_sub_epic_concepts(
-        self, 
-        parent_data: Dict[str, Any], 
-        add_concepts: callable
-    ):
-        """Recursively collect domain concepts from all sub-epics."""
-        for sub_epic in parent_data.get('sub_epics', []):
-            add_concepts(sub_epic.get('domain_concepts', []))
-            # Recurse into nested sub-epics
-            self._collect_all_sub_epic_concepts(sub_epic, add_concepts)
+    def _concept_attributes_for_story(self, story: Story) -> Set[str]:
+        """Lowercased concept attributes for the story's scope, shared across scanners."""
+        return self._model.concept_attributes_for_story(story) if self._model else set()
     
     def _extract_concept_names(self, domain_concepts: List[Dict[str, Any]]) -> Set[str]:
         """Extract all concept names (e.g., 'User', 'Enterprise', 'Recipient')."""
-        names = set()
-        for concept in domain_concepts:
-            name = concept.get('name', '')
-            if name:
-                names.add(name.lower())
-                names.add(name.lower() + 's')  # Plural
-        return names
+        return concept_names(domain_concepts)
     
     def _extract_concept_attributes(self, domain_concepts: List[Dict[str, Any]]) -> Set[str]:
         """
         Extract all attributes from domain concepts.
         Looks at responsibility names, collaborators, and known fields.
         """
-        attributes = set()
-        
-        for concept in domain_concepts:
-            concept_name = concept.get('name', '').lower()
-            
-            # Extract from responsibilities
-            for resp in concept.get('responsibilities', []):
-                resp_name = resp.get('name', '')
-                # Parse "Get X" or "has X" patterns
-                attr_match = re.search(r'(?:Get|has|owns|maintains|assigns|grants)\s+(\w+)', resp_name, re.I)
-                if attr_match:
-                    attributes.add(attr_match.group(1).lower())
-                
-                # Add collaborators as related concepts
-                for collab in resp.get('collaborators', []):
-                    attributes.add(collab.lower())
-            
-            # Common attribute patterns based on concept name
-            attributes.add(f"{concept_name}_id")
-            attributes.add(f"{concept_name}_name")
-            attributes.add(f"{concept_name}_status")
-        
-        return attributes
+        return concept_attributes(domain_concepts)
 
     # -------------------------------------------------------------------------
     # Text Analysis Utilities
@@ -12,10 +12,13 @@ from .scan_context import (
     ScanFilesContext,
     CrossFileScanContext
 )
+from .parsed_file_store import ParsedFile, ParsedFileStore
+from .similarity_index import SimilarityIndex
 
 __all__ = [
     'Scope', 'File', 'Block', 'Line', 'Scan', 'Violation',
     'ScanContext', 'FileCollection', 'FileScanContext', 
-    'ScanFilesContext', 'CrossFileScanContext'
+    'ScanFilesContext', 'CrossFileScanContext',
+    'ParsedFile', 'ParsedFileStore', 'SimilarityIndex'
 ]
 
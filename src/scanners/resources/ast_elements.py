@@ -15,6 +15,17 @@ class ASTElement(ABC):
     def node(self) -> ast.AST:
         return self._node
 
+class ASTElements:
+    """Elements of one node type under ast_node; nodes, when given, are the pre-collected ast.walk output to filter."""
+    
+    def __init__(self, ast_node: ast.AST, nodes: Optional[List[ast.AST]] = None):
+        self._ast_node = ast_node
+        self._nodes = nodes
+        self._elements = None
+    
+    def _walked_nodes(self):
+        return self._nodes if self._nodes is not None else ast.walk(self._ast_node)
+
 class Function(ASTElement):
     
     @property
@@ -33,11 +44,7 @@ class Function(ASTElement):
     def is_test_function(self) -> bool:
         return self.name.startswith('test_')
 
-class Functions:
-    
-    def __init__(self, ast_node: ast.AST):
-        self._ast_node = ast_node
-        self._elements: Optional[List[Function]] = None
+class Functions(ASTElements):
     
     @property
     def get_many_functions(self) -> List[Function]:
@@ -47,7 +54,7 @@ class Functions:
     
     def _extract_functions(self) -> List[Function]:
         functions = []
-        for node in ast.walk(self._ast_node):
+        for node in self._walked_nodes():
             if isinstance(node, ast.FunctionDef):
                 functions.append(Function(node))
         return functions
@@ -70,11 +77,7 @@ class Class(ASTElement):
     def is_test_class(self) -> bool:
         return self.name.startswith('Test')
 
-class Classes:
-    
-    def __init__(self, ast_node: ast.AST):
-        self._ast_node = ast_node
-        self._elements: Optional[List[Class]] = None
+class Classes(ASTElements):
     
     @property
     def get_many_classes(self) -> List[Class]:
@@ -84,7 +87,7 @@ class Classes:
     
     def _extract_classes(self) -> List[Class]:
         classes = []
-        for node in ast.walk(self._ast_node):
+        for node in self._walked_nodes():
             if isinstance(node, ast.ClassDef):
                 classes.append(Class(node))
         return classes
@@ -104,11 +107,7 @@ class IfStatement(ASTElement):
                 return True
         return False
 
-class IfStatements:
-    
-    def __init__(self, ast_node: ast.AST):
-        self._ast_node = ast_node
-        self._elements: Optional[List[IfStatement]] = None
+class IfStatements(ASTElements):
     
     @property
     def get_many_if_statements(self) -> List[IfStatement]:
@@ -118,7 +117,7 @@ class IfStatements:
     
     def _extract_if_statements(self) -> List[IfStatement]:
         if_statements = []
-        for node in ast.walk(self._ast_node):
+        for node in self._walked_nodes():
             if isinstance(node, ast.If):
                 if_statements.append(IfStatement(node))
         return if_statements
@@ -140,11 +139,7 @@ class TryBlock(ASTElement):
     def has_finally(self) -> bool:
         return len(self._node.finalbody) > 0
 
-class TryBlocks:
-    
-    def __init__(self, ast_node: ast.AST):
-        self._ast_node = ast_node
-        self._elements: Optional[List[TryBlock]] = None
+class TryBlocks(ASTElements):
     
     @property
     def get_many_try_blocks(self) -> List[TryBlock]:
@@ -154,7 +149,7 @@ class TryBlocks:
     
     def _extract_try_blocks(self) -> List[TryBlock]:
         try_blocks = []
-        for node in ast.walk(self._ast_node):
+        for node in self._walked_nodes():
             if isinstance(node, ast.Try):
                 try_blocks.append(TryBlock(node))
         return try_blocks
@@ -174,11 +169,7 @@ class Import(ASTElement):
                 return self._node.names[0].name
         return ''
 
-class Imports:
-    
-    def __init__(self, ast_node: ast.AST):
-        self._ast_node = ast_node
-        self._elements: Optional[List[Import]] = None
+class Imports(ASTElements):
     
     @property
     def get_many_imports(self) -> List[Import]:
@@ -188,7 +179,7 @@ class Imports:
     
     def _extract_imports(self) -> List[Import]:
         imports = []
-        for node in ast.walk(self._ast_node):
+        for node in self._walked_nodes():
             if isinstance(node, (ast.Import, ast.ImportFrom)):
                 imports.append(Import(node))
         return imports
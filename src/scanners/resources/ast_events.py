@@ -0,0 +1,112 @@
+"""Single-pass AST events: one walk per file, shared by every scanner that reads the tree.
+
+FileEvents walks a tree once and records each node with its parent, enclosing class and
+enclosing function. Scanners then either ask for nodes of a given type (in ast.walk order) or
+register enter_<NodeType> / exit_<NodeType> handler methods and have the recorded tree replayed
+depth-first, without touching the AST again.
+"""
+import ast
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+_FUNCTION_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+_HandlerTable = Tuple[Dict[str, List[Callable]], Dict[str, List[Callable]]]
+
+
+class NodeEvent:
+    __slots__ = ('node', 'parent', 'class_node', 'function_node', 'depth', 'index', 'children')
+
+    def __init__(self, node: ast.AST, parent: Optional[ast.AST], class_node: Optional[ast.ClassDef],
+                 function_node: Optional[ast.AST], depth: int, index: int):
+        self.node = node
+        self.parent = parent
+        self.class_node = class_node
+        self.function_node = function_node
+        self.depth = depth
+        self.index = index
+        self.children: List['NodeEvent'] = []
+
+    @property
+    def line_number(self) -> Optional[int]:
+        return getattr(self.node, 'lineno', None)
+
+
+class FileEvents:
+
+    def __init__(self, tree: ast.AST):
+        self._tree = tree
+        self._events: List[NodeEvent] = []
+        self._by_type: Dict[Type[ast.AST], List[NodeEvent]] = {}
+        self._root = self._walk(tree)
+
+    def _walk(self, tree: ast.AST) -> NodeEvent:
+        """Breadth-first, like ast.walk, so per-type listings keep ast.walk order."""
+        root = NodeEvent(tree, None, None, None, 0, 0)
+        pending = deque([root])
+        while pending:
+            event = pending.popleft()
+            event.index = len(self._events)
+            self._events.append(event)
+            self._by_type.setdefault(type(event.node), []).append(event)
+            node = event.node
+            class_node = node if isinstance(node, ast.ClassDef) else event.class_node
+            function_node = node if isinstance(node, _FUNCTION_TYPES) else event.function_node
+            for child in ast.iter_child_nodes(node):
+                child_event = NodeEvent(child, node, class_node, function_node, event.depth + 1, 0)
+                event.children.append(child_event)
+                pending.append(child_event)
+        return root
+
+    @property
+    def tree(self) -> ast.AST:
+        return self._tree
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def of_type(self, *node_types: Type[ast.AST]) -> List[NodeEvent]:
+        """Events for nodes of exactly these AST classes, in ast.walk order."""
+        if len(node_types) == 1:
+            return list(self._by_type.get(node_types[0], []))
+        events = [event for node_type in node_types for event in self._by_type.get(node_type, [])]
+        return sorted(events, key=lambda event: event.index)
+
+    def nodes_of_type(self, *node_types: Type[ast.AST]) -> List[ast.AST]:
+        return [event.node for event in self.of_type(*node_types)]
+
+    def dispatch(self, *handlers: object) -> None:
+        """Replay the tree depth-first: enter_<NodeType>(event) before children, exit_<NodeType>(event) after."""
+        enters: Dict[str, List[Callable]] = {}
+        exits: Dict[str, List[Callable]] = {}
+        for handler in handlers:
+            handler_enters, handler_exits = _handler_table(handler)
+            for name, methods in handler_enters.items():
+                enters.setdefault(name, []).extend(methods)
+            for name, methods in handler_exits.items():
+                exits.setdefault(name, []).extend(methods)
+        if not enters and not exits:
+            return
+        stack: List[Tuple[NodeEvent, bool]] = [(self._root, False)]
+        while stack:
+            event, leaving = stack.pop()
+            name = type(event.node).__name__
+            if leaving:
+                for method in exits[name]:
+                    method(event)
+                continue
+            for method in enters.get(name, ()):
+                method(event)
+            if name in exits:
+                stack.append((event, True))
+            stack.extend((child, False) for child in reversed(event.children))
+
+
+def _handler_table(handler: object) -> _HandlerTable:
+    enters: Dict[str, List[Callable]] = {}
+    exits: Dict[str, List[Callable]] = {}
+    for attribute in dir(type(handler)):
+        for prefix, table in (('enter_', enters), ('exit_', exits)):
+            if attribute.startswith(prefix) and isinstance(getattr(ast, attribute[len(prefix):], None), type):
+                table[attribute[len(prefix):]] = [getattr(handler, attribute)]
+    return enters, exits
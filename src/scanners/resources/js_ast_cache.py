@@ -0,0 +1,222 @@
+"""JavaScript ASTs for the JS scanners: one long-lived Node/esprima worker and a content-hash keyed cache."""
+import atexit
+import hashlib
+import json
+import logging
+import queue
+import subprocess
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Reads one JSON request per line ({"id", "sources": [...]}) and answers one line ({"id", "asts": [...]}).
+# A source that fails to parse as module and as script gets null.
+_SERVER_SCRIPT = r"""
+let esprima;
+try {
+    esprima = require('esprima');
+} catch (e) {
+    process.stdout.write(JSON.stringify({error: 'esprima not available: ' + e.message}) + '\n');
+    process.exit(1);
+}
+const options = {loc: true, range: true, comment: true, tolerant: true};
+function parse(source) {
+    try {
+        return esprima.parseModule(source, options);
+    } catch (e) {
+        try {
+            return esprima.parseScript(source, options);
+        } catch (e2) {
+            return null;
+        }
+    }
+}
+const rl = require('readline').createInterface({input: process.stdin, crlfDelay: Infinity});
+rl.on('line', (line) => {
+    const request = JSON.parse(line);
+    const asts = request.sources.map(parse);
+    process.stdout.write(JSON.stringify({id: request.id, asts: asts}) + '\n');
+});
+rl.on('close', () => process.exit(0));
+"""
+
+REQUEST_TIMEOUT_SECONDS = 30
+BATCH_BYTES = 2 * 1024 * 1024
+
+
+class EsprimaServer:
+    """Node process that parses batches of sources per round trip; started on first use."""
+
+    _shared: Optional['EsprimaServer'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, command: Optional[List[str]] = None):
+        self._command = command or ['node', '-e', _SERVER_SCRIPT]
+        self._process: Optional[subprocess.Popen] = None
+        self._responses: 'queue.Queue[Optional[str]]' = queue.Queue()
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self._available = True
+        self.round_trips = 0
+
+    @classmethod
+    def shared(cls) -> 'EsprimaServer':
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+                atexit.register(cls._shared.close)
+            return cls._shared
+
+    @property
+    def available(self) -> bool:
+        return self._available
+
+    def parse_many(self, sources: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """ASTs in the order of sources; None for sources that fail to parse or when Node/esprima is missing."""
+        results: List[Optional[Dict[str, Any]]] = []
+        for batch in self._batches(sources):
+            results.extend(self._round_trip(batch))
+        return results
+
+    def _batches(self, sources: List[str]):
+        batch, size = [], 0
+        for source in sources:
+            if batch and size + len(source) > BATCH_BYTES:
+                yield batch
+                batch, size = [], 0
+            batch.append(source)
+            size += len(source)
+        if batch:
+            yield batch
+
+    def _round_trip(self, sources: List[str]) -> List[Optional[Dict[str, Any]]]:
+        with self._lock:
+            if not self._available or not self._ensure_started():
+                return [None] * len(sources)
+            self._next_id += 1
+            request_id = self._next_id
+            try:
+                self._process.stdin.write(json.dumps({'id': request_id, 'sources': sources}) + '\n')
+                self._process.stdin.flush()
+                line = self._responses.get(timeout=REQUEST_TIMEOUT_SECONDS)
+            except (OSError, ValueError, queue.Empty) as e:
+                logger.debug(f'esprima server request failed: {e}')
+                self._stop()
+                return [None] * len(sources)
+            self.round_trips += 1
+            response = self._decode(line)
+            if response is None or response.get('id') != request_id:
+                self._stop()
+                return [None] * len(sources)
+            return response['asts']
+
+    def _decode(self, line: Optional[str]) -> Optional[Dict[str, Any]]:
+        if line is None:
+            return None
+        try:
+            response = json.loads(line)
+        except json.JSONDecodeError:
+            return None
+        if 'error' in response:
+            logger.info(f"JavaScript AST parsing disabled: {response['error']}")
+            self._available = False
+            return None
+        return response
+
+    def _ensure_started(self) -> bool:
+        if self._process is not None and self._process.poll() is None:
+            return True
+        try:
+            self._process = subprocess.Popen(
+                self._command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding='utf-8'
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.info(f'JavaScript AST parsing disabled: cannot start node ({e})')
+            self._available = False
+            return False
+        self._responses = queue.Queue()
+        threading.Thread(target=self._read_responses, args=(self._process, self._responses), daemon=True).start()
+        return True
+
+    @staticmethod
+    def _read_responses(process: subprocess.Popen, responses: 'queue.Queue[Optional[str]]') -> None:
+        for line in process.stdout:
+            responses.put(line)
+        responses.put(None)
+
+    def _stop(self) -> None:
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        try:
+            process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+    def close(self) -> None:
+        with self._lock:
+            self._stop()
+
+
+class JSAstCache:
+    """ASTs keyed by a hash of the source text, so a file is parsed once per run however many scanners read it."""
+
+    def __init__(self, server: Optional[EsprimaServer] = None, max_entries: int = 4096):
+        self._server = server
+        self._asts: 'OrderedDict[str, Optional[Dict[str, Any]]]' = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def server(self) -> EsprimaServer:
+        if self._server is None:
+            self._server = EsprimaServer.shared()
+        return self._server
+
+    @staticmethod
+    def _key(source: str) -> str:
+        return hashlib.sha1(source.encode('utf-8', errors='surrogatepass')).hexdigest()
+
+    def parse(self, source: str) -> Optional[Dict[str, Any]]:
+        return self.parse_many([source])[0]
+
+    def parse_many(self, sources: List[str]) -> List[Optional[Dict[str, Any]]]:
+        keys = [self._key(source) for source in sources]
+        missing: Dict[str, str] = {}
+        with self._lock:
+            for key, source in zip(keys, sources):
+                if key in self._asts:
+                    self._asts.move_to_end(key)
+                    self._hits += 1
+                elif key not in missing:
+                    missing[key] = source
+            self._misses += len(missing)
+        parsed: Dict[str, Optional[Dict[str, Any]]] = {}
+        if missing:
+            parsed = dict(zip(missing, self.server.parse_many(list(missing.values()))))
+            with self._lock:
+                self._asts.update(parsed)
+                while len(self._asts) > self._max_entries:
+                    self._asts.popitem(last=False)
+        with self._lock:
+            return [parsed[key] if key in parsed else self._asts.get(key) for key in keys]
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {'sources': len(self._asts), 'hits': self._hits, 'misses': self._misses}
+
+    def __len__(self) -> int:
+        return len(self._asts)
@@ -0,0 +1,240 @@
+"""Shared NLTK analysis for the story-language scanners: lazy import, batched tagging, memoized lookups.
+
+NLTK (and its corpora probe / download) is only loaded on the first lookup, so importing scanners stays
+cheap. POS tags and WordNet answers are kept in one LRU keyed by kind and text; successful answers can be
+saved to disk between runs. Lookups that fail (NLTK or a corpus missing) are remembered for the process
+only, so they are never persisted as real answers.
+"""
+import json
+import logging
+import socket
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from utils import atomic_write
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+MAX_ENTRIES = 50000
+DOWNLOAD_TIMEOUT_SECONDS = 2
+
+_RESOURCES = (
+    ('corpora/wordnet', 'wordnet'),
+    ('tokenizers/punkt_tab', 'punkt_tab'),
+    ('taggers/averaged_perceptron_tagger_eng', 'averaged_perceptron_tagger_eng'),
+)
+
+_ROLE_HYPERNYMS = {'person', 'user', 'system', 'agent', 'entity', 'causal_agent'}
+
+VERB = 'v'
+NOUN = 'n'
+
+Tags = List[Tuple[str, str]]
+
+
+class LanguageService:
+
+    _shared: Optional['LanguageService'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self._max_entries = max_entries
+        self._lock = threading.RLock()
+        self._load_lock = threading.Lock()
+        self._nltk = None
+        self._entries: 'OrderedDict[str, Any]' = OrderedDict()
+        self._failed: Set[str] = set()
+        self._hits = 0
+        self._misses = 0
+        self._dirty = False
+
+    @classmethod
+    def shared(cls) -> 'LanguageService':
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def cache_path_for(workspace_directory: Path) -> Path:
+        return Path(workspace_directory) / '.cache' / 'language' / 'nltk.json'
+
+    # --- NLTK loading -------------------------------------------------------
+
+    def _modules(self):
+        """Import NLTK and make sure its corpora are present, once per process."""
+        if self._nltk is None:
+            with self._load_lock:
+                if self._nltk is None:
+                    import nltk
+                    _ensure_resources(nltk)
+                    self._nltk = nltk
+        return self._nltk
+
+    @property
+    def nltk_loaded(self) -> bool:
+        return self._nltk is not None
+
+    # --- memo -----------------------------------------------------------------
+
+    def _memo(self, key: str, compute: Callable[[], Any], default: Any) -> Any:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return self._entries[key]
+            if key in self._failed:
+                self._hits += 1
+                return default
+            self._misses += 1
+        try:
+            value = compute()
+        except Exception as e:
+            logger.debug(f'Language lookup {key!r} failed: {e}')
+            with self._lock:
+                self._failed.add(key)
+            return default
+        with self._lock:
+            self._remember(key, value)
+        return value
+
+    def _remember(self, key: str, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        self._dirty = True
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    # --- POS tags -------------------------------------------------------------
+
+    def pos_tags(self, text: str) -> Tags:
+        """Tagged word tokens of text (punctuation-only tokens dropped); [] when NLTK is unavailable."""
+        return self._memo(f'tags:{text}', lambda: self._tag_sentences([text])[0], [])
+
+    def tag_many(self, texts: Iterable[str]) -> List[Tags]:
+        """Tag every text not yet cached in one batched tagger call."""
+        texts = list(texts)
+        with self._lock:
+            missing = list(dict.fromkeys(
+                text for text in texts
+                if f'tags:{text}' not in self._entries and f'tags:{text}' not in self._failed
+            ))
+        if missing:
+            try:
+                tagged = self._tag_sentences(missing)
+            except Exception as e:
+                logger.debug(f'Batched POS tagging failed, falling back to per-text tagging: {e}')
+            else:
+                with self._lock:
+                    self._misses += len(missing)
+                    for text, tags in zip(missing, tagged):
+                        self._remember(f'tags:{text}', tags)
+        return [self.pos_tags(text) for text in texts]
+
+    def _tag_sentences(self, texts: List[str]) -> List[Tags]:
+        nltk = self._modules()
+        sentences = [
+            [token for token in nltk.word_tokenize(text) if token.isalnum() or any(c.isalnum() for c in token)]
+            for text in texts
+        ]
+        return [[(token, tag) for token, tag in tags] for tags in nltk.pos_tag_sents(sentences)]
+
+    # --- WordNet --------------------------------------------------------------
+
+    def _synsets(self, word: str, pos: Optional[str] = None):
+        self._modules()
+        from nltk.corpus import wordnet
+        return wordnet.synsets(word, pos=pos)
+
+    def has_synsets(self, word: str, pos: str) -> bool:
+        word = word.lower()
+        return self._memo(f'synsets:{pos}:{word}', lambda: len(self._synsets(word, pos)) > 0, False)
+
+    def can_be_verb(self, word: str) -> bool:
+        word = word.lower()
+
+        def compute() -> bool:
+            if self._synsets(word, VERB):
+                return True
+            return any('v' in synset.pos() for synset in self._synsets(word))
+        return self._memo(f'verb:{word}', compute, False)
+
+    def is_actor_or_role(self, word: str) -> bool:
+        word = word.lower()
+
+        def compute() -> bool:
+            for synset in self._synsets(word):
+                for path in synset.hypernym_paths():
+                    if any(hypernym.name().split('.')[0] in _ROLE_HYPERNYMS for hypernym in path):
+                        return True
+            return False
+        return self._memo(f'actor:{word}', compute, False)
+
+    # --- persistence ------------------------------------------------------------
+
+    def load(self, cache_path: Path) -> int:
+        """Merge entries saved by an earlier run; returns how many were read."""
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError) as e:
+            logger.debug(f'Ignoring unreadable language cache {cache_path}: {e}')
+            return 0
+        if not isinstance(data, dict) or data.get('version') != CACHE_VERSION:
+            return 0
+        entries = data.get('entries', {})
+        with self._lock:
+            for key, value in entries.items():
+                if key not in self._entries:
+                    if key.startswith('tags:'):
+                        value = [tuple(pair) for pair in value]
+                    self._entries[key] = value
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return len(entries)
+
+    def save(self, cache_path: Path) -> bool:
+        """Write the cache if anything new was computed since the last save."""
+        with self._lock:
+            if not self._dirty:
+                return False
+            payload = json.dumps({'version': CACHE_VERSION, 'entries': self._entries}, separators=(',', ':'))
+            self._dirty = False
+        cache_path = Path(cache_path)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with atomic_write(cache_path) as f:
+                f.write(payload)
+        except OSError as e:
+            logger.debug(f'Could not write language cache {cache_path}: {e}')
+            return False
+        return True
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {'entries': len(self._entries), 'hits': self._hits, 'misses': self._misses}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _ensure_resources(nltk) -> None:
+    original_timeout = socket.getdefaulttimeout()
+    socket.setdefaulttimeout(DOWNLOAD_TIMEOUT_SECONDS)
+    try:
+        for resource_path, package in _RESOURCES:
+            try:
+                nltk.data.find(resource_path)
+            except LookupError:
+                try:
+                    nltk.download(package, quiet=True)
+                except Exception as e:
+                    print(f'Warning: Failed to download NLTK {package}: {e}', file=sys.stderr)
+    finally:
+        socket.setdefaulttimeout(original_timeout)
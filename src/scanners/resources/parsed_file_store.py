@@ -0,0 +1,174 @@
+"""Per-run store of parsed source files shared by every scanner in a validation run."""
+import ast
+import logging
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Any
+
+from .ast_elements import Functions, Classes, IfStatements, TryBlocks, Imports
+from .ast_events import FileEvents
+from .js_ast_cache import JSAstCache
+
+logger = logging.getLogger(__name__)
+
+
+class ParsedFile:
+
+    def __init__(self, path: Path, content: str, tree: ast.AST):
+        self._path = path
+        self._content = content
+        self._lines: Optional[List[str]] = None
+        self._tree = tree
+        self._events: Optional[FileEvents] = None
+        self._functions: Optional[Functions] = None
+        self._classes: Optional[Classes] = None
+        self._if_statements: Optional[IfStatements] = None
+        self._try_blocks: Optional[TryBlocks] = None
+        self._imports: Optional[Imports] = None
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def content(self) -> str:
+        return self._content
+
+    @property
+    def lines(self) -> List[str]:
+        if self._lines is None:
+            self._lines = self._content.split('\n')
+        return self._lines
+
+    @property
+    def tree(self) -> ast.AST:
+        return self._tree
+
+    @property
+    def events(self) -> FileEvents:
+        """The file's one AST walk; every element listing below is filtered from it."""
+        if self._events is None:
+            self._events = FileEvents(self._tree)
+        return self._events
+
+    @property
+    def functions(self) -> Functions:
+        if self._functions is None:
+            self._functions = Functions(self._tree, self.events.nodes_of_type(ast.FunctionDef))
+        return self._functions
+
+    @property
+    def classes(self) -> Classes:
+        if self._classes is None:
+            self._classes = Classes(self._tree, self.events.nodes_of_type(ast.ClassDef))
+        return self._classes
+
+    @property
+    def if_statements(self) -> IfStatements:
+        if self._if_statements is None:
+            self._if_statements = IfStatements(self._tree, self.events.nodes_of_type(ast.If))
+        return self._if_statements
+
+    @property
+    def try_blocks(self) -> TryBlocks:
+        if self._try_blocks is None:
+            self._try_blocks = TryBlocks(self._tree, self.events.nodes_of_type(ast.Try))
+        return self._try_blocks
+
+    @property
+    def imports(self) -> Imports:
+        if self._imports is None:
+            self._imports = Imports(self._tree, self.events.nodes_of_type(ast.Import, ast.ImportFrom))
+        return self._imports
+
+    @property
+    def is_walked(self) -> bool:
+        return self._events is not None
+
+    def as_tuple(self) -> Tuple[str, List[str], ast.AST]:
+        return (self._content, self.lines, self._tree)
+
+
+class ParsedFileStore:
+
+    def __init__(self):
+        self._parsed: Dict[Path, Optional[ParsedFile]] = {}
+        self._by_tree: Dict[int, ParsedFile] = {}
+        self._pending: Dict[Path, Future] = {}
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+        self._js_asts: Optional[JSAstCache] = None
+
+    def parse(self, file_path: Path) -> Optional[ParsedFile]:
+        """Parse once per path. Files are read and parsed outside the lock so thread workers
+        parse different files in parallel; a second reader of a file being parsed waits for it."""
+        key = Path(file_path)
+        with self._lock:
+            if key in self._parsed:
+                self._hits += 1
+                return self._parsed[key]
+            pending = self._pending.get(key)
+            if pending is not None:
+                self._hits += 1
+            else:
+                self._misses += 1
+                self._pending[key] = Future()
+        if pending is not None:
+            return pending.result()
+        try:
+            parsed = self._read_and_parse(key)
+        except BaseException as e:
+            with self._lock:
+                future = self._pending.pop(key)
+            future.set_exception(e)
+            raise
+        with self._lock:
+            self._parsed[key] = parsed
+            if parsed is not None:
+                self._by_tree[id(parsed.tree)] = parsed
+            future = self._pending.pop(key)
+        future.set_result(parsed)
+        return parsed
+
+    @property
+    def js_asts(self) -> JSAstCache:
+        """JavaScript ASTs for this run, keyed by source content."""
+        with self._lock:
+            if self._js_asts is None:
+                self._js_asts = JSAstCache()
+            return self._js_asts
+
+    def for_tree(self, tree: ast.AST) -> Optional[ParsedFile]:
+        return self._by_tree.get(id(tree))
+
+    def _read_and_parse(self, file_path: Path) -> Optional[ParsedFile]:
+        if not file_path.exists():
+            return None
+        try:
+            content = file_path.read_text(encoding='utf-8')
+            tree = ast.parse(content, filename=str(file_path))
+            return ParsedFile(file_path, content, tree)
+        except (SyntaxError, UnicodeDecodeError) as e:
+            logger.debug(f'Skipping file {file_path} due to {type(e).__name__}: {e}')
+            return None
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def walks(self) -> int:
+        return sum(1 for parsed in self._parsed.values() if parsed is not None and parsed.is_walked)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {'files': len(self._parsed), 'hits': self._hits, 'misses': self._misses, 'walks': self.walks}
+
+    def __len__(self) -> int:
+        return len(self._parsed)
@@ -1,12 +1,18 @@
 """Parameter objects for scanner execution."""
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from scanners.resources.parsed_file_store import ParsedFileStore
+    from scanners.resources.story_model import StoryModel
 
 @dataclass
 class ScanContext:
     story_graph: Optional[Dict[str, Any]] = None
     full_story_graph: Optional[Dict[str, Any]] = None
+    parsed_files: Optional['ParsedFileStore'] = None
+    story_model: Optional['StoryModel'] = None
     
     def __post_init__(self):
         if self.story_graph is None:
@@ -0,0 +1,91 @@
+"""MinHash/LSH index over code-block token shingles for near-duplicate candidate lookup."""
+import keyword
+import random
+import re
+import zlib
+from collections import Counter, defaultdict
+from typing import Dict, Hashable, List, Set, Tuple
+
+_TOKEN_PATTERN = re.compile(r"""[A-Za-z_]\w*|\d[\w.]*|'[^'\n]*'|"[^"\n]*"|==|!=|<=|>=|\*\*|//|->|\S""")
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def normalized_tokens(source: str) -> List[str]:
+    """Tokens with local names and literals abstracted; keywords and attribute names stay concrete."""
+    tokens = []
+    previous = ''
+    for token in _TOKEN_PATTERN.findall(source):
+        if token[0] in '\'"':
+            tokens.append('STR')
+        elif token[0].isdigit():
+            tokens.append('NUM')
+        elif (token[0].isalpha() or token[0] == '_') and not keyword.iskeyword(token) and previous != '.':
+            tokens.append('ID')
+        else:
+            tokens.append(token)
+        previous = token
+    return tokens
+
+
+class SimilarityIndex:
+    """Locality-sensitive index: blocks whose shingle sets have high Jaccard similarity share a bucket.
+
+    With the defaults (16 bands of 4 rows) a pair at Jaccard 0.5 collides ~64% of the time and a pair
+    at 0.8 over 99.9%, so near-duplicates are found while unrelated blocks rarely become candidates.
+    """
+
+    def __init__(self, bands: int = 16, rows: int = 4, shingle_size: int = 4, seed: int = 1):
+        self._bands = bands
+        self._rows = rows
+        self._shingle_size = shingle_size
+        rng = random.Random(seed)
+        self._permutations: List[Tuple[int, int]] = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(bands * rows)
+        ]
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[Hashable]] = defaultdict(list)
+        self._size = 0
+
+    def shingles(self, source: str) -> Set[int]:
+        tokens = normalized_tokens(source)
+        if len(tokens) <= self._shingle_size:
+            return {zlib.crc32(' '.join(tokens).encode('utf-8'))} if tokens else set()
+        return {
+            zlib.crc32(' '.join(tokens[i:i + self._shingle_size]).encode('utf-8'))
+            for i in range(len(tokens) - self._shingle_size + 1)
+        }
+
+    def signature(self, source: str) -> List[int]:
+        shingles = self.shingles(source)
+        if not shingles:
+            return []
+        return [min(((a * s + b) % _MERSENNE_PRIME) & _MAX_HASH for s in shingles) for a, b in self._permutations]
+
+    def _band_keys(self, signature: List[int]) -> List[Tuple[int, Tuple[int, ...]]]:
+        return [(band, tuple(signature[band * self._rows:(band + 1) * self._rows])) for band in range(self._bands)]
+
+    def add(self, key: Hashable, source: str) -> List[int]:
+        signature = self.signature(source)
+        for band_key in self._band_keys(signature):
+            self._buckets[band_key].append(key)
+        self._size += 1
+        return signature
+
+    def candidates(self, source: str = '', signature: List[int] = None) -> Set[Hashable]:
+        if signature is None:
+            signature = self.signature(source)
+        found: Set[Hashable] = set()
+        for band_key in self._band_keys(signature):
+            found.update(self._buckets.get(band_key, ()))
+        return found
+
+    def ranked_candidates(self, source: str) -> List[Hashable]:
+        """Candidate keys, those sharing the most bands (highest estimated Jaccard) first."""
+        shared = Counter()
+        for band_key in self._band_keys(self.signature(source)):
+            shared.update(self._buckets.get(band_key, ()))
+        return [key for key, _ in sorted(shared.items(), key=lambda item: (-item[1], item[0]))]
+
+    def __len__(self) -> int:
+        return self._size
@@ -0,0 +1,175 @@
+"""Scanner-side story model built once per validation run and shared by every story/scenario scanner.
+
+StoryMap builds fresh node objects on every epics()/children access, so each scanner walking the graph
+rebuilt the whole tree. StoryModel walks it once and keeps the nodes, stories, scenarios and domain
+concepts per scope (story epic + sub-epic chain) with their lowercased name/attribute term sets.
+"""
+import re
+import threading
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from scanners.story_map import Epic, Scenario, Story, StoryGroup, StoryMap, StoryNode
+
+ScopeKey = Tuple[int, Tuple[int, ...]]
+
+
+class StoryModel:
+
+    def __init__(self, story_graph: Dict[str, Any]):
+        self.source = story_graph
+        self.graph = story_graph.get('story_graph', story_graph) if isinstance(story_graph, dict) else {}
+        self.story_map = StoryMap(self.graph)
+        self.global_concepts: Tuple[Dict[str, Any], ...] = tuple(self.graph.get('domain_concepts', []))
+        self._lock = threading.Lock()
+        self._built = False
+        self._epics: Tuple[Epic, ...] = ()
+        self._all_nodes: Tuple[StoryNode, ...] = ()
+        self._nodes: Tuple[StoryNode, ...] = ()
+        self._stories: Tuple[Story, ...] = ()
+        self._epics_by_name: Dict[str, Epic] = {}
+        self._scenarios: Optional[Tuple[Scenario, ...]] = None
+        self._concepts: Dict[ScopeKey, Tuple[Dict[str, Any], ...]] = {}
+        self._concept_names: Dict[ScopeKey, frozenset] = {}
+        self._concept_attributes: Dict[ScopeKey, frozenset] = {}
+
+    def _ensure_built(self) -> None:
+        """Walk the graph on first use, so runs without story scanners never pay for it."""
+        if self._built:
+            return
+        with self._lock:
+            if self._built:
+                return
+            self._epics = tuple(self.story_map.epics())
+            self._all_nodes = tuple(node for epic in self._epics for node in self.story_map.walk(epic))
+            for epic in self._epics:
+                self._epics_by_name.setdefault(epic.name, epic)
+            self._nodes = tuple(node for node in self._all_nodes if not isinstance(node, StoryGroup))
+            self._stories = tuple(node for node in self._all_nodes if isinstance(node, Story))
+            self._built = True
+
+    @property
+    def built(self) -> bool:
+        return self._built
+
+    @property
+    def epics(self) -> Tuple[Epic, ...]:
+        self._ensure_built()
+        return self._epics
+
+    @property
+    def all_nodes(self) -> Tuple[StoryNode, ...]:
+        """Every node in walk order, story groups included."""
+        self._ensure_built()
+        return self._all_nodes
+
+    @property
+    def nodes(self) -> Tuple[StoryNode, ...]:
+        """Epics, sub-epics and stories in walk order (what story scanners visit)."""
+        self._ensure_built()
+        return self._nodes
+
+    @property
+    def stories(self) -> Tuple[Story, ...]:
+        self._ensure_built()
+        return self._stories
+
+    def is_for(self, story_graph: Dict[str, Any]) -> bool:
+        """True when this model was built from story_graph (or the graph it wraps)."""
+        return story_graph is self.source or story_graph is self.graph
+
+    def find_epic_by_name(self, epic_name: str) -> Optional[Epic]:
+        self._ensure_built()
+        return self._epics_by_name.get(epic_name)
+
+    @property
+    def scenarios(self) -> Tuple[Scenario, ...]:
+        if self._scenarios is None:
+            self._scenarios = tuple(scenario for story in self.stories for scenario in story.scenarios)
+        return self._scenarios
+
+    # --- domain concepts by scope ------------------------------------------
+
+    @staticmethod
+    def scope_key(story: StoryNode) -> ScopeKey:
+        return story.epic_idx, tuple(story.sub_epic_path)
+
+    def concepts_for_story(self, story: StoryNode) -> Tuple[Dict[str, Any], ...]:
+        """Global concepts, then the story's epic and sub-epic chain, then every other epic (first name wins)."""
+        key = self.scope_key(story)
+        if key not in self._concepts:
+            self._concepts[key] = self._collect_concepts(*key)
+        return self._concepts[key]
+
+    def concept_names_for_story(self, story: StoryNode) -> frozenset:
+        key = self.scope_key(story)
+        if key not in self._concept_names:
+            self._concept_names[key] = frozenset(concept_names(self.concepts_for_story(story)))
+        return self._concept_names[key]
+
+    def concept_attributes_for_story(self, story: StoryNode) -> frozenset:
+        key = self.scope_key(story)
+        if key not in self._concept_attributes:
+            self._concept_attributes[key] = frozenset(concept_attributes(self.concepts_for_story(story)))
+        return self._concept_attributes[key]
+
+    def _collect_concepts(self, epic_idx: int, sub_epic_path: Tuple[int, ...]) -> Tuple[Dict[str, Any], ...]:
+        concepts: List[Dict[str, Any]] = []
+        seen_names: Set[str] = set()
+
+        def add_concepts(concept_list: List[Dict[str, Any]]):
+            for concept in concept_list:
+                name = concept.get('name', '')
+                if name and name not in seen_names:
+                    seen_names.add(name)
+                    concepts.append(concept)
+
+        add_concepts(self.global_concepts)
+        if epic_idx < len(self.epics):
+            current_data = self.epics[epic_idx].data
+            add_concepts(current_data.get('domain_concepts', []))
+            for sub_idx in sub_epic_path:
+                sub_epics = current_data.get('sub_epics', [])
+                if sub_idx < len(sub_epics):
+                    current_data = sub_epics[sub_idx]
+                    add_concepts(current_data.get('domain_concepts', []))
+        for idx, epic in enumerate(self.epics):
+            if idx == epic_idx:
+                continue
+            add_concepts(epic.data.get('domain_concepts', []))
+            _add_sub_epic_concepts(epic.data, add_concepts)
+        return tuple(concepts)
+
+
+def _add_sub_epic_concepts(parent_data: Dict[str, Any], add_concepts) -> None:
+    for sub_epic in parent_data.get('sub_epics', []):
+        add_concepts(sub_epic.get('domain_concepts', []))
+        _add_sub_epic_concepts(sub_epic, add_concepts)
+
+
+def concept_names(domain_concepts) -> Set[str]:
+    """Lowercased concept names with their plural."""
+    names = set()
+    for concept in domain_concepts:
+        name = concept.get('name', '')
+        if name:
+            names.add(name.lower())
+            names.add(name.lower() + 's')
+    return names
+
+
+def concept_attributes(domain_concepts) -> Set[str]:
+    """Lowercased attributes named by responsibilities and collaborators, plus <concept>_id/_name/_status."""
+    attributes = set()
+    for concept in domain_concepts:
+        concept_name = concept.get('name', '').lower()
+        for resp in concept.get('responsibilities', []):
+            resp_name = resp.get('name', '')
+            attr_match = re.search(r'(?:Get|has|owns|maintains|assigns|grants)\s+(\w+)', resp_name, re.I)
+            if attr_match:
+                attributes.add(attr_match.group(1).lower())
+            for collab in resp.get('collaborators', []):
+                attributes.add(collab.lower())
+        attributes.add(f"{concept_name}_id")
+        attributes.add(f"{concept_name}_name")
+        attributes.add(f"{concept_name}_status")
+    return attributes
@@ -1,6 +1,8 @@
 
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional, Union, TYPE_CHECKING
+from .resources.ast_elements import Functions, Classes, IfStatements, TryBlocks, Imports
+from .resources.ast_events import FileEvents
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -11,15 +13,21 @@ if TYPE_CHECKING:
     from .resources.block import Block
     from .resources.file import File
     from .resources.scan_context import ScanContext, FileScanContext, ScanFilesContext, CrossFileScanContext
+    from .resources.parsed_file_store import ParsedFileStore, ParsedFile
+    import ast
 
 class Scanner(ABC):
+    # Story-graph edits invalidate stored results only for scanners that read the graph
+    reads_story_graph = True
     
     def __init__(self, rule: 'Rule'):
         self.rule = rule
+        self._parsed_files: Optional['ParsedFileStore'] = None
     
     def scan_with_context(self, context: 'ScanFilesContext') -> List[Dict[str, Any]]:
         from .resources.scan_context import FileScanContext
         
+        self._bind_parsed_files(context)
         violations = []
         all_files = context.files.all_files
         
@@ -28,6 +36,7 @@ class Scanner(ABC):
                 file_context = FileScanContext(
                     story_graph=context.story_graph,
                     full_story_graph=getattr(context, 'full_story_graph', None),
+                    parsed_files=self._parsed_files,
                     file_path=file_path
                 )
                 file_violations = self.scan_file_with_context(file_context)
@@ -41,6 +50,48 @@ class Scanner(ABC):
         
         return violations
     
+    def _bind_parsed_files(self, context: 'ScanContext') -> None:
+        parsed_files = getattr(context, 'parsed_files', None)
+        if parsed_files is not None:
+            self._parsed_files = parsed_files
+    
+    def _parsed_file(self, file_path: 'Path') -> Optional['ParsedFile']:
+        if self._parsed_files is None:
+            return None
+        return self._parsed_files.parse(file_path)
+    
+    def _functions_in(self, tree: 'ast.AST') -> Functions:
+        parsed = self._parsed_files.for_tree(tree) if self._parsed_files is not None else None
+        return parsed.functions if parsed else Functions(tree)
+    
+    def _classes_in(self, tree: 'ast.AST') -> Classes:
+        parsed = self._parsed_files.for_tree(tree) if self._parsed_files is not None else None
+        return parsed.classes if parsed else Classes(tree)
+    
+    def _if_statements_in(self, tree: 'ast.AST') -> IfStatements:
+        parsed = self._parsed_files.for_tree(tree) if self._parsed_files is not None else None
+        return parsed.if_statements if parsed else IfStatements(tree)
+    
+    def _try_blocks_in(self, tree: 'ast.AST') -> TryBlocks:
+        parsed = self._parsed_files.for_tree(tree) if self._parsed_files is not None else None
+        return parsed.try_blocks if parsed else TryBlocks(tree)
+    
+    def _imports_in(self, tree: 'ast.AST') -> Imports:
+        parsed = self._parsed_files.for_tree(tree) if self._parsed_files is not None else None
+        return parsed.imports if parsed else Imports(tree)
+    
+    def _events_in(self, tree: 'ast.AST') -> FileEvents:
+        parsed = self._parsed_files.for_tree(tree) if self._parsed_files is not None else None
+        return parsed.events if parsed else FileEvents(tree)
+    
+    def _nodes_of_type(self, tree: 'ast.AST', *node_types: type) -> List['ast.AST']:
+        """Nodes of exactly these AST classes, in ast.walk order, from the file's shared walk."""
+        return self._events_in(tree).nodes_of_type(*node_types)
+    
+    def _dispatch_ast(self, tree: 'ast.AST', *handlers: object) -> None:
+        """Send enter_<NodeType>/exit_<NodeType> events for tree to handlers (default: this scanner)."""
+        self._events_in(tree).dispatch(*(handlers or (self,)))
+    
     def _empty_violation_list(self) -> List[Dict[str, Any]]:
         return []
     
@@ -31,12 +31,14 @@ class LanguageAgnosticScanner(Scanner):
                 return None
             if not self._js_instance:
                 self._js_instance = self._js_scanner_class(self.rule)
+            self._js_instance._parsed_files = self._parsed_files
             return self._js_instance
         else:
             if not self._python_scanner_class:
                 return None
             if not self._python_instance:
                 self._python_instance = self._python_scanner_class(self.rule)
+            self._python_instance._parsed_files = self._parsed_files
             return self._python_instance
     
     def scan_file_with_context(self, context):
@@ -50,12 +52,13 @@ class LanguageAgnosticScanner(Scanner):
     def scan_with_context(self, context):
         """Delegate to language-specific scanner per file: .js/.ts/.mjs/.cjs use JS scanner, others use Python."""
         from scanners.resources.scan_context import FileScanContext
+        self._bind_parsed_files(context)
         violations = []
         file_list = getattr(context.files, 'all_files', []) if getattr(context, 'files', None) else []
         for file_path in file_list or []:
             if not file_path or not file_path.exists() or not file_path.is_file():
                 continue
-            file_context = FileScanContext(story_graph=context.story_graph, full_story_graph=getattr(context, 'full_story_graph', None), file_path=file_path)
+            file_context = FileScanContext(story_graph=context.story_graph, full_story_graph=getattr(context, 'full_story_graph', None), parsed_files=self._parsed_files, file_path=file_path)
             scanner = self._get_scanner_for_file(file_path)
             if scanner:
                 file_violations = scanner.scan_file_with_context(file_context)
@@ -36,7 +36,7 @@ class ParameterizedScenariosScanner(ScenarioScannerBase):
         
         # Collect domain concepts for validation
         domain_concepts = self._collect_domain_concepts_for_story(node)
-        concept_names = self._extract_concept_names(domain_concepts) if domain_concepts else set()
+        concept_names = self._concept_names_for_story(node) if domain_concepts else set()
         
         # Check background for parameter/example alignment
         background_violations = self._check_background_examples(node, concept_names)
@@ -50,8 +50,8 @@ class ScenarioLanguageScanner(ScenarioScannerBase):
             return violations
         
         # Build lookup structures
-        concept_names = self._extract_concept_names(domain_concepts)
-        concept_attributes = self._extract_concept_attributes(domain_concepts)
+        concept_names = self._concept_names_for_story(node)
+        concept_attributes = self._concept_attributes_for_story(node)
         all_domain_terms = concept_names | concept_attributes
         
         # Scan each scenario
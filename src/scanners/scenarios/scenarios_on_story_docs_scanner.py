@@ -9,13 +9,14 @@ Validates that stories have scenarios defined in the story-graph.json.
 from typing import List, Dict, Any, Optional, Set, TYPE_CHECKING
 from scanners.story_scanner import StoryScanner
 from scanners.story_map import StoryNode, Story, StoryMap
+from scanners.resources.story_model import StoryModel
 from scanners.violation import Violation
 
 if TYPE_CHECKING:
     from scanners.resources.scan_context import ScanFilesContext
 
 
-def _get_story_names_from_scope(story_graph: Dict[str, Any]) -> Set[str]:
+def _get_story_names_from_scope(story_graph: Dict[str, Any], story_model: Optional[StoryModel] = None) -> Set[str]:
     scope_config = story_graph.get('_validation_scope', {})
     
     if scope_config.get('all') is True:
@@ -24,7 +25,6 @@ def _get_story_names_from_scope(story_graph: Dict[str, Any]) -> Set[str]:
     if not scope_config:
         return None
     
-    story_map = StoryMap(story_graph)
     story_names = set()
     
     if 'story_names' in scope_config:
@@ -37,8 +37,9 @@ def _get_story_names_from_scope(story_graph: Dict[str, Any]) -> Set[str]:
     if 'epic_names' in scope_config:
         epic_names_list = scope_config['epic_names']
         epic_names_list = epic_names_list if isinstance(epic_names_list, list) else [epic_names_list]
+        find_epic = story_model.find_epic_by_name if story_model else StoryMap(story_graph).find_epic_by_name
         for epic_name in epic_names_list:
-            epic = story_map.find_epic_by_name(epic_name)
+            epic = find_epic(epic_name)
             if epic:
                 story_names.update(s.name for s in epic.all_stories)
     
@@ -103,7 +104,7 @@ class ScenariosOnStoryDocsScanner(StoryScanner):
         self._in_scope_story_names: Optional[Set[str]] = None
     
     def scan_with_context(self, context: 'ScanFilesContext') -> List[Dict[str, Any]]:
-        self._in_scope_story_names = _get_story_names_from_scope(context.story_graph)
+        self._in_scope_story_names = _get_story_names_from_scope(context.story_graph, self._shared_story_model(context))
         return super().scan_with_context(context)
     
     def scan_story_node(self, node: StoryNode) -> List[Dict[str, Any]]:
@@ -312,7 +312,6 @@ class StoryMap:
     @classmethod
     def from_bot(cls, bot: Any) -> 'StoryMap':
         from pathlib import Path
-        import json
         
         # Use centralized path resolution when available
         if hasattr(bot, 'bot_paths') and hasattr(bot.bot_paths, 'story_graph_paths'):
@@ -332,8 +331,8 @@ class StoryMap:
         if not story_graph_path.exists():
             raise FileNotFoundError(f"Story graph not found at {story_graph_path}")
         
-        with open(story_graph_path, 'r', encoding='utf-8') as f:
-            story_graph = json.load(f)
+        from story_graph.story_graph_store import StoryGraphStore
+        story_graph = StoryGraphStore.shared().load(story_graph_path)
         
         return cls(story_graph)
     
@@ -1,8 +1,10 @@
 from abc import abstractmethod
 from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from scanners.scanner import Scanner
-from scanners.story_map import StoryMap, StoryNode, StoryGroup
+from scanners.story_map import StoryNode
 from scanners.domain_concept_node import DomainConceptNode
+from scanners.resources.language_service import LanguageService
+from scanners.resources.story_model import StoryModel
 
 if TYPE_CHECKING:
     from scanners.resources.scan_context import ScanFilesContext
@@ -10,22 +12,36 @@ if TYPE_CHECKING:
 
 class StoryScanner(Scanner):
     
+    # Scanners that POS-tag node names set this so all names are tagged in one batch before scanning.
+    tags_node_names = False
+    
     def __init__(self, rule: 'Rule'):
         super().__init__(rule)
     
     def scan_with_context(self, context: 'ScanFilesContext') -> List[Dict[str, Any]]:
         violations = []
-        story_graph_data = context.story_graph.get('story_graph', context.story_graph)
-        story_map = StoryMap(story_graph_data)
+        nodes = self._story_model(context).nodes
+        if self.tags_node_names:
+            LanguageService.shared().tag_many(node.name for node in nodes if node.name)
         
-        for epic in story_map.epics():
-            for node in story_map.walk(epic):
-                if not isinstance(node, StoryGroup):
-                    node_violations = self.scan_story_node(node)
-                    violations.extend(node_violations)
+        for node in nodes:
+            node_violations = self.scan_story_node(node)
+            violations.extend(node_violations)
         
         return violations
     
+    def _story_model(self, context: 'ScanFilesContext') -> StoryModel:
+        """The run's shared story model when it was built from this context's graph, else a fresh one."""
+        model = self._shared_story_model(context)
+        return model if model is not None else StoryModel(context.story_graph)
+    
+    @staticmethod
+    def _shared_story_model(context: 'ScanFilesContext') -> Optional[StoryModel]:
+        model = getattr(context, 'story_model', None)
+        if model is not None and model.is_for(context.story_graph):
+            return model
+        return None
+    
     def _scan_domain_concepts(
         self,
         domain_concepts: List[Dict[str, Any]],
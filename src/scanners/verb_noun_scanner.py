@@ -3,31 +3,15 @@ import logging
 from scanners.story_scanner import StoryScanner
 from scanners.story_map import StoryNode, Epic, SubEpic, Story
 from scanners.violation import Violation
+from scanners.resources.language_service import LanguageService
 from .vocabulary_helper import VocabularyHelper
 
-import nltk
-from nltk import pos_tag, word_tokenize
-from nltk.corpus import wordnet as wn
-
 logger = logging.getLogger(__name__)
 
-try:
-    nltk.data.find('tokenizers/punkt_tab')
-except LookupError:
-    nltk.download('punkt_tab', quiet=True)
-
-try:
-    nltk.data.find('taggers/averaged_perceptron_tagger_eng')
-except LookupError:
-    nltk.download('averaged_perceptron_tagger_eng', quiet=True)
-
-try:
-    nltk.data.find('corpora/wordnet')
-except LookupError:
-    nltk.download('wordnet', quiet=True)
-
 class VerbNounScanner(StoryScanner):
     
+    tags_node_names = True
+    
     def scan_domain_concept(self, node: Any) -> List[Dict[str, Any]]:
         return []
     
@@ -79,13 +63,8 @@ class VerbNounScanner(StoryScanner):
         return 'unknown'
     
     def _get_tokens_and_tags(self, text: str) -> Tuple[List[str], List[Tuple[str, str]]]:
-        try:
-            tokens = word_tokenize(text)
-            tokens = [t for t in tokens if t.isalnum() or any(c.isalnum() for c in t)]
-            tags = pos_tag(tokens)
-            return tokens, tags
-        except Exception:
-            return [], []
+        tags = LanguageService.shared().pos_tags(text)
+        return [token for token, _ in tags], tags
     
     def _is_verb(self, tag: str) -> bool:
         verb_tags = ['VB', 'VBP', 'VBZ', 'VBD', 'VBG', 'VBN']
@@ -100,19 +79,7 @@ class VerbNounScanner(StoryScanner):
         return tag in proper_noun_tags
     
     def _can_be_verb(self, word: str) -> bool:
-        try:
-            word_lower = word.lower()
-            synsets = wn.synsets(word_lower, pos=wn.VERB)
-            if synsets:
-                return True
-            
-            for synset in wn.synsets(word_lower):
-                if 'v' in synset.pos():
-                    return True
-            
-            return False
-        except Exception:
-            return False
+        return LanguageService.shared().can_be_verb(word)
     
     def _check_verb_noun_order(self, node: StoryNode, node_type: str) -> Optional[Dict[str, Any]]:
         name = node.name
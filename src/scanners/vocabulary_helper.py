@@ -1,41 +1,5 @@
-
-from typing import List, Set, Optional
-import nltk
-from nltk.corpus import wordnet as wn
-from nltk import pos_tag, word_tokenize
-
-import socket
-_original_timeout = socket.getdefaulttimeout()
-socket.setdefaulttimeout(2)
-
-try:
-    nltk.data.find('corpora/wordnet')
-except LookupError:
-    try:
-        nltk.download('wordnet', quiet=True)
-    except Exception as e:
-        import sys
-        print(f"Warning: Failed to download NLTK wordnet: {e}", file=sys.stderr)
-
-try:
-    nltk.data.find('tokenizers/punkt_tab')
-except LookupError:
-    try:
-        nltk.download('punkt_tab', quiet=True)
-    except Exception as e:
-        import sys
-        print(f"Warning: Failed to download NLTK punkt_tab: {e}", file=sys.stderr)
-
-try:
-    nltk.data.find('taggers/averaged_perceptron_tagger_eng')
-except LookupError:
-    try:
-        nltk.download('averaged_perceptron_tagger_eng', quiet=True)
-    except Exception as e:
-        import sys
-        print(f"Warning: Failed to download NLTK averaged_perceptron_tagger_eng: {e}", file=sys.stderr)
-
-socket.setdefaulttimeout(_original_timeout)
+from typing import List, Optional
+from scanners.resources.language_service import LanguageService, NOUN, VERB
 
 class VocabularyHelper:
     
@@ -44,21 +8,16 @@ class VocabularyHelper:
     GERUND_SUFFIX = 'ing'
     
     @staticmethod
-    def _has_synsets(word: str, pos) -> bool:
-        try:
-            word_lower = word.lower()
-            synsets = wn.synsets(word_lower, pos=pos)
-            return len(synsets) > 0
-        except Exception:
-            return False
+    def _has_synsets(word: str, pos: str) -> bool:
+        return LanguageService.shared().has_synsets(word, pos)
     
     @staticmethod
     def is_verb(word: str) -> bool:
-        return VocabularyHelper._has_synsets(word, wn.VERB)
+        return VocabularyHelper._has_synsets(word, VERB)
     
     @staticmethod
     def is_noun(word: str) -> bool:
-        return VocabularyHelper._has_synsets(word, wn.NOUN)
+        return VocabularyHelper._has_synsets(word, NOUN)
     
     @staticmethod
     def is_agent_noun(word: str) -> tuple[bool, Optional[str], Optional[str]]:
@@ -106,12 +65,7 @@ class VocabularyHelper:
     
     @staticmethod
     def get_pos_tags(text: str) -> List[tuple[str, str]]:
-        try:
-            tokens = word_tokenize(text)
-            tokens = [t for t in tokens if t.isalnum() or any(c.isalnum() for c in t)]
-            return pos_tag(tokens)
-        except Exception:
-            return []
+        return LanguageService.shared().pos_tags(text)
     
     @staticmethod
     def is_verb_tag(tag: str) -> bool:
@@ -130,26 +84,4 @@ class VocabularyHelper:
     
     @staticmethod
     def is_actor_or_role(word: str) -> bool:
-        try:
-            word_lower = word.lower()
-            
-            synsets = wn.synsets(word_lower)
-            
-            if not synsets:
-                return False
-            
-            for synset in synsets:
-                hypernyms = set()
-                for path in synset.hypernym_paths():
-                    hypernyms.update(path)
-                
-                for hypernym in hypernyms:
-                    name = hypernym.name().split('.')[0]
-                    if name in ['person', 'user', 'system', 'agent', 'entity', 'causal_agent']:
-                        return True
-            
-            return False
-        except Exception:
-            return False
-        
-
+        return LanguageService.shared().is_actor_or_role(word)
@@ -0,0 +1,142 @@
+"""
+Enriched story graph cache - serialized + link-enriched scope content, reused until an input changes.
+
+The key covers everything the enrichment reads: the (filtered) graph content, the behavior
+configs, the test / scenario / exploration file trees and the serialization options. Entries
+live in a small in-memory tier shared by the process and, for unfiltered scopes, in the
+workspace's .story-graph-enriched-cache.json so a fresh CLI process starts warm.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from utils import atomic_write
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+MEMORY_ENTRIES = 8
+SKIPPED_DIRS = frozenset(['__pycache__', 'node_modules', '.git', '.venv', '.pytest_cache'])
+
+_memory: 'OrderedDict[Tuple[str, str], str]' = OrderedDict()
+_memory_lock = threading.Lock()
+stats: Dict[str, int] = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0}
+
+
+def clear_memory() -> None:
+    with _memory_lock:
+        _memory.clear()
+
+
+def _hash_tree(hasher, root: Optional[Path]) -> None:
+    """Feed every directory and file under root (relative path, mtime, size) into hasher."""
+    hasher.update(f'\0tree:{root}'.encode('utf-8'))
+    if not root or not root.is_dir():
+        return
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIPPED_DIRS)
+        rel_dir = os.path.relpath(dirpath, root)
+        hasher.update(f'\0d:{rel_dir}'.encode('utf-8'))
+        for name in sorted(filenames):
+            try:
+                stat = os.stat(os.path.join(dirpath, name))
+            except OSError:
+                continue
+            hasher.update(f'\0f:{name}:{stat.st_mtime_ns}:{stat.st_size}'.encode('utf-8'))
+
+
+def _hash_files(hasher, paths: Iterable[Path]) -> None:
+    for path in paths:
+        try:
+            stat = path.stat()
+            hasher.update(f'\0c:{path}:{stat.st_mtime_ns}:{stat.st_size}'.encode('utf-8'))
+        except OSError:
+            hasher.update(f'\0c:{path}:missing'.encode('utf-8'))
+
+
+def behavior_config_files(bot_directory: Optional[Path]) -> list:
+    if not bot_directory:
+        return []
+    behaviors_dir = Path(bot_directory) / 'behaviors'
+    if not behaviors_dir.is_dir():
+        return []
+    return sorted(behaviors_dir.glob('*/behavior.json'))
+
+
+def compute_key(graph_content: dict, options: dict, config_files: Iterable[Path], trees: Iterable[Optional[Path]],
+                graph_digest: Optional[str] = None) -> str:
+    """graph_digest, when known (the file's digest, plus the filter for a filtered graph), stands in for the content."""
+    hasher = hashlib.sha1()
+    hasher.update(f'v{CACHE_VERSION}'.encode('utf-8'))
+    hasher.update(json.dumps(options, sort_keys=True).encode('utf-8'))
+    if graph_digest:
+        hasher.update(f'\0file:{graph_digest}'.encode('utf-8'))
+    else:
+        hasher.update(json.dumps(graph_content, ensure_ascii=False, default=str).encode('utf-8'))
+    _hash_files(hasher, config_files)
+    for root in trees:
+        _hash_tree(hasher, root)
+    return hasher.hexdigest()
+
+
+class EnrichedGraphCache:
+
+    def __init__(self, cache_path: Path):
+        self.cache_path = Path(cache_path)
+
+    def get(self, key: str) -> Optional[dict]:
+        """Cached content for key (a private copy the caller may mutate), or None."""
+        memory_key = (str(self.cache_path), key)
+        with _memory_lock:
+            serialized = _memory.get(memory_key)
+            if serialized is not None:
+                _memory.move_to_end(memory_key)
+                stats['memory_hits'] += 1
+        if serialized is None:
+            serialized = self._read_disk(key)
+            if serialized is None:
+                with _memory_lock:
+                    stats['misses'] += 1
+                return None
+            with _memory_lock:
+                stats['disk_hits'] += 1
+            self._remember(memory_key, serialized)
+        return json.loads(serialized)
+
+    def put(self, key: str, content: dict, persist: bool = True) -> None:
+        serialized = json.dumps(content, ensure_ascii=False, separators=(',', ':'))
+        self._remember((str(self.cache_path), key), serialized)
+        if persist:
+            self._write_disk(key, serialized)
+
+    def _remember(self, memory_key: Tuple[str, str], serialized: str) -> None:
+        with _memory_lock:
+            _memory[memory_key] = serialized
+            _memory.move_to_end(memory_key)
+            while len(_memory) > MEMORY_ENTRIES:
+                _memory.popitem(last=False)
+
+    def _read_disk(self, key: str) -> Optional[str]:
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                header = f.readline()
+                if json.loads(header).get('key') != key:
+                    return None
+                return f.read()
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def _write_disk(self, key: str, serialized: str) -> None:
+        """Header line with the key, then the content - a stale cache is rejected without parsing the body."""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with atomic_write(self.cache_path) as f:
+                f.write(json.dumps({'version': CACHE_VERSION, 'key': key}) + '\n')
+                f.write(serialized)
+        except OSError as e:
+            logger.debug(f'Could not write enriched story graph cache {self.cache_path}: {e}')
@@ -0,0 +1,320 @@
+"""
+File walker - pruning, ignore-aware workspace file discovery with per-session snapshots.
+
+Validation and file scopes used to rglob the whole tree and drop node_modules, .git and
+similar paths afterwards. The walker decides per directory before descending: dependency
+and cache directories, directories matching an exclude pattern and directories a .gitignore
+ignores are never listed. Results are sorted by extension so scanners can take their files in
+one slice. Each walk is kept as a snapshot, revalidated by the (mtime, size) of every listed
+directory and every .gitignore read, so a repeat discovery in the same session is a few stats.
+"""
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+SKIPPED_DIRS = frozenset(['__pycache__', 'node_modules', '.git', '.venv', '.pytest_cache'])
+GITIGNORE = '.gitignore'
+
+Stamp = Tuple[int, int]
+# (base directory with trailing '/', compiled pattern, negated, directory only)
+IgnoreRule = Tuple[str, 're.Pattern', bool, bool]
+
+
+def translate_pattern(pattern: str, match_hidden: bool = True) -> str:
+    """Regex source for a '/'-separated wildcard pattern: * and ? stay inside one path
+    component, a whole ** component spans any number of them. With match_hidden False a
+    wildcard does not match a leading '.', as with glob."""
+    no_dot = '' if match_hidden else r'(?!\.)'
+    parts = []
+    i, n = 0, len(pattern)
+    at_component_start = True
+    while i < n:
+        c = pattern[i]
+        if c == '*':
+            whole_component = pattern.startswith('**', i) and at_component_start and (i + 2 == n or pattern[i + 2] == '/')
+            if whole_component and i + 2 == n:
+                parts.append('.*' if match_hidden else rf'(?:{no_dot}[^/]+(?:/{no_dot}[^/]+)*)?')
+                i += 2
+                continue
+            if whole_component:
+                parts.append('(?:.*/)?' if match_hidden else rf'(?:{no_dot}[^/]+/)*')
+                i += 3
+                continue
+            while i < n and pattern[i] == '*':
+                i += 1
+            parts.append((no_dot if at_component_start else '') + '[^/]*')
+        elif c == '?':
+            parts.append((no_dot if at_component_start else '') + '[^/]')
+            i += 1
+        elif c == '[':
+            j = i + 1
+            if j < n and pattern[j] in '!^':
+                j += 1
+            if j < n and pattern[j] == ']':
+                j += 1
+            while j < n and pattern[j] != ']':
+                j += 1
+            if j >= n:
+                parts.append(r'\[')
+                i += 1
+            else:
+                body = pattern[i + 1:j].replace('\\', '\\\\')
+                if body[0] in '!^':
+                    body = '^' + body[1:]
+                parts.append(f'[{body}]')
+                i = j + 1
+        elif c == '/':
+            parts.append('/')
+            i += 1
+            at_component_start = True
+            continue
+        else:
+            parts.append(re.escape(c))
+            i += 1
+        at_component_start = False
+    return ''.join(parts)
+
+
+def parse_gitignore(text: str, base: str) -> List[IgnoreRule]:
+    """Rules of one .gitignore whose directory is base ('/'-separated, absolute)."""
+    base = base.rstrip('/') + '/'
+    rules: List[IgnoreRule] = []
+    for line in text.splitlines():
+        line = line.rstrip()
+        if not line or line.startswith('#'):
+            continue
+        negated = line.startswith('!')
+        if negated:
+            line = line[1:]
+        if line.startswith('\\'):
+            line = line[1:]
+        directory_only = line.endswith('/')
+        line = line.rstrip('/')
+        if not line:
+            continue
+        anchored = '/' in line
+        source = translate_pattern(line.lstrip('/'))
+        if not anchored:
+            source = '(?:.*/)?' + source
+        try:
+            rules.append((base, re.compile(source, re.DOTALL), negated, directory_only))
+        except re.error as e:
+            logger.debug(f'Skipping .gitignore pattern {line!r} in {base}: {e}')
+    return rules
+
+
+def is_ignored(path: str, is_dir: bool, rules: Sequence[IgnoreRule]) -> bool:
+    """Whether the last rule matching path ('/'-separated, absolute) ignores it."""
+    for base, pattern, negated, directory_only in reversed(rules):
+        if directory_only and not is_dir:
+            continue
+        if path.startswith(base) and pattern.fullmatch(path[len(base):]):
+            return not negated
+    return False
+
+
+def _normalized(path: str) -> str:
+    return path.replace('\\', '/')
+
+
+class _Snapshot:
+
+    __slots__ = ('checks', 'files')
+
+    def __init__(self, checks: List[Tuple[str, Stamp]], files: List[str]):
+        self.checks = checks
+        self.files = files
+
+
+class FileWalker:
+
+    _shared: Optional['FileWalker'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._listings: Dict[str, Tuple[Stamp, List[str], List[str]]] = {}
+        self._ignore_files: Dict[str, Tuple[Stamp, List[IgnoreRule]]] = {}
+        self._snapshots: Dict[tuple, _Snapshot] = {}
+        self._stats = {'walks': 0, 'snapshot_hits': 0, 'listings': 0, 'listing_hits': 0, 'pruned': 0}
+
+    @classmethod
+    def shared(cls) -> 'FileWalker':
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def files(self, root: Union[str, Path], extensions: Optional[Iterable[str]] = None,
+              exclude: Iterable[str] = (), ignore_root: Union[str, Path, None] = None) -> List[Path]:
+        """Files under root with one of extensions (all files when None), sorted by extension then path.
+
+        Skips dependency / cache directories, directories whose path contains one of the exclude
+        substrings and anything ignored by a .gitignore in root, below it, or in an ancestor up to
+        the repository root (or up to ignore_root, typically the workspace, outside a repository).
+        """
+        prefix = str(root)
+        abs_root = os.path.abspath(prefix)
+        extensions = tuple(sorted(set(extensions))) if extensions is not None else None
+        exclude = tuple(sorted({_normalized(p) for p in exclude if p}))
+        ignore_root = os.path.abspath(str(ignore_root)) if ignore_root is not None else None
+        key = (abs_root, extensions, exclude, ignore_root)
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+        if snapshot is not None and all(_stamp(path) == stamp for path, stamp in snapshot.checks):
+            with self._lock:
+                self._stats['snapshot_hits'] += 1
+        else:
+            snapshot = self._walk(abs_root, extensions, exclude, ignore_root)
+            with self._lock:
+                self._snapshots[key] = snapshot
+                self._stats['walks'] += 1
+        if prefix == abs_root:
+            return [Path(path) for path in snapshot.files]
+        return [Path(prefix + path[len(abs_root):]) for path in snapshot.files]
+
+    def files_by_extension(self, root: Union[str, Path], extensions: Optional[Iterable[str]] = None,
+                           exclude: Iterable[str] = (), ignore_root: Union[str, Path, None] = None) -> Dict[str, List[Path]]:
+        """files() grouped by extension, for routing each group to its scanner."""
+        grouped: Dict[str, List[Path]] = {}
+        for path in self.files(root, extensions, exclude, ignore_root):
+            grouped.setdefault(path.suffix, []).append(path)
+        return grouped
+
+    def _walk(self, abs_root: str, extensions: Optional[Tuple[str, ...]], exclude: Tuple[str, ...],
+              ignore_root: Optional[str]) -> _Snapshot:
+        checks: List[Tuple[str, Stamp]] = []
+        found: List[str] = []
+        visited = set()
+        pending = [(abs_root, self._inherited_rules(abs_root, ignore_root, checks))]
+        while pending:
+            directory, rules = pending.pop()
+            real = os.path.realpath(directory)
+            if real in visited:
+                continue
+            visited.add(real)
+            listing = self._listing(directory)
+            if listing is None:
+                continue
+            stamp, file_names, dir_names = listing
+            checks.append((directory, stamp))
+            if GITIGNORE in file_names:
+                rules = rules + self._ignore_rules(os.path.join(directory, GITIGNORE), directory, checks)
+            for name in file_names:
+                if extensions is not None and not name.endswith(extensions):
+                    continue
+                path = os.path.join(directory, name)
+                if rules and is_ignored(_normalized(path), False, rules):
+                    continue
+                found.append(path)
+            for name in reversed(dir_names):
+                path = os.path.join(directory, name)
+                if self._prunes(name, _normalized(path), rules, exclude):
+                    with self._lock:
+                        self._stats['pruned'] += 1
+                    continue
+                pending.append((path, rules))
+        found.sort(key=lambda path: (os.path.splitext(path)[1], path))
+        return _Snapshot(checks, found)
+
+    @staticmethod
+    def _prunes(name: str, path: str, rules: Sequence[IgnoreRule], exclude: Tuple[str, ...]) -> bool:
+        if name in SKIPPED_DIRS:
+            return True
+        # A pattern inside the directory's path is inside the path of every file below it
+        if exclude and any(pattern in path + '/' for pattern in exclude):
+            return True
+        return bool(rules) and is_ignored(path, True, rules)
+
+    def _inherited_rules(self, abs_root: str, ignore_root: Optional[str], checks: List[Tuple[str, Stamp]]) -> List[IgnoreRule]:
+        """.gitignore rules of root's ancestors, up to the repository root or ignore_root; none past either."""
+        ancestors = []
+        current = abs_root
+        while True:
+            if current == ignore_root or os.path.exists(os.path.join(current, '.git')):
+                break
+            parent = os.path.dirname(current)
+            if parent == current:
+                return []
+            current = parent
+            ancestors.append(current)
+        rules: List[IgnoreRule] = []
+        for directory in reversed(ancestors):
+            checks.append((directory, _stamp(directory)))
+            gitignore = os.path.join(directory, GITIGNORE)
+            if os.path.isfile(gitignore):
+                rules.extend(self._ignore_rules(gitignore, directory, checks))
+        return rules
+
+    def _ignore_rules(self, gitignore: str, directory: str, checks: List[Tuple[str, Stamp]]) -> List[IgnoreRule]:
+        stamp = _stamp(gitignore)
+        checks.append((gitignore, stamp))
+        with self._lock:
+            cached = self._ignore_files.get(gitignore)
+            if cached and cached[0] == stamp:
+                return cached[1]
+        try:
+            with open(gitignore, encoding='utf-8', errors='replace') as f:
+                rules = parse_gitignore(f.read(), _normalized(directory))
+        except OSError as e:
+            logger.debug(f'Could not read {gitignore}: {e}')
+            rules = []
+        with self._lock:
+            self._ignore_files[gitignore] = (stamp, rules)
+        return rules
+
+    def _listing(self, directory: str) -> Optional[Tuple[Stamp, List[str], List[str]]]:
+        """(stamp, file names, sub-directory names) of directory, re-listed only when its stamp changes."""
+        stamp = _stamp(directory)
+        if stamp is None:
+            return None
+        with self._lock:
+            cached = self._listings.get(directory)
+            if cached and cached[0] == stamp:
+                self._stats['listing_hits'] += 1
+                return cached
+        files, dirs = [], []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            dirs.append(entry.name)
+                        elif entry.is_file():
+                            files.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            return None
+        files.sort()
+        dirs.sort()
+        listing = (stamp, files, dirs)
+        with self._lock:
+            self._listings[directory] = listing
+            self._stats['listings'] += 1
+        return listing
+
+    def clear(self) -> None:
+        with self._lock:
+            self._listings.clear()
+            self._ignore_files.clear()
+            self._snapshots.clear()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """walks done, snapshots reused, directories listed / reused and directories pruned."""
+        with self._lock:
+            return dict(self._stats)
+
+
+def _stamp(path: str) -> Optional[Stamp]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
@@ -4,6 +4,7 @@ import re
 from typing import Optional
 from pathlib import Path
 from cli.adapters import JSONAdapter
+from scope.enriched_graph_cache import EnrichedGraphCache, behavior_config_files, compute_key
 from scope.scope import Scope
 
 class JSONScope(JSONAdapter):
@@ -70,40 +71,44 @@ class JSONScope(JSONAdapter):
                 
                 # Use centralized path resolution
                 if self.scope.bot_paths:
-                    story_graph_path = self.scope.bot_paths.story_graph_paths.story_graph_path
                     cache_path = self.scope.bot_paths.story_graph_paths.story_graph_cache_path
                 else:
-                    story_graph_path = self.scope.workspace_directory / 'docs' / 'story' / 'story-graph.json'
                     cache_path = self.scope.workspace_directory / 'docs' / 'story' / '.story-graph-enriched-cache.json'
                 
-                content = None
-                # CACHE DISABLED - Always regenerate to ensure behaviors are current
-                # if not has_active_filter and story_graph_path.exists() and cache_path.exists():
-                #     # Check if cache is still valid (cache mtime > source mtime)
-                #     source_mtime = story_graph_path.stat().st_mtime
-                #     cache_mtime = cache_path.stat().st_mtime
-                #     
-                #     if cache_mtime >= source_mtime:
-                #         # Cache is valid - load it
-                #         try:
-                #             with open(cache_path, 'r', encoding='utf-8') as f:
-                #                 content = json.load(f)
-                #         except Exception:
-                #             # Cache corrupted, regenerate
-                #             content = None
+                # Instructions: use scope.include_level. Panel: use examples (fast) except when scope is
+                # increment with filter - then use include_level so epics section shows injection-level detail.
+                use_include = apply_include_level or (
+                    self.scope.type.value == 'increment' and bool(self.scope.value)
+                )
+                include_level = self.scope.include_level if use_include else 'examples'
+                # Trace is expensive - only for instructions when level is tests/code
+                generate_trace = strip_links_for_instructions and include_level in ('tests', 'code')
+                # File enrichment: add doc/test links for panel and instructions
+                # Instructions: enrich_scenarios when level is tests/code
+                # Filtered scope (story/epic): enrich scenarios - small content, affordable AST parsing
+                # showAll (no filter): skip scenario enrichment for performance (whole graph)
+                if apply_include_level or strip_links_for_instructions:
+                    enrich_scenarios = include_level in ('tests', 'code')
+                else:
+                    enrich_scenarios = bool(has_active_filter)  # Filtered scope: enrich; showAll: skip
+                
+                # Trace output depends on the whole code base, so it is never cached
+                cache = cache_key = None
+                if not generate_trace and self.scope.workspace_directory:
+                    cache = EnrichedGraphCache(cache_path)
+                    cache_key = self._enriched_cache_key(story_graph, {
+                        'include_level': include_level,
+                        'enrich_scenarios': enrich_scenarios,
+                        'strip_links': strip_links_for_instructions,
+                    })
+                    content = cache.get(cache_key)
+                else:
+                    content = None
                 
                 if content is None:
                     # Generate and enrich content (cache miss or invalid)
                     from story_graph.json_story_graph import JSONStoryGraph
                     graph_adapter = JSONStoryGraph(story_graph)
-                    # Instructions: use scope.include_level. Panel: use examples (fast) except when scope is
-                    # increment with filter - then use include_level so epics section shows injection-level detail.
-                    use_include = apply_include_level or (
-                        self.scope.type.value == 'increment' and bool(self.scope.value)
-                    )
-                    include_level = self.scope.include_level if use_include else 'examples'
-                    # Trace is expensive - only for instructions when level is tests/code
-                    generate_trace = strip_links_for_instructions and include_level in ('tests', 'code')
                     content = graph_adapter.to_dict(include_level=include_level, generate_trace=generate_trace).get('content', [])
                     t2 = time.perf_counter()
                     import sys
@@ -120,28 +125,15 @@ class JSONScope(JSONAdapter):
                         pass
                     
                     if content and 'epics' in content:
-                        # File enrichment: add doc/test links for panel and instructions
-                        # Instructions: enrich_scenarios when level is tests/code
-                        # Filtered scope (story/epic): enrich scenarios - small content, affordable AST parsing
-                        # showAll (no filter): skip scenario enrichment for performance (whole graph)
-                        if apply_include_level or strip_links_for_instructions:
-                            enrich_scenarios = include_level in ('tests', 'code')
-                        else:
-                            enrich_scenarios = bool(has_active_filter)  # Filtered scope: enrich; showAll: skip
                         self._enrich_with_links(content['epics'], story_graph, enrich_scenarios)
                         if strip_links_for_instructions:
                             self._strip_links(content['epics'])
-                        
-                        # CACHE DISABLED - Don't write cache file
-                        # # Write to disk cache only when there's no active filter
-                        # if not has_active_filter:
-                        #     try:
-                        #         with open(cache_path, 'w', encoding='utf-8') as f:
-                        #             json.dump(content, f, indent=2, ensure_ascii=False)
-                        #     except Exception:
-                        #         pass  # If cache write fails, just continue without it
                     else:
                         content = {'epics': []}
+                    
+                    # Only the unfiltered graph goes to disk - one file per workspace; filtered views stay in memory
+                    if cache:
+                        cache.put(cache_key, content, persist=not has_active_filter)
                 
                 # Filter increments by scope (increment name, priority, or story name matches). JSONStoryGraph
                 # may have already added increments to content; we always apply the filter.
@@ -168,6 +160,24 @@ class JSONScope(JSONAdapter):
         
         return result
     
+    def _enriched_cache_key(self, story_graph, options: dict) -> str:
+        """Key over everything to_dict reads: graph content, behavior configs and the linked file trees."""
+        bot_paths = self.scope.bot_paths
+        config_files = []
+        trees = []
+        if bot_paths:
+            story_graph_paths = bot_paths.story_graph_paths
+            config_files = behavior_config_files(bot_paths.bot_directory)
+            config_files.append(story_graph_paths.bot_workspace_config_path)
+            trees = [
+                self.scope.workspace_directory / bot_paths.test_path,
+                story_graph_paths.scenarios_path,
+                story_graph_paths.behavior_path('exploration'),
+            ]
+        from story_graph.story_graph_store import StoryGraphStore
+        graph_digest = self.scope.story_graph_digest or StoryGraphStore.shared().content_hash(story_graph.content)
+        return compute_key(story_graph.content, options, config_files, trees, graph_digest)
+    
     def _find_story_behavior_in_epics(self, epics: list, story_name: str) -> Optional[str]:
         """Walk epics dict to find story by name, return its behavior_needed. Same logic as epic hierarchy."""
         for epic in epics or []:
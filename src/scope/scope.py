@@ -5,6 +5,12 @@ from dataclasses import dataclass, field
 from enum import Enum
 import json
 import logging
+import os
+import re
+
+from scope.file_walker import FileWalker, translate_pattern
+from scope.story_name_index import StoryNameIndex, normalize_name
+
 logger = logging.getLogger(__name__)
 
 class ScopeType(Enum):
@@ -54,6 +60,8 @@ class StoryGraphFilter:
         if not self.search_terms and not self.increments:
             return story_graph
         
+        # Index the graph as given: the increments filter below re-wraps it in a new dict
+        index = StoryNameIndex.for_graph(story_graph)
         all_filter_names = list(self.search_terms)
         if self.increments:
             story_names = self._story_names_from_increments(story_graph)
@@ -78,14 +86,13 @@ class StoryGraphFilter:
         
         filter_set = {f.strip().lower() for f in all_filter_names}
         use_exact = bool(self.increments)
+        # Empty names are never indexed, so they never match (scenario name "" is "in" any filter)
+        matched_names = index.matching_names(filter_set, exact=use_exact)
+        # Nodes whose subtree holds a match; every other subtree is skipped without looking inside
+        relevant = index.relevant_nodes(matched_names)
 
         def name_matches(name: str) -> bool:
-            n = (name or '').strip().lower()
-            if not n:
-                return False  # Empty names must not match (e.g. scenario name "" in "filter" is True)
-            if use_exact:
-                return n in filter_set
-            return any(f in n or n in f for f in filter_set)
+            return normalize_name(name) in matched_names
 
         def epic_matches(epic_name: str) -> bool:
             """Return True only if epic should be included. Exclude when filter is a path to a child
@@ -100,6 +107,8 @@ class StoryGraphFilter:
             return True
 
         def filter_sub_epic(sub_epic: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            if id(sub_epic) not in relevant:
+                return None
             sub_epic_name = sub_epic.get('name', '')
             
             if name_matches(sub_epic_name):
@@ -109,6 +118,8 @@ class StoryGraphFilter:
             for story_group in sub_epic.get('story_groups', []):
                 matching_stories = []
                 for story in story_group.get('stories', []):
+                    if id(story) not in relevant:
+                        continue
                     story_name = story.get('name', '')
                     if name_matches(story_name):
                         # Story name matches - include full story with all scenarios
@@ -134,6 +145,8 @@ class StoryGraphFilter:
             
             matching_direct_stories = []
             for story in sub_epic.get('stories', []):
+                if id(story) not in relevant:
+                    continue
                 story_name = story.get('name', '')
                 if name_matches(story_name):
                     # Story name matches - include full story with all scenarios
@@ -175,6 +188,8 @@ class StoryGraphFilter:
         epics = story_graph.get('epics', [])
         
         for epic in epics:
+            if id(epic) not in relevant:
+                continue
             epic_name = epic.get('name', '')
 
             if epic_matches(epic_name):
@@ -269,6 +284,7 @@ class Scope:
         
         self._story_graph_filter: Optional[StoryGraphFilter] = None
         self._file_filter: Optional[FileFilter] = None
+        self._story_graph_digest: Optional[str] = None
     
     def copy(self) -> 'Scope':
         """Create a copy of this scope."""
@@ -346,12 +362,18 @@ class Scope:
         try:
             import time
             t0 = time.perf_counter()
-            graph_data = json.loads(story_graph_path.read_text(encoding='utf-8'))
+            from story_graph.story_graph_store import StoryGraphStore
+            store = StoryGraphStore.shared()
+            graph_data = store.load(story_graph_path)
+            source_digest = store.content_hash(graph_data)
             t1 = time.perf_counter()
             if self._story_graph_filter:
                 filtered_data = self._story_graph_filter.filter_story_graph(graph_data)
+                # A filtered graph is a function of the file and the filter, so the pair identifies it
+                self._story_graph_digest = f'{source_digest}:{self._story_graph_filter!r}' if source_digest else None
             else:
                 filtered_data = graph_data
+                self._story_graph_digest = source_digest
             t2 = time.perf_counter()
             import sys
             msg = f"[PERF] scope file read+parse: {(t1-t0)*1000:.0f}ms | filter: {(t2-t1)*1000:.0f}ms"
@@ -368,12 +390,10 @@ class Scope:
             from bot_path.bot_path import BotPath
             
             if self.bot_paths:
-                story_graph = StoryGraph(self.bot_paths, self.workspace_directory, require_file=False)
+                story_graph = StoryGraph(self.bot_paths, self.workspace_directory, require_file=False, content=filtered_data)
             else:
                 bot_path = BotPath(bot_directory=self.workspace_directory)
-                story_graph = StoryGraph(bot_path, self.workspace_directory, require_file=False)
-            
-            story_graph._content = filtered_data
+                story_graph = StoryGraph(bot_path, self.workspace_directory, require_file=False, content=filtered_data)
             
             return story_graph
         except Exception as e:
@@ -381,9 +401,12 @@ class Scope:
             logging.error(f"Error loading story graph: {e}")
             return None
     
+    @property
+    def story_graph_digest(self) -> Optional[str]:
+        """Identifies the story graph content of the last results, without hashing the content."""
+        return self._story_graph_digest
+
     def _get_file_results(self) -> List[Path]:
-        import glob as glob_module
-        
         all_files = []
         paths = self.value if isinstance(self.value, list) else [self.value]
         
@@ -391,22 +414,33 @@ class Scope:
             has_glob = any(char in path_str for char in ['*', '?', '['])
             
             if has_glob:
-                matched_files = self._process_glob_pattern(path_str, glob_module)
+                matched_files = self._process_glob_pattern(path_str)
                 all_files.extend(matched_files)
             else:
                 matched_files = self._process_regular_path(path_str)
                 all_files.extend(matched_files)
         
+        if self.exclude:
+            all_files = FileFilter(exclude_patterns=self.exclude).filter_files(all_files)
         return all_files
     
-    def _process_glob_pattern(self, path_str: str, glob_module) -> List[Path]:
+    def _process_glob_pattern(self, path_str: str) -> List[Path]:
         if not Path(path_str).is_absolute():
             pattern = str(self.workspace_directory / path_str)
         else:
             pattern = path_str
         
-        matched_files = glob_module.glob(pattern, recursive=True)
-        return [Path(match) for match in matched_files if Path(match).is_file()]
+        # Walk only below the pattern's literal leading directories, then match like glob(recursive=True)
+        pattern = pattern.replace('\\', '/')
+        parts = pattern.split('/')
+        literal = next(i for i, part in enumerate(parts) if any(char in part for char in '*?['))
+        base = '/'.join(parts[:literal]) or '/'
+        if not os.path.isdir(base):
+            return []
+        matcher = re.compile(translate_pattern('/'.join(parts[literal:]), match_hidden=False), re.DOTALL)
+        prefix = base.rstrip('/') + '/'
+        return [f for f in FileWalker.shared().files(base, exclude=self.exclude, ignore_root=self.workspace_directory)
+                if matcher.fullmatch(str(f).replace('\\', '/')[len(prefix):])]
     
     def _process_regular_path(self, path_str: str) -> List[Path]:
         file_path = Path(path_str)
@@ -414,7 +448,7 @@ class Scope:
             file_path = self.workspace_directory / file_path
         
         if file_path.exists() and file_path.is_dir():
-            return list(file_path.rglob('*.py'))
+            return FileWalker.shared().files(file_path, ('.py',), exclude=self.exclude, ignore_root=self.workspace_directory)
         
         if file_path.exists() and file_path.is_file():
             return [file_path]
@@ -1,5 +1,7 @@
 ﻿from typing import Dict, Any, List, Optional, Set
 
+from story_graph.story_graph_store import thaw
+
 class ScopingParameter:
     def __init__(self, scope: Dict[str, Any]):
         self._scope_type = scope.get('type')
@@ -9,6 +11,9 @@ class ScopingParameter:
         if self._is_all_scope():
             return story_graph
         
+        # Filters prune nodes in place; the shared store hands out read-only views
+        story_graph = thaw(story_graph)
+        
         if self._is_story_scope():
             self._filter_by_story_names(story_graph, self._scope_value)
             return story_graph
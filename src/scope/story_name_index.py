@@ -0,0 +1,120 @@
+"""
+Story name index - trigram postings over the node names a scope filter matches against.
+
+A scope "<names>" filter keeps a node when a filter term is a substring of its name or its
+name is a substring of a term. Rather than comparing every epic, sub-epic, story and scenario
+name with every term, the index keeps the distinct lowercased names, a trigram -> names
+postings map and each node's parent. Names containing a term come from intersecting the
+term's trigram postings; names contained in a term come from looking up the term's
+substrings. Nodes with a matching name and their ancestors then tell the filter which
+subtrees to walk. For a graph loaded through StoryGraphStore the index is built once per
+file version.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+stats: Dict[str, int] = {'builds': 0, 'queries': 0}
+
+
+def normalize_name(name: Any) -> str:
+    return (name or '').strip().lower()
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class StoryNameIndex:
+    """Names of the nodes filter_story_graph visits: epics, nested sub-epics, stories and scenarios."""
+
+    def __init__(self, story_graph: Dict[str, Any], postings: bool = True):
+        # Node ids are id() of the graph's dicts: keep the graph alive as long as the index
+        self._story_graph = story_graph
+        self._parents: Dict[int, Optional[int]] = {}
+        self._nodes_by_name: Dict[str, List[int]] = {}
+        self._postings: Optional[Dict[str, Set[str]]] = {} if postings else None
+        self._max_name_length = 0
+        for epic in story_graph.get('epics', []):
+            self._add(epic, None)
+            for sub_epic in epic.get('sub_epics', []):
+                self._add_sub_epic(sub_epic, id(epic))
+        for name in self._nodes_by_name:
+            if self._postings is not None:
+                for trigram in _trigrams(name):
+                    self._postings.setdefault(trigram, set()).add(name)
+            self._max_name_length = max(self._max_name_length, len(name))
+        stats['builds'] += 1
+
+    @classmethod
+    def for_graph(cls, story_graph: Dict[str, Any]) -> 'StoryNameIndex':
+        """Index of story_graph, reused for as long as the store holds that graph's file version.
+
+        Any other graph is indexed for one filter only, so it skips the trigram postings.
+        """
+        from story_graph.story_graph_store import StoryGraphStore
+        store = StoryGraphStore.shared()
+        if store.content_hash(story_graph) is None:
+            return cls(story_graph, postings=False)
+        return store.derived(story_graph, 'story_name_index', cls)
+
+    def _add(self, node: Dict[str, Any], parent: Optional[int]) -> int:
+        node_id = id(node)
+        self._parents[node_id] = parent
+        name = normalize_name(node.get('name', ''))
+        if name:
+            self._nodes_by_name.setdefault(name, []).append(node_id)
+        return node_id
+
+    def _add_sub_epic(self, sub_epic: Dict[str, Any], parent: int) -> None:
+        pending = [(sub_epic, parent)]
+        while pending:
+            node, parent_id = pending.pop()
+            node_id = self._add(node, parent_id)
+            stories = [story for group in node.get('story_groups', []) for story in group.get('stories', [])]
+            stories.extend(node.get('stories', []))
+            for story in stories:
+                story_id = self._add(story, node_id)
+                for scenario in story.get('scenarios', []):
+                    self._add(scenario, story_id)
+            pending.extend((nested, node_id) for nested in node.get('sub_epics', []))
+
+    def matching_names(self, terms: Iterable[str], exact: bool = False) -> Set[str]:
+        """Indexed names equal to a term (exact), or containing / contained in a term."""
+        stats['queries'] += 1
+        if exact:
+            return {term for term in terms if term in self._nodes_by_name}
+        matched: Set[str] = set()
+        for term in terms:
+            matched.update(self._names_containing(term))
+            matched.update(self._names_within(term))
+        return matched
+
+    def _names_containing(self, term: str) -> Iterable[str]:
+        if len(term) < 3 or self._postings is None:
+            return [name for name in self._nodes_by_name if term in name]
+        postings = []
+        for trigram in _trigrams(term):
+            names = self._postings.get(trigram)
+            if not names:
+                return ()
+            postings.append(names)
+        postings.sort(key=len)
+        candidates = postings[0].intersection(*postings[1:])
+        return [name for name in candidates if term in name]
+
+    def _names_within(self, term: str) -> Set[str]:
+        found = set()
+        for start in range(len(term)):
+            for end in range(start + 1, min(len(term), start + self._max_name_length) + 1):
+                if term[start:end] in self._nodes_by_name:
+                    found.add(term[start:end])
+        return found
+
+    def relevant_nodes(self, names: Iterable[str]) -> Set[int]:
+        """ids of the nodes with one of names and of all their ancestors."""
+        relevant: Set[int] = set()
+        for name in names:
+            for node_id in self._nodes_by_name.get(name, ()):
+                while node_id is not None and node_id not in relevant:
+                    relevant.add(node_id)
+                    node_id = self._parents[node_id]
+        return relevant
@@ -0,0 +1,198 @@
+"""
+Test file index - directory listings and test class / method line maps, reused until files change.
+
+Scope enrichment and story rendering look up test files by stem prefix for every sub-epic and
+the line of a test class / method for every story and scenario. The index lists each test
+directory once (revalidated by the directory's mtime) and reads each test file once (revalidated
+by the file's mtime and size), mapping every Python class / function and every JS test('...') /
+t.test('...') name in it to its first line.
+"""
+import ast
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SKIPPED_DIRS = frozenset(['__pycache__', 'node_modules', '.git', '.venv', '.pytest_cache'])
+JS_SUFFIXES = ('.js', '.ts', '.tsx')
+
+# The closing quote must match the opening one, so "it's rendered" keeps its apostrophe
+_JS_CLASS_PATTERN = re.compile(r"test\s*\(\s*(['\"])(.*?)\1")
+_JS_METHOD_PATTERN = re.compile(r"t\.test\s*\(\s*(['\"])(.*?)\1")
+
+Stamp = Tuple[int, int]
+
+
+class TestFileSymbols:
+    """First line of each test class and test method name in one file."""
+
+    __slots__ = ('classes', 'methods')
+
+    def __init__(self, classes: Dict[str, int], methods: Dict[str, int]):
+        self.classes = classes
+        self.methods = methods
+
+
+class TestFileIndex:
+
+    __test__ = False  # not a pytest test class
+
+    _shared: Optional['TestFileIndex'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._listings: Dict[str, Tuple[int, List[str], List[str]]] = {}
+        self._symbols: Dict[Tuple[str, bool], Tuple[Stamp, TestFileSymbols]] = {}
+        self._stats = {'listings': 0, 'listing_hits': 0, 'parses': 0, 'parse_hits': 0}
+
+    @classmethod
+    def shared(cls) -> 'TestFileIndex':
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    # --- directory listings ---------------------------------------------------
+
+    def _listing(self, directory: Path) -> Tuple[List[str], List[str]]:
+        """(file names, sub-directory names) of directory, re-listed only when its mtime changes."""
+        key = str(directory)
+        try:
+            mtime = os.stat(key).st_mtime_ns
+        except OSError:
+            return [], []
+        with self._lock:
+            cached = self._listings.get(key)
+            if cached and cached[0] == mtime:
+                self._stats['listing_hits'] += 1
+                return cached[1], cached[2]
+        files, dirs = [], []
+        try:
+            with os.scandir(key) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            if entry.name not in SKIPPED_DIRS:
+                                dirs.append(entry.name)
+                        elif entry.is_file():
+                            files.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            return [], []
+        files.sort()
+        dirs.sort()
+        with self._lock:
+            self._listings[key] = (mtime, files, dirs)
+            self._stats['listings'] += 1
+        return files, dirs
+
+    def files_under(self, directory: Path, recursive: bool = True) -> List[Path]:
+        """Every file in directory (and its sub-directories, skipping caches and dependencies)."""
+        result: List[Path] = []
+        pending = [Path(directory)]
+        while pending:
+            current = pending.pop()
+            files, dirs = self._listing(current)
+            result.extend(current / name for name in files)
+            if recursive:
+                pending.extend(current / name for name in reversed(dirs))
+        return result
+
+    def find_matching(self, test_dir: Path, pattern: str, extensions, under_path: Optional[str] = None) -> List[str]:
+        """Paths (relative to test_dir, '/'-separated, sorted) of files with an extension in
+        extensions whose stem starts with pattern; only directly in under_path when given."""
+        if not pattern:
+            return []
+        test_dir = Path(test_dir)
+        search_dir = test_dir / under_path if under_path else test_dir
+        if not search_dir.is_dir():
+            return []
+        result = set()
+        for path in self.files_under(search_dir, recursive=not under_path):
+            name = path.name
+            if not path.stem.startswith(pattern) or not name.endswith(tuple(extensions)):
+                continue
+            result.add(str(path.relative_to(test_dir)).replace('\\', '/'))
+        return sorted(result)
+
+    # --- test symbols ---------------------------------------------------------
+
+    def symbols(self, file_path: Path, javascript: Optional[bool] = None) -> Optional[TestFileSymbols]:
+        """Class and method lines of a test file, parsed once per (mtime, size); None if unreadable."""
+        file_path = Path(file_path)
+        if javascript is None:
+            javascript = file_path.suffix in JS_SUFFIXES
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        key = (str(file_path), javascript)
+        with self._lock:
+            cached = self._symbols.get(key)
+            if cached and cached[0] == stamp:
+                self._stats['parse_hits'] += 1
+                return cached[1]
+        try:
+            content = file_path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            logger.debug(f'Could not read test file {file_path}: {e}')
+            return None
+        symbols = _js_symbols(content) if javascript else _python_symbols(content, file_path)
+        with self._lock:
+            self._symbols[key] = (stamp, symbols)
+            self._stats['parses'] += 1
+        return symbols
+
+    def class_line(self, file_path: Path, class_name: str, javascript: Optional[bool] = None) -> Optional[int]:
+        symbols = self.symbols(file_path, javascript)
+        return symbols.classes.get(class_name) if symbols else None
+
+    def method_line(self, file_path: Path, method_name: str, javascript: Optional[bool] = None) -> Optional[int]:
+        symbols = self.symbols(file_path, javascript)
+        return symbols.methods.get(method_name) if symbols else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._listings.clear()
+            self._symbols.clear()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return dict(self._stats)
+
+
+def _python_symbols(content: str, file_path: Path) -> TestFileSymbols:
+    """First definition of each name in ast.walk order, like the per-lookup scans this replaces."""
+    classes: Dict[str, int] = {}
+    methods: Dict[str, int] = {}
+    try:
+        tree = ast.parse(content, filename=str(file_path))
+    except (SyntaxError, ValueError):
+        return TestFileSymbols(classes, methods)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            classes.setdefault(node.name, node.lineno)
+        elif isinstance(node, ast.FunctionDef):
+            methods.setdefault(node.name, node.lineno)
+    return TestFileSymbols(classes, methods)
+
+
+def _js_symbols(content: str) -> TestFileSymbols:
+    """test('Name', ...) calls as classes and t.test('name', ...) calls as methods, first line wins."""
+    classes: Dict[str, int] = {}
+    methods: Dict[str, int] = {}
+    for line_number, line in enumerate(content.split('\n'), 1):
+        if 'test' not in line:
+            continue
+        for match in _JS_CLASS_PATTERN.finditer(line):
+            classes.setdefault(match.group(2), line_number)
+        for match in _JS_METHOD_PATTERN.finditer(line):
+            methods.setdefault(match.group(2), line_number)
+    return TestFileSymbols(classes, methods)
@@ -1,4 +1,5 @@
 from .nodes import ActionResult, StoryNode, Epic, SubEpic, StoryGroup, Story, Scenario, AcceptanceCriteria, Step, EpicsCollection, StoryMap
 from .domain import DomainConcept, Responsibility, Collaborator, StoryUser
-__all__ = ['ActionResult', 'StoryNode', 'Epic', 'SubEpic', 'StoryGroup', 'Story', 'Scenario', 'AcceptanceCriteria', 'Step', 'EpicsCollection', 'StoryMap', 'DomainConcept', 'Responsibility', 'Collaborator', 'StoryUser']
+from .story_graph_store import StoryGraphStore
+__all__ = ['ActionResult', 'StoryNode', 'Epic', 'SubEpic', 'StoryGroup', 'Story', 'Scenario', 'AcceptanceCriteria', 'Step', 'EpicsCollection', 'StoryMap', 'DomainConcept', 'Responsibility', 'Collaborator', 'StoryUser', 'StoryGraphStore']
 
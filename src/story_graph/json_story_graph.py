@@ -5,6 +5,7 @@ from typing import Optional
 
 from cli.adapters import JSONAdapter
 from story_graph.story_graph import StoryGraph
+from story_graph.story_graph_store import thaw
 
 class JSONStoryGraph(JSONAdapter):
     
@@ -106,7 +107,8 @@ class JSONStoryGraph(JSONAdapter):
         
         # Add increments and other top-level fields from original content
         if 'increments' in self.story_graph.content:
-            content['increments'] = self.story_graph.content['increments']
+            # A private copy: the scope view filters and enriches increments in place
+            content['increments'] = thaw(self.story_graph.content['increments'])
         
         # Add domain_concepts if they exist at top level
         if 'domain_concepts' in self.story_graph.content:
@@ -0,0 +1,198 @@
+"""
+Node index for StoryMap - name, type, parent and test lookups without walking the tree.
+
+Name/parent/test maps are maintained incrementally by the create, rename, move and
+delete operations, and refreshed for a single node when it is saved. Listings in walk order are rebuilt by a single walk the first time
+they are needed after a structural change.
+"""
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from story_graph.nodes import StoryNode
+
+
+def index_of(node: 'StoryNode') -> Optional['StoryNodeIndex']:
+    return getattr(node, '_node_index', None)
+
+
+def _subtree(node: 'StoryNode') -> Iterator['StoryNode']:
+    """All nodes under node, including StoryGroups that SubEpic.children hides."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        yield current
+        stack.extend(reversed(current._children))
+
+
+class StoryNodeIndex:
+
+    def __init__(self, epics: List['StoryNode'], attach: bool = True):
+        self._epics = epics
+        self._attach = attach
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        self._nodes: Dict[int, 'StoryNode'] = {}
+        self._keys: Dict[int, Tuple[str, Optional[str], Optional[str]]] = {}  # name, test_class, test_method
+        self._parents: Dict[int, Optional['StoryNode']] = {}
+        self._by_name: Dict[str, List['StoryNode']] = {}
+        self._by_test_class: Dict[str, List['StoryNode']] = {}
+        self._by_test_method: Dict[str, List['StoryNode']] = {}
+        self._walk_order: Optional[List['StoryNode']] = None
+        self._positions: Dict[int, int] = {}
+        self._by_type: Dict[str, List['StoryNode']] = {}
+        for epic in self._epics:
+            self.add_subtree(epic, None)
+
+    # --- maintenance -------------------------------------------------------
+
+    def add_subtree(self, node: 'StoryNode', parent: Optional['StoryNode']) -> None:
+        self._parents[id(node)] = parent
+        for current in _subtree(node):
+            for child in current._children:
+                self._parents[id(child)] = current
+            self._register(current)
+        self.structure_changed()
+
+    def remove_subtree(self, node: 'StoryNode') -> None:
+        for current in _subtree(node):
+            self._unregister(current)
+            self._parents.pop(id(current), None)
+        self.structure_changed()
+
+    def refresh(self, node: 'StoryNode') -> None:
+        """Re-key one node after its name, test_class or test_method changed."""
+        if id(node) not in self._nodes:
+            return
+        if self._keys[id(node)] != self._keys_of(node):
+            self._unregister(node)
+            self._register(node)
+
+    def moved(self, node: 'StoryNode', new_parent: Optional['StoryNode']) -> None:
+        self._parents[id(node)] = new_parent
+        self.structure_changed()
+
+    def structure_changed(self) -> None:
+        """Children were added, removed or reordered; walk-ordered listings are stale."""
+        self._walk_order = None
+
+    @staticmethod
+    def _keys_of(node: 'StoryNode') -> Tuple[str, Optional[str], Optional[str]]:
+        return node.name, getattr(node, 'test_class', None), getattr(node, 'test_method', None)
+
+    def _register(self, node: 'StoryNode') -> None:
+        self._nodes[id(node)] = node
+        if self._attach:
+            node._node_index = self
+        name, test_class, test_method = self._keys[id(node)] = self._keys_of(node)
+        self._by_name.setdefault(name, []).append(node)
+        if test_class:
+            self._by_test_class.setdefault(test_class, []).append(node)
+        if test_method:
+            self._by_test_method.setdefault(test_method, []).append(node)
+
+    def _unregister(self, node: 'StoryNode') -> None:
+        if self._nodes.pop(id(node), None) is None:
+            return
+        if getattr(node, '_node_index', None) is self:
+            node._node_index = None
+        name, test_class, test_method = self._keys.pop(id(node))
+        self._discard(self._by_name, name, node)
+        self._discard(self._by_test_class, test_class, node)
+        self._discard(self._by_test_method, test_method, node)
+
+    @staticmethod
+    def _discard(index: Dict[str, List['StoryNode']], key: Optional[str], node: 'StoryNode') -> None:
+        bucket = index.get(key)
+        if not bucket:
+            return
+        index[key] = [n for n in bucket if n is not node]
+        if not index[key]:
+            del index[key]
+
+    # --- lookups -----------------------------------------------------------
+
+    def find(self, name: str, node_type: Optional[str] = None) -> Optional['StoryNode']:
+        """First node named `name` in walk order (optionally of one node_type)."""
+        matches = self.find_all(name, node_type)
+        return matches[0] if matches else None
+
+    def find_all(self, name: str, node_type: Optional[str] = None) -> List['StoryNode']:
+        candidates = self._by_name.get(name, [])
+        if node_type:
+            candidates = [n for n in candidates if n.node_type == node_type]
+        return self.in_walk_order(candidates)
+
+    def by_test_class(self, test_class: str) -> List['StoryNode']:
+        return self.in_walk_order(self._by_test_class.get(test_class, []))
+
+    def by_test_method(self, test_method: str) -> List['StoryNode']:
+        return self.in_walk_order(self._by_test_method.get(test_method, []))
+
+    def parent_of(self, node: 'StoryNode') -> Optional['StoryNode']:
+        return self._parents.get(id(node))
+
+    def of_type(self, node_type: str) -> List['StoryNode']:
+        self._ensure_walk_order()
+        return list(self._by_type.get(node_type, []))
+
+    def all_nodes(self) -> List['StoryNode']:
+        self._ensure_walk_order()
+        return list(self._walk_order)
+
+    def in_walk_order(self, candidates: List['StoryNode']) -> List['StoryNode']:
+        if len(candidates) <= 1:
+            return [n for n in candidates if self._is_walked(n)]
+        self._ensure_walk_order()
+        visible = [n for n in candidates if id(n) in self._positions]
+        return sorted(visible, key=lambda n: self._positions[id(n)])
+
+    def _is_walked(self, node: 'StoryNode') -> bool:
+        """StoryMap.walk skips StoryGroups that their SubEpic presents as plain stories."""
+        if node.node_type != 'storygroup':
+            return True
+        parent = self._parents.get(id(node))
+        return parent is None or any(child is node for child in parent.children)
+
+    def _ensure_walk_order(self) -> None:
+        if self._walk_order is not None:
+            return
+        order: List['StoryNode'] = []
+        stack = list(reversed(self._epics))
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(reversed(node.children))
+        self._walk_order = order
+        self._positions = {id(node): pos for pos, node in enumerate(order)}
+        self._by_type = {}
+        for node in order:
+            self._by_type.setdefault(node.node_type, []).append(node)
+
+    # --- consistency -------------------------------------------------------
+
+    def check(self) -> List[str]:
+        """Compare every index with a fresh walk of the tree; returns the problems found."""
+        expected = StoryNodeIndex(self._epics, attach=False)
+        problems = []
+        if set(self._nodes) != set(expected._nodes):
+            missing = [n.name for k, n in expected._nodes.items() if k not in self._nodes]
+            extra = [n.name for k, n in self._nodes.items() if k not in expected._nodes]
+            problems.append(f'node set differs: missing={missing} extra={extra}')
+        for key, parent in expected._parents.items():
+            if key in self._parents and self._parents[key] is not parent:
+                problems.append(f"parent of '{expected._nodes[key].name}' is stale")
+        for label, actual, wanted in (
+            ('name', self._by_name, expected._by_name),
+            ('test_class', self._by_test_class, expected._by_test_class),
+            ('test_method', self._by_test_method, expected._by_test_method),
+        ):
+            keys = set(actual) | set(wanted)
+            for key in sorted(keys, key=str):
+                if {id(n) for n in actual.get(key, [])} != {id(n) for n in wanted.get(key, [])}:
+                    problems.append(f"{label} index for '{key}' is stale")
+        if self._walk_order is not None:
+            expected._ensure_walk_order()
+            if [id(n) for n in self._walk_order] != [id(n) for n in expected._walk_order]:
+                problems.append('walk order listing is stale')
+        return problems
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Iterator, Optional, Dict, Any, Union, TYPE_CHECKING
+from typing import List, Iterator, Optional, Dict, Any, Tuple, Union, TYPE_CHECKING
 
 _LEVEL_DOMAIN = frozenset(['domain_concepts', 'acceptance', 'scenarios', 'examples', 'tests', 'code'])
 _LEVEL_ACCEPTANCE = frozenset(['acceptance', 'scenarios', 'examples', 'tests', 'code'])
@@ -26,12 +26,15 @@ def _domain_concepts_to_dict_list(domain_concepts: Optional[List[Any]]) -> List[
     return result
 
 
+import contextlib
 from dataclasses import dataclass, field
 from pathlib import Path
 import json
 import logging
 from datetime import datetime
 from story_graph.domain import DomainConcept, StoryUser
+from story_graph.node_index import StoryNodeIndex, index_of
+from utils import atomic_write
 
 def _log(message: str):
     """Write log message to file."""
@@ -75,6 +78,28 @@ class StoryNode(ABC):
     def __post_init__(self):
         self._children: List['StoryNode'] = []
 
+    @property
+    def _children(self) -> List['StoryNode']:
+        loader = self.__dict__.get('_children_loader')
+        if loader is not None:
+            self.__dict__['_children_loader'] = None
+            loader()
+        return self.__dict__['_child_nodes']
+
+    @_children.setter
+    def _children(self, children: List['StoryNode']) -> None:
+        self.__dict__['_child_nodes'] = children
+        self.__dict__['_children_loader'] = None
+
+    def _defer_children(self, data: Dict[str, Any], loader) -> None:
+        """Build children from `data` only when they are first accessed (lazy StoryMap)."""
+        self._source_data = data
+        self.__dict__['_children_loader'] = loader
+
+    @property
+    def is_materialized(self) -> bool:
+        return self.__dict__.get('_children_loader') is None
+
     @property
     @abstractmethod
     def children(self) -> List['StoryNode']:
@@ -100,6 +125,9 @@ class StoryNode(ABC):
 
     def save(self) -> None:
         """Save this node's changes to the story graph and persist to disk."""
+        index = index_of(self)
+        if index:
+            index.refresh(self)
         if not self._bot:
             return
         
@@ -108,8 +136,14 @@ class StoryNode(ABC):
         if isinstance(self, Story):
             self.file_link = story_map._calculate_story_file_link(self)
         
+        story_map.mark_dirty(self)
         story_map.save()
     
+    def _mark_dirty(self) -> None:
+        """Flag this node's epic for re-serialization on the next save (e.g. the source side of a move)."""
+        if self._bot:
+            self._bot.story_map.mark_dirty(self)
+    
     def save_all(self) -> None:
         """Save this node and all children's changes to the story graph and persist to disk."""
         # Same as save() since updating the parent updates all children
@@ -231,6 +265,9 @@ class StoryNode(ABC):
         node_type = type(self).__name__
         old_name = self.name
         self.name = name
+        index = index_of(self)
+        if index:
+            index.refresh(self)
         
         # Save changes to disk
         self.save()
@@ -277,6 +314,9 @@ class StoryNode(ABC):
         node_name = self.name
         parent = self._parent
         children_count = len(self._children)
+        index = index_of(self)
+        if index:
+            index.remove_subtree(self)
         
         # Handle Story deletion from StoryGroup
         if isinstance(parent, StoryGroup):
@@ -289,6 +329,8 @@ class StoryNode(ABC):
                 sub_epic = parent._parent
                 if sub_epic is not None and hasattr(sub_epic, '_children'):
                     sub_epic._children.remove(parent)
+                    if index:
+                        index.remove_subtree(parent)
                     sub_epic.save()
             else:
                 parent.save()
@@ -352,6 +394,8 @@ class StoryNode(ABC):
                         adjusted_position = min(position, len(actual_parent._children))
                         actual_parent._children.insert(adjusted_position, self)
                         actual_parent._resequence_children()
+                        if index_of(self):
+                            index_of(self).structure_changed()
                         
                         # Save changes to disk
                         self.save()
@@ -367,6 +411,8 @@ class StoryNode(ABC):
                     adjusted_position = min(position, len(self._parent.children))
                     self._parent._children.insert(adjusted_position, self)
                     self._resequence_siblings()
+                    if index_of(self):
+                        index_of(self).structure_changed()
                     
                     # Save changes to disk
                     self.save()
@@ -399,6 +445,8 @@ class StoryNode(ABC):
                     _bot=self._bot
                 )
                 target._children.append(story_group)
+                if index_of(target):
+                    index_of(target).add_subtree(story_group, target)
                 actual_target = story_group
         
         # Check if we need to move test class (Story moving between SubEpics)
@@ -436,6 +484,7 @@ class StoryNode(ABC):
                 _log(f"[move_to] Target SubEpic: None")
         
         # Perform the move
+        self._mark_dirty()
         _log(f"[move_to] BEFORE MOVE - actual_target type: {type(actual_target).__name__}, name: {actual_target.name}, children count: {len(actual_target._children)}")
         old_parent = self._parent
         self._parent._children.remove(self)
@@ -445,6 +494,8 @@ class StoryNode(ABC):
             sub_epic = old_parent._parent
             if sub_epic is not None and hasattr(sub_epic, '_children'):
                 sub_epic._children.remove(old_parent)
+                if index_of(old_parent):
+                    index_of(old_parent).remove_subtree(old_parent)
         self._parent = actual_target
         if position is not None:
             adjusted_position = min(position, len(actual_target.children))
@@ -455,6 +506,8 @@ class StoryNode(ABC):
             actual_target._children.append(self)
         _log(f"[move_to] AFTER MOVE - actual_target children count: {len(actual_target._children)}")
         actual_target._resequence_children()
+        if index_of(self):
+            index_of(self).moved(self, actual_target)
         
         # Move test class if needed
         if isinstance(self, Story) and source_subepic and target_subepic and source_subepic != target_subepic:
@@ -639,6 +692,7 @@ class StoryNode(ABC):
             
             # Rebuild epics collection and save
             story_map._epics = EpicsCollection(story_map._epics_list)
+            story_map._node_index.structure_changed()
             story_map.save()
             
             return {
@@ -1321,6 +1375,10 @@ class Epic(StoryNode):
             child.sequential_order = float(len(self._children))
             self._children.append(child)
         
+        index = index_of(self)
+        if index:
+            index.add_subtree(child, self)
+        
         # Save changes to disk
         child.save()
         
@@ -1343,7 +1401,7 @@ class Epic(StoryNode):
         return story_map.delete_epic(self.name)
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any], bot: Optional[Any]=None) -> 'Epic':
+    def from_dict(cls, data: Dict[str, Any], bot: Optional[Any]=None, lazy: bool = False) -> 'Epic':
         domain_concepts = [DomainConcept.from_dict(dc) for dc in data.get('domain_concepts', [])]
         epic = cls(
             name=data.get('name', ''),
@@ -1351,12 +1409,19 @@ class Epic(StoryNode):
             behavior=data.get('behavior'),
             _bot=bot
         )
-        for sub_epic_data in data.get('sub_epics', []):
-            sub_epic = SubEpic.from_dict(sub_epic_data, parent=epic, bot=bot)
-            epic._children.append(sub_epic)
-        for story_group_data in data.get('story_groups', []):
-            story_group = StoryGroup.from_dict(story_group_data, parent=epic, bot=bot)
-            epic._children.append(story_group)
+
+        def load_children():
+            for sub_epic_data in data.get('sub_epics', []):
+                sub_epic = SubEpic.from_dict(sub_epic_data, parent=epic, bot=bot, lazy=lazy)
+                epic._children.append(sub_epic)
+            for story_group_data in data.get('story_groups', []):
+                story_group = StoryGroup.from_dict(story_group_data, parent=epic, bot=bot, lazy=lazy)
+                epic._children.append(story_group)
+
+        if lazy:
+            epic._defer_children(data, load_children)
+        else:
+            load_children()
         return epic
 
 @dataclass
@@ -1412,7 +1477,7 @@ class SubEpic(StoryNode):
         raise KeyError(f"Child '{child_name}' not found in SubEpic '{self.name}'")
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any], parent: Optional[StoryNode]=None, bot: Optional[Any]=None) -> 'SubEpic':
+    def from_dict(cls, data: Dict[str, Any], parent: Optional[StoryNode]=None, bot: Optional[Any]=None, lazy: bool = False) -> 'SubEpic':
         sequential_order = data.get('sequential_order')
         if sequential_order is None:
             raise ValueError('SubEpic requires sequential_order')
@@ -1426,12 +1491,19 @@ class SubEpic(StoryNode):
             _bot=bot
         )
         sub_epic.test_file = data.get('test_file')
-        for nested_sub_epic_data in data.get('sub_epics', []):
-            nested_sub_epic = SubEpic.from_dict(nested_sub_epic_data, parent=sub_epic, bot=bot)
-            sub_epic._children.append(nested_sub_epic)
-        for story_group_data in data.get('story_groups', []):
-            story_group = StoryGroup.from_dict(story_group_data, parent=sub_epic, bot=bot)
-            sub_epic._children.append(story_group)
+
+        def load_children():
+            for nested_sub_epic_data in data.get('sub_epics', []):
+                nested_sub_epic = SubEpic.from_dict(nested_sub_epic_data, parent=sub_epic, bot=bot, lazy=lazy)
+                sub_epic._children.append(nested_sub_epic)
+            for story_group_data in data.get('story_groups', []):
+                story_group = StoryGroup.from_dict(story_group_data, parent=sub_epic, bot=bot, lazy=lazy)
+                sub_epic._children.append(story_group)
+
+        if lazy:
+            sub_epic._defer_children(data, load_children)
+        else:
+            load_children()
         return sub_epic
 
     @property
@@ -1573,6 +1645,10 @@ class SubEpic(StoryNode):
                 child.sequential_order = float(len(story_group._children))
                 story_group._children.append(child)
             
+            index = index_of(self)
+            if index:
+                index.add_subtree(child, story_group)
+            
             # Save changes to disk
             child.save()
             
@@ -1587,6 +1663,10 @@ class SubEpic(StoryNode):
             child.sequential_order = float(len(self._children))
             self._children.append(child)
         
+        index = index_of(self)
+        if index:
+            index.add_subtree(child, self)
+        
         # Save changes to disk
         child.save()
         
@@ -1598,6 +1678,9 @@ class SubEpic(StoryNode):
                 return child
         story_group = StoryGroup(name=f'{self.name} Stories', sequential_order=float(len(self._children)), _parent=self, _bot=self._bot)
         self._children.append(story_group)
+        index = index_of(self)
+        if index:
+            index.add_subtree(story_group, self)
         return story_group
 
     def _generate_unique_child_name(self, child_type: str = 'Child') -> str:
@@ -1683,7 +1766,7 @@ class StoryGroup(StoryNode):
         return seen
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any], parent: Optional[StoryNode]=None, bot: Optional[Any]=None) -> 'StoryGroup':
+    def from_dict(cls, data: Dict[str, Any], parent: Optional[StoryNode]=None, bot: Optional[Any]=None, lazy: bool = False) -> 'StoryGroup':
         """Create StoryGroup from dictionary data."""
         sequential_order = data.get('sequential_order', 0.0)
         group_type = data.get('type', 'and')
@@ -1697,9 +1780,16 @@ class StoryGroup(StoryNode):
             _parent=parent,
             _bot=bot
         )
-        for story_data in data.get('stories', []):
-            story = Story.from_dict(story_data, parent=story_group, bot=bot)
-            story_group._children.append(story)
+
+        def load_children():
+            for story_data in data.get('stories', []):
+                story = Story.from_dict(story_data, parent=story_group, bot=bot, lazy=lazy)
+                story_group._children.append(story)
+
+        if lazy:
+            story_group._defer_children(data, load_children)
+        else:
+            load_children()
         return story_group
 
 @dataclass
@@ -1892,6 +1982,10 @@ class Story(StoryNode):
         else:
             self._children.append(child)
         
+        index = index_of(self)
+        if index:
+            index.add_subtree(child, self)
+        
         # Save changes to disk
         child.save()
         
@@ -1906,7 +2000,7 @@ class Story(StoryNode):
             counter += 1
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any], parent: Optional[StoryNode]=None, bot: Optional[Any]=None) -> 'Story':
+    def from_dict(cls, data: Dict[str, Any], parent: Optional[StoryNode]=None, bot: Optional[Any]=None, lazy: bool = False) -> 'Story':
         sequential_order = data.get('sequential_order')
         if sequential_order is None:
             raise ValueError('Story requires sequential_order')
@@ -1924,19 +2018,26 @@ class Story(StoryNode):
             _parent=parent,
             _bot=bot
         )
-        acceptance_criteria_data = data.get('acceptance_criteria', [])
-        for idx, ac_data in enumerate(acceptance_criteria_data):
-            ac = AcceptanceCriteria.from_dict(ac_data, index=idx, parent=story, bot=bot)
-            story._children.append(ac)
-        scenarios_data = data.get('scenarios', [])
-        for idx, scenario_data in enumerate(scenarios_data):
-            scenario = Scenario.from_dict(scenario_data, index=idx, parent=story, bot=bot)
-            story._children.append(scenario)
-        # Legacy support: merge scenario_outlines into scenarios
-        scenario_outlines_data = data.get('scenario_outlines', [])
-        for idx, scenario_outline_data in enumerate(scenario_outlines_data):
-            scenario = Scenario.from_dict(scenario_outline_data, index=len(scenarios_data) + idx, parent=story, bot=bot)
-            story._children.append(scenario)
+
+        def load_children():
+            acceptance_criteria_data = data.get('acceptance_criteria', [])
+            for idx, ac_data in enumerate(acceptance_criteria_data):
+                ac = AcceptanceCriteria.from_dict(ac_data, index=idx, parent=story, bot=bot)
+                story._children.append(ac)
+            scenarios_data = data.get('scenarios', [])
+            for idx, scenario_data in enumerate(scenarios_data):
+                scenario = Scenario.from_dict(scenario_data, index=idx, parent=story, bot=bot)
+                story._children.append(scenario)
+            # Legacy support: merge scenario_outlines into scenarios
+            scenario_outlines_data = data.get('scenario_outlines', [])
+            for idx, scenario_outline_data in enumerate(scenario_outlines_data):
+                scenario = Scenario.from_dict(scenario_outline_data, index=len(scenarios_data) + idx, parent=story, bot=bot)
+                story._children.append(scenario)
+
+        if lazy:
+            story._defer_children(data, load_children)
+        else:
+            load_children()
         return story
 
 @dataclass
@@ -2353,13 +2454,20 @@ class IncrementCollection:
 
 class StoryMap:
 
-    def __init__(self, story_graph: Dict[str, Any], bot=None):
+    def __init__(self, story_graph: Dict[str, Any], bot=None, lazy: bool = False):
+        """lazy=True builds each node's children from the graph dict only when first accessed."""
         self.story_graph = story_graph
         self._bot = bot
         self._epics_list: List[Epic] = []
         for epic_data in story_graph.get('epics', []):
-            self._epics_list.append(Epic.from_dict(epic_data, bot=bot))
+            self._epics_list.append(Epic.from_dict(epic_data, bot=bot, lazy=lazy))
         self._epics = EpicsCollection(self._epics_list)
+        self._index: Optional[StoryNodeIndex] = None
+        self._name_paths: Optional[Dict[str, List[Tuple[str, Tuple[int, ...]]]]] = None
+        # id(epic) -> (epic, graph dict last loaded or written for it); dropped when the epic is marked dirty
+        self._clean_epic_dicts: Dict[int, Any] = {
+            id(epic): (epic, epic_data) for epic, epic_data in zip(self._epics_list, story_graph.get('epics', []))
+        }
         self._increments = IncrementCollection.from_list(story_graph.get('increments', []), story_map=self)
 
     @classmethod
@@ -2383,45 +2491,127 @@ class StoryMap:
         if not story_graph_path.exists():
             raise FileNotFoundError(f'Story graph not found at {story_graph_path}')
         
-        # Load story graph with error handling for control characters
-        try:
-            with open(story_graph_path, 'r', encoding='utf-8') as f:
-                story_graph = json.load(f)
-        except ValueError as e:
-            if 'control character' in str(e).lower() or 'Invalid' in str(e):
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.warning(f"[StoryMap] JSON parse error in story graph file, sanitizing: {str(e)}")
-                from utils import sanitize_json_string
-                content = story_graph_path.read_text(encoding='utf-8')
-                sanitized_content = sanitize_json_string(content)
-                story_graph = json.loads(sanitized_content)
-            else:
-                raise
+        # The store sanitizes control characters; the map edits its graph, so take a private copy
+        from .story_graph_store import StoryGraphStore
+        story_graph = StoryGraphStore.shared().load_copy(story_graph_path)
         
         return cls(story_graph, bot=bot)
 
+    def mark_dirty(self, node: StoryNode) -> None:
+        """Re-serialize the epic containing node on the next save."""
+        while getattr(node, '_parent', None) is not None:
+            node = node._parent
+        self._clean_epic_dicts.pop(id(node), None)
+
     def save(self) -> None:
-        """Save the story graph to disk."""
+        """Save the story graph to disk, re-serializing only epics marked dirty since the last save."""
         if not self._bot or not hasattr(self._bot, 'bot_paths'):
             return  # Cannot save without bot context
         
-        # Regenerate story_graph dict from in-memory tree (only once, right before saving)
-        self.story_graph['epics'] = [self._epic_to_dict(e) for e in self._epics_list]
+        epic_dicts = []
+        for epic in self._epics_list:
+            cached = self._clean_epic_dicts.get(id(epic))
+            if cached is None or cached[0] is not epic:
+                epic_dict = self._epic_to_dict(epic)
+            else:
+                epic_dict = cached[1]
+                if epic_dict.get('sequential_order') != epic.sequential_order:
+                    epic_dict['sequential_order'] = epic.sequential_order
+            epic_dicts.append(epic_dict)
+        self._clean_epic_dicts = {id(epic): (epic, epic_dict) for epic, epic_dict in zip(self._epics_list, epic_dicts)}
+        self.story_graph['epics'] = epic_dicts
         self.story_graph['increments'] = self._increments.to_list()
         
         story_graph_path = self._bot.bot_paths.story_graph_paths.story_graph_path
         story_graph_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(story_graph_path, 'w', encoding='utf-8') as f:
+        # Write to a temp file and rename so a crash mid-write cannot leave a truncated graph
+        with atomic_write(story_graph_path) as f:
             json.dump(self.story_graph, f, indent=2, ensure_ascii=False)
+        from .story_graph_store import StoryGraphStore
+        StoryGraphStore.shared().invalidate(story_graph_path)
         
-        # Invalidate the bot's cached story_graph to force reload on next access
-        if hasattr(self._bot, '_story_graph'):
+        # The in-memory map is what was just written: keep it as the bot's cached graph
+        # and only drop a different cached instance so it reloads on next access.
+        if getattr(self._bot, '_story_graph', None) is self:
+            try:
+                self._bot._story_graph_file_mtime = story_graph_path.stat().st_mtime
+            except OSError:
+                self._bot._story_graph = None
+        elif hasattr(self._bot, '_story_graph'):
             self._bot._story_graph = None
 
     @property
     def epics(self) -> EpicsCollection:
         return self._epics
+
+    @property
+    def _node_index(self) -> StoryNodeIndex:
+        # Built on first lookup: indexing walks (and so materializes) the whole tree.
+        if self._index is None:
+            self._index = StoryNodeIndex(self._epics_list)
+        return self._index
+
+    def _name_index(self) -> Dict[str, List[Tuple[str, Tuple[int, ...]]]]:
+        """name -> [(node_type, child positions from the epic list)] read from the graph dict, in walk order.
+
+        Steps are not indexed; a lookup that is not answered by exactly one entry uses the full node index.
+        """
+        if self._name_paths is None:
+            name_paths: Dict[str, List[Tuple[str, Tuple[int, ...]]]] = {}
+
+            def add(node_type: str, name: Any, path: Tuple[int, ...]) -> None:
+                if isinstance(name, str) and name:
+                    name_paths.setdefault(name, []).append((node_type, path))
+
+            def visit_story(data: Dict[str, Any], path: Tuple[int, ...]) -> None:
+                add('story', data.get('name'), path)
+                position = 0
+                for ac_data in data.get('acceptance_criteria', []):
+                    text = ac_data if isinstance(ac_data, str) else ac_data.get('description', ac_data.get('text'))
+                    add('acceptancecriteria', text, path + (position,))
+                    position += 1
+                for key in ('scenarios', 'scenario_outlines'):
+                    for scenario_data in data.get(key, []):
+                        add('scenario', scenario_data.get('name'), path + (position,))
+                        position += 1
+
+            def visit_container(data: Dict[str, Any], node_type: str, path: Tuple[int, ...]) -> None:
+                add(node_type, data.get('name'), path)
+                position = 0
+                for sub_epic_data in data.get('sub_epics', []):
+                    visit_container(sub_epic_data, 'subepic', path + (position,))
+                    position += 1
+                for story_group_data in data.get('story_groups', []):
+                    for story_position, story_data in enumerate(story_group_data.get('stories', [])):
+                        visit_story(story_data, path + (position, story_position))
+                    position += 1
+
+            for epic_position, epic_data in enumerate(self.story_graph.get('epics', [])):
+                visit_container(epic_data, 'epic', (epic_position,))
+            self._name_paths = name_paths
+        return self._name_paths
+
+    def _find_by_name(self, name: str, node_type: Optional[str] = None) -> Optional[StoryNode]:
+        """Until the full node index exists, materialize only the nodes on the path to a uniquely named node."""
+        if self._index is None:
+            entries = self._name_index().get(name, [])
+            if len(entries) == 1 and node_type in (None, entries[0][0]):
+                entry_type, path = entries[0]
+                node = self._node_at(path)
+                # The tree may have been edited since the graph dict was read
+                if node is not None and node.name == name and node.node_type == entry_type:
+                    return node
+        return self._node_index.find(name, node_type)
+
+    def _node_at(self, path: Tuple[int, ...]) -> Optional[StoryNode]:
+        nodes: List[StoryNode] = self._epics_list
+        for depth, position in enumerate(path):
+            if position >= len(nodes):
+                return None
+            if depth == len(path) - 1:
+                return nodes[position]
+            nodes = nodes[position]._children
+        return None
     
     def __getitem__(self, epic_name: str) -> Epic:
         """Allow epic access by name: story_map['Epic Name']"""
@@ -2434,21 +2624,11 @@ class StoryMap:
 
     @property
     def all_stories(self) -> List['Story']:
-        stories = []
-        for epic in self._epics_list:
-            for node in self.walk(epic):
-                if isinstance(node, Story):
-                    stories.append(node)
-        return stories
+        return self._node_index.of_type('story')
 
     @property
     def all_scenarios(self) -> List['Scenario']:
-        scenarios = []
-        for epic in self._epics_list:
-            for node in self.walk(epic):
-                if isinstance(node, Story):
-                    scenarios.extend(node.scenarios)
-        return scenarios
+        return self._node_index.of_type('scenario')
 
     @property
     def all_domain_concepts(self) -> List[DomainConcept]:
@@ -2459,11 +2639,20 @@ class StoryMap:
         return concepts
 
     def get_all_nodes(self) -> List[StoryNode]:
-        nodes = []
-        for epic in self._epics_list:
-            for node in self.walk(epic):
-                nodes.append(node)
-        return nodes
+        return self._node_index.all_nodes()
+
+    def parent_of(self, node: StoryNode) -> Optional[StoryNode]:
+        return self._node_index.parent_of(node)
+
+    def find_stories_by_test_class(self, test_class: str) -> List['Story']:
+        return self._node_index.by_test_class(test_class)
+
+    def find_scenarios_by_test_method(self, test_method: str) -> List['Scenario']:
+        return self._node_index.by_test_method(test_method)
+
+    def check_indexes(self) -> List[str]:
+        """Problems found comparing the node indexes with a fresh walk (empty when consistent)."""
+        return self._node_index.check()
 
     def get_all_acceptance_criteria(self) -> List[Dict[str, Any]]:
         ac_list = []
@@ -2522,8 +2711,9 @@ class StoryMap:
                 if sibling is not story and sibling.name == new_name:
                     raise ValueError(f'Story "{new_name}" already exists among siblings')
         story.name = new_name
+        self._node_index.refresh(story)
         self._increments.rename_story_references(old_name, new_name)
-        self.story_graph['epics'] = [self._epic_to_dict(e) for e in self._epics_list]
+        self.mark_dirty(story)
         self.save()
 
     def remove_story_from_all_increments(self, story_name: str) -> None:
@@ -2577,11 +2767,12 @@ class StoryMap:
             include_level = 'examples'
         generate_trace = include_level in ('tests', 'code')
         result = []
-        for story_name in story_names:
-            story = self.find_story_by_name(story_name)
-            if story:
-                node_dict = self.node_to_dict(story, include_level=include_level, generate_trace=generate_trace)
-                result.append(node_dict)
+        with self._trace_operation(generate_trace):
+            for story_name in story_names:
+                story = self.find_story_by_name(story_name)
+                if story:
+                    node_dict = self.node_to_dict(story, include_level=include_level, generate_trace=generate_trace)
+                    result.append(node_dict)
         return {'status': 'success', 'result': result}
 
     def apply_update_report(self, report: 'UpdateReport') -> None:
@@ -2645,31 +2836,31 @@ class StoryMap:
 
         # Walk up to find the containing epic and build a filtered graph
         # that includes only the path to this node.
-        for epic in self._epics_list:
-            for child in self.walk(epic):
-                if child.name == name:
-                    # Found it -- rebuild the epic with only this subtree
-                    if isinstance(node, SubEpic):
-                        filtered_epic = dict(self._epic_to_dict(epic))
-                        filtered_epic['sub_epics'] = [
-                            self._sub_epic_to_dict(node)]
-                        filtered_epic['story_groups'] = []
-                        return StoryMap({'epics': [filtered_epic]})
-                    elif isinstance(node, Story):
-                        # Find the parent sub-epic
-                        for se_child in epic.children:
-                            if isinstance(se_child, SubEpic):
-                                for s in se_child.all_stories:
-                                    if s.name == name:
-                                        filtered_se = dict(
-                                            self._sub_epic_to_dict(se_child))
-                                        filtered_epic = dict(
-                                            self._epic_to_dict(epic))
-                                        filtered_epic['sub_epics'] = [
-                                            filtered_se]
-                                        filtered_epic['story_groups'] = []
-                                        return StoryMap(
-                                            {'epics': [filtered_epic]})
+        epic = node
+        while self.parent_of(epic) is not None:
+            epic = self.parent_of(epic)
+        # Found it -- rebuild the epic with only this subtree
+        if isinstance(node, SubEpic):
+            filtered_epic = dict(self._epic_to_dict(epic))
+            filtered_epic['sub_epics'] = [
+                self._sub_epic_to_dict(node)]
+            filtered_epic['story_groups'] = []
+            return StoryMap({'epics': [filtered_epic]})
+        elif isinstance(node, Story):
+            # Find the parent sub-epic
+            for se_child in epic.children:
+                if isinstance(se_child, SubEpic):
+                    for s in se_child.all_stories:
+                        if s.name == name:
+                            filtered_se = dict(
+                                self._sub_epic_to_dict(se_child))
+                            filtered_epic = dict(
+                                self._epic_to_dict(epic))
+                            filtered_epic['sub_epics'] = [
+                                filtered_se]
+                            filtered_epic['story_groups'] = []
+                            return StoryMap(
+                                {'epics': [filtered_epic]})
         return None
 
     def filter_by_epic_names(self, epic_names: set) -> 'StoryMap':
@@ -2679,47 +2870,18 @@ class StoryMap:
 
     def filter_by_story_names(self, story_names: set) -> List['Story']:
         stories = []
-        for epic in self._epics_list:
-            for node in self.walk(epic):
-                if isinstance(node, Story) and node.name in story_names:
-                    stories.append(node)
-        return stories
+        for story_name in story_names:
+            stories.extend(self._node_index.find_all(story_name, 'story'))
+        return self._node_index.in_walk_order(stories)
 
     def find_node(self, node_name: str) -> Optional[StoryNode]:
-        for epic in self._epics_list:
-            if epic.name == node_name:
-                return epic
-            for child in epic.children:
-                if child.name == node_name:
-                    return child
-                if hasattr(child, 'children'):
-                    result = self._find_in_children(child, node_name)
-                    if result:
-                        return result
-        return None
-    
-    def _find_in_children(self, node: StoryNode, name: str) -> Optional[StoryNode]:
-        for child in node.children:
-            if child.name == name:
-                return child
-            if hasattr(child, 'children'):
-                result = self._find_in_children(child, name)
-                if result:
-                    return result
-        return None
+        return self._find_by_name(node_name)
     
     def find_epic_by_name(self, epic_name: str) -> Optional[Epic]:
-        for epic in self._epics_list:
-            if epic.name == epic_name:
-                return epic
-        return None
+        return self._find_by_name(epic_name, 'epic')
 
     def find_story_by_name(self, story_name: str) -> Optional['Story']:
-        for epic in self._epics_list:
-            for node in self.walk(epic):
-                if isinstance(node, Story) and node.name == story_name:
-                    return node
-        return None
+        return self._find_by_name(story_name, 'story')
     
     def create_epic(self, name: Optional[str] = None, position: Optional[int] = None) -> Epic:
         """Create a new Epic at the root level of the story map.
@@ -2757,6 +2919,7 @@ class StoryMap:
             self._epics_list.insert(adjusted_position, epic)
         else:
             self._epics_list.append(epic)
+        self._node_index.add_subtree(epic, None)
         
         # Set sequential_order based on position in list
         for idx, e in enumerate(self._epics_list):
@@ -2796,6 +2959,7 @@ class StoryMap:
         
         # Remove from list (cascade delete of all children)
         self._epics_list.remove(epic_to_delete)
+        self._node_index.remove_subtree(epic_to_delete)
         
         # Update sequential order
         for idx, e in enumerate(self._epics_list):
@@ -2823,15 +2987,28 @@ class StoryMap:
                 return name
             counter += 1
 
+    @staticmethod
+    def _unmaterialized_data(node: StoryNode, include_level: Optional[str], generate_trace: bool) -> Optional[Dict[str, Any]]:
+        """Raw graph dict of a node whose children were never built, when a plain save can reuse it."""
+        if include_level is None and not generate_trace and not node.is_materialized:
+            return node._source_data
+        return None
+
     def _epic_to_dict(self, epic: Epic, include_level: Optional[str] = None, generate_trace: bool = False) -> Dict[str, Any]:
         result = {
             'name': epic.name,
             'sequential_order': epic.sequential_order,
             'behavior': epic.behavior,
             'domain_concepts': _domain_concepts_to_dict_list(epic.domain_concepts) if _level_includes(_LEVEL_DOMAIN, include_level) else [],
+        }
+        raw = self._unmaterialized_data(epic, include_level, generate_trace)
+        if raw is not None:
+            result.update({'sub_epics': raw.get('sub_epics', []), 'story_groups': raw.get('story_groups', [])})
+            return result
+        result.update({
             'sub_epics': [self._sub_epic_to_dict(child, include_level, generate_trace) for child in epic._children if isinstance(child, SubEpic)],
             'story_groups': [self._story_group_to_dict(child, include_level, generate_trace) for child in epic._children if isinstance(child, StoryGroup)]
-        }
+        })
         return result
 
     def _sub_epic_to_dict(self, sub_epic: SubEpic, include_level: Optional[str] = None, generate_trace: bool = False) -> Dict[str, Any]:
@@ -2843,6 +3020,10 @@ class StoryMap:
         }
         if sub_epic.test_file is not None:
             result['test_file'] = sub_epic.test_file
+        raw = self._unmaterialized_data(sub_epic, include_level, generate_trace)
+        if raw is not None:
+            result.update({'sub_epics': raw.get('sub_epics', []), 'story_groups': raw.get('story_groups', [])})
+            return result
         nested_subepics = [child for child in sub_epic._children if isinstance(child, SubEpic)]
         result.update({
             'sub_epics': [self._sub_epic_to_dict(child, include_level, generate_trace) for child in nested_subepics],
@@ -2857,18 +3038,27 @@ class StoryMap:
             'type': story_group.group_type,
             'connector': story_group.connector,
             'behavior': story_group.behavior,
-            'stories': [self._story_to_dict(child, include_level, generate_trace) for child in story_group.children if isinstance(child, Story)]
         }
+        raw = self._unmaterialized_data(story_group, include_level, generate_trace)
+        if raw is not None:
+            result['stories'] = raw.get('stories', [])
+            return result
+        result['stories'] = [self._story_to_dict(child, include_level, generate_trace) for child in story_group.children if isinstance(child, Story)]
         return result
 
     def _story_to_dict(self, story: Story, include_level: Optional[str] = None, generate_trace: bool = False) -> Dict[str, Any]:
-        scenarios = []
-        acceptance_criteria = []
-        for child in story._children:
-            if isinstance(child, Scenario):
-                scenarios.append(self._scenario_to_dict(child, story, include_level, generate_trace))
-            elif isinstance(child, AcceptanceCriteria):
-                acceptance_criteria.append(self._acceptance_criteria_to_dict(child))
+        raw = self._unmaterialized_data(story, include_level, generate_trace)
+        if raw is not None:
+            scenarios = raw.get('scenarios', []) + raw.get('scenario_outlines', [])
+            acceptance_criteria = raw.get('acceptance_criteria', [])
+        else:
+            scenarios = []
+            acceptance_criteria = []
+            for child in story._children:
+                if isinstance(child, Scenario):
+                    scenarios.append(self._scenario_to_dict(child, story, include_level, generate_trace))
+                elif isinstance(child, AcceptanceCriteria):
+                    acceptance_criteria.append(self._acceptance_criteria_to_dict(child))
         result = {
             'name': story.name,
             'sequential_order': story.sequential_order,
@@ -3007,6 +3197,18 @@ class StoryMap:
 
     def node_to_dict(self, node: StoryNode, include_level: Optional[str] = None, generate_trace: bool = False) -> Dict[str, Any]:
         """Serialize any story node to its story-graph JSON shape (for copy_json). Uses include_level like submit."""
+        with self._trace_operation(generate_trace):
+            return self._node_to_dict(node, include_level, generate_trace)
+
+    @staticmethod
+    def _trace_operation(generate_trace: bool):
+        """Tracing a node traces each scenario; refresh the workspace index once for all of them."""
+        if not generate_trace:
+            return contextlib.nullcontext()
+        from traceability.workspace_index import WorkspaceIndex
+        return WorkspaceIndex.operation()
+
+    def _node_to_dict(self, node: StoryNode, include_level: Optional[str], generate_trace: bool) -> Dict[str, Any]:
         if isinstance(node, Epic):
             return self._epic_to_dict(node, include_level, generate_trace)
         if isinstance(node, SubEpic):
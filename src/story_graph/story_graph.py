@@ -3,20 +3,21 @@ from typing import Dict, Any, Optional, TYPE_CHECKING
 import json
 import logging
 from bot_path import BotPath
-from utils import read_json_file
 if TYPE_CHECKING:
     from build.story_graph_spec import StoryGraphSpec
 logger = logging.getLogger(__name__)
 
 class StoryGraph:
 
-    def __init__(self, bot_paths: BotPath, workspace_directory: Path, require_file: bool=True, story_graph_spec: Optional['StoryGraphSpec']=None):
+    def __init__(self, bot_paths: BotPath, workspace_directory: Path, require_file: bool=True, story_graph_spec: Optional['StoryGraphSpec']=None,
+                 content: Optional[Dict[str, Any]]=None):
         self._bot_paths = bot_paths
         self._workspace_directory = workspace_directory
         self._story_graph_spec = story_graph_spec
         self._require_file = require_file
         self._path = self._determine_story_graph_path()
-        self._content = self._load_story_graph_content()
+        # Callers that already hold the (possibly filtered) graph pass it in instead of loading the file again
+        self._content = content if content is not None else self._load_story_graph_content()
 
     def _determine_story_graph_path(self):
         if self._story_graph_spec:
@@ -39,9 +40,8 @@ class StoryGraph:
                 raise FileNotFoundError(f'Story graph file (story-graph.json) not found in {self._path.parent}. Cannot validate rules without story graph. Expected story graph to be created by build action before validate.')
             return {}
         
-        raw_content = read_json_file(self._path)
-        
-        return raw_content
+        from story_graph.story_graph_store import StoryGraphStore
+        return StoryGraphStore.shared().load(self._path)
 
     @property
     def story_graph_spec(self) -> Optional['StoryGraphSpec']:
@@ -0,0 +1,201 @@
+"""
+Story graph store - one parsed story-graph.json per file version, shared by the process.
+
+The bot, scope, render actions, scanners and synchronizers all read the same story graph.
+The store parses each file once and hands readers a read-only view of that document. A
+cached document is reused while the file's (mtime, size) is unchanged, or while its content
+hash is unchanged after a touch. Code that edits the graph takes a private copy via
+load_copy(), and code that writes the file calls invalidate() once the write is done.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+Stamp = Tuple[int, int]
+
+
+def _read_only(*args, **kwargs):
+    raise TypeError('Story graph views are read-only; use StoryGraphStore.load_copy() to edit')
+
+
+class FrozenDict(dict):
+    """dict that refuses mutation; still a dict for isinstance checks and json.dumps."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def copy(self) -> dict:
+        return dict(self)
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo) -> dict:
+        return thaw(self)
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+class FrozenList(list):
+    """list that refuses mutation; still a list for isinstance checks and json.dumps."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+
+    def copy(self) -> list:
+        return list(self)
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo) -> list:
+        return thaw(self)
+
+    def __reduce__(self):
+        return FrozenList, (list(self),)
+
+
+def freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return FrozenList([freeze(item) for item in value])
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Plain, mutable copy of a (possibly frozen) JSON document."""
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return value
+
+
+class _Document:
+
+    __slots__ = ('stamp', 'digest', 'content', 'derived')
+
+    def __init__(self, stamp: Stamp, digest: str, content: FrozenDict):
+        self.stamp = stamp
+        self.digest = digest
+        self.content = content
+        self.derived: Dict[str, Any] = {}
+
+
+class StoryGraphStore:
+
+    _shared: Optional['StoryGraphStore'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._documents: Dict[str, _Document] = {}
+        self._stats = {'parses': 0, 'hits': 0, 'hash_hits': 0, 'copies': 0, 'invalidations': 0}
+
+    @classmethod
+    def shared(cls) -> 'StoryGraphStore':
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def load(self, path: Union[str, Path]) -> FrozenDict:
+        """Read-only view of the parsed file; raises FileNotFoundError / ValueError like json.load."""
+        return self._document(path).content
+
+    def load_copy(self, path: Union[str, Path]) -> dict:
+        """Private, mutable copy of the parsed file for callers that edit the graph."""
+        content = self._document(path).content
+        with self._lock:
+            self._stats['copies'] += 1
+        return thaw(content)
+
+    def content_hash(self, content: Any) -> Optional[str]:
+        """sha1 of the file behind content when content is a view this store handed out."""
+        with self._lock:
+            document = self._owner(content)
+            return document.digest if document else None
+
+    def derived(self, content: Any, name: str, build: Callable[[Any], Any]) -> Any:
+        """build(content), kept with content's document until the file changes; built fresh for other content."""
+        with self._lock:
+            document = self._owner(content)
+            if document is not None and name in document.derived:
+                return document.derived[name]
+        value = build(content)
+        if document is not None:
+            with self._lock:
+                document.derived.setdefault(name, value)
+        return value
+
+    def _owner(self, content: Any) -> Optional[_Document]:
+        for document in self._documents.values():
+            if document.content is content:
+                return document
+        return None
+
+    def invalidate(self, path: Union[str, Path, None] = None) -> None:
+        """Forget the cached document for path (every document when path is None)."""
+        with self._lock:
+            if path is None:
+                self._documents.clear()
+            else:
+                self._documents.pop(self._key(path), None)
+            self._stats['invalidations'] += 1
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """parses done, parses avoided (hits, hash_hits), private copies and invalidations."""
+        with self._lock:
+            return dict(self._stats)
+
+    @staticmethod
+    def _key(path: Union[str, Path]) -> str:
+        return os.path.abspath(str(path))
+
+    def _document(self, path: Union[str, Path]) -> _Document:
+        key = self._key(path)
+        stat = os.stat(key)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._documents.get(key)
+            if cached is not None and cached.stamp == stamp:
+                self._stats['hits'] += 1
+                return cached
+        with open(key, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha1(data).hexdigest()
+        with self._lock:
+            cached = self._documents.get(key)
+            if cached is not None and cached.digest == digest:
+                cached.stamp = stamp
+                self._stats['hash_hits'] += 1
+                return cached
+        document = _Document(stamp, digest, freeze(_parse(data.decode('utf-8-sig'), key)))
+        with self._lock:
+            self._documents[key] = document
+            self._stats['parses'] += 1
+        return document
+
+
+def _parse(text: str, path: str) -> Any:
+    try:
+        return json.loads(text)
+    except ValueError as e:
+        if 'control character' not in str(e).lower() and 'Invalid' not in str(e):
+            raise
+        logger.warning(f'JSON parse error in story graph {path}, sanitizing: {e}')
+        from utils import sanitize_json_string
+        return json.loads(sanitize_json_string(text))
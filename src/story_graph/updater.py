@@ -97,6 +97,8 @@ class StoryMapUpdater:
             node = self._target_map.find_node(rename.original_name)
             if node:
                 node.name = rename.extracted_name
+                self._target_map._node_index.refresh(node)
+                self._target_map.mark_dirty(node)
     
     def _apply_new_nodes(self, report: 'UpdateReport') -> None:
         """Apply new node creations from report."""
@@ -137,11 +139,13 @@ class StoryMapUpdater:
                 continue
             try:
                 # Remove from old parent
+                self._target_map.mark_dirty(old_parent)
                 if hasattr(old_parent, '_children') and node in old_parent._children:
                     old_parent._children.remove(node)
                 # Add to new parent
                 to_parent._children.append(node)
                 node._parent = to_parent
+                self._target_map._node_index.moved(node, to_parent)
                 if hasattr(node, 'save'):
                     node.save()
             except (ValueError, AttributeError) as e:
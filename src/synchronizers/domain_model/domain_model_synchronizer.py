@@ -9,11 +9,12 @@ import json
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
 
+from story_graph.story_graph_store import StoryGraphStore
+
 
 def _load_domain_concepts(input_path: Path) -> Dict[str, Dict]:
     """Load and deduplicate domain concepts from story graph, tracking module and namespace."""
-    with open(input_path, 'r', encoding='utf-8') as f:
-        story_graph = json.load(f)
+    story_graph = StoryGraphStore.shared().load(input_path)
     
     domain_concepts = {}
     for epic in story_graph.get('epics', []):
@@ -8,8 +8,9 @@ and collects nodes for serialization.
 """
 import json
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Union
+from typing import Iterator, List, Optional, Dict, Any, Union
 from story_graph.nodes import StoryMap, Epic, SubEpic, Story, StoryGroup
+from utils import atomic_write
 from .drawio_story_node import (
     DrawIOStoryNode, DrawIOEpic, DrawIOSubEpic, DrawIOStory,
     DrawIOIncrementLane, SPACING, CONTAINER_PADDING, CELL_SIZE,
@@ -20,6 +21,10 @@ from .drawio_story_node_serializer import DrawIOStoryNodeSerializer
 from .layout_data import LayoutData
 from .update_report import UpdateReport
 from .render_summary import RenderSummary
+from .spatial_index import BoundaryIndex, IntervalIndex
+
+# Sub-epics without a parent join the nearest epic whose x span, widened by this much, holds their centre.
+EPIC_X_MARGIN = 200
 
 
 class DrawIOStoryMap(StoryMap):
@@ -293,10 +298,10 @@ class DrawIOStoryMap(StoryMap):
     # ------------------------------------------------------------------
 
     def save(self, file_path: Path):
-        all_nodes = self._collect_all_nodes()
-        xml_content = DrawIOStoryNodeSerializer.to_drawio_xml(all_nodes)
+        """Stream cells straight to a temp file next to file_path, then swap it in."""
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_text(xml_content, encoding='utf-8')
+        with atomic_write(file_path) as f:
+            DrawIOStoryNodeSerializer.write_drawio_xml(self._iter_all_nodes(), f)
 
     def save_layout(self, layout_path: Path):
         layout = self.extract_layout()
@@ -638,15 +643,15 @@ class DrawIOStoryMap(StoryMap):
             lane['stories'] = []
             lane['_seen'] = set()
 
+        lane_index = IntervalIndex(
+            lanes, lambda lane: (lane['y'] - TOLERANCE, lane['y'] + lane['height'] + TOLERANCE))
         for name, y in candidates:
-            for lane in lanes:
-                top = lane['y'] - TOLERANCE
-                bottom = lane['y'] + lane['height'] + TOLERANCE
-                if top <= y <= bottom:
-                    if name not in lane['_seen']:
-                        lane['_seen'].add(name)
-                        lane['stories'].append(name)
-                    break
+            hits = lane_index.stab(y)
+            if hits:
+                lane = hits[0]
+                if name not in lane['_seen']:
+                    lane['_seen'].add(name)
+                    lane['stories'].append(name)
 
         return [{'name': l['name'], 'stories': l['stories']} for l in lanes]
 
@@ -901,8 +906,7 @@ class DrawIOStoryMap(StoryMap):
     
     def _load_from_file(self, file_path: Path):
         """Internal method to load from file."""
-        content = file_path.read_text(encoding='utf-8')
-        nodes, parent_map = DrawIOStoryNodeSerializer.parse_nodes_from_xml(content)
+        nodes, parent_map = DrawIOStoryNodeSerializer.parse_nodes(str(file_path))
 
         # Resolve group-relative positions: elements whose parent is a group
         # have x/y relative to the group.  Add the group's absolute position
@@ -917,7 +921,10 @@ class DrawIOStoryMap(StoryMap):
         sub_epics = [n for n in nodes if isinstance(n, DrawIOSubEpic)]
         stories = [n for n in nodes if isinstance(n, DrawIOStory)]
 
-        self._assign_by_parent_map(nodes_by_id, parent_map, epics, sub_epics, stories, all_nodes=nodes)
+        # Boundaries do not move while the hierarchy is assigned, so one index serves every query.
+        spatial_index = BoundaryIndex(epics, sub_epics, epic_margin=EPIC_X_MARGIN)
+        self._assign_by_parent_map(nodes_by_id, parent_map, epics, sub_epics, stories, all_nodes=nodes,
+                                   spatial_index=spatial_index)
         self._assign_sequential_order_from_position(epics, sub_epics, stories)
         self._drawio_epics = epics
         self._all_stories = stories  # Keep all parsed stories for increment extraction
@@ -1009,7 +1016,11 @@ class DrawIOStoryMap(StoryMap):
     # Internal helpers (load direction)
     # ------------------------------------------------------------------
 
-    def _assign_by_parent_map(self, nodes_by_id, parent_map, epics, sub_epics, stories, all_nodes=None):
+    def _assign_by_parent_map(self, nodes_by_id, parent_map, epics, sub_epics, stories, all_nodes=None,
+                              spatial_index: Optional[BoundaryIndex] = None):
+        if spatial_index is None:
+            spatial_index = BoundaryIndex(epics, sub_epics, epic_margin=EPIC_X_MARGIN)
+
         # ── Phase 1: ID-based assignment for epics and sub-epics only ──
         # Stories are intentionally excluded here because their cell IDs
         # become stale when users drag them to a new sub-epic in DrawIO
@@ -1042,21 +1053,7 @@ class DrawIOStoryMap(StoryMap):
             parent = getattr(se, '_parent', None)
             if not parent or not isinstance(parent, DrawIOEpic):
                 continue
-            se_cx = se.boundary.center.x
-            se_y = se.boundary.y
-            best_parent_se = None
-            best_y = -1.0
-            for candidate_se in parent.get_sub_epics():
-                if candidate_se is se:
-                    continue
-                cand_y = candidate_se.boundary.y
-                if cand_y >= se_y:
-                    continue
-                cl = candidate_se.boundary.x
-                cr = candidate_se.boundary.x + candidate_se.boundary.width
-                if cl <= se_cx <= cr and cand_y > best_y:
-                    best_y = cand_y
-                    best_parent_se = candidate_se
+            best_parent_se = self._sibling_bar_above(spatial_index, se, parent)
             if best_parent_se:
                 parent._children.remove(se)
                 se._parent = None
@@ -1068,40 +1065,23 @@ class DrawIOStoryMap(StoryMap):
         for se in sub_epics:
             if se._parent is not None:
                 continue
-            se_cx = se.boundary.center.x
-            se_y = se.boundary.y
-            best_parent_se = None
-            best_y = -1.0
-            for candidate_se in sub_epics:
-                if candidate_se is se or candidate_se._parent is None:
-                    continue
-                cand_y = candidate_se.boundary.y
-                if cand_y >= se_y:
-                    continue
-                cl = candidate_se.boundary.x
-                cr = candidate_se.boundary.x + candidate_se.boundary.width
-                if cl <= se_cx <= cr and cand_y > best_y:
-                    best_y = cand_y
-                    best_parent_se = candidate_se
+            best_parent_se = spatial_index.bar_directly_above(
+                se, lambda candidate_se: candidate_se._parent is not None)
             if best_parent_se:
                 best_parent_se.add_child(se)
 
         # ── Phase 2b: Position-based sub-epic → epic fallback ──
-        MARGIN = 200
         for se in sub_epics:
             if se._parent is not None:
                 continue
             se_cx = se.boundary.center.x
             best_epic = None
             best_dist = float('inf')
-            for epic in epics:
-                left = epic.boundary.x - MARGIN
-                right = epic.boundary.x + epic.boundary.width + MARGIN
-                if left <= se_cx <= right:
-                    dist = abs(se_cx - epic.boundary.center.x)
-                    if dist < best_dist:
-                        best_dist = dist
-                        best_epic = epic
+            for epic in spatial_index.epics_near(se_cx):
+                dist = abs(se_cx - epic.boundary.center.x)
+                if dist < best_dist:
+                    best_dist = dist
+                    best_epic = epic
             if best_epic:
                 best_epic.add_child(se)
 
@@ -1116,27 +1096,9 @@ class DrawIOStoryMap(StoryMap):
                 parent = getattr(se, '_parent', None)
                 if not parent:
                     continue
-                if isinstance(parent, DrawIOEpic):
-                    siblings = parent.get_sub_epics()
-                elif hasattr(parent, 'get_sub_epics'):
-                    siblings = parent.get_sub_epics()
-                else:
+                if not hasattr(parent, 'get_sub_epics'):
                     continue
-                se_cx = se.boundary.center.x
-                se_y = se.boundary.y
-                best_parent_se = None
-                best_y = -1.0
-                for candidate_se in siblings:
-                    if candidate_se is se:
-                        continue
-                    cand_y = candidate_se.boundary.y
-                    if cand_y >= se_y:
-                        continue
-                    cl = candidate_se.boundary.x
-                    cr = candidate_se.boundary.x + candidate_se.boundary.width
-                    if cl <= se_cx <= cr and cand_y > best_y:
-                        best_y = cand_y
-                        best_parent_se = candidate_se
+                best_parent_se = self._sibling_bar_above(spatial_index, se, parent)
                 if best_parent_se:
                     parent._children.remove(se)
                     se._parent = None
@@ -1188,36 +1150,35 @@ class DrawIOStoryMap(StoryMap):
                     if is_lane:
                         lane_y_ranges.append((n.position.y, n.position.y + bnd.height))
         
+        lane_index = IntervalIndex(lane_y_ranges, lambda y_range: y_range)
         for story in stories:
             # Skip story copies in increment lanes (by cell ID or Y position)
             if story.cell_id.startswith('inc-lane/'):
                 continue
             # Skip stories positioned within any increment lane Y range
-            if lane_y_ranges:
-                story_y = story.position.y
-                in_lane = False
-                for y_start, y_end in lane_y_ranges:
-                    if y_start <= story_y <= y_end:
-                        in_lane = True
-                        break
-                if in_lane:
-                    continue
+            if lane_y_ranges and lane_index.stab(story.position.y):
+                continue
             
             story_cx = story.boundary.center.x
             best_se = None
             best_width = float('inf')
-            for se in sub_epics:
+            for se in spatial_index.sub_epics_spanning(story_cx):
                 if se._parent is None:
                     continue
-                se_left = se.boundary.x
-                se_right = se.boundary.x + se.boundary.width
-                if se_left <= story_cx <= se_right:
-                    if not se.get_sub_epics() and se.boundary.width < best_width:
-                        best_width = se.boundary.width
-                        best_se = se
+                if not se.get_sub_epics() and se.boundary.width < best_width:
+                    best_width = se.boundary.width
+                    best_se = se
             if best_se:
                 best_se.add_child(story)
 
+    @staticmethod
+    def _sibling_bar_above(spatial_index: BoundaryIndex, se, parent):
+        """Sibling sub-epic directly above se (ties go to the earlier sibling), or None."""
+        siblings = parent._children
+        return spatial_index.bar_directly_above(
+            se, lambda candidate_se: candidate_se._parent is parent,
+            order=siblings.index)
+
     def _assign_sequential_order_from_position(self, epics, sub_epics, stories):
         Y_TOLERANCE = 30  # nodes within this many px of Y are on the same row
 
@@ -1242,7 +1203,10 @@ class DrawIOStoryMap(StoryMap):
     # ------------------------------------------------------------------
 
     def _collect_all_nodes(self) -> list:
-        """Walk the tree and gather every renderable node.
+        return list(self._iter_all_nodes())
+
+    def _iter_all_nodes(self) -> Iterator:
+        """Walk the tree and yield every renderable node.
 
         Serialization order determines visual stacking in DrawIO (later =
         on top).  For increments view we want:
@@ -1251,25 +1215,21 @@ class DrawIOStoryMap(StoryMap):
              (includes stories with their actor and AC elements)
           3. Lane labels, actors, story copies inside lanes
         """
-        nodes = []
-
         # 1. Lane backgrounds first (bottom layer)
         for lane in self._increment_lanes:
             if lane._lane_element:
-                nodes.append(lane._lane_element)
+                yield lane._lane_element
 
         # 2. Epic tree (epics, sub-epics, stories, actors, AC)
         for epic in self._drawio_epics:
-            nodes.extend(epic.collect_all_nodes())
+            yield from epic.collect_all_nodes()
 
         # 3. Lane labels, actors, story copies (top layer)
         for lane in self._increment_lanes:
             if lane._label_element:
-                nodes.append(lane._label_element)
-            nodes.extend(lane._actor_elements)
-            nodes.extend(lane._story_copies)
-
-        return nodes
+                yield lane._label_element
+            yield from lane._actor_elements
+            yield from lane._story_copies
 
     def _collect_domain_stories(self, story_map: StoryMap) -> dict:
         """Build name→Story lookup from all stories in the map."""
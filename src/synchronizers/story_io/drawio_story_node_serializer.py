@@ -1,9 +1,14 @@
 """
 DrawIOStoryNodeSerializer - Creates, loads, and writes DrawIO story nodes to XML.
+
+Reading and writing both stream: iter_nodes walks the file with iterparse and drops each
+mxCell once it has been turned into a node, and write_drawio_xml emits one mxCell at a time,
+so neither direction holds an ElementTree (or the XML text) of the whole diagram.
 """
+import io
 import re
 import xml.etree.ElementTree as ET
-from typing import Optional, List
+from typing import IO, Iterable, Iterator, Optional, List, Tuple, Union
 from .drawio_element import DrawIOElement
 from .drawio_story_node import DrawIOStoryNode, DrawIOEpic, DrawIOSubEpic, DrawIOStory
 from .story_io_position import Position, Boundary
@@ -129,34 +134,61 @@ class DrawIOStoryNodeSerializer:
         return None
 
     @staticmethod
-    def to_drawio_xml(nodes: list) -> str:
-        mxfile = ET.Element('mxfile')
-        mxfile.set('host', 'app.diagrams.net')
-        diagram = ET.SubElement(mxfile, 'diagram')
-        diagram.set('name', 'Story Map')
-        diagram.set('id', 'story-map')
-        model = ET.SubElement(diagram, 'mxGraphModel')
-        root = ET.SubElement(model, 'root')
-        ET.SubElement(root, 'mxCell').set('id', '0')
-        parent_cell = ET.SubElement(root, 'mxCell')
-        parent_cell.set('id', '1')
-        parent_cell.set('parent', '0')
+    def to_drawio_xml(nodes: Iterable) -> str:
+        output = io.StringIO()
+        DrawIOStoryNodeSerializer.write_drawio_xml(nodes, output)
+        return output.getvalue()
+
+    @staticmethod
+    def write_drawio_xml(nodes: Iterable, output: IO[str]) -> int:
+        """Write the diagram to a text stream one mxCell at a time; returns the number of cells written."""
+        output.write(_DRAWIO_HEADER)
+        count = 0
         for node in nodes:
-            root.append(DrawIOStoryNodeSerializer.to_mx_cell(node))
-        return ET.tostring(mxfile, encoding='unicode', xml_declaration=True)
+            output.write(ET.tostring(DrawIOStoryNodeSerializer.to_mx_cell(node), encoding='unicode'))
+            count += 1
+        output.write(_DRAWIO_FOOTER)
+        return count
 
     @staticmethod
-    def parse_nodes_from_xml(xml_content: str):
-        tree = ET.fromstring(xml_content)
+    def iter_nodes(source: Union[str, IO]) -> Iterator[Tuple[object, str]]:
+        """Yield (node, parent_id) for each vertex mxCell of a file path or stream, in document order.
+
+        Each mxCell is released as soon as it has been classified, so memory holds the nodes
+        but not the parsed document.
+        """
+        stack = []
+        for event, element in ET.iterparse(source, events=('start', 'end')):
+            if event == 'start':
+                stack.append(element)
+                continue
+            stack.pop()
+            if element.tag != 'mxCell':
+                continue
+            if element.get('vertex') == '1':
+                node, parent_id = DrawIOStoryNodeSerializer.from_mx_cell(element)
+                if node:
+                    yield node, parent_id
+            if stack:
+                stack[-1].remove(element)
+
+    @staticmethod
+    def parse_nodes(source: Union[str, IO]):
         nodes = []
         parent_map = {}
-        for cell in tree.iter('mxCell'):
-            if cell.get('vertex') == '1':
-                result = DrawIOStoryNodeSerializer.from_mx_cell(cell)
-                if result is None:
-                    continue
-                node, parent_id = result
-                if node:
-                    nodes.append(node)
-                    parent_map[node.cell_id] = parent_id
+        for node, parent_id in DrawIOStoryNodeSerializer.iter_nodes(source):
+            nodes.append(node)
+            parent_map[node.cell_id] = parent_id
         return nodes, parent_map
+
+    @staticmethod
+    def parse_nodes_from_xml(xml_content: str):
+        return DrawIOStoryNodeSerializer.parse_nodes(io.StringIO(xml_content))
+
+
+_DRAWIO_HEADER = (
+    "<?xml version='1.0' encoding='utf-8'?>\n"
+    '<mxfile host="app.diagrams.net"><diagram name="Story Map" id="story-map"><mxGraphModel><root>'
+    '<mxCell id="0" /><mxCell id="1" parent="0" />'
+)
+_DRAWIO_FOOTER = '</root></mxGraphModel></diagram></mxfile>'
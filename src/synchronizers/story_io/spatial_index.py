@@ -0,0 +1,141 @@
+"""
+Spatial index - interval trees over node boundaries for diagram import.
+
+Loading a story map asks, for every sub-epic and story, which bars span its x centre (the
+"bar directly above" / containing sub-epic queries) and which lanes span its y. Comparing
+every node with every candidate is quadratic; IntervalIndex answers a stabbing query in
+O(log n + hits) from a centred interval tree built once per load. Hits come back in the order
+the items were given, so callers that pick "the first best" keep their tie-breaking.
+"""
+from typing import Callable, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+Interval = Tuple[float, float, int]  # (low, high, insertion order)
+
+
+class _IntervalNode:
+
+    __slots__ = ('center', 'by_low', 'by_high', 'left', 'right')
+
+    def __init__(self, center: float, overlapping: List[Interval]):
+        self.center = center
+        self.by_low = sorted(overlapping, key=lambda iv: iv[0])
+        self.by_high = sorted(overlapping, key=lambda iv: iv[1], reverse=True)
+        self.left: Optional['_IntervalNode'] = None
+        self.right: Optional['_IntervalNode'] = None
+
+
+class IntervalIndex(Generic[T]):
+    """Static index of items by a closed [low, high] interval."""
+
+    def __init__(self, items: Iterable[T], interval: Callable[[T], Tuple[float, float]]):
+        self._items: List[T] = list(items)
+        intervals = []
+        for order, item in enumerate(self._items):
+            low, high = interval(item)
+            if low <= high:
+                intervals.append((low, high, order))
+        self._root = self._build(intervals)
+
+    @staticmethod
+    def _build(intervals: List[Interval]) -> Optional[_IntervalNode]:
+        if not intervals:
+            return None
+        root: Optional[_IntervalNode] = None
+        pending = [(intervals, None, False)]
+        while pending:
+            group, parent, is_right = pending.pop()
+            endpoints = sorted(value for low, high, _ in group for value in (low, high))
+            center = endpoints[len(endpoints) // 2]
+            node = _IntervalNode(center, [iv for iv in group if iv[0] <= center <= iv[1]])
+            if parent is None:
+                root = node
+            elif is_right:
+                parent.right = node
+            else:
+                parent.left = node
+            lower = [iv for iv in group if iv[1] < center]
+            higher = [iv for iv in group if iv[0] > center]
+            if lower:
+                pending.append((lower, node, False))
+            if higher:
+                pending.append((higher, node, True))
+        return root
+
+    def stab(self, value: float) -> List[T]:
+        """Items whose interval contains value, in the order they were indexed."""
+        orders = []
+        node = self._root
+        while node is not None:
+            if value < node.center:
+                for low, _, order in node.by_low:
+                    if low > value:
+                        break
+                    orders.append(order)
+                node = node.left
+            elif value > node.center:
+                for _, high, order in node.by_high:
+                    if high < value:
+                        break
+                    orders.append(order)
+                node = node.right
+            else:
+                orders.extend(order for _, _, order in node.by_low)
+                break
+        orders.sort()
+        return [self._items[order] for order in orders]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+def x_span(node) -> Tuple[float, float]:
+    boundary = node.boundary
+    return boundary.x, boundary.x + boundary.width
+
+
+class BoundaryIndex:
+    """Epics and sub-epics of a loaded diagram indexed by the x span of their boundaries."""
+
+    def __init__(self, epics: Iterable, sub_epics: Iterable, epic_margin: float = 0.0):
+        self.epic_margin = epic_margin
+        self.sub_epics: IntervalIndex = IntervalIndex(sub_epics, x_span)
+        self.epics: IntervalIndex = IntervalIndex(
+            epics, lambda epic: (epic.boundary.x - epic_margin,
+                                 epic.boundary.x + epic.boundary.width + epic_margin))
+
+    def sub_epics_spanning(self, x: float) -> list:
+        return self.sub_epics.stab(x)
+
+    def epics_near(self, x: float) -> list:
+        """Epics whose x span, widened by epic_margin on both sides, contains x."""
+        return self.epics.stab(x)
+
+    def bar_directly_above(self, node, accept: Callable[[object], bool],
+                           order: Optional[Callable[[object], int]] = None):
+        """Sub-epic spanning node's x centre whose top is the largest y above node's top.
+
+        Only candidates passing accept are considered. Ties on y go to the first candidate,
+        by order when given (e.g. position among the node's siblings), else by index order.
+        """
+        node_cx = node.boundary.center.x
+        node_y = node.boundary.y
+        best = []
+        best_y = -1.0
+        for candidate in self.sub_epics.stab(node_cx):
+            if candidate is node or not accept(candidate):
+                continue
+            cand_y = candidate.boundary.y
+            if cand_y >= node_y:
+                continue
+            if cand_y > best_y:
+                best_y = cand_y
+                best = [candidate]
+            elif best and cand_y == best_y:
+                best.append(candidate)
+        if not best:
+            return None
+        if order is not None and len(best) > 1:
+            return min(best, key=order)
+        return best[0]
@@ -6,7 +6,9 @@ Follows the same pattern as DrawIOSynchronizer.
 """
 
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, Union
+import hashlib
 import json
 import os
 import re
@@ -426,6 +428,47 @@ def build_folder_path_from_graph(epic_name, sub_epic_name, story_graph_data):
     return fallback_epic, fallback_sub_epic
 
 
+def build_story_folder_map(story_graph_data):
+    """
+    Map (epic_name, sub_epic_name) -> (epic_folder, sub_epic_folder) for every epic and
+    sub-epic in one walk of the graph, keyed the way extract_stories_from_graph names stories.
+    Gives the same folders as build_folder_path_from_graph without searching the graph per story.
+    """
+    folders = {}
+
+    def add_sub_epics(sub_epics, epic_name, epic_folder, parent_path):
+        for sub_epic in sub_epics:
+            sub_epic_name = f"{parent_path}/{sub_epic['name']}" if parent_path else sub_epic['name']
+            if sub_epic_name == epic_name:
+                sub_epic_folder = epic_name
+            elif '/' in sub_epic_name:
+                sub_epic_folder = str(Path(*[f"⚙️ {part.strip()}" for part in sub_epic_name.split('/')]))
+            else:
+                sub_epic_folder = f"⚙️ {sub_epic_name}"
+            folders.setdefault((epic_name, sub_epic_name), (epic_folder, sub_epic_folder))
+            add_sub_epics(sub_epic.get('sub_epics', []), epic_name, epic_folder, sub_epic_name)
+
+    for epic in story_graph_data.get('epics', []):
+        epic_folder = f"🎯 {epic['name']}"
+        folders.setdefault((epic['name'], epic['name']), (epic_folder, epic['name']))
+        add_sub_epics(epic.get('sub_epics', []), epic['name'], epic_folder, "")
+    return folders
+
+
+def content_hash(text):
+    """SHA-256 of rendered markdown, used to skip rewriting files whose content did not change."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def file_content_hash(file_path):
+    """Hash of an existing file read the same way it is written; None when it cannot be read."""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return content_hash(f.read())
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
 def create_story_content(story, epic_name, sub_epic_name, workspace_directory, story_file_path=None):
     """Create markdown content for a story. sub_epic_name is the sub-epic name."""
     """Create markdown content for a story"""
@@ -642,7 +685,8 @@ class StoryScenariosSynchronizer:
     """Synchronizer for rendering story markdown files from story graph JSON."""
     
     def render(self, input_path: Union[str, Path], output_path: Union[str, Path], 
-               renderer_command: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+               renderer_command: Optional[str] = None, parallel: bool = False,
+               max_workers: Optional[int] = None, **kwargs) -> Dict[str, Any]:
         """
         Render story markdown files from story graph JSON.
         
@@ -650,10 +694,12 @@ class StoryScenariosSynchronizer:
             input_path: Path to story graph JSON file
             output_path: Path to output directory for story files
             renderer_command: Optional command variant (unused for now)
+            parallel: Render stories in a thread pool (for large graphs)
+            max_workers: Thread pool size when rendering in parallel
             **kwargs: Additional arguments
         
         Returns:
-            Dictionary with output_path, summary, and created files
+            Dictionary with output_path, summary, and created/updated/unchanged/deleted files
         """
         input_path = Path(input_path)
         output_dir = Path(output_path)
@@ -688,49 +734,30 @@ class StoryScenariosSynchronizer:
         # This is used for cleanup - we need to know ALL valid stories to identify obsolete files
         all_story_names_in_graph = {story['name'] for story in all_stories}
         
-        # Create story files and track which files were rendered in correct locations
+        # Folder for every epic/sub-epic, built in one walk instead of searching the graph per story
+        folder_map = build_story_folder_map(data)
+        # workspace_directory is 3 levels up from map directory (map -> stories -> docs -> workspace)
+        workspace_directory = base_dir.parent.parent.parent
+        
+        def render_one(story):
+            return self._render_story_file(story, data, folder_map, base_dir, workspace_directory)
+        
+        if parallel and len(all_stories) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='StoryRenderer') as executor:
+                results = list(executor.map(render_one, all_stories))
+        else:
+            results = [render_one(story) for story in all_stories]
+        
+        # Results come back in story order either way, so the summary does not depend on parallel
         created_files = []
         updated_files = []
+        unchanged_files = []
         deleted_files = []
         rendered_file_paths = set()  # Track all files we rendered in their correct locations
-        
-        for story in all_stories:
-            story_name = story['name']
-            # Sanitize story name for use in file path (replace invalid path characters)
-            # Forward slashes and backslashes are not valid in filenames on Windows
-            # Replace characters invalid in Windows filenames: / \ " : * ? < > |
-            sanitized_story_name = story_name
-            for ch in ['/', '\\', '"', ':', '*', '?', '<', '>', '|']:
-                sanitized_story_name = sanitized_story_name.replace(ch, '-')
-            
-            # Build folder path dynamically from story graph structure
-            epic_folder, sub_epic_folder = build_folder_path_from_graph(
-                story['epic_name'], 
-                story.get('sub_epic_name', story['epic_name']),
-                data
-            )
-            
-            # Create directory structure using names from the graph
-            story_dir = base_dir / epic_folder / sub_epic_folder
-            story_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Create file (use 📄 emoji prefix) with sanitized name
-            story_file = story_dir / f"📄 {sanitized_story_name}.md"
-            rendered_file_paths.add(story_file)  # Track this as a valid file location
-            
-            # Generate content - workspace_directory is 3 levels up from map directory (map -> stories -> docs -> workspace)
-            workspace_directory = base_dir.parent.parent.parent
-            content = create_story_content(story, story['epic_name'], story.get('sub_epic_name', story['epic_name']), workspace_directory, story_file)
-            
-            # Check if file exists
-            if story_file.exists():
-                updated_files.append(str(story_file.relative_to(output_dir)))
-            else:
-                created_files.append(str(story_file.relative_to(output_dir)))
-            
-            # Write file
-            with open(story_file, 'w', encoding='utf-8') as f:
-                f.write(content)
+        outcome_lists = {'created': created_files, 'updated': updated_files, 'unchanged': unchanged_files}
+        for story_file, outcome in results:
+            rendered_file_paths.add(story_file)
+            outcome_lists[outcome].append(str(story_file.relative_to(output_dir)))
         
         # Delete files that exist but weren't rendered (wrong location or obsolete)
         # This runs regardless of scope - we always clean up files that don't belong
@@ -749,10 +776,46 @@ class StoryScenariosSynchronizer:
                 'total_stories': len(all_stories),
                 'created_files': len(created_files),
                 'updated_files': len(updated_files),
+                'skipped_unchanged': len(unchanged_files),
                 'deleted_files': len(deleted_files)
             },
             'created_files': created_files,
             'updated_files': updated_files,
+            'unchanged_files': unchanged_files,
             'deleted_files': deleted_files
         }
-
+    
+    def _render_story_file(self, story, data, folder_map, base_dir, workspace_directory):
+        """Render one story file; returns (path, 'created' | 'updated' | 'unchanged')."""
+        story_name = story['name']
+        sub_epic_name = story.get('sub_epic_name', story['epic_name'])
+        # Sanitize story name for use in file path (replace invalid path characters)
+        # Forward slashes and backslashes are not valid in filenames on Windows
+        # Replace characters invalid in Windows filenames: / \ " : * ? < > |
+        sanitized_story_name = story_name
+        for ch in ['/', '\\', '"', ':', '*', '?', '<', '>', '|']:
+            sanitized_story_name = sanitized_story_name.replace(ch, '-')
+        
+        folders = folder_map.get((story['epic_name'], sub_epic_name))
+        if folders is None:
+            folders = build_folder_path_from_graph(story['epic_name'], sub_epic_name, data)
+        epic_folder, sub_epic_folder = folders
+        
+        # Create directory structure using names from the graph
+        story_dir = base_dir / epic_folder / sub_epic_folder
+        story_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Create file (use 📄 emoji prefix) with sanitized name
+        story_file = story_dir / f"📄 {sanitized_story_name}.md"
+        content = create_story_content(story, story['epic_name'], sub_epic_name, workspace_directory, story_file)
+        
+        if not story_file.exists():
+            outcome = 'created'
+        elif file_content_hash(story_file) == content_hash(content):
+            return story_file, 'unchanged'
+        else:
+            outcome = 'updated'
+        
+        with open(story_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return story_file, outcome
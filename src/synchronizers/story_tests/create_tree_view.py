@@ -7,6 +7,8 @@ import re
 from pathlib import Path
 from collections import defaultdict
 
+from story_graph.story_graph_store import StoryGraphStore
+
 def normalize_name(name):
     """Normalize names for matching."""
     return re.sub(r'[^a-zA-Z0-9]', '', name.lower())
@@ -420,8 +422,7 @@ def print_tree(story_structure, test_mapping, stories_dir, test_dir, file_to_epi
 
 def main():
     story_graph_path = Path('agile_bots/bots/base_bot/docs/story/story-graph.json')
-    with open(story_graph_path, 'r', encoding='utf-8') as f:
-        story_graph = json.load(f)
+    story_graph = StoryGraphStore.shared().load(story_graph_path)
     
     def build_structure(epic):
         node = {
@@ -7,6 +7,8 @@ import re
 from pathlib import Path
 from collections import defaultdict
 
+from story_graph.story_graph_store import StoryGraphStore
+
 def normalize_name(name):
     """Normalize names for matching."""
     return re.sub(r'[^a-zA-Z0-9]', '', name.lower())
@@ -115,9 +117,8 @@ def main():
     story_graph_path = Path('agile_bots/bots/base_bot/docs/story/story-graph.json')
     test_dir = Path('agile_bots/bots/base_bot/test')
     
-    # Load story graph
-    with open(story_graph_path, 'r', encoding='utf-8') as f:
-        story_graph = json.load(f)
+    # Load story graph (a private copy: steps are added to it below)
+    story_graph = StoryGraphStore.shared().load_copy(story_graph_path)
     
     # Parse all test files
     test_methods_map = {}
@@ -189,6 +190,7 @@ def main():
     if updated_count > 0:
         with open(story_graph_path, 'w', encoding='utf-8') as f:
             json.dump(story_graph, f, indent=2, ensure_ascii=False)
+        StoryGraphStore.shared().invalidate(story_graph_path)
         print(f"\nUpdated {updated_count} scenarios with steps in story graph JSON")
     else:
         print("No scenarios were updated. Check if test methods have docstrings with scenario steps.")
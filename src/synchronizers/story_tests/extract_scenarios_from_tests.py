@@ -7,6 +7,8 @@ import re
 from pathlib import Path
 from collections import defaultdict
 
+from story_graph.story_graph_store import StoryGraphStore
+
 def normalize_name(name):
     """Normalize names for matching."""
     return re.sub(r'[^a-zA-Z0-9]', '', name.lower())
@@ -184,9 +186,8 @@ def main():
     story_graph_path = Path('agile_bots/bots/base_bot/docs/story/story-graph.json')
     test_dir = Path('agile_bots/bots/base_bot/test')
     
-    # Load story graph
-    with open(story_graph_path, 'r', encoding='utf-8') as f:
-        story_graph = json.load(f)
+    # Load story graph (a private copy: scenarios are added to it below)
+    story_graph = StoryGraphStore.shared().load_copy(story_graph_path)
     
     # Collect all story names
     all_stories = collect_all_stories(story_graph)
@@ -236,6 +237,7 @@ def main():
     # Save updated story graph
     with open(story_graph_path, 'w', encoding='utf-8') as f:
         json.dump(story_graph, f, indent=2, ensure_ascii=False)
+    StoryGraphStore.shared().invalidate(story_graph_path)
     
     print(f"Updated story graph with scenarios from test files")
     print(f"Updated {len(test_mapping)} stories")
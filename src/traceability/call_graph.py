@@ -0,0 +1,125 @@
+"""
+Call Graph - outgoing calls of every indexed symbol, computed once per file parse.
+"""
+import ast
+import copy
+import re
+import textwrap
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from traceability.workspace_index import WorkspaceIndex
+
+_JS_CALL_KEYWORDS = frozenset([
+    'if', 'for', 'while', 'switch', 'catch', 'return', 'typeof', 'new', 'delete',
+    'void', 'function', 'class', 'extends', 'import', 'export', 'await', 'case'
+])
+_JS_METHOD_CALL = re.compile(r'\.([a-zA-Z_][a-zA-Z0-9_]*)\s*\(')
+_JS_FUNCTION_CALL = re.compile(r'(?<![.:\w])([a-zA-Z_][a-zA-Z0-9_]*)\s*\(')
+
+
+def get_attr_chain(node) -> list:
+    """Get attribute chain like helper.domain.story."""
+    chain = []
+    while isinstance(node, ast.Attribute):
+        chain.insert(0, node.attr)
+        node = node.value
+    if isinstance(node, ast.Name):
+        chain.insert(0, node.id)
+    return chain
+
+
+def parse_call_node(node: ast.Call) -> Optional[dict]:
+    """Parse an AST Call node into structured info."""
+    if isinstance(node.func, ast.Attribute):
+        return {"type": "method", "method": node.func.attr, "chain": get_attr_chain(node.func.value)}
+    elif isinstance(node.func, ast.Name):
+        return {"type": "function", "name": node.func.id}
+    return None
+
+
+def calls_in_tree(tree: ast.AST) -> list:
+    """Unique calls in breadth-first order."""
+    calls = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call):
+            call_info = parse_call_node(node)
+            if call_info and call_info not in calls:
+                calls.append(call_info)
+    return calls
+
+
+def calls_in_python_code(code: str) -> list:
+    try:
+        return calls_in_tree(ast.parse(textwrap.dedent(code)))
+    except SyntaxError:
+        return []
+
+
+def calls_in_js_code(code: str) -> list:
+    """Find function/method calls in JavaScript code using regex."""
+    calls = []
+    for m in _JS_METHOD_CALL.finditer(code):
+        name = m.group(1)
+        if name not in _JS_CALL_KEYWORDS and name not in ('then', 'catch', 'finally'):
+            call = {"type": "method", "method": name, "chain": []}
+            if call not in calls:
+                calls.append(call)
+    for m in _JS_FUNCTION_CALL.finditer(code):
+        name = m.group(1)
+        if name not in _JS_CALL_KEYWORDS and name not in ('then', 'catch', 'finally'):
+            call = {"type": "function", "name": name}
+            if call not in calls:
+                calls.append(call)
+    return calls
+
+
+class CallGraph:
+    """Memoized edges symbol -> outgoing calls, invalidated when the index sees a file change."""
+
+    def __init__(self, index: 'WorkspaceIndex'):
+        self._index = index
+        self._edges: Dict[str, Tuple[Optional[Tuple[int, int]], Dict[Tuple[int, int], list]]] = {}
+        self._lock = threading.Lock()
+        self.files_parsed = 0
+
+    def calls_from(self, rel_path: str, line: int, end_line: int) -> list:
+        stamp = self._index.stamp(rel_path)
+        with self._lock:
+            cached = self._edges.get(rel_path)
+            if cached is None or cached[0] != stamp:
+                cached = (stamp, {})
+                self._edges[rel_path] = cached
+                if rel_path.endswith('.py'):
+                    cached[1].update(self._python_edges(rel_path))
+                    self.files_parsed += 1
+            edges = cached[1]
+            key = (line, end_line)
+            if key not in edges:
+                edges[key] = self._snippet_calls(rel_path, line, end_line)
+            return edges[key]
+
+    def _python_edges(self, rel_path: str) -> Dict[Tuple[int, int], list]:
+        """Calls of every top-level function and method, from a single parse of the file."""
+        try:
+            tree = ast.parse(self._index.source(rel_path))
+        except (SyntaxError, ValueError):
+            return {}
+        edges = {}
+        for node in ast.iter_child_nodes(tree):
+            members = node.body if isinstance(node, ast.ClassDef) else [node]
+            for func in members:
+                if isinstance(func, ast.FunctionDef):
+                    # Decorators sit above the def line, outside the traced source range.
+                    undecorated = copy.copy(func)
+                    undecorated.decorator_list = []
+                    edges[(func.lineno, func.end_lineno or func.lineno)] = calls_in_tree(undecorated)
+        return edges
+
+    def _snippet_calls(self, rel_path: str, line: int, end_line: int) -> list:
+        lines = self._index.source(rel_path).split('\n')
+        code = '\n'.join(lines[line - 1:end_line])
+        if rel_path.endswith('.js'):
+            return calls_in_js_code(code)
+        return calls_in_python_code(code)
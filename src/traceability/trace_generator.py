@@ -9,133 +9,33 @@ import re
 from pathlib import Path
 from typing import Optional
 
+from traceability.call_graph import calls_in_js_code, calls_in_python_code
+from traceability.workspace_index import WorkspaceIndex, find_js_block_end
 
-def _should_skip_path(file_path: Path) -> bool:
-    """Skip generated/external directories."""
-    s = str(file_path)
-    return any(x in s for x in ['__pycache__', 'node_modules', '.venv', 'site-packages', '.git'])
+TRACE_ROOTS = ("test", "src")
 
 
 class TraceGenerator:
     """Generate trace by analyzing code AST - no hardcoding."""
     
-    def __init__(self, workspace: Path, max_depth: int = 3):
+    def __init__(self, workspace: Path, max_depth: int = 3, index: Optional[WorkspaceIndex] = None):
         self.workspace = workspace
         self.seen_symbols = set()
         self.max_depth = max_depth  # Default to 3 per plan
-        self._file_cache = {}  # Cache file contents
+        self._index = index
         self._method_index = None  # Cache method locations
     
     def _build_method_index(self):
-        """Build index of all methods/functions in workspace (Python and JS) - do this once."""
+        """Use the shared workspace index of all methods/functions (Python and JS) - parsed once per session."""
         if self._method_index is not None:
             return
-        
-        self._method_index = {}  # method_name -> [{class, file, line, end_line}]
-        
-        search_dirs = [
-            self.workspace / "test",  # All test code
-            self.workspace / "src",   # All source code
-        ]
-        
-        for search_dir in search_dirs:
-            if not search_dir.exists():
-                continue
-            for py_file in search_dir.rglob("*.py"):
-                if _should_skip_path(py_file):
-                    continue
-                try:
-                    source = py_file.read_text(encoding='utf-8')
-                    self._file_cache[str(py_file)] = source
-                    tree = ast.parse(source)
-                    
-                    for node in ast.iter_child_nodes(tree):
-                        if isinstance(node, ast.ClassDef):
-                            class_name = node.name
-                            for item in node.body:
-                                if isinstance(item, ast.FunctionDef):
-                                    self._add_to_index(item.name, class_name, py_file, item.lineno, item.end_lineno or item.lineno)
-                        elif isinstance(node, ast.FunctionDef):
-                            self._add_to_index(node.name, "", py_file, node.lineno, node.end_lineno or node.lineno)
-                except Exception:
-                    continue
-            
-            for js_file in search_dir.rglob("*.js"):
-                if _should_skip_path(js_file):
-                    continue
-                try:
-                    self._index_javascript_file(js_file)
-                except Exception:
-                    continue
-    
-    def _add_to_index(self, method_name: str, class_name: str, file_path: Path, line: int, end_line: int):
-        if not method_name:
-            return
-        rel_path = str(file_path.relative_to(self.workspace)).replace("\\", "/")
-        if method_name not in self._method_index:
-            self._method_index[method_name] = []
-        self._method_index[method_name].append({
-            "class": class_name,
-            "file": rel_path,
-            "line": line,
-            "end_line": end_line
-        })
-    
-    _JS_KEYWORDS = frozenset([
-        'if', 'for', 'while', 'switch', 'catch', 'return', 'typeof', 'new', 'delete',
-        'void', 'function', 'class', 'extends', 'import', 'export', 'await', 'case',
-        'else', 'try', 'throw', 'finally', 'with', 'in', 'of', 'instanceof', 'typeof'
-    ])
-
-    def _index_javascript_file(self, js_file: Path):
-        """Index JS file: functions and class methods."""
-        source = js_file.read_text(encoding='utf-8')
-        self._file_cache[str(js_file)] = source
-        lines = source.split('\n')
-        
-        func_pattern = re.compile(r'^\s*(?:export\s+)?(?:async\s+)?function\s+(\w+)\s*\(')
-        class_pattern = re.compile(r'^\s*(?:export\s+)?class\s+(\w+)')
-        method_pattern = re.compile(r'^\s+(?:async\s+)?(\w+)\s*\([^)]*\)\s*\{')
-        arrow_method = re.compile(r'^\s+(\w+)\s*=\s*\([^)]*\)\s*=>')
-        method_shorthand = re.compile(r'^\s+(\w+)\s*\([^)]*\)\s*\{')
-        
-        current_class = ""
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            if match := class_pattern.match(line):
-                current_class = match.group(1)
-                i += 1
-                continue
-            if match := func_pattern.match(line):
-                name = match.group(1)
-                if name not in self._JS_KEYWORDS:
-                    end_line = self._find_js_block_end(lines, i)
-                    self._add_to_index(name, "", js_file, i + 1, end_line)
-                i += 1
-                continue
-            if current_class and (match := method_pattern.match(line) or method_shorthand.match(line) or arrow_method.match(line)):
-                name = match.group(1)
-                if name not in self._JS_KEYWORDS:
-                    end_line = self._find_js_block_end(lines, i)
-                    self._add_to_index(name, current_class, js_file, i + 1, end_line)
-                i += 1
-                continue
-            i += 1
+        if self._index is None:
+            self._index = WorkspaceIndex.shared(self.workspace, TRACE_ROOTS)
+        self._method_index = self._index.method_index
     
     def _find_js_block_end(self, lines: list, start_idx: int) -> int:
         """Find the line number (1-based) of the closing brace for a block starting at start_idx."""
-        depth = 0
-        for j in range(start_idx, len(lines)):
-            line = lines[j]
-            for c in line:
-                if c == '{':
-                    depth += 1
-                elif c == '}':
-                    depth -= 1
-                    if depth == 0:
-                        return j + 1
-        return start_idx + 1
+        return find_js_block_end(lines, start_idx)
     
     def find_story_by_test_class(self, test_class: str, story_graph_path: str = "docs/story/story-graph.json") -> Optional[dict]:
         """Find a story in story-graph.json by its test_class.
@@ -415,63 +315,8 @@ class TraceGenerator:
     def _find_calls_in_code(self, code: str, source_file: Optional[str] = None) -> list:
         """Find all function/method calls in code. Uses JS parsing when source_file ends with .js."""
         if source_file and source_file.endswith('.js'):
-            return self._find_calls_in_code_js(code)
-        import textwrap
-        calls = []
-        try:
-            dedented = textwrap.dedent(code)
-            tree = ast.parse(dedented)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Call):
-                    call_info = self._parse_call_node(node)
-                    if call_info and call_info not in calls:
-                        calls.append(call_info)
-        except SyntaxError:
-            pass
-        return calls
-    
-    def _find_calls_in_code_js(self, code: str) -> list:
-        """Find function/method calls in JavaScript code using regex."""
-        calls = []
-        js_keywords = frozenset([
-            'if', 'for', 'while', 'switch', 'catch', 'return', 'typeof', 'new', 'delete',
-            'void', 'function', 'class', 'extends', 'import', 'export', 'await', 'case'
-        ])
-        # Method calls: .methodName(
-        for m in re.finditer(r'\.([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', code):
-            name = m.group(1)
-            if name not in js_keywords and name not in ('then', 'catch', 'finally'):
-                call = {"type": "method", "method": name, "chain": []}
-                if call not in calls:
-                    calls.append(call)
-        # Function calls: identifier( - not preceded by . or :
-        for m in re.finditer(r'(?<![.:\w])([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', code):
-            name = m.group(1)
-            if name not in js_keywords and name not in ('then', 'catch', 'finally'):
-                call = {"type": "function", "name": name}
-                if call not in calls:
-                    calls.append(call)
-        return calls
-    
-    def _parse_call_node(self, node: ast.Call) -> Optional[dict]:
-        """Parse an AST Call node into structured info."""
-        if isinstance(node.func, ast.Attribute):
-            method = node.func.attr
-            chain = self._get_attr_chain(node.func.value)
-            return {"type": "method", "method": method, "chain": chain}
-        elif isinstance(node.func, ast.Name):
-            return {"type": "function", "name": node.func.id}
-        return None
-    
-    def _get_attr_chain(self, node) -> list:
-        """Get attribute chain like helper.domain.story."""
-        chain = []
-        while isinstance(node, ast.Attribute):
-            chain.insert(0, node.attr)
-            node = node.value
-        if isinstance(node, ast.Name):
-            chain.insert(0, node.id)
-        return chain
+            return calls_in_js_code(code)
+        return calls_in_python_code(code)
     
     def _resolve_call(self, call: dict, depth: int, shallow: bool = False) -> list:
         """Resolve a call to its implementation(s). Returns list of sections (Python + JS)."""
@@ -514,22 +359,14 @@ class TraceGenerator:
             if match["class"] == name:
                 if shallow:
                     return {"symbol": f"{name}.__init__", "file": match["file"], "line": match["line"]}
-                file_path = self.workspace / match["file"]
                 try:
-                    if str(file_path) in self._file_cache:
-                        source = self._file_cache[str(file_path)]
-                    else:
-                        source = file_path.read_text(encoding='utf-8')
-                    
-                    lines = source.split('\n')
                     start = match["line"]
-                    end = match["end_line"]
-                    code = '\n'.join(lines[start - 1:end])
                     
                     # Recursively find calls
                     children = []
                     if depth < self.max_depth:
-                        children = self._analyze_children(code, depth + 1, match["file"])
+                        calls = self._index.call_graph.calls_from(match["file"], start, match["end_line"])
+                        children = self._analyze_children(calls, depth + 1)
                     
                     is_lazy = depth >= 3
                     result = {
@@ -563,18 +400,11 @@ class TraceGenerator:
                 sections.append({"symbol": symbol, "file": match["file"], "line": match["line"]})
                 continue
             try:
-                file_path = self.workspace / match["file"]
-                if str(file_path) in self._file_cache:
-                    source = self._file_cache[str(file_path)]
-                else:
-                    source = file_path.read_text(encoding='utf-8')
-                lines = source.split('\n')
                 start = match["line"]
-                end = match["end_line"]
-                code = '\n'.join(lines[start - 1:end])
                 children = []
                 if depth < self.max_depth:
-                    children = self._analyze_children(code, depth + 1, match["file"])
+                    calls = self._index.call_graph.calls_from(match["file"], start, match["end_line"])
+                    children = self._analyze_children(calls, depth + 1)
                 is_lazy = depth >= 3
                 result = {
                     "symbol": symbol,
@@ -590,13 +420,12 @@ class TraceGenerator:
                 continue
         return sections
     
-    def _analyze_children(self, code: str, depth: int, source_file: Optional[str] = None) -> list:
-        """Analyze code for calls and build children list. Uses JS parsing when source_file ends with .js."""
+    def _analyze_children(self, calls: list, depth: int) -> list:
+        """Resolve a symbol's outgoing calls (from the call graph) into a children list."""
         if depth > self.max_depth:
             return []
         
         children = []
-        calls = self._find_calls_in_code(code, source_file)
         for call in calls:
             sections = self._resolve_call(call, depth)
             if sections:
@@ -1,133 +1,264 @@
 """
 Workspace Index - indexes Python/JS files for symbol lookup.
+
+One index is shared per (workspace, roots) for the whole process and persisted to
+.cache/symbol_index so later sessions only re-index files whose mtime or size changed.
+Inside WorkspaceIndex.operation() each shared index is refreshed at most once.
 """
 import ast
+import contextlib
+import json
+import os
+import re
+import threading
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+
+from traceability.call_graph import CallGraph
+
+INDEX_VERSION = 1
+EXCLUDED_DIRS = ("node_modules", ".venv", "site-packages", "__pycache__", ".git")
+JS_KEYWORDS = frozenset([
+    'if', 'for', 'while', 'switch', 'catch', 'return', 'typeof', 'new', 'delete',
+    'void', 'function', 'class', 'extends', 'import', 'export', 'await', 'case',
+    'else', 'try', 'throw', 'finally', 'with', 'in', 'of', 'instanceof', 'typeof'
+])
+
+_FUNC_PATTERN = re.compile(r'^\s*(?:export\s+)?(?:async\s+)?function\s+(\w+)\s*\(')
+_CLASS_PATTERN = re.compile(r'^\s*(?:export\s+)?class\s+(\w+)')
+_METHOD_PATTERN = re.compile(r'^\s+(?:async\s+)?(\w+)\s*\([^)]*\)\s*\{')
+_ARROW_METHOD_PATTERN = re.compile(r'^\s+(\w+)\s*=\s*\([^)]*\)\s*=>')
+
+_shared_indexes: Dict[Tuple[str, Tuple[str, ...]], 'WorkspaceIndex'] = {}
+_shared_lock = threading.Lock()
+_operation = threading.local()
+
+
+def find_js_block_end(lines: list, start_idx: int) -> int:
+    """Find the line number (1-based) of the closing brace for a block starting at start_idx."""
+    depth = 0
+    for j in range(start_idx, len(lines)):
+        for c in lines[j]:
+            if c == '{':
+                depth += 1
+            elif c == '}':
+                depth -= 1
+                if depth == 0:
+                    return j + 1
+    return start_idx + 1
+
+
+def _symbol(kind: str, name: str, parent: Optional[str], start_line: int, end_line: int, start_col: int = 0, end_col: int = 0) -> dict:
+    return {
+        "kind": kind,
+        "name": name,
+        "parent": parent,
+        "range": {"startLine": start_line, "startCol": start_col, "endLine": end_line, "endCol": end_col}
+    }
 
 
 class WorkspaceIndex:
-    def __init__(self, workspace: Path):
-        self.workspace = workspace
+    def __init__(self, workspace: Path, roots: Optional[Tuple[str, ...]] = None, cache_path: Optional[Path] = None):
+        self.workspace = Path(workspace)
+        self.roots = tuple(roots) if roots else ()
         self.files: List[Path] = []
         self.symbols: Dict[str, List[dict]] = {}  # path → [symbols]
+        self._stamps: Dict[str, Tuple[int, int]] = {}  # path → (mtime_ns, size)
+        self._sources: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        self._method_index: Optional[Dict[str, List[dict]]] = None
+        self._call_graph: Optional[CallGraph] = None
+        self._cache_path = cache_path or self._default_cache_path()
+        self._lock = threading.RLock()
+        self._loaded = False
+        self.reindexed_files = 0
+
+    @classmethod
+    def shared(cls, workspace: Path, roots: Optional[Tuple[str, ...]] = None) -> 'WorkspaceIndex':
+        """Process-wide index for a workspace, refreshed so only changed files are re-indexed."""
+        key = (str(Path(workspace).resolve()), tuple(roots) if roots else ())
+        with _shared_lock:
+            index = _shared_indexes.get(key)
+            if index is None:
+                index = cls(workspace, roots)
+                _shared_indexes[key] = index
+        refreshed = getattr(_operation, 'refreshed', None)
+        if refreshed is None or key not in refreshed:
+            index.refresh()
+            if refreshed is not None:
+                refreshed.add(key)
+        return index
+
+    @classmethod
+    @contextlib.contextmanager
+    def operation(cls):
+        """Scope in which shared() refreshes each index once, e.g. one serialization tracing many scenarios."""
+        if getattr(_operation, 'refreshed', None) is not None:
+            yield
+            return
+        _operation.refreshed = set()
+        try:
+            yield
+        finally:
+            _operation.refreshed = None
+
+    @classmethod
+    def clear_shared(cls) -> None:
+        with _shared_lock:
+            _shared_indexes.clear()
+
+    def _default_cache_path(self) -> Path:
+        suffix = '-'.join(self.roots) if self.roots else 'workspace'
+        return self.workspace / '.cache' / 'symbol_index' / f'{suffix}.json'
 
     def build(self):
         """Build index of all Python and JS files."""
-        self.files = []
-        self.symbols = {}
-        
-        for pattern in ["**/*.py", "**/*.js"]:
-            for file_path in self.workspace.glob(pattern):
-                if self._should_index(file_path):
-                    self.files.append(file_path)
-                    self._index_file(file_path)
+        self.refresh()
+
+    def refresh(self) -> int:
+        """Re-index files that are new or changed since the last refresh; returns how many were parsed."""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            reindexed = 0
+            current: Dict[str, Path] = {}
+            for file_path in self._discover_files():
+                rel_path = self._relative(file_path)
+                current[rel_path] = file_path
+                try:
+                    stat = file_path.stat()
+                except OSError:
+                    continue
+                stamp = (stat.st_mtime_ns, stat.st_size)
+                if self._stamps.get(rel_path) == stamp and rel_path in self.symbols:
+                    continue
+                self._stamps[rel_path] = stamp
+                self._index_file(file_path)
+                reindexed += 1
+            removed = [rel_path for rel_path in self.symbols if rel_path not in current]
+            for rel_path in removed:
+                self.symbols.pop(rel_path, None)
+                self._stamps.pop(rel_path, None)
+                self._sources.pop(rel_path, None)
+            self.files = list(current.values())
+            if reindexed or removed:
+                self._method_index = None
+                self._save()
+            self.reindexed_files += reindexed
+            return reindexed
+
+    def _discover_files(self):
+        search_dirs = [self.workspace / root for root in self.roots] if self.roots else [self.workspace]
+        for search_dir in search_dirs:
+            if not search_dir.exists():
+                continue
+            for pattern in ("*.py", "*.js"):
+                for file_path in search_dir.rglob(pattern):
+                    if self._should_index(file_path):
+                        yield file_path
 
     def _should_index(self, file_path: Path) -> bool:
         """Skip external/generated code."""
-        excludes = ["node_modules", ".venv", "site-packages", "__pycache__", ".git"]
-        return not any(ex in str(file_path) for ex in excludes)
+        return not any(ex in str(file_path) for ex in EXCLUDED_DIRS)
+
+    def _relative(self, file_path: Path) -> str:
+        return str(file_path.relative_to(self.workspace)).replace("\\", "/")
 
     def _index_file(self, file_path: Path):
         """Extract symbols from a file."""
-        rel_path = str(file_path.relative_to(self.workspace)).replace("\\", "/")
-        
+        rel_path = self._relative(file_path)
+        self._sources.pop(rel_path, None)
+
         if file_path.suffix == ".py":
             self._index_python(file_path, rel_path)
         elif file_path.suffix == ".js":
             self._index_javascript(file_path, rel_path)
 
     def _index_python(self, file_path: Path, rel_path: str):
-        """Index Python file using AST."""
+        """Index Python file using AST: top-level classes, their methods and top-level functions."""
+        self.symbols[rel_path] = []
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                source = f.read()
+            source = file_path.read_text(encoding='utf-8')
             tree = ast.parse(source)
-        except (SyntaxError, UnicodeDecodeError):
+        except (SyntaxError, UnicodeDecodeError, ValueError, OSError):
             return
-        
+
         symbols = []
-        
-        for node in ast.walk(tree):
+        for node in ast.iter_child_nodes(tree):
             if isinstance(node, ast.ClassDef):
-                symbols.append({
-                    "kind": "class",
-                    "name": node.name,
-                    "parent": None,
-                    "range": {
-                        "startLine": node.lineno,
-                        "startCol": node.col_offset,
-                        "endLine": node.end_lineno or node.lineno,
-                        "endCol": node.end_col_offset or 0
-                    }
-                })
-                # Index methods
+                symbols.append(_symbol("class", node.name, None, node.lineno, node.end_lineno or node.lineno, node.col_offset, node.end_col_offset or 0))
                 for item in node.body:
                     if isinstance(item, ast.FunctionDef):
-                        symbols.append({
-                            "kind": "method",
-                            "name": item.name,
-                            "parent": node.name,
-                            "range": {
-                                "startLine": item.lineno,
-                                "startCol": item.col_offset,
-                                "endLine": item.end_lineno or item.lineno,
-                                "endCol": item.end_col_offset or 0
-                            }
-                        })
-            
-            elif isinstance(node, ast.FunctionDef) and not hasattr(node, '_in_class'):
-                # Top-level function
-                symbols.append({
-                    "kind": "function",
-                    "name": node.name,
-                    "parent": None,
-                    "range": {
-                        "startLine": node.lineno,
-                        "startCol": node.col_offset,
-                        "endLine": node.end_lineno or node.lineno,
-                        "endCol": node.end_col_offset or 0
-                    }
-                })
-        
+                        symbols.append(_symbol("method", item.name, node.name, item.lineno, item.end_lineno or item.lineno, item.col_offset, item.end_col_offset or 0))
+            elif isinstance(node, ast.FunctionDef):
+                symbols.append(_symbol("function", node.name, None, node.lineno, node.end_lineno or node.lineno, node.col_offset, node.end_col_offset or 0))
+
         self.symbols[rel_path] = symbols
 
     def _index_javascript(self, file_path: Path, rel_path: str):
-        """Index JS file using regex (simple initial approach)."""
+        """Index JS file using regex: classes, functions and class methods."""
+        self.symbols[rel_path] = []
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-        except UnicodeDecodeError:
+            lines = file_path.read_text(encoding='utf-8').split('\n')
+        except (UnicodeDecodeError, OSError):
             return
-        
+
         symbols = []
-        import re
-        
-        # Simple patterns for functions/classes
-        func_pattern = re.compile(r'^\s*(?:export\s+)?(?:async\s+)?function\s+(\w+)')
-        class_pattern = re.compile(r'^\s*(?:export\s+)?class\s+(\w+)')
-        method_pattern = re.compile(r'^\s+(\w+)\s*\([^)]*\)\s*{')
-        
         current_class = None
-        for i, line in enumerate(lines, 1):
-            if match := class_pattern.match(line):
+        for i, line in enumerate(lines):
+            if match := _CLASS_PATTERN.match(line):
                 current_class = match.group(1)
-                symbols.append({
-                    "kind": "class",
-                    "name": current_class,
-                    "parent": None,
-                    "range": {"startLine": i, "startCol": 0, "endLine": i, "endCol": 0}
-                })
-            elif match := func_pattern.match(line):
-                symbols.append({
-                    "kind": "function",
-                    "name": match.group(1),
-                    "parent": None,
-                    "range": {"startLine": i, "startCol": 0, "endLine": i, "endCol": 0}
-                })
-        
+                symbols.append(_symbol("class", current_class, None, i + 1, find_js_block_end(lines, i)))
+            elif match := _FUNC_PATTERN.match(line):
+                if match.group(1) not in JS_KEYWORDS:
+                    symbols.append(_symbol("function", match.group(1), None, i + 1, find_js_block_end(lines, i)))
+            elif current_class and (match := _METHOD_PATTERN.match(line) or _ARROW_METHOD_PATTERN.match(line)):
+                if match.group(1) not in JS_KEYWORDS:
+                    symbols.append(_symbol("method", match.group(1), current_class, i + 1, find_js_block_end(lines, i)))
+
         self.symbols[rel_path] = symbols
 
+    @property
+    def method_index(self) -> Dict[str, List[dict]]:
+        """method_name -> [{class, file, line, end_line}] for methods and functions."""
+        with self._lock:
+            if self._method_index is None:
+                method_index: Dict[str, List[dict]] = {}
+                for rel_path, symbols in self.symbols.items():
+                    for sym in symbols:
+                        if sym["kind"] == "class" or not sym["name"]:
+                            continue
+                        method_index.setdefault(sym["name"], []).append({
+                            "class": sym["parent"] or "",
+                            "file": rel_path,
+                            "line": sym["range"]["startLine"],
+                            "end_line": sym["range"]["endLine"]
+                        })
+                self._method_index = method_index
+            return self._method_index
+
+    @property
+    def call_graph(self) -> CallGraph:
+        with self._lock:
+            if self._call_graph is None:
+                self._call_graph = CallGraph(self)
+            return self._call_graph
+
+    def stamp(self, rel_path: str) -> Optional[Tuple[int, int]]:
+        return self._stamps.get(rel_path)
+
+    def source(self, rel_path: str) -> str:
+        """File contents, re-read only when the indexed file has changed."""
+        with self._lock:
+            stamp = self._stamps.get(rel_path)
+            cached = self._sources.get(rel_path)
+            if cached is not None and stamp is not None and cached[0] == stamp:
+                return cached[1]
+        source = (self.workspace / rel_path).read_text(encoding='utf-8')
+        with self._lock:
+            if stamp is not None:
+                self._sources[rel_path] = (stamp, source)
+        return source
+
     def find_symbol(self, name: str) -> List[dict]:
         """Find all occurrences of a symbol."""
         results = []
@@ -136,3 +267,28 @@ class WorkspaceIndex:
                 if sym["name"] == name:
                     results.append({"filePath": file_path, **sym})
         return results
+
+    def _load(self):
+        self._loaded = True
+        try:
+            data = json.loads(self._cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        for rel_path, entry in data.get("files", {}).items():
+            self._stamps[rel_path] = (entry["mtime_ns"], entry["size"])
+            self.symbols[rel_path] = entry["symbols"]
+
+    def _save(self):
+        files = {
+            rel_path: {"mtime_ns": self._stamps[rel_path][0], "size": self._stamps[rel_path][1], "symbols": symbols}
+            for rel_path, symbols in self.symbols.items() if rel_path in self._stamps
+        }
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self._cache_path.with_suffix('.json.tmp')
+            temp_path.write_text(json.dumps({"version": INDEX_VERSION, "files": files}, separators=(',', ':')), encoding='utf-8')
+            os.replace(temp_path, self._cache_path)
+        except OSError:
+            pass
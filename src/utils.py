@@ -1,15 +1,34 @@
 from pathlib import Path
+import contextlib
 import json
+import os
 import sys
-import ast
 import re
-from typing import Dict, Any, Optional, List
+import threading
+from typing import Dict, Any, Iterator, Optional, List, IO
 
 def read_json_file(file_path: Path) -> Dict[str, Any]:
     if not file_path.exists():
         raise FileNotFoundError(f'File not found: {file_path}')
     return json.loads(file_path.read_text(encoding='utf-8-sig'))
 
+@contextlib.contextmanager
+def atomic_write(path: Path, mode: str = 'w', encoding: str = 'utf-8') -> Iterator[IO]:
+    """Write through a temp file next to path and swap it in, so readers never see a partial file.
+
+    The temp name is unique per process and thread, so concurrent writers of one path cannot share it.
+    """
+    path = Path(path)
+    temp_path = path.with_name(f'.{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    try:
+        with open(temp_path, mode, encoding=None if 'b' in mode else encoding) as f:
+            yield f
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            temp_path.unlink()
+        raise
+
 def sanitize_json_string(text: str) -> str:
     """Remove invalid control characters from a string before JSON serialization.
     
@@ -295,78 +314,39 @@ def build_test_method_link(test_file: str, test_method: str, workspace_directory
             file_uri = link_builder.get_file_uri(str(actual_file_path), line_number)
             return f" | [Test]({file_uri})"
 
-def _find_ast_node_line(file_path: Path, node_name: str, node_type: type) -> Optional[int]:
-    """Generic helper to find AST node line number by name and type.
-    
-    Args:
-        file_path: Path to Python file to parse
-        node_name: Name of the node to find
-        node_type: Type of AST node to look for (ast.ClassDef, ast.FunctionDef, etc.)
-        
-    Returns:
-        Line number where node is defined, or None if not found
-    """
-    if not file_path.exists() or not node_name or node_name == '?':
-        return None
-    try:
-        content = file_path.read_text(encoding='utf-8')
-        tree = ast.parse(content, filename=str(file_path))
-        for node in ast.walk(tree):
-            if isinstance(node, node_type) and node.name == node_name:
-                return node.lineno
-    except SyntaxError:
-        return None
-    except Exception:
-        return None
-    return None
+def _test_file_index():
+    from scope.test_file_index import TestFileIndex
+    return TestFileIndex.shared()
 
 def find_test_class_line(test_file_path: Path, test_class_name: str) -> Optional[int]:
     """Find line number where a test class is defined."""
-    return _find_ast_node_line(test_file_path, test_class_name, ast.ClassDef)
+    if not test_class_name or test_class_name == '?':
+        return None
+    return _test_file_index().class_line(test_file_path, test_class_name, javascript=False)
 
 def find_test_method_line(test_file_path: Path, test_method_name: str) -> Optional[int]:
     """Find line number where a test method/function is defined."""
-    return _find_ast_node_line(test_file_path, test_method_name, ast.FunctionDef)
-
-import re
+    if not test_method_name or test_method_name == '?':
+        return None
+    return _test_file_index().method_line(test_file_path, test_method_name, javascript=False)
 
 def find_js_test_class_line(test_file_path: Path, test_class_name: str) -> Optional[int]:
     """Find line number where a JavaScript test class is defined.
     
     Looks for patterns like: test('TestClassName', ...)
     """
-    if not test_file_path.exists() or not test_class_name or test_class_name == '?':
+    if not test_class_name or test_class_name == '?':
         return None
-    try:
-        content = test_file_path.read_text(encoding='utf-8')
-        lines = content.split('\n')
-        # Look for test('TestClassName', ...) pattern
-        pattern = re.compile(rf"test\s*\(\s*['\"]({re.escape(test_class_name)})['\"]")
-        for i, line in enumerate(lines, 1):
-            if pattern.search(line):
-                return i
-    except Exception:
-        return None
-    return None
+    return _test_file_index().class_line(test_file_path, test_class_name, javascript=True)
 
 def find_js_test_method_line(test_file_path: Path, test_method_name: str) -> Optional[int]:
     """Find line number where a JavaScript test method is defined.
     
     Looks for patterns like: await t.test('test_method_name', ...) or t.test('test_method_name', ...)
     """
-    if not test_file_path.exists() or not test_method_name or test_method_name == '?':
+    if not test_method_name or test_method_name == '?':
         return None
-    try:
-        content = test_file_path.read_text(encoding='utf-8')
-        lines = content.split('\n')
-        # Look for t.test('test_method_name', ...) or await t.test('test_method_name', ...) pattern
-        pattern = re.compile(rf"(?:await\s+)?t\.test\s*\(\s*['\"]({re.escape(test_method_name)})['\"]")
-        for i, line in enumerate(lines, 1):
-            if pattern.search(line):
-                return i
-    except Exception:
-        return None
-    return None
+    return _test_file_index().method_line(test_file_path, test_method_name, javascript=True)
 
 def get_js_test_file_path(py_test_file_path: Path) -> Optional[Path]:
     """Get the corresponding JavaScript test file for a Python test file.
@@ -469,29 +449,4 @@ def find_matching_test_files(
     Returns:
         List of paths relative to test_dir (e.g. ['invoke_bot/perform_action/test_some_sub_epic.py', ...]).
     """
-    if not pattern:
-        return []
-    search_dir = test_dir / under_path if under_path else test_dir
-    if not search_dir.exists() or not search_dir.is_dir():
-        return []
-    seen_stems = set()
-    result: List[str] = []
-    # When under_path is set, search only that directory; else search recursively under test_dir
-    for ext in TEST_FILE_EXTENSIONS:
-        iterator = search_dir.glob(f'*{ext}') if under_path else search_dir.rglob(f'*{ext}')
-        for path in iterator:
-            if not path.is_file():
-                continue
-            stem = path.stem
-            if not stem.startswith(pattern):
-                continue
-            # Prefer one file per stem (e.g. .py over .pyc) and avoid duplicates
-            rel = path.relative_to(test_dir)
-            rel_str = str(rel).replace('\\', '/')
-            if rel_str in seen_stems:
-                continue
-            seen_stems.add(rel_str)
-            result.append(rel_str)
-    # Sort for stable order (e.g. .py first, then .js)
-    result.sort()
-    return result
\ No newline at end of file
+    return _test_file_index().find_matching(test_dir, pattern, TEST_FILE_EXTENSIONS, under_path)
\ No newline at end of file
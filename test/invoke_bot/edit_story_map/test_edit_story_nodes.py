@@ -363,6 +363,76 @@ class TestNavigateStoryGraph:
         # Then: Scenario map location is correct
         helper.story.assert_map_location_matches(scenario)
 
+    def test_lazy_story_map_builds_children_on_first_access(self, tmp_path):
+        """
+        SCENARIO: Lazy story map builds children on first access
+        GIVEN: Story graph with two epics
+        WHEN: The bot's story map is loaded and one story is renamed
+        THEN: Only the epic, sub-epic and story that were visited have built children
+        AND: The untouched epic is written back from its original dict
+        """
+        import json
+        helper = BotTestHelper(tmp_path)
+        untouched_epic = {'name': 'Billing', 'notes': 'kept as written', 'sub_epics': [
+            {'name': 'Invoices', 'sequential_order': 0, 'story_groups': [{'type': 'and', 'stories': [
+                {'name': 'Send Invoice', 'sequential_order': 0}]}]}]}
+        graph_path = helper.story.create_story_graph({'epics': [
+            {'name': 'Orders', 'sub_epics': [{'name': 'Checkout', 'sequential_order': 0, 'story_groups': [
+                {'type': 'and', 'stories': [{'name': 'Pay Order', 'sequential_order': 0,
+                                             'scenarios': [{'name': 'Pays by card', 'steps': 'Given a cart'}]}]}]}]},
+            untouched_epic,
+        ]})
+        story_map = helper.story.bot.story_map
+        orders, billing = list(story_map.epics)
+        assert not orders.is_materialized and not billing.is_materialized
+
+        # When: One story is reached by path and renamed
+        story = orders['Checkout']['Pay Order']
+        assert orders.is_materialized and not story.is_materialized
+        assert [scenario.name for scenario in story.scenarios] == ['Pays by card']
+        story.rename('Pay For Order')
+
+        # Then: Only the visited path has built children
+        assert not billing.is_materialized
+
+        # And: The untouched epic is written back from its original dict
+        saved = json.loads(Path(graph_path).read_text(encoding='utf-8'))
+        assert saved['epics'][0]['sub_epics'][0]['story_groups'][0]['stories'][0]['name'] == 'Pay For Order'
+        assert saved['epics'][1]['sub_epics'] == untouched_epic['sub_epics']
+
+    def test_lazy_story_map_finds_a_story_by_name_building_only_its_path(self, tmp_path):
+        """
+        SCENARIO: Finding a story by name builds only the path to it
+        GIVEN: Story graph with two epics
+        WHEN: A story in the first epic is found by name
+        THEN: The story is returned from its sub-epic
+        AND: The other epic has not built its children
+        AND: A renamed story is found under its new name
+        """
+        helper = BotTestHelper(tmp_path)
+        helper.story.create_story_graph({'epics': [
+            {'name': 'Orders', 'sub_epics': [{'name': 'Checkout', 'sequential_order': 0, 'story_groups': [
+                {'type': 'and', 'stories': [{'name': 'Pay Order', 'sequential_order': 0}]}]}]},
+            {'name': 'Billing', 'sub_epics': [{'name': 'Invoices', 'sequential_order': 0, 'story_groups': [
+                {'type': 'and', 'stories': [{'name': 'Send Invoice', 'sequential_order': 0}]}]}]},
+        ]})
+        story_map = helper.story.bot.story_map
+        orders, billing = list(story_map.epics)
+
+        # When: A story in the first epic is found by name
+        story = story_map.find_story_by_name('Pay Order')
+
+        # Then: The story is returned from its sub-epic
+        assert story.name == 'Pay Order' and story._parent._parent is orders['Checkout']
+
+        # And: The other epic has not built its children
+        assert not billing.is_materialized and not story.is_materialized
+
+        # And: A renamed story is found under its new name
+        story.rename('Pay For Order')
+        assert story_map.find_story_by_name('Pay Order') is None
+        assert story_map.find_story_by_name('Pay For Order') is story
+
 # ============================================================================
 # DOMAIN TESTS - Core Story Graph Editing Logic
 # ============================================================================
@@ -1344,6 +1414,84 @@ from helpers.bot_test_helper import BotTestHelper
         assert 'def test_story_map_loads_epics(self, tmp_path):' in target_file_content
         assert 'def test_epic_has_sub_epics(self, tmp_path):' in target_file_content
 
+class TestLookUpStoryNodes:
+    """Tests for StoryMap lookups served from its node indexes."""
+
+    @staticmethod
+    def _create_orders_graph(helper):
+        helper.story.create_story_graph({'epics': [{'name': 'Orders', 'sub_epics': [
+            {'name': 'Checkout', 'sequential_order': 0, 'story_groups': [{'type': 'and', 'stories': [
+                {'name': 'Pay Order', 'sequential_order': 0, 'test_class': 'TestPayOrder',
+                 'scenarios': [{'name': 'Pays by card', 'test_method': 'test_pays_by_card'}]}]}]},
+            {'name': 'Returns', 'sequential_order': 1, 'story_groups': [{'type': 'and', 'stories': [
+                {'name': 'Refund Order', 'sequential_order': 0, 'scenarios': []}]}]},
+        ]}]})
+        return helper.story.bot.story_graph
+
+    def test_lookups_follow_create_rename_move_and_delete(self, tmp_path):
+        """
+        SCENARIO: Lookups follow create, rename, move and delete
+        GIVEN: Story map with stories linked to test classes and methods
+        WHEN: Nodes are created, renamed, moved and deleted
+        THEN: Name, type, parent and test lookups reflect every edit
+        AND: The index consistency check finds no problems after each edit
+        """
+        helper = BotTestHelper(tmp_path)
+        story_map = self._create_orders_graph(helper)
+        checkout = story_map.find_node('Checkout')
+        returns = story_map.find_node('Returns')
+        assert story_map.check_indexes() == []
+        assert story_map.find_story_by_name('Pay Order').test_class == 'TestPayOrder'
+        assert [s.name for s in story_map.find_stories_by_test_class('TestPayOrder')] == ['Pay Order']
+        assert [s.name for s in story_map.find_scenarios_by_test_method('test_pays_by_card')] == ['Pays by card']
+
+        # When: A story is created and given a test class
+        story = checkout.create_story(name='Split Order')
+        story.test_class = 'TestSplitOrder'
+        story.save()
+        assert story_map.find_stories_by_test_class('TestSplitOrder') == [story]
+        assert [s.name for s in story_map.all_stories] == ['Pay Order', 'Split Order', 'Refund Order']
+        assert story_map.check_indexes() == []
+
+        # When: The story is renamed
+        story.rename('Split Payment')
+        assert story_map.find_node('Split Order') is None
+        assert story_map.find_story_by_name('Split Payment') is story
+        assert story_map.check_indexes() == []
+
+        # When: The story is moved to another sub-epic
+        story.move_to(returns)
+        assert story_map.parent_of(story) is story._parent
+        assert story._parent._parent is returns
+        assert [s.name for s in story_map.all_stories] == ['Pay Order', 'Refund Order', 'Split Payment']
+        assert story_map.check_indexes() == []
+
+        # When: The story is deleted
+        story.delete()
+        assert story_map.find_story_by_name('Split Payment') is None
+        assert story_map.find_stories_by_test_class('TestSplitOrder') == []
+        assert story_map.check_indexes() == []
+
+    def test_consistency_check_reports_edits_that_bypass_the_index(self, tmp_path):
+        """
+        SCENARIO: Consistency check reports edits that bypass the index
+        GIVEN: Story map loaded with its node indexes
+        WHEN: A story is attached directly to a story group's children
+        THEN: The consistency check reports the missing node
+        """
+        from story_graph.nodes import Story as StoryNode
+
+        helper = BotTestHelper(tmp_path)
+        story_map = self._create_orders_graph(helper)
+        story_map.get_all_nodes()
+        story_group = story_map.find_story_by_name('Refund Order')._parent
+
+        story_group._children.append(StoryNode(name='Unindexed', sequential_order=1.0, _parent=story_group))
+
+        problems = story_map.check_indexes()
+        assert any('Unindexed' in problem for problem in problems)
+
+
 class TestCreateEpic:
     """
     Story: Create Epic at Root Level Using CLI
@@ -2401,6 +2549,75 @@ class TestSaveStoryMapPreservesDomainConcepts:
             context_path="TestEpic"
         )
 
+    def test_save_rewrites_only_edited_epics_and_keeps_map_in_memory(self, tmp_path):
+        """
+        SCENARIO: Save rewrites only edited epics and keeps the map in memory
+        GIVEN: Story graph with two epics whose stories were both visited
+        WHEN: A story in one epic is moved to the other epic's sub-epic
+        THEN: Both epics are re-serialized while a third untouched epic keeps its original dict
+        AND: The file is replaced without leaving a temp file behind
+        AND: The bot keeps serving the same in-memory story map
+        """
+        import json
+        helper = BotTestHelper(tmp_path)
+        untouched_epic = {'name': 'Billing', 'notes': 'kept as written', 'sub_epics': []}
+        graph_path = helper.story.create_story_graph({'epics': [
+            {'name': 'Orders', 'sub_epics': [{'name': 'Checkout', 'sequential_order': 0, 'story_groups': [
+                {'type': 'and', 'stories': [{'name': 'Pay Order', 'sequential_order': 0}]}]}]},
+            {'name': 'Returns', 'sub_epics': [{'name': 'Refunds', 'sequential_order': 0, 'story_groups': [
+                {'type': 'and', 'stories': [{'name': 'Refund Order', 'sequential_order': 0}]}]}]},
+            untouched_epic,
+        ]})
+        story_map = helper.bot.story_map
+        assert [story.name for story in story_map.all_stories] == ['Pay Order', 'Refund Order']
+
+        # When: A story moves across epics
+        story_map.find_story_by_name('Pay Order').move_to(story_map.find_node('Refunds'))
+
+        # Then: Both edited epics are re-serialized, the untouched one is written as loaded
+        saved = json.loads(Path(graph_path).read_text(encoding='utf-8'))
+        orders, returns, billing = saved['epics']
+        assert orders['sub_epics'][0]['story_groups'] == []
+        assert [story['name'] for story in returns['sub_epics'][0]['story_groups'][0]['stories']] == ['Refund Order', 'Pay Order']
+        assert billing == untouched_epic
+
+        # And: No temp file is left next to the graph
+        assert [path.name for path in Path(graph_path).parent.iterdir()] == [Path(graph_path).name]
+
+        # And: The bot keeps serving the same in-memory map
+        assert helper.bot.story_map is story_map
+        assert story_map.check_indexes() == []
+
+    def test_save_interrupted_mid_write_keeps_the_previous_graph(self, tmp_path):
+        """
+        SCENARIO: A save interrupted mid-write keeps the previous graph
+        GIVEN: A saved story graph
+        WHEN: Writing the renamed graph fails part way through
+        THEN: The graph file still holds the previous content
+        AND: No temp file is left next to the graph
+        """
+        from unittest.mock import patch
+        helper = BotTestHelper(tmp_path)
+        graph_path = Path(helper.story.create_story_graph({'epics': [
+            {'name': 'Orders', 'sub_epics': [{'name': 'Checkout', 'sequential_order': 0, 'story_groups': [
+                {'type': 'and', 'stories': [{'name': 'Pay Order', 'sequential_order': 0}]}]}]},
+        ]}))
+        previous = graph_path.read_text(encoding='utf-8')
+        story = helper.bot.story_map.find_story_by_name('Pay Order')
+
+        # When: Writing the renamed graph fails part way through
+        def interrupted_dump(data, f, **kwargs):
+            f.write('{"epics": [')
+            raise OSError('disk full')
+        with patch('story_graph.nodes.json.dump', side_effect=interrupted_dump), pytest.raises(OSError):
+            story.rename('Pay For Order')
+
+        # Then: The graph file still holds the previous content
+        assert graph_path.read_text(encoding='utf-8') == previous
+
+        # And: No temp file is left next to the graph
+        assert [path.name for path in graph_path.parent.iterdir()] == [graph_path.name]
+
 # ============================================================================
 # CLI TESTS - Scope Operations via CLI Commands
 # ============================================================================
\ No newline at end of file
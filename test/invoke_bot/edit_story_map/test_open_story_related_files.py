@@ -259,7 +259,71 @@ class TestOpenAllRelatedFiles:
         
         for file_info in result['files']:
             helper.story.assert_file_exists(file_info['file'], "Test file")
-    
+
+    def test_js_test_links_keep_apostrophes_in_double_quoted_names(self, tmp_path):
+        """
+        SCENARIO: JS test names quoted with one kind of quote may contain the other
+        GIVEN: A JS test file whose test names contain apostrophes inside double quotes
+        WHEN: The class and method lines are looked up by their full names
+        THEN: Each name is found on its own line
+        """
+        from utils import find_js_test_class_line, find_js_test_method_line
+        # GIVEN: a JS test file with apostrophes in double-quoted names
+        js_file = tmp_path / 'test_order_panel.js'
+        js_file.write_text('test("Order\'s panel", async (t) => {\n  await t.test("it\'s rendered", () => {});\n'
+                           '  await t.test(\'shows "total"\', () => {});\n});\n', encoding='utf-8')
+
+        # WHEN / THEN: each full name is found on its line
+        assert find_js_test_class_line(js_file, "Order's panel") == 1
+        assert find_js_test_method_line(js_file, "it's rendered") == 2
+        assert find_js_test_method_line(js_file, 'shows "total"') == 3
+
+    def test_test_links_parse_each_test_file_once_until_it_changes(self, tmp_path):
+        """
+        SCENARIO: Test links reuse one parse per test file until the file changes
+        GIVEN: Python and JS test files for a sub-epic
+        WHEN: Test files are discovered and class / method lines are looked up repeatedly
+        THEN: Each directory is listed and each file parsed once, and a changed file is parsed again
+        """
+        import os
+        from utils import (find_matching_test_files, find_test_class_line, find_test_method_line,
+                           find_js_test_method_line)
+        from scope.test_file_index import TestFileIndex
+        helper = BotTestHelper(tmp_path)
+        # GIVEN: a Python test file and its JS counterpart
+        py_file = helper.story.create_test_file(
+            'invoke_bot/edit_story_map/test_open_story_related_files.py',
+            'TestOpenAllRelatedFiles',
+            ['test_opens_graph', 'test_opens_stories']
+        )
+        js_file = py_file.with_suffix('.js')
+        js_file.write_text("test('TestOpenAllRelatedFiles', async (t) => {\n  await t.test('test_opens_panel', () => {});\n});\n", encoding='utf-8')
+        test_dir = helper.workspace / 'test'
+        index = TestFileIndex.shared()
+        before = index.stats
+
+        # WHEN: every story / scenario looks its test up
+        for _ in range(5):
+            matching = find_matching_test_files(test_dir, 'test_open_story_related')
+            assert find_test_class_line(py_file, 'TestOpenAllRelatedFiles') == 1
+            assert find_test_method_line(py_file, 'test_opens_stories') == 4
+            assert find_js_test_method_line(js_file, 'test_opens_panel') == 2
+        # THEN: one listing per directory and one parse per file
+        after = index.stats
+        assert matching == ['invoke_bot/edit_story_map/test_open_story_related_files.js',
+                            'invoke_bot/edit_story_map/test_open_story_related_files.py']
+        assert after['parses'] - before['parses'] == 2
+        assert after['listings'] - before['listings'] == 3
+
+        # WHEN: the Python test file changes
+        py_file.write_text("import pytest\n\nclass TestOpenAllRelatedFiles:\n    pass\n", encoding='utf-8')
+        stat = py_file.stat()
+        os.utime(py_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        # THEN: it is parsed again
+        assert find_test_class_line(py_file, 'TestOpenAllRelatedFiles') == 3
+        assert find_test_method_line(py_file, 'test_opens_stories') is None
+        assert index.stats['parses'] - after['parses'] == 1
+
     def test_graph_button_opens_story_graph_with_selected_node_expanded(self, tmp_path):
         """
         SCENARIO: Graph button opens story graph with selected node expanded
@@ -1486,7 +1550,138 @@ class TestEnrichScopeWithLinks:
                 helper.story.assert_file_exists(file_path, "Test file in link")
         else:
             assert len(test_links) == 0, f"Story should not have test link with sub_epic test_file={sub_epic_test_file}, story test_class={story_test_class}"
-    
+
+    def test_enriched_content_is_cached_until_graph_or_test_files_change(self, tmp_path):
+        """
+        SCENARIO: Panel reuses enriched content until one of its inputs changes
+        GIVEN: Story graph whose sub-epic names a test file that does not exist yet
+        WHEN: Scope is serialized twice, then again from a cold process, then after the test file is created
+        THEN: Repeat calls are served from memory / disk and the new test file invalidates the cache
+        """
+        from scope.json_scope import JSONScope
+        from scope import Scope, ScopeType
+        from scope import enriched_graph_cache
+
+        helper = BotTestHelper(tmp_path)
+        helper.story.create_story_graph({
+            'epics': [{
+                'name': 'Work With Story Map',
+                'sub_epics': [{
+                    'name': 'Open Story Related Files',
+                    'sequential_order': 1.0,
+                    'test_file': 'test_story.py',
+                    'story_groups': [{
+                        'type': 'and',
+                        'stories': [{'name': 'Open All Related Files', 'test_class': 'TestMyStory', 'sequential_order': 1.0}]
+                    }]
+                }]
+            }]
+        })
+        scope = Scope(workspace_directory=helper.workspace, bot_paths=helper.bot.bot_paths)
+        scope.filter(type=ScopeType.SHOW_ALL)
+        stats = enriched_graph_cache.stats
+
+        def story_test_links():
+            before = dict(stats)
+            result = JSONScope(scope).to_dict()
+            story = result['content']['epics'][0]['sub_epics'][0]['story_groups'][0]['stories'][0]
+            links = [link for link in story.get('links', []) if link['icon'] == 'test_tube']
+            return links, {k: stats[k] - before[k] for k in stats}
+
+        links, delta = story_test_links()
+        assert links == [] and delta['misses'] == 1
+        assert helper.bot.bot_paths.story_graph_paths.story_graph_cache_path.exists()
+
+        links, delta = story_test_links()
+        assert links == [] and delta['memory_hits'] == 1 and delta['misses'] == 0
+
+        enriched_graph_cache.clear_memory()
+        links, delta = story_test_links()
+        assert links == [] and delta['disk_hits'] == 1 and delta['misses'] == 0
+
+        helper.story.create_test_file('test_story.py', 'TestMyStory', ['test_scenario'])
+        links, delta = story_test_links()
+        assert delta['misses'] == 1
+        assert len(links) == 1 and 'test_story.py' in links[0]['url']
+
+    def test_filtered_scope_cache_key_does_not_serialize_the_graph(self, tmp_path):
+        """
+        SCENARIO: A filtered scope is keyed by the graph file and the filter
+        GIVEN: Story graph with two stories and a scope filtered to one of them
+        WHEN: The scope is serialized twice
+        THEN: The second call is served from memory
+        AND: No cache key serialized the filtered graph content
+        """
+        from unittest.mock import patch
+        from scope.json_scope import JSONScope
+        from scope import Scope, ScopeType
+        from scope import enriched_graph_cache
+
+        # GIVEN: Story graph with two stories and a scope filtered to one of them
+        helper = BotTestHelper(tmp_path)
+        helper.story.create_story_graph({'epics': [{'name': 'Work With Story Map', 'sub_epics': [{
+            'name': 'Open Story Related Files', 'sequential_order': 1.0, 'story_groups': [{'type': 'and', 'stories': [
+                {'name': 'Open All Related Files', 'sequential_order': 1.0},
+                {'name': 'Open Story File', 'sequential_order': 2.0}]}]}]}]})
+        scope = Scope(workspace_directory=helper.workspace, bot_paths=helper.bot.bot_paths)
+        scope.filter(type=ScopeType.STORY, value=['Open Story File'])
+        enriched_graph_cache.clear_memory()
+        stats = enriched_graph_cache.stats
+        before = dict(stats)
+
+        # WHEN: The scope is serialized twice
+        with patch('scope.enriched_graph_cache.json.dumps', wraps=enriched_graph_cache.json.dumps) as dumps:
+            JSONScope(scope).to_dict()
+            JSONScope(scope).to_dict()
+
+        # THEN: The second call is served from memory
+        assert stats['memory_hits'] - before['memory_hits'] == 1
+
+        # AND: No cache key serialized the filtered graph content (the one dump stores the enriched miss)
+        graph_dumps = [call for call in dumps.call_args_list if isinstance(call.args[0], dict) and 'epics' in call.args[0]]
+        assert len(graph_dumps) == 1
+        enriched_graph_cache.clear_memory()
+
+    def test_story_graph_is_parsed_once_until_it_is_saved(self, tmp_path):
+        """
+        SCENARIO: Scope, bot and scanners share one parsed story graph
+        GIVEN: Story graph in the workspace
+        WHEN: Scope is serialized twice and the bot's story map is loaded, then the map is saved
+        THEN: The file is parsed once until the save invalidates it
+              Readers get a read-only view while the story map edits a private copy
+        """
+        from scope.json_scope import JSONScope
+        from scope import Scope, ScopeType
+        from story_graph.story_graph_store import StoryGraphStore
+
+        helper = BotTestHelper(tmp_path)
+        helper.story.create_story_graph({
+            'epics': [{'name': 'Work With Story Map', 'sub_epics': [
+                {'name': 'Open Story Related Files', 'sequential_order': 1.0, 'story_groups': []}]}]
+        })
+        graph_path = helper.bot.bot_paths.story_graph_paths.story_graph_path
+        store = StoryGraphStore.shared()
+        helper.bot.reload_story_graph()
+        scope = Scope(workspace_directory=helper.workspace, bot_paths=helper.bot.bot_paths)
+        scope.filter(type=ScopeType.SHOW_ALL)
+        before = store.stats
+
+        JSONScope(scope).to_dict()
+        JSONScope(scope).to_dict()
+        story_map = helper.bot.story_map
+        delta = {key: value - before[key] for key, value in store.stats.items()}
+        assert delta['parses'] == 1 and delta['hits'] == 2 and delta['copies'] == 1
+
+        view = store.load(graph_path)
+        with pytest.raises(TypeError):
+            view['epics'][0]['name'] = 'Renamed'
+        assert story_map.story_graph is not view
+
+        story_map.save()
+        before = store.stats
+        JSONScope(scope).to_dict()
+        assert store.stats['parses'] - before['parses'] == 1
+
     @pytest.mark.parametrize('include_level', ['tests', 'code'])
     def test_scenario_serialization_includes_trace_when_include_level_tests_or_code(self, tmp_path, include_level):
         """
@@ -1557,7 +1752,138 @@ class TestTraceScenario:
         assert 'trace' in scenario, f"Scenario should have trace when include_level='{include_level}'"
         # Trace may be empty list if no resolvable calls, or have sections
         assert isinstance(scenario['trace'], list), "Trace should be a list"
-    
+
+    def test_trace_generators_share_one_workspace_index(self, tmp_path):
+        """
+        SCENARIO: Trace generators share one workspace method index
+        GIVEN: Source and test files in the workspace
+        WHEN: Two trace generators build their method index
+        THEN: Every file is indexed once and both see the same methods
+        AND: After one file changes only that file is re-indexed
+        AND: A fresh session loads the persisted index without re-parsing
+        """
+        from traceability.trace_generator import TraceGenerator, TRACE_ROOTS
+        from traceability.workspace_index import WorkspaceIndex
+
+        # GIVEN: Source and test files in the workspace
+        workspace = tmp_path / 'workspace'
+        (workspace / 'src').mkdir(parents=True)
+        (workspace / 'test').mkdir(parents=True)
+        order_file = workspace / 'src' / 'order.py'
+        order_file.write_text('class Order:\n    def total(self):\n        return 1\n', encoding='utf-8')
+        (workspace / 'test' / 'test_order.py').write_text('class TestOrder:\n    def test_total(self):\n        Order().total()\n', encoding='utf-8')
+        WorkspaceIndex.clear_shared()
+
+        # WHEN: Two trace generators build their method index
+        first = TraceGenerator(workspace)
+        first._build_method_index()
+        second = TraceGenerator(workspace)
+        second._build_method_index()
+
+        # THEN: Every file is indexed once and both see the same methods
+        index = WorkspaceIndex.shared(workspace, TRACE_ROOTS)
+        assert index.reindexed_files == 2
+        assert second._method_index is first._method_index
+        assert first._method_index['total'] == [{'class': 'Order', 'file': 'src/order.py', 'line': 2, 'end_line': 3}]
+
+        # AND: After one file changes only that file is re-indexed
+        order_file.write_text('class Order:\n    def total(self):\n        return 1\n\n    def tax(self):\n        return 0\n', encoding='utf-8')
+        third = TraceGenerator(workspace)
+        third._build_method_index()
+        assert index.reindexed_files == 3
+        assert 'tax' in third._method_index
+
+        # AND: A fresh session loads the persisted index without re-parsing
+        WorkspaceIndex.clear_shared()
+        assert WorkspaceIndex.shared(workspace, TRACE_ROOTS).reindexed_files == 0
+        WorkspaceIndex.clear_shared()
+
+    def test_trace_generators_in_one_operation_refresh_the_index_once(self, tmp_path):
+        """
+        SCENARIO: One operation refreshes the shared workspace index once
+        GIVEN: Source and test files in the workspace
+        WHEN: Three trace generators build their method index inside one operation
+        THEN: The shared index is refreshed once
+        AND: A generator after the operation refreshes it again
+        """
+        from unittest.mock import patch
+        from traceability.trace_generator import TraceGenerator
+        from traceability.workspace_index import WorkspaceIndex
+
+        # GIVEN: Source and test files in the workspace
+        workspace = tmp_path / 'workspace'
+        (workspace / 'src').mkdir(parents=True)
+        (workspace / 'test').mkdir(parents=True)
+        (workspace / 'src' / 'order.py').write_text('class Order:\n    def total(self):\n        return 1\n', encoding='utf-8')
+        (workspace / 'test' / 'test_order.py').write_text('class TestOrder:\n    def test_total(self):\n        Order().total()\n', encoding='utf-8')
+        WorkspaceIndex.clear_shared()
+
+        with patch.object(WorkspaceIndex, 'refresh', autospec=True, side_effect=WorkspaceIndex.refresh) as refresh:
+            # WHEN: Three trace generators build their method index inside one operation
+            with WorkspaceIndex.operation():
+                for _ in range(3):
+                    TraceGenerator(workspace)._build_method_index()
+
+            # THEN: The shared index is refreshed once
+            assert refresh.call_count == 1
+
+            # AND: A generator after the operation refreshes it again
+            TraceGenerator(workspace)._build_method_index()
+            assert refresh.call_count == 2
+        WorkspaceIndex.clear_shared()
+
+    def test_trace_call_resolution_parses_each_file_once(self, tmp_path):
+        """
+        SCENARIO: Trace call resolution parses each file once
+        GIVEN: A constructor that calls methods defined across two source files
+        WHEN: Two trace generators resolve the same call
+        THEN: Both produce the same call tree
+        AND: The expanded source file is parsed once for the whole session
+        AND: After a file changes its calls are re-read
+        """
+        from traceability.trace_generator import TraceGenerator, TRACE_ROOTS
+        from traceability.workspace_index import WorkspaceIndex
+
+        # GIVEN: A constructor that calls methods defined across two source files
+        workspace = tmp_path / 'workspace'
+        (workspace / 'src').mkdir(parents=True)
+        order_file = workspace / 'src' / 'order.py'
+        order_file.write_text(
+            'class Order:\n    def __init__(self):\n        self.total()\n\n'
+            '    def total(self):\n        return compute_tax()\n',
+            encoding='utf-8')
+        (workspace / 'src' / 'tax.py').write_text('def compute_tax():\n    return 0\n', encoding='utf-8')
+        WorkspaceIndex.clear_shared()
+
+        # WHEN: Two trace generators resolve the same call
+        traces = []
+        for _ in range(2):
+            generator = TraceGenerator(workspace)
+            generator._build_method_index()
+            traces.append(generator._resolve_call({'type': 'function', 'name': 'Order'}, depth=1))
+
+        # THEN: Both produce the same call tree
+        assert traces[0] == traces[1]
+        total = traces[0][0]['children'][0]
+        assert total['symbol'] == 'Order.total'
+        assert total['children'][0]['symbol'] == 'compute_tax'
+
+        # AND: The expanded source file is parsed once for the whole session
+        call_graph = WorkspaceIndex.shared(workspace, TRACE_ROOTS).call_graph
+        assert call_graph.files_parsed == 1
+
+        # AND: After a file changes its calls are re-read
+        order_file.write_text(
+            'class Order:\n    def __init__(self):\n        self.total()\n\n'
+            '    def total(self):\n        return 1\n',
+            encoding='utf-8')
+        generator = TraceGenerator(workspace)
+        generator._build_method_index()
+        trace = generator._resolve_call({'type': 'function', 'name': 'Order'}, depth=1)
+        assert trace[0]['children'][0]['children'] == []
+        assert call_graph.files_parsed == 2
+        WorkspaceIndex.clear_shared()
+
     def test_scenario_with_test_method_gets_test_link(self, tmp_path):
         """
         SCENARIO: Scenario with test_method gets test link
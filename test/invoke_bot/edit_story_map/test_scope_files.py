@@ -195,6 +195,49 @@ class TestFilterScopeByFiles:
         assert Path('test/test_helpers.py') not in filtered_files
         assert Path('test/__pycache__/cached.pyc') not in filtered_files
 
+    def test_files_scope_prunes_ignored_directories_and_reuses_its_snapshot(self, tmp_path):
+        """
+        SCENARIO: Files scope discovery skips ignored directories and reuses the walk
+        GIVEN: A workspace with a .gitignore, node_modules and an excluded folder
+        WHEN: The files scope results are read twice, then a file is added
+        THEN: Ignored, dependency and excluded directories are never listed
+              Results are sorted by extension
+              The second read reuses the snapshot and the added file shows up after it
+        """
+        from scope import Scope, ScopeType
+        from scope.file_walker import FileWalker
+
+        # GIVEN: A workspace with ignored, dependency and excluded directories
+        for relative in ['src/app/main.py', 'src/app/view.js', 'src/build/generated.py',
+                         'src/node_modules/lib/index.js', 'src/legacy/old.py', 'src/app/debug.log']:
+            (tmp_path / relative).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / relative).write_text('', encoding='utf-8')
+        (tmp_path / '.gitignore').write_text('build/\n*.log\n', encoding='utf-8')
+        scope = Scope(tmp_path)
+        scope.filter(ScopeType.FILES, ['src/**/*'], exclude=['src/legacy'])
+        walker = FileWalker.shared()
+        before = walker.stats
+
+        # WHEN: Results are read twice
+        first = scope.results
+        scope.filter(ScopeType.FILES, ['src/**/*'], exclude=['src/legacy'])
+        second = scope.results
+
+        # THEN: Only the files nothing ignores, sorted by extension, from one walk
+        assert [p.relative_to(tmp_path).as_posix() for p in first] == ['src/app/view.js', 'src/app/main.py']
+        assert second == first
+        after = walker.stats
+        assert after['walks'] - before['walks'] == 1
+        assert after['snapshot_hits'] - before['snapshot_hits'] == 1
+
+        # WHEN: A file is added
+        (tmp_path / 'src' / 'app' / 'model.py').write_text('', encoding='utf-8')
+        scope.filter(ScopeType.FILES, ['src/**/*'], exclude=['src/legacy'])
+
+        # THEN: The changed directory is re-listed
+        assert [p.relative_to(tmp_path).as_posix() for p in scope.results] == [
+            'src/app/view.js', 'src/app/main.py', 'src/app/model.py']
+
 # ============================================================================
 # CLI TESTS - Scope Operations via CLI Commands
 # ============================================================================
@@ -180,6 +180,49 @@ class TestFilterScopeByStories:
         assert "Build Story Graph" not in story_names, "Unallocated story should be excluded"
         assert "Clarify Requirements" not in story_names, "Unallocated story should be excluded"
 
+    def test_multi_term_filter_uses_name_index_built_once_per_graph_version(self, tmp_path):
+        """
+        SCENARIO: Scope filters resolve names from an index that lives with the loaded graph
+        GIVEN: Story graph saved in the workspace and loaded through the story graph store
+        WHEN: Two multi-term filters run against it, then the graph is rewritten
+        THEN: Stories and scenarios matching any term keep their ancestors, siblings are pruned
+              The name index is built once for the loaded graph and again after the file changes
+        """
+        from scope.scope import StoryGraphFilter
+        from scope import story_name_index
+        from story_graph.story_graph_store import StoryGraphStore
+
+        helper = BotTestHelper(tmp_path)
+        helper.story.create_story_graph({'epics': [{
+            'name': 'Epic A',
+            'sub_epics': [{
+                'name': 'SubEpic A1',
+                'sequential_order': 1.0,
+                'story_groups': [{'type': 'and', 'stories': [
+                    {'name': 'Open Panel', 'sequential_order': 1.0, 'scenarios': [{'name': 'Panel shows status'}]},
+                    {'name': 'Close Panel', 'sequential_order': 2.0, 'scenarios': [{'name': 'User saves layout'}]},
+                    {'name': 'Render Diagram', 'sequential_order': 3.0, 'scenarios': []},
+                ]}],
+            }],
+        }]})
+        graph_path = helper.bot.bot_paths.story_graph_paths.story_graph_path
+        store = StoryGraphStore.shared()
+        builds = story_name_index.stats['builds']
+
+        filtered = StoryGraphFilter(search_terms=['open panel', 'SAVES LAYOUT']).filter_story_graph(store.load(graph_path))
+        StoryGraphFilter(search_terms=['Render']).filter_story_graph(store.load(graph_path))
+
+        stories = filtered['epics'][0]['sub_epics'][0]['story_groups'][0]['stories']
+        assert [story['name'] for story in stories] == ['Open Panel', 'Close Panel']
+        assert [scenario['name'] for scenario in stories[1]['scenarios']] == ['User saves layout']
+        assert story_name_index.stats['builds'] - builds == 1
+
+        helper.story.create_story_graph({'epics': [{'name': 'Epic B', 'sub_epics': []}]})
+        store.invalidate(graph_path)
+        filtered = StoryGraphFilter(search_terms=['Epic B']).filter_story_graph(store.load(graph_path))
+        assert [epic['name'] for epic in filtered['epics']] == ['Epic B']
+        assert story_name_index.stats['builds'] - builds == 2
+
 # ============================================================================
 # CLI TESTS - Scope Operations via CLI Commands
 # ============================================================================
@@ -143,4 +143,199 @@ class TestInitializeCLISession:
         
         # Then - Validate complete CLI response structure
         assert isinstance(cli_response.output, str)
-        helper.bot.assert_status_section_present(cli_response.output)
\ No newline at end of file
+        helper.bot.assert_status_section_present(cli_response.output)
+
+class TestServeFramedCLIRequests:
+    """
+    Story: Serve Framed CLI Requests
+
+    CLI-specific story: The panel's persistent process pipelines id-tagged frames
+    """
+
+    @staticmethod
+    def _serve(helper, messages):
+        import io
+        import threading
+        from cli.cli_daemon import CLIDaemon, encode_frame, read_frame
+
+        daemon = CLIDaemon(helper.cli_session)
+        cancel_seen = threading.Event()
+        executed = []
+        execute_command = helper.cli_session.execute_command
+        cancel = daemon.cancel
+
+        def gated_execute(command):
+            executed.append(command)
+            if command == 'shape':
+                assert cancel_seen.wait(10), 'cancel was not read while shape ran'
+            return execute_command(command)
+
+        def seen_cancel(request_id):
+            cancel(request_id)
+            cancel_seen.set()
+
+        helper.cli_session.execute_command = gated_execute
+        daemon.cancel = seen_cancel
+        output = io.BytesIO()
+        daemon.serve(io.BytesIO(b''.join(encode_frame(message) for message in messages)), output)
+
+        output.seek(0)
+        responses = []
+        while True:
+            frame = read_frame(output)
+            if frame is None:
+                return responses, executed
+            responses.append(frame[0])
+
+    def test_status_during_command_answers_from_state_before_command(self, tmp_path):
+        """
+        SCENARIO: Status refresh while a command changes the session
+        GIVEN: A framed CLI session whose status was queried
+        WHEN: A navigation command has changed the current behavior but not yet finished
+        AND: A status query arrives
+        THEN: The status is answered at once from the state before the command
+        AND: A status after the command reports the state it left
+        AND: Exit ends the session while the panel's input is still open
+        """
+        import os
+        import threading
+        from cli.cli_daemon import CLIDaemon, encode_frame, read_frame
+
+        # Given
+        helper = JsonBotTestHelper(tmp_path)
+        helper.domain.state.set_state('shape', 'build')
+        navigated, release = threading.Event(), threading.Event()
+        execute_command = helper.cli_session.execute_command
+
+        def gated_execute(command):
+            response = execute_command(command)
+            if command == 'exploration':
+                navigated.set()
+                assert release.wait(10), 'exploration was never released'
+            return response
+
+        helper.cli_session.execute_command = gated_execute
+        input_read, input_write = os.pipe()
+        output_read, output_write = os.pipe()
+        daemon = CLIDaemon(helper.cli_session)
+        server = threading.Thread(target=daemon.serve, args=(
+            os.fdopen(input_read, 'rb', buffering=0), os.fdopen(output_write, 'wb')), daemon=True)
+        server.start()
+        responses = os.fdopen(output_read, 'rb')
+
+        def request(message):
+            os.write(input_write, encode_frame(message))
+
+        def current_behavior(response):
+            return response['result']['bot']['current_behavior']
+
+        try:
+            request({'id': 1, 'command': 'status'})
+            assert current_behavior(read_frame(responses)[0]) == 'shape'
+
+            # When
+            request({'id': 2, 'command': 'exploration'})
+            assert navigated.wait(10)
+            request({'id': 3, 'command': 'status'})
+            during = read_frame(responses)[0]
+            release.set()
+            finished = read_frame(responses)[0]
+            request({'id': 4, 'command': 'status'})
+            after = read_frame(responses)[0]
+            request({'id': 5, 'command': 'exit'})
+            exited = read_frame(responses)[0]
+            server.join(10)
+
+            # Then
+            assert during['id'] == 3 and current_behavior(during) == 'shape'
+            assert finished['id'] == 2 and finished['status'] == 'ok'
+            assert after['id'] == 4 and current_behavior(after) == 'exploration'
+            assert exited['id'] == 5 and exited['status'] == 'ok'
+            assert not server.is_alive()
+            assert daemon.stats['snapshot_answers'] == 1
+        finally:
+            release.set()
+            os.close(input_write)
+            responses.close()
+
+    def test_cancelled_request_never_runs(self, tmp_path):
+        """
+        SCENARIO: Cancel a queued command
+        GIVEN: A framed CLI session running a slow command
+        WHEN: A queued command is cancelled before it starts
+        THEN: It is answered as cancelled and never executed
+        """
+        # Given
+        helper = JsonBotTestHelper(tmp_path)
+        helper.domain.state.set_state('shape', 'build')
+
+        # When
+        responses, executed = self._serve(helper, [
+            {'id': 1, 'command': 'shape'},
+            {'id': 2, 'command': 'exploration'},
+            {'id': 3, 'cancel': 2},
+            {'id': 4, 'command': 'status'},
+        ])
+
+        # Then
+        by_id = {response['id']: response for response in responses}
+        assert by_id[2] == {'id': 2, 'status': 'cancelled'}
+        assert by_id[1]['status'] == by_id[4]['status'] == 'ok'
+        assert 3 not in by_id
+        assert 'exploration' not in executed
+
+    def test_queries_share_the_session_and_requests_without_ids_are_answered(self, tmp_path):
+        """
+        SCENARIO: Read-only queries run side by side and every request is answered once
+        GIVEN: A framed CLI session
+        WHEN: A status query starts while a help query is still running
+        AND: Requests arrive with no id or with a repeated id
+        THEN: The status query ran before the help query finished
+        AND: Every request is answered, in compact frames built from the session's value
+        """
+        import io
+        import threading
+        from cli.cli_daemon import CLIDaemon, HEADER, encode_frame, read_frame
+
+        # Given
+        helper = JsonBotTestHelper(tmp_path)
+        helper.domain.state.set_state('shape', 'build')
+        status_started = threading.Event()
+        overlapped = []
+        execute_command = helper.cli_session.execute_command
+
+        def gated_execute(command):
+            if command == 'status':
+                status_started.set()
+            if command == 'help':
+                overlapped.append(status_started.wait(10))
+            return execute_command(command)
+
+        helper.cli_session.execute_command = gated_execute
+        daemon = CLIDaemon(helper.cli_session)
+
+        # When
+        output = io.BytesIO()
+        daemon.serve(io.BytesIO(b''.join(encode_frame(message) for message in [
+            {'command': 'help'},
+            {'command': 'status'},
+            {'id': 7, 'command': 'status'},
+            {'id': 7, 'command': 'status'},
+        ])), output)
+
+        # Then
+        assert overlapped == [True]
+        raw = output.getvalue()
+        payloads, offset = [], 0
+        while offset < len(raw):
+            length, _ = HEADER.unpack_from(raw, offset)
+            payloads.append(raw[offset + HEADER.size:offset + HEADER.size + length])
+            offset += HEADER.size + length
+        assert all(b'\n' not in payload for payload in payloads)
+        output.seek(0)
+        responses = [read_frame(output)[0] for _ in payloads]
+        assert sorted(str(response['id']) for response in responses) == ['7', '7', 'None', 'None']
+        assert all(response['status'] == 'ok' for response in responses)
+        statuses = [response['result'] for response in responses if 'bot' in response['result']]
+        assert len(statuses) == 3
+        assert all(status['bot']['current_behavior'] == 'shape' for status in statuses)
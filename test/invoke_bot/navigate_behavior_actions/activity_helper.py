@@ -1,42 +1,38 @@
 """
 Activity Test Helper
 Handles activity logging, tracking, timestamps
-
-NOTE: Activity tracking via TinyDB is currently DISABLED due to file corruption issues.
-These helper methods will return empty/no-op results when TinyDB is disabled.
 """
 import json
 from pathlib import Path
 from helpers.base_helper import BaseHelper
-
-# Check if TinyDB is available and enabled
-try:
-    from actions.activity_tracker import TINYDB_AVAILABLE
-except ImportError:
-    TINYDB_AVAILABLE = False
+from actions.activity_journal import ActivityJournal, JOURNAL_NAME
 
 
 class ActivityTestHelper(BaseHelper):
     """Helper for activity logging and tracking testing"""
     
+    @property
+    def log_file(self) -> Path:
+        return self.parent.workspace / JOURNAL_NAME
+    
+    def _read_entries(self, log_file: Path) -> list:
+        return ActivityJournal(log_file).entries()
+    
+    def _append_entries(self, log_file: Path, entries: list):
+        journal = ActivityJournal(log_file)
+        for entry in entries:
+            journal.append(entry)
+        journal.close()
+    
     def get_activity_log(self) -> list:
-        """Read and parse activity_log.json (TinyDB format)."""
-        if not TINYDB_AVAILABLE:
-            return []  # Activity tracking disabled
-        log_file = self.parent.workspace / 'activity_log.json'
-        if not log_file.exists():
-            return []
-        from tinydb import TinyDB
-        with TinyDB(log_file) as db:
-            return db.all()
+        """Read and parse the activity journal."""
+        return self._read_entries(self.log_file)
     
     def create_activity_log_file(self):
         """Create activity log file in workspace."""
-        if not TINYDB_AVAILABLE:
-            return None  # Activity tracking disabled
-        log_file = self.parent.workspace / 'activity_log.json'
+        log_file = self.log_file
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        log_file.write_text(json.dumps({'_default': {}}), encoding='utf-8')
+        log_file.touch()
         return log_file
     
     def create_activity_log_with_entries(self, entries: list = None):
@@ -51,21 +47,15 @@ class ActivityTestHelper(BaseHelper):
         log_file = self.create_activity_log_file()
         if entries is None:
             # Default: create multiple entries
-            from tinydb import TinyDB
-            with TinyDB(log_file) as db:
-                db.insert({'action_state': 'story_bot.shape.render', 'timestamp': '09:00'})
-                db.insert({'action_state': 'story_bot.exploration.render', 'timestamp': '10:00'})
-        elif entries:
-            from tinydb import TinyDB
-            with TinyDB(log_file) as db:
-                for entry in entries:
-                    db.insert(entry)
+            entries = [
+                {'action_state': 'story_bot.shape.render', 'timestamp': '09:00'},
+                {'action_state': 'story_bot.exploration.render', 'timestamp': '10:00'},
+            ]
+        self._append_entries(log_file, entries)
         return log_file
     
     def assert_activity_logged_with_action_state(self, expected_action_state: str):
         """Assert activity logged with expected action_state."""
-        if not TINYDB_AVAILABLE:
-            return  # Activity tracking disabled - skip assertion
         activity_log = self.get_activity_log()
         if not any(entry.get('action_state') == expected_action_state for entry in activity_log):
             actual_states = [entry.get('action_state') for entry in activity_log]
@@ -76,8 +66,6 @@ class ActivityTestHelper(BaseHelper):
     
     def assert_completion_entry_logged_with_outputs(self, expected_outputs: dict = None, expected_duration: int = None):
         """Assert completion entry logged with outputs and duration."""
-        if not TINYDB_AVAILABLE:
-            return  # Activity tracking disabled - skip assertion
         activity_log = self.get_activity_log()
         completion_entry = next((e for e in activity_log if 'outputs' in e), None)
         assert completion_entry is not None, "No completion entry found with outputs"
@@ -92,64 +80,59 @@ class ActivityTestHelper(BaseHelper):
         Args:
             **checks: Checks to perform (expected_count, expected_action_state, etc.)
         """
-        if not TINYDB_AVAILABLE:
-            return  # Activity tracking disabled - skip assertion
-        from tinydb import TinyDB
-        
-        log_file = self.parent.workspace / 'activity_log.json'
+        log_file = self.log_file
         
         if not log_file.exists():
             if 'expected_count' in checks and checks['expected_count'] == 0:
                 return
             assert False, f"Activity log file does not exist at {log_file}"
         
-        with TinyDB(log_file) as db:
-            entries = db.all()
-            
-            if 'expected_count' in checks:
-                assert len(entries) == checks['expected_count'], \
-                    f"Expected {checks['expected_count']} entries, got {len(entries)}"
-            
-            if 'expected_action_states' in checks:
-                expected_states = checks['expected_action_states']
-                assert len(entries) == len(expected_states), \
-                    f"Expected {len(expected_states)} entries, got {len(entries)}"
-                for i, expected_state in enumerate(expected_states):
-                    assert entries[i].get('action_state') == expected_state, (
-                        f"Entry {i} should have action_state '{expected_state}', got '{entries[i].get('action_state')}'"
-                    )
+        entries = self._read_entries(log_file)
+        
+        if 'expected_count' in checks:
+            assert len(entries) == checks['expected_count'], \
+                f"Expected {checks['expected_count']} entries, got {len(entries)}"
             
-            if 'expected_last_action_state' in checks:
-                assert len(entries) > 0, "No entries in activity log"
-                assert entries[-1].get('action_state') == checks['expected_last_action_state'], (
-                    f"Last entry should have action_state '{checks['expected_last_action_state']}', "
-                    f"got '{entries[-1].get('action_state')}'"
+        if 'expected_action_states' in checks:
+            expected_states = checks['expected_action_states']
+            assert len(entries) == len(expected_states), \
+                f"Expected {len(expected_states)} entries, got {len(entries)}"
+            for i, expected_state in enumerate(expected_states):
+                assert entries[i].get('action_state') == expected_state, (
+                    f"Entry {i} should have action_state '{expected_state}', got '{entries[i].get('action_state')}'"
                 )
             
-            if 'expected_action_state' in checks:
-                matching_entries = [e for e in entries if e.get('action_state') == checks['expected_action_state']]
-                assert len(matching_entries) > 0, \
-                    f"No entry found with action_state={checks['expected_action_state']}"
-                if 'expected_status' in checks:
-                    assert matching_entries[0].get('status') == checks['expected_status'], \
-                        f"Expected status {checks['expected_status']}, got {matching_entries[0].get('status')}"
+        if 'expected_last_action_state' in checks:
+            assert len(entries) > 0, "No entries in activity log"
+            assert entries[-1].get('action_state') == checks['expected_last_action_state'], (
+                f"Last entry should have action_state '{checks['expected_last_action_state']}', "
+                f"got '{entries[-1].get('action_state')}'"
+            )
+            
+        if 'expected_action_state' in checks:
+            matching_entries = [e for e in entries if e.get('action_state') == checks['expected_action_state']]
+            assert len(matching_entries) > 0, \
+                f"No entry found with action_state={checks['expected_action_state']}"
+            if 'expected_status' in checks:
+                assert matching_entries[0].get('status') == checks['expected_status'], \
+                    f"Expected status {checks['expected_status']}, got {matching_entries[0].get('status')}"
             
-            if 'workflow_complete' in checks and checks['workflow_complete']:
-                completion_entry = next((e for e in entries if 'outputs' in e), None)
-                assert completion_entry is not None, "No completion entry found with outputs"
-                assert completion_entry['outputs'].get('workflow_complete') is True, \
-                    "Completion entry does not have workflow_complete flag set to True"
+        if 'workflow_complete' in checks and checks['workflow_complete']:
+            completion_entry = next((e for e in entries if 'outputs' in e), None)
+            assert completion_entry is not None, "No completion entry found with outputs"
+            assert completion_entry['outputs'].get('workflow_complete') is True, \
+                "Completion entry does not have workflow_complete flag set to True"
             
-            if 'expected_entries' in checks:
-                expected_entries = checks['expected_entries']
-                assert len(entries) == len(expected_entries), \
-                    f"Expected {len(expected_entries)} entries, got {len(entries)}"
-                for expected_entry in expected_entries:
-                    expected_action_state = expected_entry.get('action_state')
-                    assert any(
-                        entry.get('action_state') == expected_action_state
-                        for entry in entries
-                    ), f"No entry found with action_state '{expected_action_state}'"
+        if 'expected_entries' in checks:
+            expected_entries = checks['expected_entries']
+            assert len(entries) == len(expected_entries), \
+                f"Expected {len(expected_entries)} entries, got {len(entries)}"
+            for expected_entry in expected_entries:
+                expected_action_state = expected_entry.get('action_state')
+                assert any(
+                    entry.get('action_state') == expected_action_state
+                    for entry in entries
+                ), f"No entry found with action_state '{expected_action_state}'"
     
     def create_activity_tracker(self, bot_name='story_bot'):
         """Create ActivityTracker instance."""
@@ -187,97 +170,83 @@ class ActivityTestHelper(BaseHelper):
     
     def given_activity_log(self, entries: list = None, **params):
         """Create activity log with entries."""
-        log_file = self.parent.workspace / 'activity_log.json'
-        from tinydb import TinyDB
-        
-        with TinyDB(log_file) as db:
-            if entries is None:
-                db.insert({'action_state': 'story_bot.shape.render', 'timestamp': '09:00'})
-                db.insert({'action_state': 'story_bot.exploration.render', 'timestamp': '10:00'})
-            else:
-                for entry in entries:
-                    db.insert(entry)
-        
+        log_file = self.log_file
+        if entries is None:
+            entries = [
+                {'action_state': 'story_bot.shape.render', 'timestamp': '09:00'},
+                {'action_state': 'story_bot.exploration.render', 'timestamp': '10:00'},
+            ]
+        self._append_entries(log_file, entries)
         return log_file
     
     def read_activity_log(self) -> list:
         """Read activity log from workspace directory."""
-        log_file = self.parent.workspace / 'activity_log.json'
-        from tinydb import TinyDB
-        with TinyDB(log_file) as db:
-            return db.all()
+        return self._read_entries(self.log_file)
     
     def then_activity_logged_with_action_state(self, expected_action_state: str):
         """Assert activity logged with expected action_state."""
-        from tinydb import TinyDB
-        log_file = self.parent.workspace / 'activity_log.json'
-        
-        with TinyDB(log_file) as db:
-            entries = db.all()
-            if not any(entry.get('action_state') == expected_action_state for entry in entries):
-                actual_states = [entry.get('action_state') for entry in entries]
-                raise AssertionError(
-                    f"Expected action_state '{expected_action_state}' not found in activity log. "
-                    f"Actual entries: {actual_states}"
-                )
+        entries = self._read_entries(self.log_file)
+        if not any(entry.get('action_state') == expected_action_state for entry in entries):
+            actual_states = [entry.get('action_state') for entry in entries]
+            raise AssertionError(
+                f"Expected action_state '{expected_action_state}' not found in activity log. "
+                f"Actual entries: {actual_states}"
+            )
     
     def then_activity_log_matches(self, log_file=None, **checks):
         """Assert activity log matches expected values."""
-        from tinydb import TinyDB
-        
         if log_file is None:
-            log_file = self.parent.workspace / 'activity_log.json'
+            log_file = self.log_file
         
         if not log_file.exists():
             if 'expected_count' in checks and checks['expected_count'] == 0:
                 return
             assert False, f"Activity log file does not exist at {log_file}"
         
-        with TinyDB(log_file) as db:
-            entries = db.all()
-            
-            if 'expected_count' in checks:
-                assert len(entries) == checks['expected_count'], \
-                    f"Expected {checks['expected_count']} entries, got {len(entries)}"
+        entries = self._read_entries(log_file)
+        
+        if 'expected_count' in checks:
+            assert len(entries) == checks['expected_count'], \
+                f"Expected {checks['expected_count']} entries, got {len(entries)}"
             
-            if 'expected_action_state' in checks:
-                assert any(entry.get('action_state') == checks['expected_action_state'] for entry in entries), \
-                    f"Expected action_state '{checks['expected_action_state']}' not found in entries"
+        if 'expected_action_state' in checks:
+            assert any(entry.get('action_state') == checks['expected_action_state'] for entry in entries), \
+                f"Expected action_state '{checks['expected_action_state']}' not found in entries"
             
-            if 'expected_action_states' in checks:
-                expected_states = checks['expected_action_states']
-                actual_states = [entry.get('action_state') for entry in entries]
-                assert len(actual_states) == len(expected_states), \
-                    f"Expected {len(expected_states)} entries, got {len(actual_states)}"
-                for i, expected_state in enumerate(expected_states):
-                    assert actual_states[i] == expected_state, \
-                        f"Entry {i}: expected '{expected_state}', got '{actual_states[i]}'"
+        if 'expected_action_states' in checks:
+            expected_states = checks['expected_action_states']
+            actual_states = [entry.get('action_state') for entry in entries]
+            assert len(actual_states) == len(expected_states), \
+                f"Expected {len(expected_states)} entries, got {len(actual_states)}"
+            for i, expected_state in enumerate(expected_states):
+                assert actual_states[i] == expected_state, \
+                    f"Entry {i}: expected '{expected_state}', got '{actual_states[i]}'"
             
-            if 'expected_last_action_state' in checks:
-                assert entries[-1].get('action_state') == checks['expected_last_action_state'], \
-                    f"Expected last action_state '{checks['expected_last_action_state']}', got '{entries[-1].get('action_state')}'"
+        if 'expected_last_action_state' in checks:
+            assert entries[-1].get('action_state') == checks['expected_last_action_state'], \
+                f"Expected last action_state '{checks['expected_last_action_state']}', got '{entries[-1].get('action_state')}'"
             
-            if 'expected_status' in checks:
-                assert any(entry.get('status') == checks['expected_status'] for entry in entries), \
-                    f"Expected status '{checks['expected_status']}' not found in entries"
+        if 'expected_status' in checks:
+            assert any(entry.get('status') == checks['expected_status'] for entry in entries), \
+                f"Expected status '{checks['expected_status']}' not found in entries"
             
-            if 'expected_entries' in checks:
-                expected_entries = checks['expected_entries']
-                for expected_entry in expected_entries:
-                    expected_action_state = expected_entry.get('action_state')
-                    matching_entry = next((e for e in entries if e.get('action_state') == expected_action_state), None)
-                    assert matching_entry is not None, \
-                        f"Expected entry with action_state '{expected_action_state}' not found"
-                    for key, value in expected_entry.items():
-                        if key != 'action_state':
-                            assert matching_entry.get(key) == value, \
-                                f"Entry {expected_action_state}: expected {key}='{value}', got '{matching_entry.get(key)}'"
+        if 'expected_entries' in checks:
+            expected_entries = checks['expected_entries']
+            for expected_entry in expected_entries:
+                expected_action_state = expected_entry.get('action_state')
+                matching_entry = next((e for e in entries if e.get('action_state') == expected_action_state), None)
+                assert matching_entry is not None, \
+                    f"Expected entry with action_state '{expected_action_state}' not found"
+                for key, value in expected_entry.items():
+                    if key != 'action_state':
+                        assert matching_entry.get(key) == value, \
+                            f"Entry {expected_action_state}: expected {key}='{value}', got '{matching_entry.get(key)}'"
             
-            if 'workflow_complete' in checks:
-                completion_entry = next((e for e in entries if 'outputs' in e), None)
-                assert completion_entry is not None, "No completion entry found in activity log"
-                assert completion_entry.get('outputs', {}).get('workflow_complete') == True, \
-                    "Completion entry should have workflow_complete=True in outputs"
+        if 'workflow_complete' in checks:
+            completion_entry = next((e for e in entries if 'outputs' in e), None)
+            assert completion_entry is not None, "No completion entry found in activity log"
+            assert completion_entry.get('outputs', {}).get('workflow_complete') == True, \
+                "Completion entry should have workflow_complete=True in outputs"
     
     def given_activity_tracker(self, bot_name='story_bot'):
         """Create activity tracker."""
@@ -310,20 +279,18 @@ class ActivityTestHelper(BaseHelper):
     
     def then_completion_entry_logged_with_outputs(self, log_file_or_workspace: Path, expected_outputs: dict = None, expected_duration: int = None):
         """Assert completion entry logged with outputs and duration."""
-        from tinydb import TinyDB
-        if (log_file_or_workspace / 'activity_log.json').exists():
-            log_file = log_file_or_workspace / 'activity_log.json'
+        if (log_file_or_workspace / JOURNAL_NAME).exists():
+            log_file = log_file_or_workspace / JOURNAL_NAME
         else:
             log_file = log_file_or_workspace
         
-        with TinyDB(log_file) as db:
-            entries = db.all()
-            completion_entry = next((e for e in entries if 'outputs' in e), None)
-            assert completion_entry is not None
-            if expected_outputs is not None:
-                assert completion_entry['outputs'] == expected_outputs
-            if expected_duration is not None:
-                assert completion_entry['duration'] == expected_duration
+        entries = self._read_entries(log_file)
+        completion_entry = next((e for e in entries if 'outputs' in e), None)
+        assert completion_entry is not None
+        if expected_outputs is not None:
+            assert completion_entry['outputs'] == expected_outputs
+        if expected_duration is not None:
+            assert completion_entry['duration'] == expected_duration
     
     def given_environment_bootstrapped_and_activity_log_initialized(self, bot_directory: Path, workspace_directory: Path):
         """Bootstrap environment and initialize activity log."""
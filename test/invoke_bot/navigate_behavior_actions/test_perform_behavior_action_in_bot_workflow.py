@@ -9,12 +9,10 @@ CLI tests verify command parsing and output formatting across TTY, Pipe, and JSO
 """
 import pytest
 from unittest.mock import patch
-
-# TEMPORARILY DISABLED: Activity tracking tests - TinyDB was causing file corruption issues
-_activity_skip = pytest.mark.skip(reason="Activity tracking disabled due to TinyDB corruption issues")
 from pathlib import Path
 import json
 import os
+import time
 from helpers.bot_test_helper import BotTestHelper
 from helpers import TTYBotTestHelper, PipeBotTestHelper, JsonBotTestHelper
 
@@ -23,7 +21,6 @@ from helpers import TTYBotTestHelper, PipeBotTestHelper, JsonBotTestHelper
 # DOMAIN TESTS - Core Bot Logic
 # ============================================================================
 
-@_activity_skip
 class TestInjectContextIntoInstructions:
     
     def test_next_behavior_reminder_not_injected_when_not_final_action(self, tmp_path):
@@ -60,7 +57,6 @@ class TestInjectContextIntoInstructions:
 
 
 # End-to-end integration test (no story mapping)
-@_activity_skip
 class TestExecuteEndToEndWorkflow:
 
     def test_complete_workflow_progresses_through_single_behavior(self, tmp_path):
@@ -150,7 +146,6 @@ class TestExecuteEndToEndWorkflow:
 
 
 # Story: Track Activity For Workspace (sequential_order: 6)
-@_activity_skip
 class TestTrackActivityForWorkspace:
 
     def test_activity_logged_to_workspace_area_not_bot_area(self, tmp_path):
@@ -159,8 +154,8 @@ class TestTrackActivityForWorkspace:
         GIVEN: WORKING_AREA environment variable specifies workspace_area
         AND: action 'gather_context' executes
         WHEN: Activity logger creates entry
-        THEN: Activity log file is at: workspace_area/activity_log.json
-        AND: Activity log is NOT at: agile_bots/bots/story_bot/activity_log.json
+        THEN: Activity log file is at: workspace_area/activity_log.jsonl
+        AND: Activity log is NOT at: agile_bots/bots/story_bot/activity_log.jsonl
         AND: Activity log location matches workspace_area from WORKING_AREA environment variable
         """
         # Given: Bot using production story_bot
@@ -171,14 +166,14 @@ class TestTrackActivityForWorkspace:
         helper.activity.when_activity_tracks_start(tracker, 'story_bot.shape.gather_context')
         
         # Then: Activity log exists in workspace area
-        expected_log = helper.workspace / 'activity_log.json'
+        expected_log = helper.workspace / 'activity_log.jsonl'
         assert expected_log.exists()
         
         # And: Activity log does NOT exist in bot's area (production bot is read-only)
         from pathlib import Path
         repo_root = Path(__file__).parent.parent.parent.parent
         production_bot_dir = repo_root / 'agile_bots' / 'bots' / 'story_bot'
-        bot_area_log = production_bot_dir / 'activity_log.json'
+        bot_area_log = production_bot_dir / 'activity_log.jsonl'
         assert not bot_area_log.exists()
 
     def test_activity_log_contains_correct_entry(self, tmp_path):
@@ -201,11 +196,136 @@ class TestTrackActivityForWorkspace:
         # Then: Activity log has entry
         helper.activity.then_activity_log_matches(expected_action_state='story_bot.shape.gather_context', expected_status='started', expected_count=1)
 
+    def test_activity_log_migrates_tinydb_log_and_compacts_on_rotation(self, tmp_path):
+        """
+        SCENARIO: Activity journal migrates a TinyDB log and keeps the last state per action when rotated
+        GIVEN: workspace has a legacy TinyDB activity_log.json
+        WHEN: Activity tracker tracks a completion and the journal rotates
+        THEN: Legacy entries are in the journal and activity_log.json is renamed to activity_log.json.migrated
+        AND: Last state per behavior/action is answered from the index
+        AND: Rotated journal holds one entry per action state and status; the full history is archived
+        """
+        # Given: Legacy TinyDB log in workspace
+        helper = BotTestHelper(tmp_path)
+        legacy_log = helper.workspace / 'activity_log.json'
+        legacy_log.write_text(json.dumps({'_default': {
+            '1': {'action_state': 'story_bot.shape.clarify', 'status': 'started', 'timestamp': '2026-01-01T09:00:00'},
+            '2': {'action_state': 'story_bot.shape.clarify', 'status': 'completed', 'timestamp': '2026-01-01T09:05:00'},
+        }}), encoding='utf-8')
+
+        # When: Activity tracker tracks more activity and the journal rotates
+        tracker = helper.activity.given_activity_tracker('story_bot')
+        helper.activity.when_activity_tracks_start(tracker, 'story_bot.shape.clarify')
+        helper.activity.when_activity_tracks_start(tracker, 'story_bot.shape.build')
+        from actions.activity_tracker import ActionState
+        tracker.track_completion(ActionState('story_bot', 'shape', 'build', outputs={'workflow_complete': True}))
+
+        # Then: Legacy entries migrated once
+        assert not legacy_log.exists()
+        assert (helper.workspace / 'activity_log.json.migrated').exists()
+        helper.activity.then_activity_log_matches(
+            expected_action_states=['story_bot.shape.clarify'] * 3 + ['story_bot.shape.build'] * 2
+        )
+
+        # And: Last state per behavior / action comes from the index
+        assert tracker.last_state('shape')['action_state'] == 'story_bot.shape.build'
+        assert tracker.last_state('shape', 'clarify')['status'] == 'started'
+        assert tracker.last_state('shape', 'clarify', 'completed')['timestamp'] == '2026-01-01T09:05:00'
+
+        # And: Rotation compacts the journal and archives the history
+        tracker.journal.rotate()
+        helper.activity.then_activity_log_matches(expected_count=4)
+        assert tracker.last_state('shape', 'clarify')['status'] == 'started'
+        archived = (helper.workspace / 'activity_log.jsonl.1').read_text(encoding='utf-8').splitlines()
+        assert len(archived) == 5
+
+    def test_activity_log_age_rotation_dates_segment_from_rotation_not_oldest_kept_entry(self, tmp_path):
+        """
+        SCENARIO: Compacted entries older than max age do not make every append rotate the journal
+        GIVEN: journal was rotated while holding an entry older than its max age
+        WHEN: more activity is appended, by the same process and after a reopen
+        THEN: journal is not rotated again and the archive keeps the real history
+        AND: journal rotates once its segment itself is older than max age
+        """
+        # Given: Journal rotated with a compacted entry older than max age
+        from actions.activity_journal import ActivityJournal, SEGMENT_MARKER
+        log_file = tmp_path / 'activity_log.jsonl'
+        journal = ActivityJournal(log_file, max_age_seconds=3600)
+        journal.append({'action_state': 'story_bot.shape.clarify', 'status': 'completed', 'timestamp': '2026-09-01T09:00:00'})
+        journal.rotate()
+        archive = journal.archive_path(1)
+        archived = archive.read_text(encoding='utf-8')
+
+        # When: Activity is appended by this process and after a reopen
+        for status in ('started', 'completed'):
+            journal.append({'action_state': 'story_bot.shape.build', 'status': status, 'timestamp': '2026-10-18T09:00:00'})
+        journal.close()
+        reopened = ActivityJournal(log_file, max_age_seconds=3600)
+        reopened.append({'action_state': 'story_bot.shape.render', 'status': 'started', 'timestamp': '2026-10-18T09:05:00'})
+
+        # Then: No further rotation; history stays archived
+        assert not journal.archive_path(2).exists()
+        assert archive.read_text(encoding='utf-8') == archived
+        assert [entry['status'] for entry in reopened.entries()] == ['completed', 'started', 'completed', 'started']
+
+        # And: Journal rotates once its segment is older than max age
+        reopened.close()
+        lines = log_file.read_text(encoding='utf-8').splitlines()
+        lines[0] = json.dumps({SEGMENT_MARKER: time.time() - 7200})
+        log_file.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+        aged = ActivityJournal(log_file, max_age_seconds=3600)
+        aged.append({'action_state': 'story_bot.shape.render', 'status': 'completed', 'timestamp': '2026-10-18T09:10:00'})
+        assert journal.archive_path(2).read_text(encoding='utf-8') == archived
+        assert journal.archive_path(1).read_text(encoding='utf-8').splitlines()[:len(lines)] == lines
+        assert json.loads(log_file.read_text(encoding='utf-8').splitlines()[0])[SEGMENT_MARKER] > time.time() - 60
+
+    def test_activity_log_snapshot_over_max_bytes_rotates_on_growth_and_idle_journal_releases_its_descriptor(self, tmp_path):
+        """
+        SCENARIO: A compacted snapshot larger than max bytes does not make every append rotate the journal
+        GIVEN: journal was rotated into a snapshot larger than its max bytes
+        WHEN: a small entry is appended
+        THEN: journal is not rotated again
+        AND: journal rotates once it grew by more than max bytes since the snapshot
+        AND: an idle journal syncs and closes its descriptor, and closing drops it from the workspace cache
+        """
+        # Given: Journal rotated into a snapshot larger than max bytes
+        from actions import activity_journal
+        from actions.activity_journal import ActivityJournal
+        journal = ActivityJournal.for_workspace(tmp_path)
+        for number in range(6):
+            journal.append({'action_state': f'story_bot.shape.action_{number}', 'status': 'completed', 'note': 'x' * 40})
+        journal.max_bytes = 200
+        journal.rotate()
+        assert journal.path.stat().st_size > journal.max_bytes
+
+        # When: A small entry is appended
+        journal.append({'action_state': 'story_bot.shape.action_0', 'status': 'started'})
+
+        # Then: No further rotation
+        assert not journal.archive_path(2).exists()
+
+        # And: Journal rotates once it grew by more than max bytes since the snapshot
+        for _ in range(4):
+            journal.append({'action_state': 'story_bot.shape.action_1', 'status': 'started', 'note': 'y' * 40})
+        assert journal.archive_path(2).exists()
+
+        # And: Idle journal releases its descriptor; closing drops it from the cache
+        with patch.object(activity_journal, 'FSYNC_INTERVAL_SECONDS', 0.05):
+            journal.append({'action_state': 'story_bot.shape.action_2', 'status': 'started'})
+            deadline = time.time() + 5
+            while journal._fd is not None and time.time() < deadline:
+                time.sleep(0.02)
+        assert journal._fd is None
+        assert ActivityJournal.for_workspace(tmp_path) is journal
+        journal.close()
+        reopened = ActivityJournal.for_workspace(tmp_path)
+        assert reopened is not journal
+        reopened.close()
+
 # ============================================================================
 # CLI TESTS - Bot Operations via CLI Commands
 # ============================================================================
 
-@_activity_skip
 class TestExecuteEndToEndWorkflowUsingCLI:
     """
     Story: Execute End-to-End Workflow Using CLI
@@ -1026,4 +1146,86 @@ class TestConfigureActionExecution:
         assert result is not None and result.get("status") != "error"
         content = result.get("instructions", "") or ""
         assert "clarify" in content.lower() and "strategy" in content.lower()
-        assert "**Combined instructions:**" in content or "## Next action:" in content
\ No newline at end of file
+        assert "**Combined instructions:**" in content or "## Next action:" in content
+
+
+class TestSignalActionCompletion:
+    """
+    Story: Signal Action Completion
+    Waiters wake on completion events published through the workspace's completion channel.
+    """
+
+    @pytest.fixture(autouse=True)
+    def remove_events_directory(self, tmp_path):
+        """The events directory lives under the system temp dir, keyed by workspace; remove it after each test."""
+        import shutil
+        from bot.completion_channel import events_directory
+        yield
+        shutil.rmtree(events_directory(tmp_path / 'workspace'), ignore_errors=True)
+
+    def test_bot_waiting_for_action_done_wakes_when_action_is_marked_done(self, tmp_path):
+        """
+        Scenario: Waiting for an action to finish wakes on the completion signal
+        GIVEN an action is running and the Bot is waiting for it with a long poll interval
+        WHEN the action is marked done from another thread
+        THEN the Bot stops waiting well before one poll interval passes
+        AND a validation waiter receives progress events and then the final result
+        """
+        import threading
+        from bot.completion_channel import CompletionChannel
+        helper = BotTestHelper(tmp_path)
+        helper.bot.set_action_is_done(False)
+
+        timer = threading.Timer(0.2, helper.bot.set_action_is_done, args=(True,))
+        started = time.monotonic()
+        timer.start()
+        done = helper.bot.wait_until_action_done(timeout_seconds=10, poll_interval=30)
+        timer.join()
+
+        assert done is True
+        assert time.monotonic() - started < 5
+
+        channel = CompletionChannel.for_workspace(helper.workspace)
+        events = []
+
+        def run_validation():
+            time.sleep(0.2)
+            channel.publish('shape-validation-test', {'event': 'progress', 'files_scanned': 1, 'total_files': 2})
+            channel.publish('shape-validation-test', {'event': 'done', 'violations': 0}, final=True)
+        channel.clear_result('shape-validation-test')
+        threading.Thread(target=run_validation).start()
+        result = channel.wait_for_result('shape-validation-test', timeout_seconds=10, on_event=events.append)
+
+        assert result['event'] == 'done' and result['final'] is True
+        assert events and events[0]['files_scanned'] == 1
+
+    def test_streaming_validation_writer_publishes_started_progress_and_done(self, tmp_path):
+        """
+        Scenario: A validation run publishes its lifecycle on the completion channel
+        GIVEN a subscriber to a validation run's topic
+        WHEN the run starts, scans a file, completes a scanner, finishes and writes its report
+        THEN the subscriber receives started, then progress, then the final done event
+        AND the done event is kept for subscribers that arrive later
+        """
+        from bot.completion_channel import CompletionChannel
+        from actions.validate.validation_report_writer import StreamingValidationReportWriter
+        helper = BotTestHelper(tmp_path)
+        source_file = helper.workspace / 'src' / 'order.py'
+        writer = StreamingValidationReportWriter('shape', helper.bot.bot_paths, timestamp='events-test')
+        channel = CompletionChannel.for_workspace(helper.workspace)
+
+        with channel.subscribe(writer.topic) as subscription:
+            writer.start({'src': [source_file], 'test': []})
+            writer.on_file_scanned(source_file, [], None)
+            writer.on_scanner_complete({'rule_file': 'rule.json', 'scanner_status': {'status': 'EXECUTED', 'violations_found': 0}})
+            writer.finish({}, [])
+            writer.publish_done(report_path=tmp_path / 'report.md')
+            events = subscription.pending_events()
+
+        names = [event['event'] for event in events]
+        assert names[0] == 'started' and names[-1] == 'done'
+        assert set(names[1:-1]) == {'progress'}
+        assert events[0]['total_files'] == 1
+        assert events[-2]['files_scanned'] == 1 and events[-2]['scanners_executed'] == 1
+        assert events[-1]['final'] is True and events[-1]['report_file'] == str(tmp_path / 'report.md')
+        assert channel.result(writer.topic)['event'] == 'done'
@@ -96,6 +96,53 @@ class TestRenderOutput:
         base_instructions = '\n'.join(result.get('base_instructions', []))
         assert 'Synchronizers Already Executed' in base_instructions or 'render' in base_instructions.lower()
 
+    def test_story_files_render_skips_unchanged_files(self, tmp_path):
+        """
+        SCENARIO: Re-rendering story files only writes stories whose content changed
+        GIVEN: Story markdown files already rendered from a story graph
+        WHEN: The graph is rendered again, sequentially and in parallel, after one story changes
+        THEN: Unchanged files are skipped and reported, and only the changed story is updated
+        """
+        from synchronizers.story_scenarios.story_scenarios_synchronizer import StoryScenariosSynchronizer
+        # GIVEN: a graph with one epic, a sub-epic and a nested sub-epic
+        graph = {'epics': [{
+            'name': 'Manage Orders',
+            'story_groups': [{'stories': [{'name': 'Place Order', 'users': ['Customer']}]}],
+            'sub_epics': [{
+                'name': 'Ship Orders',
+                'story_groups': [{'stories': [{'name': 'Pack Order', 'users': ['Clerk']}]}],
+                'sub_epics': [{
+                    'name': 'Track Shipments',
+                    'story_groups': [{'stories': [{'name': 'Track Parcel', 'users': ['Customer']}]}],
+                }],
+            }],
+        }]}
+        graph_path = tmp_path / 'story-graph.json'
+        graph_path.write_text(json.dumps(graph), encoding='utf-8')
+        output_dir = tmp_path / 'docs' / 'story' / 'map'
+        synchronizer = StoryScenariosSynchronizer()
+        first = synchronizer.render(graph_path, output_dir)
+        assert first['summary']['created_files'] == 3
+        nested_file = output_dir / '🎯 Manage Orders' / '⚙️ Ship Orders' / '⚙️ Track Shipments' / '📄 Track Parcel.md'
+        assert nested_file.exists()
+
+        # WHEN: rendering again with nothing changed
+        second = synchronizer.render(graph_path, output_dir, parallel=True, max_workers=2)
+        # THEN: every file is skipped
+        assert second['summary']['skipped_unchanged'] == 3
+        assert second['summary']['updated_files'] == 0
+        assert sorted(second['unchanged_files']) == sorted(first['created_files'])
+
+        # WHEN: one story changes
+        graph['epics'][0]['sub_epics'][0]['story_groups'][0]['stories'][0]['users'] = ['Courier']
+        graph_path.write_text(json.dumps(graph), encoding='utf-8')
+        third = synchronizer.render(graph_path, output_dir)
+        # THEN: only that story's file is rewritten
+        assert third['summary']['updated_files'] == 1
+        assert third['summary']['skipped_unchanged'] == 2
+        assert third['updated_files'][0].endswith('📄 Pack Order.md')
+        assert 'Courier' in (output_dir / third['updated_files'][0]).read_text(encoding='utf-8')
+
 
 # ============================================================================
 # STORY: Save Guardrails (Domain Layer)
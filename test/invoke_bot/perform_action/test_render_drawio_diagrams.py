@@ -152,6 +152,49 @@ class TestRenderStoryMap:
         assert len(drawio_story_map.get_epics()) == 0
         assert summary == {'epics': 0, 'sub_epic_count': 0, 'diagram_generated': True}
 
+    def test_save_and_load_stream_cells_without_building_the_whole_tree(self, tmp_path):
+        import io
+        import xml.etree.ElementTree as ET
+        from unittest.mock import patch
+        from synchronizers.story_io.drawio_story_node_serializer import DrawIOStoryNodeSerializer
+        helper = BotTestHelper(tmp_path)
+        story_map = StoryMap(helper.drawio_story_map.create_simple_story_map_data())
+        drawio_story_map = DrawIOStoryMap(diagram_type='outline')
+        drawio_story_map.render_from_story_map(story_map, layout_data=None)
+        output_file = tmp_path / 'story-map.drawio'
+
+        drawio_story_map.save(output_file)
+
+        # Streamed file is the same document the in-memory writer produces, and no temp file is left
+        nodes = drawio_story_map._collect_all_nodes()
+        assert output_file.read_text(encoding='utf-8') == DrawIOStoryNodeSerializer.to_drawio_xml(nodes)
+        assert [p.name for p in tmp_path.iterdir() if 'story-map.drawio' in p.name] == ['story-map.drawio']
+        assert len(ET.parse(output_file).getroot().findall('.//mxCell')) == len(nodes) + 2
+
+        # The reader yields cells lazily, in document order, from a stream
+        stream = io.StringIO(output_file.read_text(encoding='utf-8'))
+        reader = DrawIOStoryNodeSerializer.iter_nodes(stream)
+        first_node, parent_id = next(reader)
+        assert first_node.cell_id == nodes[0].cell_id and parent_id == '1'
+        assert [first_node.cell_id] + [node.cell_id for node, _ in reader] == [node.cell_id for node in nodes]
+
+        reloaded = DrawIOStoryMap.load(output_file, diagram_type='outline')
+        assert [epic.name for epic in reloaded.get_epics()] == [epic.name for epic in drawio_story_map.get_epics()]
+        assert sorted(story.name for story in reloaded.get_stories()) == \
+            sorted(story.name for story in drawio_story_map.get_stories())
+
+        # A save interrupted mid-stream keeps the previous file and leaves no temp file
+        saved = output_file.read_text(encoding='utf-8')
+
+        def write_then_fail(cells, f):
+            f.write('<mxfile>')
+            raise OSError('disk full')
+        with patch.object(DrawIOStoryNodeSerializer, 'write_drawio_xml', side_effect=write_then_fail):
+            with pytest.raises(OSError):
+                drawio_story_map.save(output_file)
+        assert output_file.read_text(encoding='utf-8') == saved
+        assert [p.name for p in tmp_path.iterdir() if 'story-map.drawio' in p.name] == ['story-map.drawio']
+
 
 class TestRenderStoryMapNestedSubEpics:
 
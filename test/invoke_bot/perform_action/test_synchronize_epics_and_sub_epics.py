@@ -458,6 +458,62 @@ class TestUpdateEpicsAndSubEpicsFromDiagram(BaseUpdateDiagramTest):
             for i in range(len(stories) - 1):
                 assert stories[i].sequential_order <= stories[i + 1].sequential_order
 
+    def test_extract_nests_stacked_bars_using_spatial_index(self, tmp_path):
+        """
+        SCENARIO: Extract nests flat-ID sub-epic bars under the bar directly above them
+        GIVEN: A wide diagram of flat-ID sub-epic columns, each a bar with a narrower bar stacked below it
+        WHEN: DrawIOStoryMap extracts outline from diagram
+        THEN: each lower bar is nested under the bar above it and its story under the lower bar
+        AND: the interval index behind those queries finds the same spans as a full scan
+        """
+        import random
+        from synchronizers.story_io.spatial_index import IntervalIndex
+        helper = BotTestHelper(tmp_path)
+        columns = 60
+        cells = []
+        for col in range(columns):
+            x = 20 + col * 130
+            cells.append(
+                f'<mxCell id="bar-{col}" value="Bar {col}" '
+                f'style="rounded=1;fillColor=#d5e8d4;strokeColor=#82b366;fontColor=#000000;whiteSpace=wrap;html=1;" '
+                f'vertex="1" parent="1"><mxGeometry x="{x}" y="180" width="120" height="60" as="geometry"/></mxCell>')
+            cells.append(
+                f'<mxCell id="sub-bar-{col}" value="Sub Bar {col}" '
+                f'style="rounded=1;fillColor=#d5e8d4;strokeColor=#82b366;fontColor=#000000;whiteSpace=wrap;html=1;" '
+                f'vertex="1" parent="1"><mxGeometry x="{x + 10}" y="250" width="100" height="60" as="geometry"/></mxCell>')
+            cells.append(
+                f'<mxCell id="story-{col}" value="Story {col}" '
+                f'style="fillColor=#fff2cc;strokeColor=#d6b656;fontColor=#000000;whiteSpace=wrap;html=1;" '
+                f'vertex="1" parent="1"><mxGeometry x="{x + 20}" y="330" width="80" height="50" as="geometry"/></mxCell>')
+        xml = f'''<?xml version="1.0" encoding="UTF-8"?>
+<mxfile host="app.diagrams.net">
+  <diagram name="Story Map" id="test-diagram">
+    <mxGraphModel><root>
+        <mxCell id="0"/>
+        <mxCell id="1" parent="0"/>
+        <mxCell id="epic-1" value="Payment Processing" style="rounded=1;fillColor=#e1d5e7;strokeColor=#9673a6;fontColor=#000000;whiteSpace=wrap;html=1;" vertex="1" parent="1">
+          <mxGeometry x="10" y="120" width="{columns * 130 + 20}" height="300" as="geometry"/></mxCell>
+        {"".join(cells)}
+    </root></mxGraphModel>
+  </diagram>
+</mxfile>'''
+        drawio_file = helper.drawio_story_map.create_drawio_file(xml)
+
+        drawio = DrawIOStoryMap.load(drawio_file, diagram_type='outline')
+
+        bars = drawio.get_epics()[0].get_sub_epics()
+        assert [bar.name for bar in bars] == [f'Bar {col}' for col in range(columns)]
+        for col, bar in enumerate(bars):
+            nested = bar.get_sub_epics()
+            assert [se.name for se in nested] == [f'Sub Bar {col}']
+            assert [story.name for story in nested[0].get_stories()] == [f'Story {col}']
+
+        rng = random.Random(7)
+        spans = [(low, low + rng.uniform(0, 300)) for low in (rng.uniform(0, 5000) for _ in range(500))]
+        index = IntervalIndex(spans, lambda span: span)
+        for value in [rng.uniform(-100, 5400) for _ in range(300)] + [spans[0][0], spans[0][1]]:
+            assert index.stab(value) == [span for span in spans if span[0] <= value <= span[1]]
+
     def test_sync_persists_layout_data_alongside_diagram(self, tmp_path):
         """
         SCENARIO: Sync persists layout data alongside diagram
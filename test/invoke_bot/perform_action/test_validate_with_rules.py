@@ -8,6 +8,7 @@ Domain tests verify core action logic.
 CLI tests verify command parsing and output formatting across TTY, Pipe, and JSON channels.
 """
 import pytest
+from unittest.mock import patch
 from pathlib import Path
 import json
 from helpers.bot_test_helper import BotTestHelper
@@ -22,6 +23,11 @@ from actions.action_context import (
 )
 
 
+def _worker_pos_tags(text):
+    from scanners.resources.language_service import LanguageService
+    return LanguageService.shared().pos_tags(text)
+
+
 # ============================================================================
 # DOMAIN TESTS - Core Action Logic
 # ============================================================================
@@ -134,6 +140,41 @@ class TestValidateRules:
         rules = result.get('rules', [])
         assert len(rules) > 0, "Shape behavior must have validation rules"
     
+    def test_story_scoped_validation_filters_a_copy_of_the_shared_story_graph(self, tmp_path):
+        """
+        SCENARIO: Story scope filters the story graph handed to scanners, not the shared graph
+        GIVEN: Story graph with two epics, each with one story
+        AND: Scope filtered to the first story
+        WHEN: Validation context is built for the scope
+        THEN: Scanners receive only the scoped story
+        AND: The story graph shared with other readers still holds both epics
+        """
+        # GIVEN: Story graph with two epics, each with one story
+        helper = BotTestHelper(tmp_path)
+        def epic(name, story):
+            return {'name': name, 'sub_epics': [{'name': f'{name} Sub', 'sub_epics': [], 'story_groups': [
+                {'type': 'and', 'stories': [{'name': story, 'scenarios': []}]}]}], 'story_groups': []}
+        helper.story.create_story_graph({'epics': [epic('Epic A', 'Story A'), epic('Epic B', 'Story B')]})
+        
+        # AND: Scope filtered to the first story
+        from scope import Scope, ScopeType
+        scope = Scope(workspace_directory=tmp_path)
+        scope.filter(type=ScopeType.STORY, value=['Story A'])
+        helper.bot.behaviors.navigate_to('shape')
+        behavior = helper.bot.behaviors.current
+        
+        # WHEN: Validation context is built for the scope
+        from rules.rules import ValidationContext
+        validation_context = ValidationContext.from_action_context(behavior, ValidateActionContext(scope=scope))
+        
+        # THEN: Scanners receive only the scoped story
+        assert [e['name'] for e in validation_context.story_graph['epics']] == ['Epic A']
+        
+        # AND: The shared story graph still holds both epics
+        from story_graph.story_graph_store import StoryGraphStore
+        shared = StoryGraphStore.shared().load(helper.workspace / 'docs' / 'story' / 'story-graph.json')
+        assert [e['name'] for e in shared['epics']] == ['Epic A', 'Epic B']
+
     def test_file_scanner_receives_file_data(self, tmp_path):
         """
         SCENARIO: File scanners receive scoped file paths
@@ -198,6 +239,513 @@ class TestValidateRules:
         assert len(rules) > 0, "Code behavior must have validation rules"
 
 
+    def test_scanners_share_parsed_files_across_rules(self, tmp_path):
+        """
+        SCENARIO: Every scanner in a validation run reuses one parse per file
+        GIVEN: Two Python source files in the workspace
+        AND: Production story_bot with code behavior
+        WHEN: Rules validate runs over all files
+        THEN: Each file is parsed exactly once
+        AND: Later scanners are served from the shared parsed-file store
+        """
+        # GIVEN: Two Python source files in the workspace
+        helper = BotTestHelper(tmp_path)
+        helper.story.create_story_graph({'epics': []})
+        src_dir = helper.workspace / 'src'
+        src_dir.mkdir(parents=True)
+        (src_dir / 'order.py').write_text('class Order:\n    def total(self):\n        return 1\n')
+        (src_dir / 'customer.py').write_text('def find_customer(name):\n    return name\n')
+        
+        # AND: Production story_bot with code behavior
+        helper.bot.behaviors.navigate_to('code')
+        behavior = helper.bot.behaviors.current
+        
+        # WHEN: Rules validate runs over all files
+        from rules.rules import ValidationContext
+        context = ValidationContext.from_action_context(behavior, ValidateActionContext(all_files=True, skip_cross_file=True))
+        behavior.rules.validate(context)
+        
+        # THEN: Each file is parsed exactly once
+        stats = context.parsed_files.stats
+        assert stats['files'] == 2
+        assert stats['misses'] == 2
+        
+        # AND: Later scanners are served from the shared parsed-file store
+        assert stats['hits'] > stats['misses']
+
+        # AND: Each file's tree is walked once for every scanner's element listings
+        assert stats['walks'] == 2
+
+    def test_story_scanners_share_one_story_model_per_run(self, tmp_path):
+        """
+        SCENARIO: Every story and scenario scanner in a validation run reuses one story model
+        GIVEN: A story graph with domain concepts, an epic, a sub-epic and a story with a scenario
+        AND: Production story_bot with scenarios behavior
+        WHEN: Rules validate runs
+        THEN: The story tree is built once for the whole run
+        AND: Domain concepts are collected once per story scope
+        """
+        # GIVEN: A story graph with domain concepts, an epic, a sub-epic and a story with a scenario
+        helper = BotTestHelper(tmp_path)
+        helper.story.create_story_graph({
+            'domain_concepts': [{'name': 'Order'}],
+            'epics': [{'name': 'Places Order', 'story_groups': [], 'sub_epics': [{
+                'name': 'Checks Out', 'sub_epics': [],
+                'story_groups': [{'type': 'and', 'stories': [
+                    {'name': 'Pays Order', 'scenarios': [{'name': 'Pays', 'steps': ['Given the order']}]}
+                ]}]
+            }]}]
+        })
+
+        # AND: Production story_bot with scenarios behavior
+        helper.bot.behaviors.navigate_to('scenarios')
+        behavior = helper.bot.behaviors.current
+
+        # WHEN: Rules validate runs
+        from unittest.mock import patch
+        from rules.rules import ValidationContext
+        from scanners.story_map import StoryMap
+        original_epics = StoryMap.epics
+        context = ValidationContext.from_action_context(behavior, ValidateActionContext())
+        with patch.object(StoryMap, 'epics', autospec=True, side_effect=original_epics) as epics:
+            behavior.rules.validate(context)
+
+        # THEN: The story tree is built once for the whole run
+        assert context.story_model.built
+        assert epics.call_count == 1
+
+        # AND: Domain concepts are collected once per story scope
+        story = context.story_model.stories[0]
+        assert context.story_model.concepts_for_story(story) is context.story_model.concepts_for_story(story)
+        assert 'order' in context.story_model.concept_names_for_story(story)
+
+    def test_ast_events_carry_parent_and_enclosing_context(self):
+        """
+        SCENARIO: One walk of a file's tree feeds typed enter/exit events with their context
+        GIVEN: A module with a class whose method calls a function
+        WHEN: A handler is dispatched over the file's events
+        THEN: Events arrive depth-first, enter before exit
+        AND: Each event knows its parent, enclosing class and enclosing function
+        AND: Typed listings keep ast.walk order
+        """
+        # GIVEN: A module with a class whose method calls a function
+        import ast
+        from scanners.resources.ast_events import FileEvents
+        tree = ast.parse('class Order:\n    def total(self):\n        return compute(self)\n\ndef compute(order):\n    return 1\n')
+        events = FileEvents(tree)
+
+        # WHEN: A handler is dispatched over the file's events
+        seen = []
+        class Recorder:
+            def enter_FunctionDef(self, event):
+                seen.append(('enter', event.node.name, event.class_node.name if event.class_node else None))
+            def exit_FunctionDef(self, event):
+                seen.append(('exit', event.node.name, None))
+            def enter_Call(self, event):
+                seen.append(('call', event.node.func.id, event.function_node.name))
+                assert isinstance(event.parent, ast.Return)
+        events.dispatch(Recorder())
+
+        # THEN: Events arrive depth-first, enter before exit
+        # AND: Each event knows its parent, enclosing class and enclosing function
+        assert seen == [
+            ('enter', 'total', 'Order'), ('call', 'compute', 'total'), ('exit', 'total', None),
+            ('enter', 'compute', None), ('exit', 'compute', None),
+        ]
+
+        # AND: Typed listings keep ast.walk order
+        assert events.nodes_of_type(ast.FunctionDef) == [n for n in ast.walk(tree) if isinstance(n, ast.FunctionDef)]
+
+    def test_story_language_lookups_load_nltk_lazily_and_are_memoized(self, tmp_path):
+        """
+        SCENARIO: Story-language scanners share one lazily loaded, memoized NLTK service
+        GIVEN: The story-language scanner modules
+        WHEN: They are imported
+        THEN: NLTK is not loaded
+        WHEN: The same node names are tagged in a batch and looked up again
+        THEN: Each name is analysed once and later lookups are cache hits
+        AND: Saved answers load back into a new service
+        """
+        # GIVEN / WHEN: The story-language scanner modules are imported in a fresh interpreter
+        import os
+        import subprocess
+        import sys
+        src_dir = Path(__file__).parents[3] / 'src'
+        probe = subprocess.run(
+            [sys.executable, '-c', 'import sys, scanners.verb_noun_scanner, scanners.active_language_scanner; print("nltk" in sys.modules)'],
+            cwd=src_dir, capture_output=True, text=True, env={**os.environ, 'PYTHONPATH': str(src_dir)}
+        )
+
+        # THEN: NLTK is not loaded
+        assert probe.stdout.strip() == 'False', probe.stderr
+
+        # WHEN: The same node names are tagged in a batch and looked up again
+        # (the tagger and WordNet are stubbed so the memo is checked whether or not the corpora are installed)
+        from scanners.resources.language_service import LanguageService
+        service = LanguageService()
+        tagged_batches = []
+        synset_lookups = []
+
+        def tag_sentences(texts):
+            tagged_batches.append(list(texts))
+            return [[(word, 'NNP') for word in text.split()] for text in texts]
+
+        def synsets(word, pos=None):
+            synset_lookups.append((word, pos))
+            return []
+
+        with patch.object(service, '_tag_sentences', side_effect=tag_sentences), \
+                patch.object(service, '_synsets', side_effect=synsets):
+            tags = service.tag_many(['Places Order', 'Ships Order', 'Places Order'])
+            service.pos_tags('Places Order')
+            service.is_actor_or_role('customer')
+            service.is_actor_or_role('customer')
+
+        # THEN: Each name is analysed once and later lookups are cache hits
+        assert tagged_batches == [['Places Order', 'Ships Order']]
+        assert synset_lookups == [('customer', None)]
+        assert tags == [[('Places', 'NNP'), ('Order', 'NNP')], [('Ships', 'NNP'), ('Order', 'NNP')], [('Places', 'NNP'), ('Order', 'NNP')]]
+        stats = service.stats
+        assert stats['misses'] == 3
+        assert stats['hits'] == 5
+
+        # AND: Saved answers load back into a new service
+        cache_path = LanguageService.cache_path_for(tmp_path)
+        service.save(cache_path)
+        assert LanguageService().load(cache_path) == len(service)
+
+    def test_process_workers_start_with_the_saved_language_memo(self, tmp_path):
+        """
+        SCENARIO: Process-mode scanner workers reuse the language answers saved by earlier runs
+        GIVEN: A language cache saved in the workspace
+        WHEN: A process-mode rule runner starts a worker
+        THEN: The worker answers from the saved memo without tagging again
+        """
+        # GIVEN: A language cache saved in the workspace
+        from scanners.resources.language_service import LanguageService
+        from rules.parallel_rule_runner import ParallelRuleRunner, PROCESS_MODE
+        cache_path = LanguageService.cache_path_for(tmp_path)
+        service = LanguageService()
+        with patch.object(service, '_tag_sentences', return_value=[[('Zzyzx', 'SAVED'), ('Road', 'SAVED')]]):
+            service.tag_many(['Zzyzx Road'])
+        service.save(cache_path)
+
+        # WHEN: A process-mode rule runner starts a worker
+        runner = ParallelRuleRunner(1, PROCESS_MODE, language_cache_path=cache_path)
+        with runner._create_executor(1) as executor:
+            tags = executor.submit(_worker_pos_tags, 'Zzyzx Road').result()
+
+        # THEN: The worker answers from the saved memo without tagging again
+        assert tags == [('Zzyzx', 'SAVED'), ('Road', 'SAVED')]
+
+    def test_javascript_scanners_share_one_ast_per_file_content(self, tmp_path):
+        """
+        SCENARIO: Every JavaScript scanner in a validation run reuses one AST per file content
+        GIVEN: Two JavaScript source files in the workspace
+        AND: Production story_bot with code behavior
+        WHEN: Rules validate runs over all files
+        THEN: Each file's source is sent to the parse server exactly once
+        AND: Later scanners are served from the shared AST cache
+        AND: The worker returned each file's Program AST
+        AND: Parsing a file again is a cache hit, with no new request to the same worker
+        """
+        # GIVEN: Two JavaScript source files in the workspace
+        helper = BotTestHelper(tmp_path)
+        helper.story.create_story_graph({'epics': []})
+        src_dir = helper.workspace / 'src'
+        src_dir.mkdir(parents=True)
+        customer_source = 'function findCustomer(name) {\n    return name;\n}\n'
+        (src_dir / 'order.js').write_text('class Order {\n    total() {\n        return 1;\n    }\n}\nmodule.exports = Order;\n')
+        (src_dir / 'customer.js').write_text(customer_source)
+
+        # AND: Production story_bot with code behavior
+        helper.bot.behaviors.navigate_to('code')
+        behavior = helper.bot.behaviors.current
+
+        # WHEN: Rules validate runs over all files
+        from rules.rules import ValidationContext
+        context = ValidationContext.from_action_context(behavior, ValidateActionContext(all_files=True, skip_cross_file=True))
+        behavior.rules.validate(context)
+        js_asts = context.parsed_files.js_asts
+        if not js_asts.server.available:
+            pytest.skip('node with the esprima package is not installed')
+
+        # THEN: Each file's source is sent to the parse server exactly once
+        stats = js_asts.stats
+        assert stats['sources'] == 2
+        assert stats['misses'] == 2
+
+        # AND: Later scanners are served from the shared AST cache
+        assert stats['hits'] > stats['misses']
+
+        # AND: The worker returned each file's Program AST
+        worker_pid = js_asts.server._process.pid
+        round_trips = js_asts.server.round_trips
+        hits = js_asts.stats['hits']
+        tree = js_asts.parse(customer_source)
+        assert tree['type'] == 'Program'
+        assert [(node['type'], node['id']['name']) for node in tree['body']] == [('FunctionDeclaration', 'findCustomer')]
+
+        # AND: Parsing a file again is a cache hit, with no new request to the same worker
+        assert js_asts.parse(customer_source) is tree
+        assert js_asts.stats['misses'] == 2 and js_asts.stats['hits'] == hits + 2
+        assert js_asts.server.round_trips == round_trips
+        assert js_asts.server._process.pid == worker_pid
+
+    @pytest.mark.parametrize("parallel_mode", ['thread', 'process'])
+    def test_parallel_validation_matches_sequential_results(self, tmp_path, parallel_mode):
+        """
+        SCENARIO: Parallel rule execution returns the same results in rule order
+        GIVEN: Python source files with code smells in the workspace
+        AND: Production story_bot with code behavior
+        WHEN: Rules validate runs once sequentially and once with two workers
+        THEN: Processed rules come back in the same rule order
+        AND: Every rule reports the same violations
+        AND: File-scanned callbacks are replayed for every rule
+        """
+        # GIVEN: Python source files with code smells in the workspace
+        helper = BotTestHelper(tmp_path)
+        helper.story.create_story_graph({'epics': []})
+        src_dir = helper.workspace / 'src'
+        src_dir.mkdir(parents=True)
+        (src_dir / 'order.py').write_text('class Order:\n    def calc(self, x):\n        try:\n            return x / 0\n        except:\n            pass\n')
+        (src_dir / 'customer.py').write_text('def f(d):\n    if d:\n        return d\n    return None\n')
+        
+        # AND: Production story_bot with code behavior
+        helper.bot.behaviors.navigate_to('code')
+        behavior = helper.bot.behaviors.current
+        
+        # WHEN: Rules validate runs once sequentially and once with two workers
+        from rules.rules import ValidationContext, ValidationCallbacks
+        sequential_context = ValidationContext.from_action_context(behavior, ValidateActionContext(all_files=True, skip_cross_file=True))
+        sequential = behavior.rules.validate(sequential_context)
+        scanned = []
+        parallel_context = ValidationContext.from_action_context(
+            behavior,
+            ValidateActionContext(all_files=True, skip_cross_file=True, jobs=2, parallel_mode=parallel_mode),
+            ValidationCallbacks(on_file_scanned=lambda file_path, violations, rule: scanned.append((rule.name, file_path.name)))
+        )
+        parallel = behavior.rules.validate(parallel_context)
+        
+        # THEN: Processed rules come back in the same rule order
+        assert [r['rule_file'] for r in parallel] == [r['rule_file'] for r in sequential]
+        
+        # AND: Every rule reports the same violations
+        for sequential_rule, parallel_rule in zip(sequential, parallel):
+            assert parallel_rule['scanner_status'] == sequential_rule['scanner_status']
+            assert parallel_rule.get('scanner_results') == sequential_rule.get('scanner_results')
+        
+        # AND: File-scanned callbacks are replayed for every rule
+        executed = [r for r in parallel if r['scanner_status'].get('status') == 'EXECUTED']
+        assert len(scanned) == 2 * len(executed)
+
+    def test_parsed_file_store_parses_different_files_concurrently_and_each_file_once(self, tmp_path):
+        """
+        SCENARIO: Thread workers parse different files at the same time and share each parse
+        GIVEN: Two Python source files
+        WHEN: Two threads parse one file each, and four threads parse the same file
+        THEN: Both different files are being parsed at the same time
+        AND: A file asked for by several threads is parsed once and shared
+        """
+        import ast
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        from scanners.resources.parsed_file_store import ParsedFileStore
+
+        # GIVEN: Two Python source files
+        first, second = tmp_path / 'first.py', tmp_path / 'second.py'
+        first.write_text('def a():\n    return 1\n')
+        second.write_text('def b():\n    return 2\n')
+        store = ParsedFileStore()
+        both_parsing = threading.Barrier(2, timeout=5)
+        parse = ast.parse
+
+        def parse_together(content, filename):
+            both_parsing.wait()
+            return parse(content, filename=filename)
+
+        # WHEN: Two threads parse one file each
+        with patch('scanners.resources.parsed_file_store.ast.parse', parse_together):
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                parsed = list(pool.map(store.parse, [first, second]))
+
+        # THEN: Both files were parsed at the same time (the barrier released both)
+        assert [p.path for p in parsed] == [first, second]
+
+        # AND: A file asked for by several threads is parsed once and shared
+        third = tmp_path / 'third.py'
+        third.write_text('x = 1\n')
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            shared = list(pool.map(store.parse, [third] * 4))
+        assert all(p is shared[0] for p in shared)
+        assert (store.misses, store.hits) == (3, 3)
+
+    def test_incremental_validation_rescans_only_edited_files(self, tmp_path):
+        """
+        SCENARIO: A rerun only rescans files whose content changed
+        GIVEN: Two Python source files with code smells in the workspace
+        AND: A previous validation run stored its per-file results
+        WHEN: One file is edited and validation runs again
+        THEN: Only the edited file is rescanned
+        AND: Stored results for the untouched file are replayed unchanged
+        """
+        # GIVEN: Two Python source files with code smells in the workspace
+        helper = BotTestHelper(tmp_path)
+        helper.story.create_story_graph({'epics': []})
+        src_dir = helper.workspace / 'src'
+        src_dir.mkdir(parents=True)
+        order_file = src_dir / 'order.py'
+        customer_file = src_dir / 'customer.py'
+        order_file.write_text('class Order:\n    def calc(self, x):\n        try:\n            return x / 0\n        except:\n            pass\n')
+        customer_file.write_text('def f(d):\n    if d:\n        return d\n    return None\n')
+        helper.bot.behaviors.navigate_to('code')
+        behavior = helper.bot.behaviors.current
+
+        # AND: A previous validation run stored its per-file results
+        from rules.rules import ValidationContext, ValidationCallbacks
+        first = behavior.rules.validate(ValidationContext.from_action_context(behavior, ValidateActionContext(skip_cross_file=True)))
+
+        # WHEN: One file is edited and validation runs again
+        customer_file.write_text('def f(d):\n    if d:\n        return d\n    return 0\n')
+        scanned = []
+        context = ValidationContext.from_action_context(
+            behavior,
+            ValidateActionContext(skip_cross_file=True),
+            ValidationCallbacks(on_file_scanned=lambda file_path, violations, rule: scanned.append((rule.name, file_path.name, len(violations))))
+        )
+        second = behavior.rules.validate(context)
+
+        # THEN: Only the edited file is rescanned
+        stats = context.result_store.stats
+        assert stats['replayed'] > 0
+        assert context.parsed_files.stats['files'] == 1
+
+        # AND: Stored results for the untouched file are replayed unchanged
+        def order_violations(rule_result):
+            results = rule_result.get('scanner_results', {})
+            violations = results.get('violations', results.get('file_by_file', {}).get('violations', []))
+            return [v for v in violations if str(v.get('location', '')).endswith('order.py')]
+        assert any(order_violations(rule_result) for rule_result in first)
+        for first_rule, second_rule in zip(first, second):
+            assert order_violations(second_rule) == order_violations(first_rule)
+        assert {name for _, name, _ in scanned} == {'order.py', 'customer.py'}
+
+    def test_story_graph_edit_rescans_only_rules_that_read_the_story_graph(self, tmp_path):
+        """
+        SCENARIO: A story graph edit does not invalidate pure code rules
+        GIVEN: A Python source file whose validation results are stored
+        WHEN: The story graph is edited and validation runs again
+        THEN: Only rules whose scanner reads the story graph rescan the file
+        AND: Every other rule replays its stored result
+        """
+        # GIVEN: A Python source file whose validation results are stored
+        helper = BotTestHelper(tmp_path)
+        helper.story.create_story_graph({'epics': []})
+        src_dir = helper.workspace / 'src'
+        src_dir.mkdir(parents=True)
+        (src_dir / 'order.py').write_text('class Order:\n    def calc(self, x):\n        try:\n            return x / 0\n        except:\n            pass\n')
+        helper.bot.behaviors.navigate_to('code')
+        behavior = helper.bot.behaviors.current
+        from rules.rules import ValidationContext
+        behavior.rules.validate(ValidationContext.from_action_context(behavior, ValidateActionContext(skip_cross_file=True)))
+
+        # WHEN: The story graph is edited and validation runs again
+        helper.story.create_story_graph({'epics': [{'name': 'Place Order', 'sub_epics': [], 'story_groups': []}]})
+        context = ValidationContext.from_action_context(behavior, ValidateActionContext(skip_cross_file=True))
+        behavior.rules.validate(context)
+
+        # THEN: Only rules whose scanner reads the story graph rescan the file
+        scanned_rules = [rule for rule in behavior.rules if rule.has_scanner]
+        graph_rules = [rule for rule in scanned_rules if rule.reads_story_graph]
+        assert 0 < len(graph_rules) < len(scanned_rules)
+        assert context.result_store.stats['rescanned'] == len(graph_rules)
+
+        # AND: Every other rule replays its stored result
+        assert context.result_store.stats['replayed'] == len(scanned_rules) - len(graph_rules)
+
+    def test_cross_file_duplication_found_across_distant_packages(self, tmp_path):
+        """
+        SCENARIO: Cross-file duplication is detected anywhere in the workspace
+        GIVEN: A duplicated code block in two packages far apart
+        AND: More than twenty unrelated files between them
+        WHEN: The eliminate_duplication rule scans cross-file
+        THEN: The duplicate pair is reported
+        """
+        # GIVEN: A duplicated code block in two packages far apart
+        helper = BotTestHelper(tmp_path)
+        helper.story.create_story_graph({'epics': []})
+        src_dir = helper.workspace / 'src'
+        duplicated_body = (
+            '    totals = {}\n'
+            '    for item in items:\n'
+            '        key = item.category\n'
+            '        totals[key] = totals.get(key, 0) + item.amount\n'
+            '    ranked = sorted(totals.items(), key=lambda pair: pair[1])\n'
+            '    limit = max(1, len(ranked) // 2)\n'
+            '    return ranked[:limit]\n'
+        )
+        first_file = src_dir / 'billing' / 'invoices.py'
+        last_file = src_dir / 'zreports' / 'summary.py'
+        for file_path, func_name in ((first_file, 'rank_invoices'), (last_file, 'rank_report_rows')):
+            file_path.parent.mkdir(parents=True)
+            file_path.write_text(f'def {func_name}(items):\n{duplicated_body}')
+
+        # AND: More than twenty unrelated files between them
+        for index in range(25):
+            package_dir = src_dir / f'package_{index:02d}'
+            package_dir.mkdir(parents=True)
+            (package_dir / 'module.py').write_text(f'def value_{index}():\n    return {index}\n')
+        helper.bot.behaviors.navigate_to('code')
+        behavior = helper.bot.behaviors.current
+
+        # WHEN: The eliminate_duplication rule scans cross-file
+        from rules.scan_config import ScanConfig
+        rule = behavior.rules.find_by_name('eliminate_duplication')
+        rule.reload_scanner_for_language('python')
+        all_files = sorted(src_dir.rglob('*.py'))
+        rule.scan(ScanConfig(story_graph={'epics': []}, files={'src': all_files}, changed_files={'src': [first_file]}))
+
+        # THEN: The duplicate pair is reported
+        assert [Path(v['location']).name for v in rule.cross_file_violations] == ['invoices.py']
+        assert 'summary.py' in rule.cross_file_violations[0]['violation_message']
+
+    def test_cross_file_duplication_reports_each_pair_once_on_full_scan(self, tmp_path):
+        """
+        SCENARIO: A full cross-file scan reports a duplicate pair once
+        GIVEN: A duplicated code block in two files
+        WHEN: The eliminate_duplication rule scans cross-file with every file changed
+        THEN: One violation is reported for the pair, not one from each end
+        """
+        # GIVEN: A duplicated code block in two files
+        helper = BotTestHelper(tmp_path)
+        helper.story.create_story_graph({'epics': []})
+        src_dir = helper.workspace / 'src'
+        src_dir.mkdir(parents=True)
+        duplicated_body = (
+            '    totals = {}\n'
+            '    for item in items:\n'
+            '        key = item.category\n'
+            '        totals[key] = totals.get(key, 0) + item.amount\n'
+            '    ranked = sorted(totals.items(), key=lambda pair: pair[1])\n'
+            '    limit = max(1, len(ranked) // 2)\n'
+            '    return ranked[:limit]\n'
+        )
+        for file_name, func_name in (('invoices.py', 'rank_invoices'), ('summary.py', 'rank_report_rows')):
+            (src_dir / file_name).write_text(f'def {func_name}(items):\n{duplicated_body}')
+        helper.bot.behaviors.navigate_to('code')
+        behavior = helper.bot.behaviors.current
+
+        # WHEN: The eliminate_duplication rule scans cross-file with every file changed
+        from rules.scan_config import ScanConfig
+        rule = behavior.rules.find_by_name('eliminate_duplication')
+        rule.reload_scanner_for_language('python')
+        all_files = sorted(src_dir.rglob('*.py'))
+        rule.scan(ScanConfig(story_graph={'epics': []}, files={'src': all_files}, changed_files={'src': all_files}))
+
+        # THEN: One violation is reported for the pair, not one from each end
+        assert len(rule.cross_file_violations) == 1
+
+
 # ============================================================================
 # STORY: Display Rules
 # ============================================================================
@@ -279,6 +827,47 @@ class TestValidateRulesUsingCLI:
         helper.instructions.assert_section_shows_behavior_and_action(
             cli_response.output, 'code', 'validate')
 
+    @pytest.mark.parametrize("helper_class", [
+        TTYBotTestHelper,
+        PipeBotTestHelper,
+        JsonBotTestHelper
+    ])
+    def test_validate_passes_jobs_and_parallel_mode_to_rule_scanners(self, tmp_path, helper_class):
+        """
+        SCENARIO: Validate with parallel rule scanners from the CLI
+        GIVEN: CLI is at code.validate
+        WHEN: user runs code.validate --jobs=3 --parallel-mode thread
+        THEN: The validation context runs scanners on 3 thread workers
+        AND: CLI output tells the scanner run to use 3 thread workers
+        WHEN: user passes an unknown parallel mode
+        THEN: CLI reports the invalid option
+        """
+        # Given
+        helper = helper_class(tmp_path)
+        helper.domain.story.create_story_graph({'epics': []})
+        helper.domain.state.set_state('code', 'validate')
+        from actions.validate.validate_action import ValidateRulesAction
+        from rules.rules import ValidationContext
+        contexts = []
+        get_instructions = ValidateRulesAction.get_instructions
+
+        def capture(action, context=None, include_scope=False):
+            contexts.append(context)
+            return get_instructions(action, context, include_scope)
+
+        # When
+        with patch.object(ValidateRulesAction, 'get_instructions', capture):
+            cli_response = helper.cli_session.execute_command('code.validate --jobs=3 --parallel-mode thread')
+
+        # Then
+        validation_context = ValidationContext.from_action_context(helper.domain.bot.behaviors.current, contexts[-1])
+        assert (validation_context.jobs, validation_context.parallel_mode) == (3, 'thread')
+        assert '--jobs 3 --parallel-mode thread' in cli_response.output
+
+        # When / Then
+        invalid_response = helper.cli_session.execute_command('code.validate --jobs=2 --parallel-mode=fork')
+        assert 'Invalid --parallel-mode: fork' in invalid_response.output
+
 
 # ============================================================================
 # STORY: Display Rules